@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Repository Secret Scan
+
+Scans the repository (or the given paths) for committed secrets with the
+parallel, incremental SecretScanEngine. Keep the cache file between runs
+(e.g. CI cache) and unchanged files are not rescanned. Intentional
+literals are exempted with an inline "# pragma: allowlist secret".
+
+Exit code 0 = no findings at or above --fail-on
+Exit code 1 = findings at or above --fail-on
+
+Usage:
+    python scripts/security/scan_secrets.py                  # whole repository
+    python scripts/security/scan_secrets.py src --workers 8
+    python scripts/security/scan_secrets.py --cache .cache/secret_scan.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from ai_pal.security.scan_engine import SecretScanEngine
+
+
+SEVERITY_ORDER = ["info", "low", "medium", "high", "critical"]
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Scan files for committed secrets")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[str(project_root)],
+        help="Directories or files to scan (default: repository root)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Scan processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="JSON result cache to reuse and update",
+    )
+    parser.add_argument(
+        "--max-file-kb",
+        type=int,
+        default=2048,
+        help="Skip files larger than this (default: 2048)",
+    )
+    parser.add_argument(
+        "--fail-on",
+        choices=SEVERITY_ORDER,
+        default="high",
+        help="Lowest severity that fails the scan (default: high)",
+    )
+
+    args = parser.parse_args()
+
+    engine = SecretScanEngine(
+        workers=args.workers,
+        max_file_bytes=args.max_file_kb * 1024,
+        cache_path=args.cache,
+    )
+
+    results = {}
+    files = 0
+    seconds = 0.0
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            results.update(engine.scan_directory(path))
+        else:
+            results.update(engine.scan_paths([path]))
+        files += engine.last_stats.files
+        seconds += engine.last_stats.seconds
+    engine.save_cache()
+
+    threshold = SEVERITY_ORDER.index(args.fail_on)
+    failing = 0
+    for file_path, matches in sorted(results.items()):
+        for match in matches:
+            level = SEVERITY_ORDER.index(match.severity.value)
+            marker = "✗" if level >= threshold else "·"
+            failing += level >= threshold
+            print(
+                f"{marker} {file_path}:{match.line_number}:{match.column} "
+                f"[{match.severity.value}] {match.secret_type.value}: {match.matched_text}"
+            )
+
+    print(
+        f"\nScanned {files} files in {seconds:.2f}s: "
+        f"{sum(len(m) for m in results.values())} findings, "
+        f"{failing} at or above {args.fail_on}"
+    )
+    sys.exit(1 if failing else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,687 @@
+"""
+Admission Control
+
+Decides, before any work is done, whether the API takes a request:
+- Token-bucket rate limits per user (all routes), per user and route, and
+  per route across all users; Redis-backed so limits hold across workers,
+  with an in-process fallback
+- A bounded concurrency pool for generation requests with priority
+  classes: interactive chat is admitted ahead of background work
+- Fast shedding: 429 when a caller is over its rate, 503 when the
+  generation queue is full or no slot frees up in time, both with
+  Retry-After
+
+Queue depth, in-flight generations and shed counts are exported through
+MetricsCollector (and so on /metrics).
+"""
+
+import asyncio
+import hashlib
+import heapq
+import ipaddress
+import itertools
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+from starlette.responses import JSONResponse
+
+from ai_pal.monitoring.metrics import MetricsCollector, get_metrics
+
+
+# ============================================================================
+# Policies
+# ============================================================================
+
+
+class Priority(IntEnum):
+    """Generation priority classes; lower values are admitted first"""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: `rate` tokens per second, holding at most `burst`"""
+    rate: float
+    burst: float
+
+
+@dataclass(frozen=True)
+class RoutePolicy:
+    """Admission rules for requests under a path prefix"""
+    # Per user, for this route
+    user_limit: Optional[RateLimit] = None
+    # All users combined, for this route
+    route_limit: Optional[RateLimit] = None
+    # Generation class; None = not a generation request (no pool slot)
+    priority: Optional[Priority] = None
+    methods: Tuple[str, ...] = ("POST",)
+
+
+DEFAULT_ROUTE_POLICIES: Dict[str, RoutePolicy] = {
+    # Covers /api/chat/stream too: one chat budget per user
+    "/api/chat": RoutePolicy(
+        user_limit=RateLimit(rate=1.0, burst=10),
+        route_limit=RateLimit(rate=50.0, burst=100),
+        priority=Priority.INTERACTIVE,
+    ),
+    "/api/ffe/goals": RoutePolicy(
+        user_limit=RateLimit(rate=0.2, burst=5),
+        priority=Priority.BACKGROUND,
+    ),
+    "/api/tasks": RoutePolicy(
+        user_limit=RateLimit(rate=0.5, burst=10),
+        route_limit=RateLimit(rate=20.0, burst=50),
+    ),
+}
+
+# Per user across all routes
+DEFAULT_USER_LIMIT = RateLimit(rate=20.0, burst=60)
+
+EXEMPT_PATHS = ("/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+# Clients may lower (never raise) a generation request's priority
+PRIORITY_HEADER = "x-request-priority"
+
+
+class AdmissionRejected(Exception):
+    """A request was shed before doing any work"""
+
+    def __init__(self, status_code: int, retry_after: float, reason: str, detail: str):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+        self.detail = detail
+        super().__init__(detail)
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After value: whole seconds, at least 1"""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+# ============================================================================
+# Rate Limiters
+# ============================================================================
+
+
+Bucket = Tuple[str, RateLimit]
+
+
+class RateLimiter(ABC):
+    """Token buckets, charged all-or-nothing"""
+
+    @abstractmethod
+    async def acquire(self, buckets: Sequence[Bucket], cost: float = 1.0) -> float:
+        """
+        Take `cost` tokens from every bucket, or from none
+
+        Args:
+            buckets: (key, limit) pairs
+            cost: Tokens per bucket
+
+        Returns:
+            0 if admitted, else seconds until every bucket could pay
+        """
+
+
+class MemoryRateLimiter(RateLimiter):
+    """Buckets in this process; least recently used keys are evicted"""
+
+    def __init__(self, max_keys: int = 100000):
+        """
+        Initialize limiter
+
+        Args:
+            max_keys: Buckets kept before evicting (an evicted bucket
+                comes back full)
+        """
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def acquire(self, buckets: Sequence[Bucket], cost: float = 1.0) -> float:
+        now = time.monotonic()
+        levels = []
+        wait = 0.0
+
+        for key, limit in buckets:
+            tokens, updated = self._buckets.get(key, (limit.burst, now))
+            level = min(limit.burst, tokens + (now - updated) * limit.rate)
+            levels.append(level)
+            if level < cost:
+                wait = max(wait, (cost - level) / limit.rate)
+
+        for (key, _), level in zip(buckets, levels):
+            self._buckets[key] = (level - cost if wait == 0 else level, now)
+            self._buckets.move_to_end(key)
+
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        return wait
+
+
+# Same algorithm as MemoryRateLimiter, atomically in Redis using its clock.
+# KEYS: bucket keys; ARGV: cost, then rate and burst per key
+_TOKEN_BUCKET_SCRIPT = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local levels = {}
+local wait = 0
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i])
+    local burst = tonumber(ARGV[2 * i + 1])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local level = tonumber(state[1]) or burst
+    local updated = tonumber(state[2]) or now
+    level = math.min(burst, level + math.max(0, now - updated) * rate)
+    levels[i] = level
+    if level < cost then
+        wait = math.max(wait, (cost - level) / rate)
+    end
+end
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i])
+    local burst = tonumber(ARGV[2 * i + 1])
+    local level = levels[i]
+    if wait == 0 then
+        level = level - cost
+    end
+    redis.call('HSET', key, 'tokens', tostring(level), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.ceil(burst / rate) + 1)
+end
+
+return tostring(wait)
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    Buckets shared by all workers through Redis
+
+    While Redis is unreachable, limits fall back to a per-worker
+    MemoryRateLimiter; Redis is retried after `retry_seconds`.
+    """
+
+    def __init__(self, redis_cache, key_prefix: str = "ratelimit", retry_seconds: float = 30.0):
+        """
+        Initialize limiter
+
+        Args:
+            redis_cache: Enabled RedisCache (its client is reused)
+            key_prefix: Prefix for bucket keys
+            retry_seconds: How long to stay on the fallback after an error
+        """
+        if not redis_cache.enabled or redis_cache.client is None:
+            raise ValueError("RedisRateLimiter requires an enabled RedisCache")
+
+        self.key_prefix = key_prefix
+        self.retry_seconds = retry_seconds
+        self.fallback = MemoryRateLimiter()
+        self._script = redis_cache.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        self._down_until = 0.0
+
+    async def acquire(self, buckets: Sequence[Bucket], cost: float = 1.0) -> float:
+        if time.monotonic() < self._down_until:
+            return await self.fallback.acquire(buckets, cost)
+
+        args: List[float] = [cost]
+        for _, limit in buckets:
+            args.extend((limit.rate, limit.burst))
+
+        try:
+            wait = await self._script(
+                keys=[f"{self.key_prefix}:{key}" for key, _ in buckets],
+                args=args
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(
+                f"Redis rate limiting unavailable ({e}); "
+                f"using per-worker limits for {self.retry_seconds:.0f}s"
+            )
+            self._down_until = time.monotonic() + self.retry_seconds
+            return await self.fallback.acquire(buckets, cost)
+
+
+# ============================================================================
+# Generation Pool
+# ============================================================================
+
+
+class GenerationPool:
+    """
+    Bounded concurrency for generation requests, with priority classes
+
+    Up to `max_concurrent` requests hold a slot; the rest wait in a
+    priority queue (FIFO within a class). A request is shed instead of
+    queued when its class's queue is full, or when it waits longer than
+    `max_wait_seconds`.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_queue: Optional[Dict[Priority, int]] = None,
+        max_wait_seconds: float = 10.0,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize pool
+
+        Args:
+            max_concurrent: Generation requests running at once
+            max_queue: Waiting requests allowed per priority class
+            max_wait_seconds: Longest a request may wait for a slot
+            metrics: Where to report queue depth (default: global collector)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue or {Priority.INTERACTIVE: 64, Priority.BACKGROUND: 16}
+        self.max_wait_seconds = max_wait_seconds
+        self.metrics = metrics or get_metrics()
+
+        self.in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._queued: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._seq = itertools.count()
+        # Moving average of slot hold time, for Retry-After estimates
+        self._avg_hold_seconds = 1.0
+        self._report()
+
+    def queue_depth(self, priority: Optional[Priority] = None) -> int:
+        """Requests waiting for a slot (in one class, or all)"""
+        if priority is not None:
+            return self._queued[priority]
+        return sum(self._queued.values())
+
+    def retry_after(self) -> float:
+        """Estimated seconds until a new request could get a slot"""
+        return self._avg_hold_seconds * (self.queue_depth() + 1) / max(1, self.max_concurrent)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority = Priority.INTERACTIVE):
+        """
+        Hold a generation slot for the duration of the block
+
+        Raises:
+            AdmissionRejected: 503 if the queue is full or the wait times out
+        """
+        await self._acquire(priority)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            held = time.monotonic() - started
+            self._avg_hold_seconds = 0.9 * self._avg_hold_seconds + 0.1 * held
+            self._release()
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self.in_flight < self.max_concurrent and not self.queue_depth():
+            self.in_flight += 1
+            self._report()
+            return
+
+        if self._queued[priority] >= self.max_queue[priority]:
+            raise AdmissionRejected(
+                503, self.retry_after(), "queue_full",
+                "Server is at capacity; try again later"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), waiter))
+        self._queued[priority] += 1
+        self._report()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            if waiter.done():
+                return  # handed a slot just as the wait ran out
+            self._abandon(waiter, priority)
+            raise AdmissionRejected(
+                503, self.retry_after(), "queue_timeout",
+                "Server is at capacity; try again later"
+            ) from None
+        except BaseException:
+            # Cancelled (e.g. client went away)
+            if waiter.done():
+                self._release()
+            else:
+                self._abandon(waiter, priority)
+            raise
+
+    def _abandon(self, waiter: asyncio.Future, priority: Priority) -> None:
+        """Leave the queue without a slot; _release skips cancelled waiters"""
+        waiter.cancel()
+        self._queued[priority] -= 1
+        self._report()
+
+    def _release(self) -> None:
+        # Hand the slot straight to the best live waiter
+        while self._waiters:
+            priority, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._queued[Priority(priority)] -= 1
+            waiter.set_result(None)
+            self._report()
+            return
+
+        self.in_flight -= 1
+        self._report()
+
+    def _report(self) -> None:
+        self.metrics.record_admission_queue(
+            {priority.name.lower(): depth for priority, depth in self._queued.items()},
+            self.in_flight
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics"""
+        return {
+            "in_flight": self.in_flight,
+            "max_concurrent": self.max_concurrent,
+            "queued": {priority.name.lower(): depth for priority, depth in self._queued.items()},
+        }
+
+
+# ============================================================================
+# Controller
+# ============================================================================
+
+
+class AdmissionController:
+    """Applies rate limits and the generation pool to incoming requests"""
+
+    def __init__(
+        self,
+        limiter: Optional[RateLimiter] = None,
+        pool: Optional[GenerationPool] = None,
+        policies: Optional[Dict[str, RoutePolicy]] = None,
+        user_limit: Optional[RateLimit] = DEFAULT_USER_LIMIT,
+        exempt_paths: Sequence[str] = EXEMPT_PATHS,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize controller
+
+        Args:
+            limiter: Token bucket store (default: in-process)
+            pool: Generation pool (default: 8 concurrent)
+            policies: Path prefix -> policy (default: DEFAULT_ROUTE_POLICIES)
+            user_limit: Per-user limit across all routes (None = no limit)
+            exempt_paths: Path prefixes never limited (health, metrics, docs)
+            metrics: Where to count shed requests (default: global collector)
+        """
+        self.metrics = metrics or get_metrics()
+        self.limiter = limiter or MemoryRateLimiter()
+        self.pool = pool or GenerationPool(metrics=self.metrics)
+        self.user_limit = user_limit
+        self.exempt_paths = tuple(exempt_paths)
+        # Longest prefix first, so the most specific policy wins
+        self.policies = dict(sorted(
+            (policies if policies is not None else DEFAULT_ROUTE_POLICIES).items(),
+            key=lambda item: len(item[0]),
+            reverse=True
+        ))
+
+    def route_for(self, path: str, method: str) -> Tuple[Optional[str], Optional[RoutePolicy]]:
+        """
+        Find the policy governing a request
+
+        Returns:
+            (route prefix, policy), or (None, None) if no policy applies
+        """
+        for prefix, policy in self.policies.items():
+            if path.startswith(prefix) and method in policy.methods:
+                return prefix, policy
+        return None, None
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        caller: str,
+        path: str,
+        method: str = "POST",
+        requested_priority: Optional[str] = None
+    ):
+        """
+        Admit a request for the duration of the block
+
+        Args:
+            caller: Stable caller identity (user or client address)
+            path: Request path
+            method: HTTP method
+            requested_priority: Client's priority hint ("background" lowers
+                a generation request's class)
+
+        Raises:
+            AdmissionRejected: 429 when over a rate limit, 503 when the
+                generation pool can't take the request
+        """
+        if path.startswith(self.exempt_paths):
+            yield
+            return
+
+        route, policy = self.route_for(path, method)
+        label = route or "other"
+
+        buckets: List[Bucket] = []
+        if self.user_limit is not None:
+            buckets.append((f"user:{caller}", self.user_limit))
+        if policy is not None and policy.user_limit is not None:
+            buckets.append((f"user:{caller}:{route}", policy.user_limit))
+        if policy is not None and policy.route_limit is not None:
+            buckets.append((f"route:{route}", policy.route_limit))
+
+        if buckets:
+            wait = await self.limiter.acquire(buckets)
+            if wait > 0:
+                self.metrics.record_admission_shed(label, "rate_limited")
+                raise AdmissionRejected(429, wait, "rate_limited", "Rate limit exceeded")
+
+        if policy is None or policy.priority is None:
+            yield
+            return
+
+        priority = policy.priority
+        if requested_priority and requested_priority.lower() == "background":
+            priority = max(priority, Priority.BACKGROUND)
+
+        try:
+            slot = self.pool.slot(priority)
+            await slot.__aenter__()
+        except AdmissionRejected as e:
+            self.metrics.record_admission_shed(label, e.reason)
+            raise
+
+        try:
+            yield
+        finally:
+            await slot.__aexit__(None, None, None)
+
+
+# ============================================================================
+# ASGI Middleware
+# ============================================================================
+
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(value: str) -> Tuple[IPNetwork, ...]:
+    """
+    Parse a comma-separated list of proxy addresses or CIDR ranges
+
+    Args:
+        value: e.g. "10.0.0.0/8, 192.168.1.5" (empty trusts no proxy)
+
+    Raises:
+        ValueError: An entry is not an address or network
+    """
+    return tuple(
+        ipaddress.ip_network(entry.strip(), strict=False)
+        for entry in value.split(",") if entry.strip()
+    )
+
+
+def _is_trusted(address: str, trusted_proxies: Sequence[IPNetwork]) -> bool:
+    """Whether a connecting address belongs to a trusted proxy"""
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted_proxies)
+
+
+def client_address(scope: Dict[str, Any], trusted_proxies: Sequence[IPNetwork] = ()) -> str:
+    """
+    Address of the client behind any trusted proxies
+
+    When the connecting peer is a trusted proxy (e.g. the ingress
+    controller), X-Forwarded-For is read right to left, skipping trusted
+    hops; the first untrusted address is the client. Entries left of it
+    are client-supplied and ignored, so callers can't pick their own
+    address. Without trusted proxies the peer address is used as is.
+
+    Args:
+        scope: ASGI scope
+        trusted_proxies: Networks whose forwarded headers are believed
+    """
+    client = scope.get("client")
+    address = client[0] if client else "unknown"
+    if not trusted_proxies or not _is_trusted(address, trusted_proxies):
+        return address
+
+    forwarded = [
+        value.decode("latin-1")
+        for name, value in scope.get("headers", ())
+        if name == b"x-forwarded-for"
+    ]
+    hops = [hop.strip() for hop in ",".join(forwarded).split(",") if hop.strip()]
+    for hop in reversed(hops):
+        address = hop
+        if not _is_trusted(hop, trusted_proxies):
+            break
+    return address
+
+
+def caller_identity(
+    scope: Dict[str, Any],
+    principal: Optional[str] = None,
+    trusted_proxies: Sequence[IPNetwork] = ()
+) -> str:
+    """
+    Identify the caller of an HTTP or WebSocket request
+
+    A verified principal is limited per user (digested, so user IDs never
+    become Redis keys). Everyone else is limited per client address,
+    including callers whose bearer token is unverified. Keying on the raw
+    Authorization header would let a caller get a fresh bucket with every
+    request by sending a new random token.
+
+    Behind a reverse proxy or ingress, the connecting address is the
+    proxy's; list it in trusted_proxies or every unverified caller (all
+    callers in development mode) shares one bucket.
+
+    Args:
+        scope: ASGI scope
+        principal: User ID whose credentials were verified, if any
+        trusted_proxies: Proxies whose X-Forwarded-For is believed (see
+            client_address)
+    """
+    if principal is not None:
+        return "principal:" + hashlib.sha256(principal.encode()).hexdigest()[:32]
+
+    return f"ip:{client_address(scope, trusted_proxies)}"
+
+
+def rejection_response(error: AdmissionRejected) -> JSONResponse:
+    """Error response for a shed request, in the API's error format"""
+    return JSONResponse(
+        status_code=error.status_code,
+        content={
+            "error": {
+                "code": error.status_code,
+                "message": error.detail,
+                "reason": error.reason,
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            }
+        },
+        headers={"Retry-After": error.retry_after_header}
+    )
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware running every HTTP request through admission control
+
+    Pure ASGI rather than BaseHTTPMiddleware, so a streamed response keeps
+    its generation slot until the last byte is sent.
+    """
+
+    def __init__(
+        self,
+        app,
+        get_controller: Callable[[], Optional[AdmissionController]],
+        resolve_principal: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[str]]]] = None,
+        trusted_proxies: Sequence[IPNetwork] = ()
+    ):
+        """
+        Initialize middleware
+
+        Args:
+            app: Wrapped ASGI app
+            get_controller: Returns the controller (None disables admission
+                control); resolved per request so it can be configured
+                after the app is built
+            resolve_principal: Returns the verified user ID for a request
+                scope, or None (callers are then limited per address)
+            trusted_proxies: Proxies whose X-Forwarded-For gives the
+                client address (see client_address)
+        """
+        self.app = app
+        self.get_controller = get_controller
+        self.resolve_principal = resolve_principal
+        self.trusted_proxies = tuple(trusted_proxies)
+
+    async def __call__(self, scope, receive, send):
+        controller = self.get_controller() if scope["type"] == "http" else None
+        if controller is None:
+            await self.app(scope, receive, send)
+            return
+
+        priority = None
+        for name, value in scope.get("headers", ()):
+            if name == PRIORITY_HEADER.encode():
+                priority = value.decode("latin-1")
+
+        principal = None
+        if self.resolve_principal is not None:
+            principal = await self.resolve_principal(scope)
+
+        try:
+            admission = controller.admit(
+                caller_identity(scope, principal, self.trusted_proxies),
+                scope["path"], scope["method"], priority
+            )
+            await admission.__aenter__()
+        except AdmissionRejected as e:
+            await rejection_response(e)(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await admission.__aexit__(None, None, None)
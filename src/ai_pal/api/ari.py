@@ -8,13 +8,14 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.monitoring import get_logger
 from ai_pal.storage.database import DatabaseManager, ARIRepository
 from ai_pal.cache.redis_cache import RedisCache
 from ai_pal.storage.cached_repositories import CachedARIRepository, create_cached_ari_repo
 
 logger = get_logger("ai_pal.api.ari")
-router = APIRouter(prefix="/api/users", tags=["ARI Metrics"])
+router = APIRouter(prefix="/api/users", tags=["ARI Metrics"], route_class=FastJSONRoute)
 
 # Store db_manager and cache references (set during app startup)
 _db_manager: Optional[DatabaseManager] = None
@@ -8,11 +8,12 @@ from fastapi import APIRouter, Query, Path, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.monitoring import get_logger
 from ai_pal.security.audit_log import AuditLogger, AuditEventType, AuditSeverity
 
 logger = get_logger("ai_pal.api.audit")
-router = APIRouter(prefix="/api/users", tags=["Audit Logs"])
+router = APIRouter(prefix="/api/users", tags=["Audit Logs"], route_class=FastJSONRoute)
 
 # Initialize audit logger
 _audit_logger: Optional[AuditLogger] = None
@@ -0,0 +1,537 @@
+"""
+API Authentication
+
+Resolves bearer tokens to principals:
+- JWT verification (RS256/384/512, ES256/384, EdDSA, HS256) against keys
+  from a JWKS endpoint, cached and refreshed on key rotation, or a shared
+  secret
+- A bounded TTL cache of verified token -> principal results, keyed by
+  token hash, so signatures are checked once per token rather than once
+  per request
+- Verification latency and cache hit rate exported through
+  MetricsCollector (and so on /metrics)
+
+Without a JWKS URL or secret configured the API runs in development mode
+and uses the bearer token itself as the user ID.
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+import httpx
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+from loguru import logger
+
+from ai_pal.monitoring.metrics import MetricsCollector, get_metrics
+
+
+# ============================================================================
+# Principals and Errors
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated caller"""
+    user_id: str
+    claims: Dict[str, Any] = field(default_factory=dict)
+    # Unix time the credential stops being valid (None = no expiry)
+    expires_at: Optional[float] = None
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return self.expires_at is not None and (now or time.time()) >= self.expires_at
+
+
+class AuthError(Exception):
+    """Token rejected; `detail` is safe to return to the client"""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        self.detail = detail
+
+
+def bearer_token(authorization: Optional[str]) -> str:
+    """
+    Extract the token from an Authorization header
+
+    Args:
+        authorization: Header value, e.g. "Bearer <token>"
+
+    Returns:
+        The token
+
+    Raises:
+        AuthError: Missing header, other scheme or malformed value
+    """
+    if not authorization:
+        raise AuthError("Authorization header required")
+
+    parts = authorization.split()
+    if len(parts) != 2:
+        raise AuthError("Invalid authorization header format")
+    scheme, token = parts
+    if scheme.lower() != "bearer":
+        raise AuthError("Invalid authentication scheme")
+    return token
+
+
+# ============================================================================
+# JWT Verification
+# ============================================================================
+
+
+_RSA_HASHES = {"RS256": hashes.SHA256, "RS384": hashes.SHA384, "RS512": hashes.SHA512}
+_EC_PARAMS = {"ES256": (hashes.SHA256, "P-256", 32), "ES384": (hashes.SHA384, "P-384", 48)}
+_HMAC_HASHES = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_CURVES = {"P-256": ec.SECP256R1, "P-384": ec.SECP384R1}
+
+SUPPORTED_ALGORITHMS = (*_RSA_HASHES, *_EC_PARAMS, "EdDSA", *_HMAC_HASHES)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64url_int(segment: str) -> int:
+    return int.from_bytes(_b64url_decode(segment), "big")
+
+
+def public_key_from_jwk(jwk: Dict[str, Any]):
+    """
+    Build a public key from a JSON Web Key
+
+    Args:
+        jwk: RSA, EC (P-256/P-384) or OKP (Ed25519) key
+
+    Returns:
+        cryptography public key
+
+    Raises:
+        ValueError: Unsupported key type or curve
+    """
+    kty = jwk.get("kty")
+    if kty == "RSA":
+        return rsa.RSAPublicNumbers(_b64url_int(jwk["e"]), _b64url_int(jwk["n"])).public_key()
+    if kty == "EC" and jwk.get("crv") in _CURVES:
+        curve = _CURVES[jwk["crv"]]()
+        return ec.EllipticCurvePublicNumbers(
+            _b64url_int(jwk["x"]), _b64url_int(jwk["y"]), curve
+        ).public_key()
+    if kty == "OKP" and jwk.get("crv") == "Ed25519":
+        return Ed25519PublicKey.from_public_bytes(_b64url_decode(jwk["x"]))
+    raise ValueError(f"Unsupported JWK: kty={kty} crv={jwk.get('crv')}")
+
+
+def _verify_signature(alg: str, key: Any, signing_input: bytes, signature: bytes) -> bool:
+    """Check a JWS signature; the key's type must match the algorithm"""
+    try:
+        if alg in _HMAC_HASHES:
+            if not isinstance(key, bytes):
+                return False
+            expected = hmac.new(key, signing_input, _HMAC_HASHES[alg]).digest()
+            return hmac.compare_digest(expected, signature)
+
+        if alg in _RSA_HASHES:
+            if not isinstance(key, rsa.RSAPublicKey):
+                return False
+            key.verify(signature, signing_input, padding.PKCS1v15(), _RSA_HASHES[alg]())
+            return True
+
+        if alg in _EC_PARAMS:
+            hash_cls, curve_name, size = _EC_PARAMS[alg]
+            if (
+                not isinstance(key, ec.EllipticCurvePublicKey)
+                or key.curve.name != _CURVES[curve_name].name
+                or len(signature) != 2 * size
+            ):
+                return False
+            der = encode_dss_signature(
+                int.from_bytes(signature[:size], "big"), int.from_bytes(signature[size:], "big")
+            )
+            key.verify(der, signing_input, ec.ECDSA(hash_cls()))
+            return True
+
+        if alg == "EdDSA":
+            if not isinstance(key, Ed25519PublicKey):
+                return False
+            key.verify(signature, signing_input)
+            return True
+    except InvalidSignature:
+        return False
+    return False
+
+
+class JWKSCache:
+    """
+    Signing keys from a JWKS endpoint
+
+    Keys are refetched after `ttl_seconds`, or early when a token names an
+    unknown key ID (key rotation), at most once per `min_refresh_seconds`
+    so forged key IDs can't hammer the identity provider. Concurrent
+    refreshes share one fetch, and a failed refresh keeps the old keys.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float = 3600.0,
+        min_refresh_seconds: float = 30.0,
+        fetch: Optional[Callable[[str], Awaitable[Dict[str, Any]]]] = None
+    ):
+        """
+        Initialize JWKS cache
+
+        Args:
+            url: JWKS endpoint (e.g. https://issuer/.well-known/jwks.json)
+            ttl_seconds: How long fetched keys are trusted
+            min_refresh_seconds: Minimum spacing between fetches
+            fetch: Async callable returning the JWKS document (default: HTTP GET)
+        """
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_seconds = min_refresh_seconds
+        self._fetch = fetch or self._http_fetch
+        self._keys: Dict[str, Tuple[Any, Optional[str]]] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._refresh: Optional[asyncio.Task] = None
+        self.fetch_count = 0
+
+    @staticmethod
+    async def _http_fetch(url: str) -> Dict[str, Any]:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
+
+    async def get_key(self, kid: Optional[str]) -> Tuple[Any, Optional[str]]:
+        """
+        Look up a signing key
+
+        Args:
+            kid: Key ID from the token header (None matches a single-key set)
+
+        Returns:
+            Tuple of (public key, algorithm pinned by the JWK or None)
+
+        Raises:
+            AuthError: No such key after refreshing
+        """
+        if self._refresh is not None and not self._refresh.done():
+            await asyncio.shield(self._refresh)
+
+        now = time.monotonic()
+        due = self._attempted_at is None or now - self._attempted_at >= self.min_refresh_seconds
+        stale = self._fetched_at is None or now - self._fetched_at >= self.ttl_seconds
+        if due and (stale or self._lookup(kid) is None):
+            await self.refresh()
+
+        key = self._lookup(kid)
+        if key is None:
+            raise AuthError("Unknown signing key")
+        return key
+
+    def _lookup(self, kid: Optional[str]) -> Optional[Tuple[Any, Optional[str]]]:
+        if kid is None:
+            return next(iter(self._keys.values())) if len(self._keys) == 1 else None
+        return self._keys.get(kid)
+
+    async def refresh(self):
+        """Refetch the key set (joins a fetch already in progress)"""
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._refresh)
+
+    async def _load(self):
+        self.fetch_count += 1
+        self._attempted_at = time.monotonic()
+        try:
+            document = await self._fetch(self.url)
+        except Exception as e:
+            logger.warning(f"JWKS fetch from {self.url} failed, keeping {len(self._keys)} cached keys: {e}")
+            return
+
+        keys = {}
+        for index, jwk in enumerate(document.get("keys", [])):
+            if jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk.get("kid", f"#{index}")] = (public_key_from_jwk(jwk), jwk.get("alg"))
+            except (KeyError, ValueError) as e:
+                logger.warning(f"Skipping JWK {jwk.get('kid')}: {e}")
+
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+        logger.info(f"Loaded {len(keys)} signing keys from {self.url}")
+
+
+class JWTVerifier:
+    """Verifies JWT signatures and registered claims"""
+
+    def __init__(
+        self,
+        jwks: Optional[JWKSCache] = None,
+        secret: Optional[str] = None,
+        algorithms: Sequence[str] = ("RS256", "ES256", "EdDSA"),
+        issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        user_claim: str = "sub",
+        leeway_seconds: float = 30.0
+    ):
+        """
+        Initialize verifier
+
+        Args:
+            jwks: Key source for asymmetric algorithms
+            secret: Shared secret for HS* algorithms
+            algorithms: Accepted `alg` values ("none" is never accepted)
+            issuer: Required `iss` claim, if set
+            audience: Required entry in the `aud` claim, if set
+            user_claim: Claim holding the user ID
+            leeway_seconds: Clock skew tolerated on exp/nbf
+        """
+        if jwks is None and secret is None:
+            raise ValueError("JWTVerifier needs a JWKS source or a secret")
+        unsupported = set(algorithms) - set(SUPPORTED_ALGORITHMS)
+        if unsupported:
+            raise ValueError(f"Unsupported JWT algorithms: {sorted(unsupported)}")
+
+        self.jwks = jwks
+        self.secret = secret.encode() if secret else None
+        self.algorithms = frozenset(algorithms)
+        self.issuer = issuer
+        self.audience = audience
+        self.user_claim = user_claim
+        self.leeway_seconds = leeway_seconds
+
+    async def verify(self, token: str) -> Principal:
+        """
+        Verify a compact-serialized JWT
+
+        Args:
+            token: "header.payload.signature"
+
+        Returns:
+            Principal for the token's subject
+
+        Raises:
+            AuthError: Malformed token, bad signature or failed claim check
+        """
+        try:
+            header_b64, payload_b64, signature_b64 = token.split(".")
+            header = json.loads(_b64url_decode(header_b64))
+            signature = _b64url_decode(signature_b64)
+        except (ValueError, TypeError):
+            raise AuthError("Malformed token")
+
+        alg = header.get("alg") if isinstance(header, dict) else None
+        if alg not in self.algorithms:
+            raise AuthError("Token algorithm not allowed")
+
+        if alg in _HMAC_HASHES:
+            key, pinned_alg = self.secret, None
+        elif self.jwks is not None:
+            key, pinned_alg = await self.jwks.get_key(header.get("kid"))
+        else:
+            key, pinned_alg = None, None
+        if key is None or (pinned_alg is not None and pinned_alg != alg):
+            raise AuthError("No key for token algorithm")
+
+        signing_input = f"{header_b64}.{payload_b64}".encode("ascii")
+        if not _verify_signature(alg, key, signing_input, signature):
+            raise AuthError("Invalid token signature")
+
+        try:
+            claims = json.loads(_b64url_decode(payload_b64))
+        except ValueError:
+            raise AuthError("Malformed token")
+        if not isinstance(claims, dict):
+            raise AuthError("Malformed token")
+
+        return self._check_claims(claims)
+
+    def _check_claims(self, claims: Dict[str, Any]) -> Principal:
+        now = time.time()
+
+        exp = claims.get("exp")
+        if exp is not None and (not isinstance(exp, (int, float)) or now > exp + self.leeway_seconds):
+            raise AuthError("Token expired")
+        nbf = claims.get("nbf")
+        if nbf is not None and (not isinstance(nbf, (int, float)) or now < nbf - self.leeway_seconds):
+            raise AuthError("Token not yet valid")
+
+        if self.issuer is not None and claims.get("iss") != self.issuer:
+            raise AuthError("Invalid token issuer")
+        if self.audience is not None:
+            aud = claims.get("aud")
+            audiences = aud if isinstance(aud, list) else [aud]
+            if self.audience not in audiences:
+                raise AuthError("Invalid token audience")
+
+        user_id = claims.get(self.user_claim)
+        if not isinstance(user_id, str) or not user_id:
+            raise AuthError(f"Token has no '{self.user_claim}' claim")
+
+        return Principal(
+            user_id=user_id,
+            claims=claims,
+            expires_at=float(exp) + self.leeway_seconds if exp is not None else None,
+        )
+
+
+# ============================================================================
+# Principal Cache
+# ============================================================================
+
+
+class TokenCache:
+    """
+    Bounded LRU of verified token -> principal
+
+    Keyed by SHA-256 of the token so raw credentials aren't kept in memory.
+    An entry lives for `ttl_seconds` or until the token expires, whichever
+    comes first.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Entries kept before evicting least recently used
+            ttl_seconds: Longest time a verification result is reused
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[bytes, Tuple[Principal, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[Principal]:
+        """Cached principal for a token, or None"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.time():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, token: str, principal: Principal):
+        """Cache a verified principal"""
+        expires_at = time.time() + self.ttl_seconds
+        if principal.expires_at is not None:
+            expires_at = min(expires_at, principal.expires_at)
+
+        key = self._key(token)
+        self._entries[key] = (principal, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ============================================================================
+# Authenticator
+# ============================================================================
+
+
+class Authenticator:
+    """Resolves bearer tokens to principals, verifying each token once"""
+
+    def __init__(
+        self,
+        verifier: Optional[JWTVerifier] = None,
+        cache: Optional[TokenCache] = None,
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize authenticator
+
+        Args:
+            verifier: JWT verifier (None = development mode, token is the user ID)
+            cache: Verified principal cache (default: TokenCache())
+            metrics: Metrics collector (default: global)
+        """
+        self.verifier = verifier
+        self.cache = cache if cache is not None else TokenCache()
+        self.metrics = metrics or get_metrics()
+
+        if verifier is None:
+            logger.warning(
+                "JWT verification not configured (AI_PAL_JWT_JWKS_URL / AI_PAL_JWT_SECRET); "
+                "bearer tokens are used as user IDs"
+            )
+
+    @property
+    def verifies_tokens(self) -> bool:
+        return self.verifier is not None
+
+    async def authenticate(self, token: str) -> Principal:
+        """
+        Resolve a bearer token
+
+        Args:
+            token: Bearer token
+
+        Returns:
+            Principal
+
+        Raises:
+            AuthError: Token rejected
+        """
+        if self.verifier is None:
+            if not token:
+                raise AuthError("Invalid authorization header format")
+            return Principal(user_id=token)
+
+        principal = self.cache.get(token)
+        self.metrics.record_auth_cache_lookup(principal is not None, self.cache.hit_rate())
+        if principal is not None:
+            return principal
+
+        start = time.perf_counter()
+        try:
+            principal = await self.verifier.verify(token)
+        except AuthError as e:
+            self.metrics.record_auth_verification("rejected", time.perf_counter() - start)
+            logger.debug(f"Token rejected: {e.detail}")
+            raise
+        self.metrics.record_auth_verification("verified", time.perf_counter() - start)
+
+        self.cache.put(token, principal)
+        return principal
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "verifies_tokens": self.verifies_tokens,
+            "cached_principals": len(self.cache),
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+            "cache_hit_rate": self.cache.hit_rate(),
+        }
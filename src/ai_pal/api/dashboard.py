@@ -6,15 +6,17 @@ Provides aggregated metrics for the main dashboard overview.
 
 from fastapi import APIRouter, Path, HTTPException, status
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.monitoring import get_logger
-from ai_pal.storage.database import DatabaseManager, ARIRepository, GoalRepository, BackgroundTaskRepository
+from ai_pal.storage.database import DatabaseManager, DashboardRepository
+from ai_pal.storage.cached_repositories import CachedDashboardRepository, create_cached_dashboard_repo
 from ai_pal.cache.redis_cache import RedisCache
 from ai_pal.security.audit_log import AuditLogger
 
 logger = get_logger("ai_pal.api.dashboard")
-router = APIRouter(prefix="/api/users", tags=["Dashboard"])
+router = APIRouter(prefix="/api/users", tags=["Dashboard"], route_class=FastJSONRoute)
 
 # Store db_manager and cache references (set during app startup)
 _db_manager: Optional[DatabaseManager] = None
@@ -33,6 +35,19 @@ def set_cache(cache: RedisCache):
     _cache = cache
 
 
+def get_dashboard_repository() -> Union[CachedDashboardRepository, DashboardRepository]:
+    """Get dashboard repository (with caching if available)"""
+    if not _db_manager:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database not initialized"
+        )
+
+    if _cache and _cache.enabled:
+        return create_cached_dashboard_repo(_db_manager, _cache)
+    return DashboardRepository(_db_manager)
+
+
 # ===== RESPONSE MODELS =====
 
 class RecentActivity(BaseModel):
@@ -104,13 +119,18 @@ async def get_dashboard_summary(
             )
 
         # Get repositories
-        ari_repo = ARIRepository(_db_manager)
-        goal_repo = GoalRepository(_db_manager)
-        task_repo = BackgroundTaskRepository(_db_manager)
+        dashboard_repo = get_dashboard_repository()
         audit_logger = AuditLogger(log_to_file=True, log_to_console=False)
 
+        # One cache round trip (plus one grouped DB read for any misses)
+        user_data = await dashboard_repo.get_user_data(
+            user_id,
+            fields=["recent_ari", "active_goals", "tasks"],
+            ari_limit=2
+        )
+
         # ===== Gather ARI Metrics =====
-        ari_snapshots = await ari_repo.get_snapshots_by_user(user_id, limit=2)
+        ari_snapshots = user_data["recent_ari"]
         current_ari_score = 50.0
         ari_trend = "stable"
         ari_status = "stable"
@@ -143,16 +163,17 @@ async def get_dashboard_summary(
                 ari_status = "critical"
 
         # ===== Gather Goal Metrics =====
-        goals = await goal_repo.get_active_goals(user_id)
+        goals = user_data["active_goals"]
         active_goals = len([g for g in goals if g.get("status") == "active"])
         completed_goals = len([g for g in goals if g.get("status") == "completed"])
         total_goals = len(goals)
         goal_completion_rate = (completed_goals / total_goals * 100) if total_goals > 0 else 0
 
         # ===== Gather Task Metrics =====
-        pending_tasks = await task_repo.get_tasks_by_status(user_id, "pending", limit=1000)
-        completed_tasks = await task_repo.get_tasks_by_status(user_id, "completed", limit=1000)
-        failed_tasks = await task_repo.get_tasks_by_status(user_id, "failed", limit=1000)
+        tasks = user_data["tasks"]
+        pending_tasks = [t for t in tasks if t.get("status") == "pending"]
+        completed_tasks = [t for t in tasks if t.get("status") == "completed"]
+        failed_tasks = [t for t in tasks if t.get("status") == "failed"]
 
         # Count tasks completed today
         from datetime import datetime, timedelta
@@ -8,13 +8,14 @@ from fastapi import APIRouter, Depends, HTTPException, status, Path, Query
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.monitoring import get_logger
 from ai_pal.storage.database import DatabaseManager, GoalRepository
 from ai_pal.cache.redis_cache import RedisCache
 from ai_pal.storage.cached_repositories import CachedGoalRepository, create_cached_goal_repo
 
 logger = get_logger("ai_pal.api.goals")
-router = APIRouter(prefix="/api/users", tags=["FFE Goals"])
+router = APIRouter(prefix="/api/users", tags=["FFE Goals"], route_class=FastJSONRoute)
 
 # Store db_manager and cache references (set during app startup)
 _db_manager: Optional[DatabaseManager] = None
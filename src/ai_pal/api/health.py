@@ -10,10 +10,11 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import time
 import asyncio
-from ai_pal.monitoring import get_health_checker, get_logger
+from ai_pal.api.responses import FastJSONResponse, FastJSONRoute
+from ai_pal.monitoring import get_health_checker, get_logger, get_tracer
 
 logger = get_logger("ai_pal.api.health")
-router = APIRouter(prefix="/api/system", tags=["System Health"])
+router = APIRouter(prefix="/api/system", tags=["System Health"], route_class=FastJSONRoute)
 
 
 # ===== RESPONSE MODELS =====
@@ -286,6 +287,20 @@ async def get_services_health() -> List[ServiceStatus]:
     return response.services
 
 
+@router.get("/traces")
+async def get_traces() -> FastJSONResponse:
+    """
+    Export finished trace spans in Jaeger JSON format.
+
+    Span exports grow with traffic, so the body is rendered straight to
+    JSON bytes rather than through FastAPI's encoder.
+
+    Returns:
+        Jaeger-format traces
+    """
+    return FastJSONResponse(get_tracer().export_jaeger_format())
+
+
 # ===== CACHE HEALTH ENDPOINTS =====
 
 class CacheMetricsResponse(BaseModel):
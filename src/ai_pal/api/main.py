@@ -6,6 +6,7 @@ FastAPI application providing access to all AI-PAL features.
 Endpoints:
 - /health - Health check
 - /api/chat - Process AC system requests
+- /api/chat/stream - Streamed chat (Server-Sent Events)
 - /api/users - User profile management
 - /api/ffe - Fractal Flow Engine
 - /api/social - Social features
@@ -14,22 +15,26 @@ Endpoints:
 - /metrics - Prometheus metrics
 
 Authentication: Bearer token (JWT)
-Rate limiting: Configured per endpoint
+Rate limiting: Per user and per endpoint (see api.admission)
 """
 
 from fastapi import FastAPI, HTTPException, Depends, Header, status, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import asyncio
+import json
 import os
 
 # Import AI-PAL components
 from ai_pal.core.integrated_system import IntegratedACSystem, SystemConfig
+from ai_pal.core.privacy import get_analyzer_pool
 from ai_pal.monitoring import get_health_checker, get_metrics, get_logger
-from ai_pal.storage.database import DatabaseManager, BackgroundTaskRepository
+from ai_pal.storage.database import DatabaseManager, BackgroundTaskRepository, TaskStateWriter
 from ai_pal.cache.redis_cache import RedisCache
+from ai_pal.storage.state_store import StateStore, create_state_store
 from ai_pal.api import tasks as tasks_router
 from ai_pal.api import health as health_router
 from ai_pal.api import ari as ari_router
@@ -37,7 +42,28 @@ from ai_pal.api import goals as goals_router
 from ai_pal.api import audit as audit_router
 from ai_pal.api import dashboard as dashboard_router
 from ai_pal.api import predictions as predictions_router
-from ai_pal.api.websocket import manager as ws_manager, start_heartbeat_task
+from ai_pal.api.websocket import manager as ws_manager, start_heartbeat_task, stream_chat_frames
+from ai_pal.api.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    GenerationPool,
+    MemoryRateLimiter,
+    Priority,
+    RedisRateLimiter,
+    caller_identity,
+    parse_trusted_proxies,
+)
+from ai_pal.api.auth import (
+    Authenticator,
+    AuthError,
+    JWKSCache,
+    JWTVerifier,
+    Principal,
+    TokenCache,
+    bearer_token,
+)
+from ai_pal.api.responses import CompressionMiddleware, FastJSONResponse, FastJSONRoute
 from ai_pal.tasks.celery_app import app as celery_app
 from pathlib import Path
 
@@ -52,6 +78,24 @@ app = FastAPI(
     redoc_url="/redoc"
 )
 
+# orjson rendering for routes without a response_model (FastJSONRoute keeps
+# FastAPI's pydantic fast path for the ones with one)
+app.router.route_class = FastJSONRoute
+
+# Proxies (e.g. the ingress controller) whose X-Forwarded-For names the
+# client; unverified callers are rate limited per client address
+_TRUSTED_PROXIES = parse_trusted_proxies(os.getenv("AI_PAL_TRUSTED_PROXIES", ""))
+
+# Admission control: sheds over-limit requests (429) and overload (503)
+# before any work is done. Added before CORS so rejections still carry
+# CORS headers.
+app.add_middleware(
+    AdmissionMiddleware,
+    get_controller=lambda: get_admission_controller(),
+    resolve_principal=lambda scope: verified_principal(scope),
+    trusted_proxies=_TRUSTED_PROXIES,
+)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -61,15 +105,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip/brotli for large responses (dashboards, histories, audit logs);
+# outermost so every body, including error responses, is covered
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("AI_PAL_COMPRESSION_MIN_BYTES", "1024")),
+)
+
 # Initialize AC system (singleton)
 _ac_system: Optional[IntegratedACSystem] = None
 
+# Rate limits and generation concurrency (see get_admission_controller)
+_admission_controller: Optional[AdmissionController] = None
+
+# Bearer token verification with a verified-principal cache
+_authenticator: Optional[Authenticator] = None
+
 # Initialize database manager for background tasks (singleton)
 _db_manager: Optional[DatabaseManager] = None
 
+# Batched background task state writes (started/stopped with the app)
+_task_state_writer: Optional[TaskStateWriter] = None
+
 # Initialize Redis cache (singleton)
 _redis_cache: Optional[RedisCache] = None
 
+# Shared per-user state for multi-worker deployments (None = process-local)
+_state_store: Optional[StateStore] = None
+
+# Startup warm-up of AC system components (kept referenced while it runs)
+_warm_up_task: Optional[asyncio.Task] = None
+
+# Periodic journaling of buffered privacy budget changes
+_privacy_flush_task: Optional[asyncio.Task] = None
+
 
 def get_ac_system() -> IntegratedACSystem:
     """Get or create AC system instance"""
@@ -97,7 +166,7 @@ def get_ac_system() -> IntegratedACSystem:
             enable_personality_discovery=True,
             enable_teaching_mode=True,
         )
-        _ac_system = IntegratedACSystem(config=config)
+        _ac_system = IntegratedACSystem(config=config, state_store=get_state_store())
     return _ac_system
 
 
@@ -115,7 +184,9 @@ def get_db_manager() -> DatabaseManager:
             database_url=database_url,
             echo=os.getenv("DB_ECHO", "false").lower() == "true",
             pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
-            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10"))
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            sqlite_tuned=os.getenv("DB_SQLITE_TUNED", "true").lower() == "true",
+            sqlite_pool_size=int(os.getenv("DB_SQLITE_POOL_SIZE", "4"))
         )
 
         logger.info(f"Database manager initialized with {database_url}")
@@ -123,6 +194,18 @@ def get_db_manager() -> DatabaseManager:
     return _db_manager
 
 
+def get_task_state_writer() -> TaskStateWriter:
+    """Get or create the batched writer for background task state"""
+    global _task_state_writer
+    if _task_state_writer is None:
+        _task_state_writer = TaskStateWriter(
+            get_db_manager(),
+            max_batch_size=int(os.getenv("TASK_STATE_BATCH_SIZE", "100")),
+            flush_interval=float(os.getenv("TASK_STATE_FLUSH_INTERVAL", "1.0"))
+        )
+    return _task_state_writer
+
+
 def get_redis_cache() -> RedisCache:
     """Get or create Redis cache instance"""
     global _redis_cache
@@ -136,7 +219,8 @@ def get_redis_cache() -> RedisCache:
         _redis_cache = RedisCache(
             redis_url=redis_url,
             enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
-            ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "300"))
+            default_ttl=int(os.getenv("CACHE_TTL_SECONDS", "300")),
+            codec=os.getenv("CACHE_CODEC") or None
         )
 
         logger.info(f"Redis cache initialized with {redis_url}")
@@ -144,6 +228,124 @@ def get_redis_cache() -> RedisCache:
     return _redis_cache
 
 
+def get_state_store() -> Optional[StateStore]:
+    """
+    Get or create the shared state store
+
+    AI_PAL_STATE_BACKEND selects where privacy budgets live: "local"
+    (default), "database" or "redis". With Redis available, processes
+    sharing a backend invalidate each other's local caches. Privacy budgets
+    are the only state migrated so far; context memories, EDM debts, ARI
+    snapshots and FFE goals are still process-local to each worker.
+    """
+    global _state_store
+    backend = os.getenv("AI_PAL_STATE_BACKEND", "local").lower()
+    if _state_store is None and backend != "local":
+        cache = get_redis_cache()
+        _state_store = create_state_store(
+            backend,
+            db_manager=get_db_manager() if backend == "database" else None,
+            redis_cache=cache if backend == "redis" else None,
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0") if cache.enabled else None,
+            cache_ttl_seconds=float(os.getenv("AI_PAL_STATE_CACHE_TTL", "30"))
+        )
+
+    return _state_store
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """
+    Get or create the admission controller
+
+    Rate limits are shared across workers through Redis when caching is
+    enabled (per-worker otherwise). AI_PAL_MAX_CONCURRENT_GENERATIONS caps
+    generation requests in flight per worker; AI_PAL_GENERATION_QUEUE
+    bounds how many interactive requests may wait for a slot (background
+    requests get a quarter of that) and AI_PAL_GENERATION_QUEUE_WAIT how
+    long, in seconds. AI_PAL_ADMISSION_ENABLED=false turns it all off.
+    """
+    global _admission_controller
+    if os.getenv("AI_PAL_ADMISSION_ENABLED", "true").lower() != "true":
+        return None
+
+    if _admission_controller is None:
+        cache = get_redis_cache()
+        queue = int(os.getenv("AI_PAL_GENERATION_QUEUE", "64"))
+        _admission_controller = AdmissionController(
+            limiter=RedisRateLimiter(cache) if cache.enabled else MemoryRateLimiter(),
+            pool=GenerationPool(
+                max_concurrent=int(os.getenv("AI_PAL_MAX_CONCURRENT_GENERATIONS", "8")),
+                max_queue={
+                    Priority.INTERACTIVE: queue,
+                    Priority.BACKGROUND: max(1, queue // 4),
+                },
+                max_wait_seconds=float(os.getenv("AI_PAL_GENERATION_QUEUE_WAIT", "10"))
+            )
+        )
+
+    return _admission_controller
+
+
+def _jwt_algorithms(jwks_url: Optional[str], secret: Optional[str]) -> List[str]:
+    """
+    Accepted JWT algorithms
+
+    Args:
+        jwks_url: Configured JWKS URL, if any
+        secret: Configured shared secret, if any
+
+    Returns:
+        AI_PAL_JWT_ALGORITHMS (comma-separated, whitespace ignored), or the
+        asymmetric defaults with a JWKS URL plus HS256 with a secret
+    """
+    configured = os.getenv("AI_PAL_JWT_ALGORITHMS")
+    if configured is not None:
+        return [alg.strip() for alg in configured.split(",") if alg.strip()]
+
+    algorithms = ["RS256", "ES256", "EdDSA"] if jwks_url else []
+    if secret:
+        algorithms.append("HS256")
+    return algorithms
+
+
+def get_authenticator() -> Authenticator:
+    """
+    Get or create the authenticator
+
+    Tokens are verified as JWTs against AI_PAL_JWT_JWKS_URL (asymmetric
+    keys, refreshed on rotation) and/or AI_PAL_JWT_SECRET (HS256), limited
+    to AI_PAL_JWT_ALGORITHMS and checked against AI_PAL_JWT_ISSUER and
+    AI_PAL_JWT_AUDIENCE when set. Verified principals are cached for
+    AI_PAL_AUTH_CACHE_TTL seconds (never past token expiry), at most
+    AI_PAL_AUTH_CACHE_SIZE of them. With neither a JWKS URL nor a secret
+    configured, the bearer token is used as the user ID (development).
+    """
+    global _authenticator
+    if _authenticator is None:
+        jwks_url = os.getenv("AI_PAL_JWT_JWKS_URL")
+        secret = os.getenv("AI_PAL_JWT_SECRET")
+
+        verifier = None
+        if jwks_url or secret:
+            verifier = JWTVerifier(
+                jwks=JWKSCache(jwks_url) if jwks_url else None,
+                secret=secret,
+                algorithms=_jwt_algorithms(jwks_url, secret),
+                issuer=os.getenv("AI_PAL_JWT_ISSUER"),
+                audience=os.getenv("AI_PAL_JWT_AUDIENCE"),
+            )
+
+        _authenticator = Authenticator(
+            verifier=verifier,
+            cache=TokenCache(
+                max_entries=int(os.getenv("AI_PAL_AUTH_CACHE_SIZE", "10000")),
+                ttl_seconds=float(os.getenv("AI_PAL_AUTH_CACHE_TTL", "300"))
+            )
+        )
+
+    return _authenticator
+
+
 # ===== REQUEST/RESPONSE MODELS =====
 
 class ChatRequest(BaseModel):
@@ -151,14 +353,25 @@ class ChatRequest(BaseModel):
     query: str = Field(..., description="User's request/question", min_length=1)
     session_id: str = Field(..., description="Session identifier")
     context: Optional[Dict[str, Any]] = Field(default=None, description="Optional context")
+    wait_for_background: bool = Field(
+        default=False,
+        description="Wait for ARI and EDM monitoring so the response includes their results"
+    )
 
 
 class ChatResponse(BaseModel):
-    """Response from AC system"""
+    """
+    Response from AC system
+
+    ARI and EDM analysis run after the response is sent. ari_snapshot and
+    edm_analysis are filled in only when the request set
+    wait_for_background; otherwise they are null (read them from the final
+    `done` frame of /api/chat/stream or from /api/users/{user_id}/ari).
+    """
     response: str
     gate_results: Dict[str, Any]
-    ari_snapshot: Dict[str, Any]
-    edm_analysis: Dict[str, Any]
+    ari_snapshot: Optional[Dict[str, Any]] = None
+    edm_analysis: Optional[Dict[str, Any]] = None
     metadata: Dict[str, Any]
 
 
@@ -182,38 +395,81 @@ class GoalResponse(BaseModel):
 
 async def get_current_user(authorization: Optional[str] = Header(None)) -> str:
     """
-    Extract user from authorization header
+    Resolve the caller's user ID from the Authorization header
 
-    In production, this would validate JWT tokens.
-    For now, we extract user_id from bearer token.
+    The bearer token is verified as a JWT (see get_authenticator); each
+    token's signature is checked once and the principal cached.
     """
-    if not authorization:
+    try:
+        principal = await get_authenticator().authenticate(bearer_token(authorization))
+    except AuthError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header required",
+            detail=e.detail,
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return principal.user_id
+
+
+async def verified_principal(scope: Dict[str, Any]) -> Optional[str]:
+    """
+    Verified user ID of an HTTP request, for admission control
+
+    Returns None when JWT verification isn't configured (development
+    tokens are unverified) or the token is missing or rejected; such
+    callers are rate limited per client address. Verification goes
+    through the principal cache, so the route's own check is a cache hit.
+    """
+    authenticator = get_authenticator()
+    if not authenticator.verifies_tokens:
+        return None
+
+    authorization = None
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            authorization = value.decode("latin-1")
     try:
-        # Format: "Bearer <token>"
-        scheme, token = authorization.split()
-        if scheme.lower() != "bearer":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication scheme",
-            )
+        principal = await authenticator.authenticate(bearer_token(authorization))
+    except AuthError:
+        return None
+    return principal.user_id
 
-        # In production: validate JWT and extract user_id
-        # For now: use token as user_id (for development/testing)
-        user_id = token
 
-        return user_id
+async def authenticate_websocket(websocket: WebSocket, user_id: str) -> Optional[Principal]:
+    """
+    Authenticate a WebSocket connection once, before accepting it
 
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header format",
-        )
+    Browsers can't set headers on WebSocket requests, so the token may also
+    be passed as a `token` query parameter. In development mode (no JWT
+    configuration) a connection without a token is accepted for the user
+    in the path.
+
+    Args:
+        websocket: Connecting socket
+        user_id: User the connection is for
+
+    Returns:
+        Principal, or None if the connection was rejected (and closed)
+    """
+    authenticator = get_authenticator()
+    token = websocket.query_params.get("token")
+    try:
+        if token is None:
+            authorization = websocket.headers.get("authorization")
+            if authorization is None and not authenticator.verifies_tokens:
+                return Principal(user_id=user_id)
+            token = bearer_token(authorization)
+        principal = await authenticator.authenticate(token)
+    except AuthError as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+        return None
+
+    if principal.user_id != user_id:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Token is for another user")
+        return None
+
+    return principal
 
 
 # ===== HEALTH & METRICS =====
@@ -228,7 +484,7 @@ async def health_check():
     checker = get_health_checker()
     health = await checker.check_health()
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=200 if health.status.value == "healthy" else 503,
         content=health.to_dict()
     )
@@ -245,10 +501,26 @@ async def metrics():
     return metrics_collector.export_prometheus()
 
 
+@app.get("/health/ready", tags=["System"])
+async def readiness_check():
+    """
+    Readiness endpoint
+
+    Reports per-component warm status of the AC system. Returns 503 until
+    every critical component has finished initializing.
+    """
+    readiness = get_ac_system().readiness()
+
+    return FastJSONResponse(
+        status_code=200 if readiness["ready"] else 503,
+        content=readiness
+    )
+
+
 # ===== APP STARTUP/SHUTDOWN =====
 
 @app.on_event("startup")
-async def startup_event():
+async def startup_background_systems():
     """Initialize background systems on startup"""
     try:
         # Initialize database manager and create tables
@@ -279,9 +551,12 @@ async def startup_event():
         predictions_router.set_db_manager(db_manager)
         predictions_router.set_cache(cache)
 
-        # Setup Celery task base class with database
+        # Setup Celery task base class with database; task state goes
+        # through the batched writer, flushed in the background
         from ai_pal.tasks.base_task import AIpalTask
-        AIpalTask.setup_db(db_manager)
+        state_writer = get_task_state_writer()
+        await state_writer.start()
+        AIpalTask.setup_db(db_manager, state_writer=state_writer)
 
         logger.info("Background task system initialized")
 
@@ -295,9 +570,14 @@ async def startup_event():
 
 
 @app.on_event("shutdown")
-async def shutdown_event():
+async def shutdown_background_systems():
     """Clean up resources on shutdown"""
     try:
+        # Drain buffered task state before the connections go away
+        if _task_state_writer:
+            await _task_state_writer.stop()
+            logger.info("Task state writer drained")
+
         if _db_manager:
             await _db_manager.close()
             logger.info("Database connections closed")
@@ -353,12 +633,36 @@ async def websocket_user_endpoint(websocket: WebSocket, user_id: str):
     - Goal updates for their goals
     - System health changes
     - Critical events relevant to the user
+
+    Clients can also send {"type": "chat", "query": ..., "session_id": ...}
+    to stream a chat response back as chat_started, chat_token and a final
+    chat_complete (or chat_error) event.
+
+    The connection is authenticated once, on connect (bearer token in the
+    Authorization header or `token` query parameter), and closed when the
+    token expires.
     """
+    principal = await authenticate_websocket(websocket, user_id)
+    if principal is None:
+        return
+
+    # Chat frames are admitted like /api/chat/stream requests
+    caller = caller_identity(
+        websocket.scope,
+        principal.user_id if get_authenticator().verifies_tokens else None,
+        _TRUSTED_PROXIES,
+    )
+
     await ws_manager.connect(websocket, user_id)
     try:
         while True:
             # Keep connection alive and listen for messages
-            await websocket.receive_text()
+            message = await websocket.receive_text()
+            if principal.is_expired():
+                await ws_manager.disconnect(websocket, user_id)
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Token expired")
+                return
+            await _handle_ws_message(websocket, user_id, message, caller)
     except WebSocketDisconnect:
         await ws_manager.disconnect(websocket, user_id)
         logger.info(f"WebSocket connection closed for user {user_id}")
@@ -367,8 +671,69 @@ async def websocket_user_endpoint(websocket: WebSocket, user_id: str):
         await ws_manager.disconnect(websocket, user_id)
 
 
+async def _handle_ws_message(websocket: WebSocket, user_id: str, message: str, caller: str):
+    """
+    Dispatch a client message received on a user WebSocket
+
+    Chat requests go through admission control (rate limits and the
+    generation pool) per frame, as /api/chat/stream requests from caller.
+    """
+    try:
+        payload = json.loads(message)
+    except ValueError:
+        return  # Plain keepalive text
+
+    if not isinstance(payload, dict) or payload.get("type") != "chat":
+        return
+
+    try:
+        request = ChatRequest(**{k: v for k, v in payload.items() if k != "type"})
+    except Exception as e:
+        await stream_chat_frames(websocket, user_id, _single_frame(
+            {"type": "error", "error": f"Invalid chat request: {e}", "rejected": True}
+        ))
+        return
+
+    def frames():
+        return get_ac_system().stream_request(
+            user_id=user_id,
+            query=request.query,
+            session_id=request.session_id
+        )
+
+    controller = get_admission_controller()
+    if controller is None:
+        await stream_chat_frames(websocket, user_id, frames())
+        return
+
+    try:
+        async with controller.admit(caller, "/api/chat/stream", "POST"):
+            await stream_chat_frames(websocket, user_id, frames())
+    except AdmissionRejected as e:
+        await stream_chat_frames(websocket, user_id, _single_frame({
+            "type": "error",
+            "error": e.detail,
+            "rejected": True,
+            "reason": e.reason,
+            "retry_after": e.retry_after_header,
+        }))
+
+
+async def _single_frame(frame: Dict[str, Any]):
+    yield frame
+
+
+def _sse_event(frame: Dict[str, Any]) -> str:
+    """Format a stream frame as a Server-Sent Event"""
+    return f"event: {frame['type']}\ndata: {json.dumps(frame, default=str)}\n\n"
+
+
 # ===== CORE AC SYSTEM =====
 
+# Request summary fields filled in by the post-response tail; /api/chat
+# leaves them out unless it waited for the tail (wait_for_background)
+_BACKGROUND_SUMMARY_FIELDS = ("epistemic_debts_detected", "new_memories_created")
+
 @app.post("/api/chat", response_model=ChatResponse, tags=["Core"])
 async def process_chat(
     request: ChatRequest,
@@ -379,7 +744,8 @@ async def process_chat(
 
     This is the main entry point for AI-PAL interactions.
     Request goes through all Four Gates and returns response with
-    ARI, EDM, and other metadata.
+    gate results and request metadata. ARI and EDM monitoring run
+    after the response unless wait_for_background is set (see ChatResponse).
     """
     logger.info(
         "Processing chat request",
@@ -396,8 +762,13 @@ async def process_chat(
             user_id=user_id,
             query=request.query,
             session_id=request.session_id,
-            context=request.context
+            wait_for_background=request.wait_for_background
         )
+        if not result.success:
+            if result.metadata.get("rejected"):
+                # Privacy budget or gates refused the request
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=result.error)
+            raise RuntimeError(result.error)
 
         # Record metrics
         metrics = get_metrics()
@@ -405,38 +776,41 @@ async def process_chat(
             endpoint="/api/chat",
             method="POST",
             status_code=200,
-            latency_seconds=result.execution_time_ms / 1000,
-            model_used=result.model_used
+            latency_seconds=result.latency_ms / 1000,
+            model_used=result.selected_model
         )
 
         # Return response
+        summary = IntegratedACSystem.summarize_request(result)
+        excluded = ("type", "gates")
+        ari_snapshot = edm_analysis = None
+        if request.wait_for_background:
+            snapshot = result.agency_snapshot
+            ari_snapshot = {
+                "autonomy_retention": snapshot.autonomy_retention,
+                "delta_agency": snapshot.delta_agency,
+                "skill_development": snapshot.skill_development
+            } if snapshot else {}
+            edm_analysis = {
+                "epistemic_debts_detected": result.epistemic_debts_detected
+            }
+        else:
+            excluded += _BACKGROUND_SUMMARY_FIELDS
+
         return ChatResponse(
-            response=result.response,
+            response=result.model_response,
             gate_results={
-                "all_passed": result.gate_results.all_passed,
-                "gate1_passed": result.gate_results.gate1_passed,
-                "gate2_passed": result.gate_results.gate2_passed,
-                "gate3_passed": result.gate_results.gate3_passed,
-                "gate4_passed": result.gate_results.gate4_passed,
-                "violations": [v.__dict__ for v in result.gate_results.violations]
-            },
-            ari_snapshot={
-                "autonomy_retention": result.ari_snapshot.autonomy_retention,
-                "trend": result.ari_snapshot.trend,
-                "total_interactions": result.ari_snapshot.total_interactions
+                "all_passed": all(summary["gates"].values()),
+                "gates": summary["gates"],
+                "tribunal_override": result.tribunal_override
             },
-            edm_analysis={
-                "debt_score": result.edm_analysis.debt_score,
-                "flagged_claims": len(result.edm_analysis.flagged_claims),
-                "requires_review": result.edm_analysis.requires_review
-            },
-            metadata={
-                "execution_time_ms": result.execution_time_ms,
-                "model_used": result.model_used,
-                "cost_usd": result.cost_usd
-            }
+            ari_snapshot=ari_snapshot,
+            edm_analysis=edm_analysis,
+            metadata={k: v for k, v in summary.items() if k not in excluded}
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(
             "Chat request failed",
@@ -451,6 +825,47 @@ async def process_chat(
         )
 
 
+@app.post("/api/chat/stream", tags=["Core"])
+async def stream_chat(
+    request: ChatRequest,
+    user_id: str = Depends(get_current_user)
+):
+    """
+    Stream a chat response as Server-Sent Events
+
+    Privacy and gate checks run before the response starts: a rejected
+    request gets a 403 (or 500 on internal failure) instead of a stream.
+    Then one `start` event, a `token` event per generated chunk, and a final
+    `done` event carrying EDM, ARI, gate and timing metadata.
+    """
+    frames = get_ac_system().stream_request(
+        user_id=user_id,
+        query=request.query,
+        session_id=request.session_id
+    )
+
+    first = await frames.__anext__()
+    if first["type"] == "error":
+        raise HTTPException(
+            status_code=(
+                status.HTTP_403_FORBIDDEN if first.get("rejected")
+                else status.HTTP_500_INTERNAL_SERVER_ERROR
+            ),
+            detail=first["error"]
+        )
+
+    async def event_stream():
+        yield _sse_event(first)
+        async for frame in frames:
+            yield _sse_event(frame)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/api/users/{user_id}/profile", tags=["Users"])
 async def get_user_profile(
     user_id: str,
@@ -471,7 +886,11 @@ async def get_user_profile(
     ac_system = get_ac_system()
 
     try:
-        profile = await ac_system.get_user_profile(user_id)
+        profile = await ac_system.run_for_user(
+            user_id,
+            ac_system.get_user_profile,
+            user_id
+        )
 
         return {
             "user_id": profile.user_id,
@@ -523,7 +942,9 @@ async def create_goal(
             context["deadline"] = request.deadline
         context["priority"] = request.priority
 
-        goal = await ac_system.ffe_engine.ingest_goal(
+        goal = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.ingest_goal,
             user_id=user_id,
             goal_description=request.description,
             context=context
@@ -598,7 +1019,9 @@ async def create_5_block_plan(
         raise HTTPException(status_code=503, detail="FFE not available")
 
     try:
-        plan = await ac_system.ffe_engine.create_5_block_plan(
+        plan = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.create_5_block_plan,
             goal_id=goal_id,
             user_id=user_id
         )
@@ -643,7 +1066,9 @@ async def create_social_group(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        result = await ac_system.ffe_engine.social_interface.create_group(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.create_group,
             user_id=user_id,
             name=name,
             description=description,
@@ -671,7 +1096,9 @@ async def join_social_group(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        result = await ac_system.ffe_engine.social_interface.join_group(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.join_group,
             user_id=user_id,
             group_id=group_id
         )
@@ -702,7 +1129,9 @@ async def leave_social_group(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        result = await ac_system.ffe_engine.social_interface.leave_group(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.leave_group,
             user_id=user_id,
             group_id=group_id
         )
@@ -727,7 +1156,11 @@ async def list_my_groups(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        groups = await ac_system.ffe_engine.social_interface.list_my_groups(user_id)
+        groups = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.list_my_groups,
+            user_id
+        )
         return {"groups": groups}
 
     except Exception as e:
@@ -752,7 +1185,9 @@ async def get_group_feed(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        feed = await ac_system.ffe_engine.social_interface.view_group_feed(
+        feed = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.view_group_feed,
             user_id=user_id,
             group_id=group_id,
             limit=limit
@@ -796,7 +1231,9 @@ async def share_win(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        result = await ac_system.ffe_engine.social_interface.share_win(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.share_win,
             user_id=user_id,
             win_id=request.win_id,
             win_description=request.win_description,
@@ -833,7 +1270,9 @@ async def send_encouragement(
         raise HTTPException(status_code=503, detail="Social features not available")
 
     try:
-        result = await ac_system.ffe_engine.social_interface.send_encouragement(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.social_interface.send_encouragement,
             from_user_id=user_id,
             share_id=share_id,
             message=request.message
@@ -868,7 +1307,11 @@ async def start_personality_discovery(
         raise HTTPException(status_code=503, detail="Personality discovery not available")
 
     try:
-        session = await ac_system.ffe_engine.personality_discovery.start_discovery_session(user_id)
+        session = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_discovery.start_discovery_session,
+            user_id
+        )
 
         return {
             "session_id": session.session_id,
@@ -897,7 +1340,9 @@ async def get_next_question(
         raise HTTPException(status_code=503, detail="Personality discovery not available")
 
     try:
-        question = await ac_system.ffe_engine.personality_discovery.get_next_question(
+        question = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_discovery.get_next_question,
             session_id=session_id,
             user_id=user_id
         )
@@ -943,7 +1388,9 @@ async def record_answer(
         raise HTTPException(status_code=503, detail="Personality discovery not available")
 
     try:
-        await ac_system.ffe_engine.personality_discovery.record_answer(
+        await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_discovery.record_answer,
             session_id=session_id,
             user_id=user_id,
             question_id=question_id,
@@ -976,7 +1423,9 @@ async def complete_discovery(
         raise HTTPException(status_code=503, detail="Personality discovery not available")
 
     try:
-        result = await ac_system.ffe_engine.personality_discovery.complete_session(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_discovery.complete_session,
             session_id=session_id,
             user_id=user_id
         )
@@ -1017,7 +1466,9 @@ async def get_current_strengths(
         raise HTTPException(status_code=503, detail="Personality features not available")
 
     try:
-        strengths = await ac_system.ffe_engine.personality_connector.get_current_strengths(
+        strengths = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_connector.get_current_strengths,
             user_id=user_id,
             min_confidence=min_confidence
         )
@@ -1055,7 +1506,11 @@ async def get_personality_insights(
         raise HTTPException(status_code=503, detail="Personality features not available")
 
     try:
-        insights = await ac_system.ffe_engine.personality_connector.generate_insights(user_id)
+        insights = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.personality_connector.generate_insights,
+            user_id
+        )
         return insights
 
     except Exception as e:
@@ -1080,7 +1535,11 @@ async def start_teaching_mode(
         raise HTTPException(status_code=503, detail="Teaching features not available")
 
     try:
-        result = await ac_system.ffe_engine.teaching_interface.start_teaching_mode(user_id)
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.teaching_interface.start_teaching_mode,
+            user_id
+        )
 
         return {
             "message": "Teaching mode started! What would you like to teach me about?",
@@ -1122,7 +1581,9 @@ async def submit_teaching_content(
         raise HTTPException(status_code=503, detail="Teaching features not available")
 
     try:
-        result = await ac_system.ffe_engine.teaching_interface.submit_teaching_content(
+        result = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.teaching_interface.submit_teaching_content,
             user_id=user_id,
             topic=request.topic,
             explanation=request.explanation,
@@ -1151,7 +1612,11 @@ async def get_taught_topics(
         raise HTTPException(status_code=503, detail="Teaching features not available")
 
     try:
-        topics = await ac_system.ffe_engine.teaching_interface.get_taught_topics(user_id)
+        topics = await ac_system.run_for_user(
+            user_id,
+            ac_system.ffe_engine.teaching_interface.get_taught_topics,
+            user_id
+        )
         return {"taught_topics": topics}
 
     except Exception as e:
@@ -1343,13 +1808,66 @@ async def get_protected_files(
 
 # ===== STARTUP/SHUTDOWN =====
 
+def preload_pii_analyzers() -> None:
+    """
+    Load the PII analyzer pool's spaCy pipelines at import time
+
+    AI_PAL_PRELOAD_PII=true loads them for AI_PAL_PII_LANGUAGES (comma
+    separated, default "en") when this module is imported. Under a
+    fork-based server that imports the app before forking (gunicorn
+    --preload), workers then share one loaded pipeline copy-on-write;
+    otherwise each worker is simply warm before its first request.
+    """
+    if os.getenv("AI_PAL_PRELOAD_PII", "false").lower() != "true":
+        return
+
+    languages = [lang.strip() for lang in os.getenv("AI_PAL_PII_LANGUAGES", "en").split(",")]
+    try:
+        timings = get_analyzer_pool().preload(languages)
+        logger.info(f"Preloaded PII analyzers: {timings}")
+    except Exception as e:
+        # Scrubbers load on first use instead
+        logger.error(f"PII analyzer preload failed: {e}")
+
+
+preload_pii_analyzers()
+
+
+async def flush_privacy_budgets_periodically(interval: float) -> None:
+    """
+    Journal buffered privacy budget changes every `interval` seconds
+
+    Budget checks only journal once their flush interval has passed, so an
+    idle user's last changes would otherwise wait for their next request
+    or for shutdown.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await get_ac_system().flush_privacy_budgets()
+        except Exception as e:
+            logger.error(f"Periodic privacy budget flush failed: {e}")
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup"""
+    global _warm_up_task, _privacy_flush_task
     logger.info("AI-PAL API starting up")
 
-    # Initialize AC system
-    get_ac_system()
+    # Shared state: start listening for other processes' invalidations
+    state_store = get_state_store()
+    if state_store is not None:
+        await state_store.start()
+
+    # Initialize AC system; heavy components warm in parallel in the
+    # background so startup isn't blocked (see /health/ready)
+    _warm_up_task = asyncio.create_task(get_ac_system().warm_up())
+
+    # Budget changes reach the journal even when no further checks come
+    flush_interval = float(os.getenv("AI_PAL_PRIVACY_FLUSH_INTERVAL", "1.0"))
+    if flush_interval > 0:
+        _privacy_flush_task = asyncio.create_task(flush_privacy_budgets_periodically(flush_interval))
 
     logger.info("AI-PAL API ready")
 
@@ -1357,15 +1875,34 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    global _privacy_flush_task
     logger.info("AI-PAL API shutting down")
 
+    # AC system shutdown does the final flush
+    if _privacy_flush_task is not None:
+        _privacy_flush_task.cancel()
+        try:
+            await _privacy_flush_task
+        except asyncio.CancelledError:
+            pass
+        _privacy_flush_task = None
+
+    if _ac_system is not None:
+        try:
+            await _ac_system.shutdown()
+        except Exception as exc:
+            logger.error(f"Error shutting down AC system: {exc}", exc_info=True)
+
+    if _state_store is not None:
+        await _state_store.close()
+
 
 # ===== ERROR HANDLERS =====
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Custom HTTP exception handler"""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
@@ -1382,7 +1919,7 @@ async def general_exception_handler(request, exc):
     """General exception handler"""
     logger.error("Unhandled exception", exc_info=True)
 
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={
             "error": {
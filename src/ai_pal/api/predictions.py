@@ -9,6 +9,7 @@ from fastapi import APIRouter, Path, Query, HTTPException, status, Depends
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.monitoring import get_logger
 from ai_pal.storage.database import DatabaseManager, ARIRepository, GoalRepository
 from ai_pal.cache.redis_cache import RedisCache
@@ -16,7 +17,7 @@ from ai_pal.analytics.forecasting import ARIForecaster
 from ai_pal.analytics.goal_prediction import GoalPredictor
 
 logger = get_logger("ai_pal.api.predictions")
-router = APIRouter(prefix="/api/users", tags=["Predictions"])
+router = APIRouter(prefix="/api/users", tags=["Predictions"], route_class=FastJSONRoute)
 
 # Store db_manager and cache references (set during app startup)
 _db_manager: Optional[DatabaseManager] = None
@@ -17,11 +17,12 @@ from uuid import uuid4
 from loguru import logger
 
 # Import Celery tasks
+from ai_pal.api.responses import FastJSONRoute
 from ai_pal.tasks.celery_app import app as celery_app
 from ai_pal.storage.database import DatabaseManager, BackgroundTaskRepository
 
 # Create router
-router = APIRouter(prefix="/api/tasks", tags=["tasks"])
+router = APIRouter(prefix="/api/tasks", tags=["tasks"], route_class=FastJSONRoute)
 
 # Initialize database (will be set by main.py)
 _db_manager: Optional[DatabaseManager] = None
@@ -9,7 +9,7 @@ Provides real-time notifications for:
 """
 
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Set, Dict, Any, Optional
+from typing import Set, Dict, Any, AsyncIterator, Optional
 from datetime import datetime
 import json
 import asyncio
@@ -30,6 +30,19 @@ class EventType(str, Enum):
     HEARTBEAT = "heartbeat"
     CONNECTED = "connected"
     DISCONNECTED = "disconnected"
+    CHAT_STARTED = "chat_started"
+    CHAT_TOKEN = "chat_token"
+    CHAT_COMPLETE = "chat_complete"
+    CHAT_ERROR = "chat_error"
+
+
+# IntegratedACSystem.stream_request frame type -> WebSocket event type
+CHAT_FRAME_EVENTS = {
+    "start": EventType.CHAT_STARTED,
+    "token": EventType.CHAT_TOKEN,
+    "done": EventType.CHAT_COMPLETE,
+    "error": EventType.CHAT_ERROR,
+}
 
 
 class WebSocketEvent(BaseModel):
@@ -48,7 +61,7 @@ class WebSocketEvent(BaseModel):
             "user_id": self.user_id,
             "data": self.data,
             "metadata": self.metadata,
-        })
+        }, default=str)
 
 
 class ConnectionManager:
@@ -324,6 +337,30 @@ async def start_heartbeat_task():
 
 # ===== WEBSOCKET HELPER FUNCTIONS =====
 
+async def stream_chat_frames(
+    websocket: WebSocket,
+    user_id: str,
+    frames: AsyncIterator[Dict[str, Any]]
+):
+    """
+    Send streamed chat frames to a single WebSocket connection.
+
+    Args:
+        websocket: Connection that sent the chat request
+        user_id: User ID
+        frames: Frames from IntegratedACSystem.stream_request
+    """
+    async for frame in frames:
+        data = {k: v for k, v in frame.items() if k != "type"}
+        event = WebSocketEvent(
+            type=CHAT_FRAME_EVENTS[frame["type"]],
+            timestamp=datetime.utcnow().isoformat() + "Z",
+            user_id=user_id,
+            data=data,
+        )
+        await websocket.send_text(event.to_json())
+
+
 async def notify_task_status_change(
     task_id: str,
     task_type: str,
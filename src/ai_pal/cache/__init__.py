@@ -11,11 +11,25 @@ from .redis_cache import (
     ModelResponseCache,
     cached
 )
+from .codecs import (
+    CacheCodec,
+    CacheCodecError,
+    CacheSerializer,
+    JSONCodec,
+    MsgpackCodec,
+    register_cache_type
+)
 
 __all__ = [
     "RedisCache",
     "CacheKey",
     "UserDataCache",
     "ModelResponseCache",
-    "cached"
+    "cached",
+    "CacheCodec",
+    "CacheCodecError",
+    "CacheSerializer",
+    "JSONCodec",
+    "MsgpackCodec",
+    "register_cache_type"
 ]
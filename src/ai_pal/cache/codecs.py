@@ -0,0 +1,379 @@
+"""
+Cache Payload Codecs
+
+Pluggable serialization for values stored in Redis.
+
+Every payload written by RedisCache is wrapped in a small versioned frame so
+the wire format can change (or be rolled back) without breaking readers that
+are still running the previous release:
+
+    byte 0   magic (0xA1)
+    byte 1   frame version
+    byte 2   codec id (see CacheCodec.codec_id)
+    byte 3   flags (bit 0 = body is zlib-compressed)
+    byte 4+  codec body
+
+Readers pick the codec from the frame header, not from their own configuration,
+so a cluster can switch its write codec one worker at a time. 0xA1 is a UTF-8
+continuation byte, so a framed payload can never be mistaken for legacy text.
+
+Features:
+- Compact binary codec (msgpack) with typed extensions
+- JSON codec with the same typed encoding (datetime, date, Enum, dataclass, set)
+- Optional zlib compression above a size threshold
+- Read-compatibility with unframed legacy JSON/string payloads
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Type, Union
+import json
+import zlib
+
+from loguru import logger
+
+# Optional msgpack dependency
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    logger.warning("msgpack not installed. Run: pip install msgpack")
+
+
+FRAME_MAGIC = 0xA1
+FRAME_VERSION = 1
+FRAME_HEADER_SIZE = 4
+
+FLAG_COMPRESSED = 0x01
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cached payload cannot be encoded or decoded"""
+
+
+# ============================================================================
+# Type Registry
+# ============================================================================
+
+# Enums and dataclasses are encoded with their qualified name. Only registered
+# types are rebuilt on decode; anything else degrades to its plain value/dict so
+# a payload can never make the reader import arbitrary code.
+_TYPE_REGISTRY: Dict[str, Type] = {}
+
+
+def _type_name(cls: Type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def register_cache_type(cls: Type) -> Type:
+    """
+    Register an Enum or dataclass so it round-trips through the cache
+
+    Can be used as a class decorator.
+
+    Args:
+        cls: Enum subclass or dataclass type
+
+    Returns:
+        The class, unchanged
+    """
+    if not (isinstance(cls, type) and (issubclass(cls, Enum) or is_dataclass(cls))):
+        raise TypeError(f"Only Enum and dataclass types can be registered, got {cls!r}")
+    _TYPE_REGISTRY[_type_name(cls)] = cls
+    return cls
+
+
+def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+    # Shallow on purpose: nested values go back through the codec's own hooks
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _rebuild_enum(name: str, value: Any) -> Any:
+    cls = _TYPE_REGISTRY.get(name)
+    if cls is None:
+        return value
+    return cls(value)
+
+
+def _rebuild_dataclass(name: str, data: Dict[str, Any]) -> Any:
+    cls = _TYPE_REGISTRY.get(name)
+    if cls is None:
+        return data
+    return cls(**data)
+
+
+# ============================================================================
+# Codecs
+# ============================================================================
+
+class CacheCodec(ABC):
+    """Base class for cache body codecs"""
+
+    codec_id: int = 0
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value to the codec body"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Deserialize a codec body"""
+
+
+class JSONCodec(CacheCodec):
+    """
+    JSON codec with typed encoding
+
+    Non-JSON types are written as {"__cache_type__": <tag>, ...} objects.
+    """
+
+    codec_id = 1
+    name = "json"
+
+    _TYPE_TAG = "__cache_type__"
+
+    def _default(self, obj: Any) -> Any:
+        tag = self._TYPE_TAG
+        if isinstance(obj, Enum):
+            return {tag: "enum", "name": _type_name(type(obj)), "value": obj.value}
+        # datetime must be checked before date (it is a date subclass)
+        if isinstance(obj, datetime):
+            return {tag: "datetime", "value": obj.isoformat()}
+        if isinstance(obj, date):
+            return {tag: "date", "value": obj.isoformat()}
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {tag: "dataclass", "name": _type_name(type(obj)), "value": _dataclass_fields(obj)}
+        if isinstance(obj, (set, frozenset)):
+            return {tag: "set", "value": list(obj)}
+        raise TypeError(f"Object of type {type(obj).__name__} is not cache-serializable")
+
+    def _object_hook(self, obj: Dict[str, Any]) -> Any:
+        tag = obj.get(self._TYPE_TAG)
+        if tag is None:
+            return obj
+        if tag == "datetime":
+            return datetime.fromisoformat(obj["value"])
+        if tag == "date":
+            return date.fromisoformat(obj["value"])
+        if tag == "enum":
+            return _rebuild_enum(obj["name"], obj["value"])
+        if tag == "dataclass":
+            return _rebuild_dataclass(obj["name"], obj["value"])
+        if tag == "set":
+            return set(obj["value"])
+        return obj
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=self._default, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data, object_hook=self._object_hook)
+
+
+class MsgpackCodec(CacheCodec):
+    """
+    Compact binary codec backed by msgpack
+
+    Non-native types use msgpack extension types.
+    """
+
+    codec_id = 2
+    name = "msgpack"
+
+    EXT_DATETIME = 1
+    EXT_DATE = 2
+    EXT_ENUM = 3
+    EXT_DATACLASS = 4
+    EXT_SET = 5
+
+    def __init__(self):
+        if not MSGPACK_AVAILABLE:
+            raise CacheCodecError("msgpack codec requested but msgpack is not installed")
+
+    def _pack(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True)
+
+    def _default(self, obj: Any) -> Any:
+        if isinstance(obj, Enum):
+            return msgpack.ExtType(self.EXT_ENUM, self._pack([_type_name(type(obj)), obj.value]))
+        if isinstance(obj, datetime):
+            return msgpack.ExtType(self.EXT_DATETIME, obj.isoformat().encode("ascii"))
+        if isinstance(obj, date):
+            return msgpack.ExtType(self.EXT_DATE, obj.isoformat().encode("ascii"))
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return msgpack.ExtType(
+                self.EXT_DATACLASS,
+                self._pack([_type_name(type(obj)), _dataclass_fields(obj)])
+            )
+        if isinstance(obj, (set, frozenset)):
+            return msgpack.ExtType(self.EXT_SET, self._pack(list(obj)))
+        raise TypeError(f"Object of type {type(obj).__name__} is not cache-serializable")
+
+    def _unpack(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == self.EXT_DATETIME:
+            return datetime.fromisoformat(data.decode("ascii"))
+        if code == self.EXT_DATE:
+            return date.fromisoformat(data.decode("ascii"))
+        if code == self.EXT_ENUM:
+            name, value = self._unpack(data)
+            return _rebuild_enum(name, value)
+        if code == self.EXT_DATACLASS:
+            name, value = self._unpack(data)
+            return _rebuild_dataclass(name, value)
+        if code == self.EXT_SET:
+            return set(self._unpack(data))
+        return msgpack.ExtType(code, data)
+
+    def encode(self, value: Any) -> bytes:
+        return self._pack(value)
+
+    def decode(self, data: bytes) -> Any:
+        return self._unpack(data)
+
+
+_CODEC_CLASSES: Dict[str, Type[CacheCodec]] = {
+    JSONCodec.name: JSONCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(name: str) -> CacheCodec:
+    """
+    Create a codec by name
+
+    Args:
+        name: Codec name ("json" or "msgpack")
+
+    Returns:
+        Codec instance
+    """
+    try:
+        return _CODEC_CLASSES[name]()
+    except KeyError:
+        raise CacheCodecError(f"Unknown cache codec: {name}")
+
+
+def default_codec_name() -> str:
+    """Preferred codec for new writes in this environment"""
+    return MsgpackCodec.name if MSGPACK_AVAILABLE else JSONCodec.name
+
+
+# ============================================================================
+# Framed Serializer
+# ============================================================================
+
+class CacheSerializer:
+    """
+    Frames, compresses and decodes cache payloads
+
+    Writes always use the configured codec; reads accept any known codec and
+    unframed legacy payloads.
+    """
+
+    def __init__(
+        self,
+        codec: Optional[Union[str, CacheCodec]] = None,
+        compression_threshold: Optional[int] = 1024,
+        compression_level: int = 6
+    ):
+        """
+        Initialize serializer
+
+        Args:
+            codec: Codec instance or name for writes (defaults to msgpack when available)
+            compression_threshold: Compress bodies at least this many bytes (None disables)
+            compression_level: zlib compression level
+        """
+        if codec is None:
+            codec = default_codec_name()
+        self.codec = get_codec(codec) if isinstance(codec, str) else codec
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+        self._decoders: Dict[int, CacheCodec] = {self.codec.codec_id: self.codec}
+
+    def _decoder_for(self, codec_id: int) -> CacheCodec:
+        decoder = self._decoders.get(codec_id)
+        if decoder is None:
+            for codec_cls in _CODEC_CLASSES.values():
+                if codec_cls.codec_id == codec_id:
+                    decoder = codec_cls()
+                    self._decoders[codec_id] = decoder
+                    break
+            else:
+                raise CacheCodecError(f"Unknown codec id in cache frame: {codec_id}")
+        return decoder
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize a value into a framed payload
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Framed bytes
+        """
+        try:
+            body = self.codec.encode(value)
+        except (TypeError, ValueError, OverflowError) as e:
+            raise CacheCodecError(f"{self.codec.name} encode failed: {e}") from e
+
+        flags = 0
+        if self.compression_threshold is not None and len(body) >= self.compression_threshold:
+            compressed = zlib.compress(body, self.compression_level)
+            if len(compressed) < len(body):
+                body = compressed
+                flags |= FLAG_COMPRESSED
+
+        return bytes((FRAME_MAGIC, FRAME_VERSION, self.codec.codec_id, flags)) + body
+
+    def loads(self, payload: Union[bytes, str]) -> Any:
+        """
+        Deserialize a payload written by dumps() or by the legacy JSON path
+
+        Args:
+            payload: Raw value read from Redis
+
+        Returns:
+            Decoded value
+        """
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        if len(payload) < FRAME_HEADER_SIZE or payload[0] != FRAME_MAGIC:
+            return self._loads_legacy(payload)
+
+        version, codec_id, flags = payload[1], payload[2], payload[3]
+        if version > FRAME_VERSION:
+            raise CacheCodecError(f"Unsupported cache frame version: {version}")
+
+        body = payload[FRAME_HEADER_SIZE:]
+        try:
+            if flags & FLAG_COMPRESSED:
+                body = zlib.decompress(body)
+            return self._decoder_for(codec_id).decode(body)
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f"Corrupt cache payload: {e}") from e
+
+    @staticmethod
+    def _loads_legacy(payload: bytes) -> Any:
+        # Pre-codec writers stored dicts/lists as JSON and everything else as a
+        # plain string, so a non-JSON legacy value is returned as text.
+        try:
+            text = payload.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CacheCodecError(f"Unframed payload is not UTF-8: {e}") from e
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return text
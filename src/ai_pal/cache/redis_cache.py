@@ -15,16 +15,21 @@ Features:
 - Async operations
 - Connection pooling
 - Graceful fallback when Redis unavailable
+- Pluggable payload codecs (see cache.codecs)
 """
 
 from datetime import timedelta
-from typing import Optional, Any, Dict, List
-import json
+from typing import Optional, Any, Dict, List, Union
 import hashlib
+import inspect
+import time
 from functools import wraps
 
 from loguru import logger
 
+from ai_pal.cache.codecs import CacheCodec, CacheCodecError, CacheSerializer
+from ai_pal.monitoring.metrics import MetricsCollector, get_metrics
+
 # Optional Redis dependency
 try:
     import redis.asyncio as redis
@@ -41,9 +46,11 @@ class CacheKey:
     # User data
     USER_PROFILE = "user:profile:{user_id}"
     USER_ARI_LATEST = "user:ari:latest:{user_id}"
+    USER_ARI_RECENT = "user:ari:recent:{user_id}"
     USER_ARI_HISTORY = "user:ari:history:{user_id}:{days}"
     USER_GOALS_ACTIVE = "user:goals:active:{user_id}"
     USER_STRENGTHS = "user:strengths:{user_id}"
+    USER_TASKS = "user:tasks:{user_id}:all"
 
     # FFE data
     GOAL_DETAILS = "goal:{goal_id}"
@@ -66,7 +73,9 @@ class RedisCache:
         redis_url: str = "redis://localhost:6379/0",
         default_ttl: int = 300,  # 5 minutes
         max_connections: int = 10,
-        enabled: bool = True
+        enabled: bool = True,
+        codec: Optional[Union[str, CacheCodec]] = None,
+        compression_threshold: Optional[int] = 1024
     ):
         """
         Initialize Redis cache
@@ -76,10 +85,18 @@ class RedisCache:
             default_ttl: Default TTL in seconds
             max_connections: Max connections in pool
             enabled: Enable caching (set to False to disable)
+            codec: Payload codec for writes ("msgpack", "json" or a CacheCodec).
+                Reads accept every known codec regardless of this setting.
+            compression_threshold: Compress payloads at least this many bytes
+                (None disables compression)
         """
         self.redis_url = redis_url
         self.default_ttl = default_ttl
         self.enabled = enabled and REDIS_AVAILABLE
+        self.serializer = CacheSerializer(
+            codec=codec,
+            compression_threshold=compression_threshold
+        )
 
         if not REDIS_AVAILABLE:
             logger.warning("Redis caching disabled: redis package not installed")
@@ -96,7 +113,7 @@ class RedisCache:
         self.pool = ConnectionPool.from_url(
             redis_url,
             max_connections=max_connections,
-            decode_responses=True  # Automatically decode bytes to strings
+            decode_responses=False  # Payloads are framed bytes (see cache.codecs)
         )
 
         # Create client
@@ -137,12 +154,11 @@ class RedisCache:
         try:
             value = await self.client.get(key)
             if value is not None:
-                # Try to deserialize JSON
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    # Not JSON, return as-is
-                    return value
+                return self.serializer.loads(value)
+            return None
+        except CacheCodecError as e:
+            # Undecodable payloads are treated as a miss so callers repopulate them
+            logger.warning(f"Redis get decode error for key {key}: {e}")
             return None
         except Exception as e:
             logger.error(f"Redis get error for key {key}: {e}")
@@ -169,14 +185,15 @@ class RedisCache:
             return False
 
         try:
-            # Serialize to JSON if needed
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
+            payload = self.serializer.dumps(value)
 
             # Set with TTL
             ttl = ttl or self.default_ttl
-            await self.client.setex(key, ttl, value)
+            await self.client.setex(key, ttl, payload)
             return True
+        except CacheCodecError as e:
+            logger.error(f"Redis set encode error for key {key}: {e}")
+            return False
         except Exception as e:
             logger.error(f"Redis set error for key {key}: {e}")
             return False
@@ -304,9 +321,9 @@ class RedisCache:
             for key, value in zip(keys, values):
                 if value is not None:
                     try:
-                        result[key] = json.loads(value)
-                    except json.JSONDecodeError:
-                        result[key] = value
+                        result[key] = self.serializer.loads(value)
+                    except CacheCodecError as e:
+                        logger.warning(f"Redis get_many decode error for key {key}: {e}")
             return result
         except Exception as e:
             logger.error(f"Redis get_many error: {e}")
@@ -315,7 +332,8 @@ class RedisCache:
     async def set_many(
         self,
         items: Dict[str, Any],
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None
     ) -> bool:
         """
         Set multiple values at once
@@ -323,6 +341,7 @@ class RedisCache:
         Args:
             items: Dict of key -> value
             ttl: TTL in seconds (applies to all keys)
+            ttls: Optional per-key TTL overrides
 
         Returns:
             True if successful
@@ -332,17 +351,16 @@ class RedisCache:
 
         try:
             # Serialize values
-            serialized = {}
-            for key, value in items.items():
-                if isinstance(value, (dict, list)):
-                    serialized[key] = json.dumps(value)
-                else:
-                    serialized[key] = value
+            serialized = {
+                key: self.serializer.dumps(value)
+                for key, value in items.items()
+            }
 
             # Use pipeline for efficiency
+            ttls = ttls or {}
             async with self.client.pipeline() as pipe:
                 for key, value in serialized.items():
-                    ttl_val = ttl or self.default_ttl
+                    ttl_val = ttls.get(key) or ttl or self.default_ttl
                     pipe.setex(key, ttl_val, value)
                 await pipe.execute()
 
@@ -375,11 +393,70 @@ class RedisCache:
 # Caching Decorators
 # ============================================================================
 
+# Stored in place of a None result when negative caching is enabled
+NEGATIVE_CACHE_MARKER = "__ai_pal_cached_none__"
+
+_MISSING = object()
+
+
+def _build_key_extractor(func, key_args: Optional[List[str]]):
+    """
+    Precompute how to pull key arguments out of a call
+
+    Resolves parameter positions and defaults once, at decoration time, so the
+    per-call work is plain tuple/dict indexing instead of Signature.bind().
+
+    Args:
+        func: Decorated function
+        key_args: Argument names used in the key (None = all parameters)
+
+    Returns:
+        Function mapping (args, kwargs) to a dict of key values
+    """
+    params = inspect.signature(func).parameters
+    names = key_args if key_args else list(params)
+
+    # (name, position or None, keyword-passable, default, kind)
+    plan = []
+    named = set()
+    for name in names:
+        param = params.get(name)
+        if param is None:
+            continue
+        named.add(name)
+        position = None
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD, param.VAR_POSITIONAL):
+            position = list(params).index(name)
+        default = param.default if param.default is not param.empty else _MISSING
+        plan.append((name, position, param.kind != param.POSITIONAL_ONLY, default, param.kind))
+
+    plan = tuple(plan)
+
+    def extract(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        values = {}
+        for name, position, by_keyword, default, kind in plan:
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                values[name] = args[position:]
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                values[name] = {k: v for k, v in kwargs.items() if k not in named}
+            elif position is not None and position < len(args):
+                values[name] = args[position]
+            elif by_keyword and name in kwargs:
+                values[name] = kwargs[name]
+            elif default is not _MISSING:
+                values[name] = default
+        return values
+
+    return extract
+
+
 def cached(
     cache: RedisCache,
     key_template: str,
     ttl: Optional[int] = None,
-    key_args: Optional[List[str]] = None
+    key_args: Optional[List[str]] = None,
+    negative_ttl: Optional[int] = None,
+    metrics: Optional[MetricsCollector] = None
 ):
     """
     Decorator to cache function results
@@ -395,25 +472,22 @@ def cached(
         key_template: Key template with {arg_name} placeholders
         ttl: Cache TTL in seconds
         key_args: List of argument names to use in key (if None, uses all)
+        negative_ttl: Cache None results for this many seconds
+            (None disables negative caching)
+        metrics: Collector for hit/miss/latency metrics (defaults to global)
     """
     def decorator(func):
+        extract_key_values = _build_key_extractor(func, key_args)
+        metric_name = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Build cache key from function arguments
-            import inspect
-            sig = inspect.signature(func)
-            bound = sig.bind(*args, **kwargs)
-            bound.apply_defaults()
-
-            # Extract key arguments
-            if key_args:
-                key_values = {k: bound.arguments[k] for k in key_args if k in bound.arguments}
-            else:
-                key_values = bound.arguments
+            start = time.perf_counter()
+            collector = metrics or get_metrics()
 
             # Format cache key
             try:
-                cache_key = key_template.format(**key_values)
+                cache_key = key_template.format(**extract_key_values(args, kwargs))
             except KeyError as e:
                 logger.warning(f"Cache key formatting failed: {e}")
                 # Fall through to execute function
@@ -423,7 +497,13 @@ def cached(
             cached_value = await cache.get(cache_key)
             if cached_value is not None:
                 logger.debug(f"Cache hit: {cache_key}")
-                return cached_value
+                negative = cached_value == NEGATIVE_CACHE_MARKER
+                collector.record_cache_lookup(
+                    metric_name, hit=True,
+                    latency_seconds=time.perf_counter() - start,
+                    negative=negative
+                )
+                return None if negative else cached_value
 
             # Execute function
             logger.debug(f"Cache miss: {cache_key}")
@@ -432,7 +512,13 @@ def cached(
             # Cache result
             if result is not None:
                 await cache.set(cache_key, result, ttl=ttl)
+            elif negative_ttl:
+                await cache.set(cache_key, NEGATIVE_CACHE_MARKER, ttl=negative_ttl)
 
+            collector.record_cache_lookup(
+                metric_name, hit=False,
+                latency_seconds=time.perf_counter() - start
+            )
             return result
 
         return wrapper
@@ -452,7 +538,8 @@ class UserDataCache:
     async def get_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get cached user profile"""
         key = CacheKey.USER_PROFILE.format(user_id=user_id)
-        return await self.cache.get(key)
+        profile = await self.cache.get(key)
+        return None if profile == NEGATIVE_CACHE_MARKER else profile
 
     async def set_profile(self, user_id: str, profile: Dict[str, Any], ttl: int = 600):
         """Cache user profile"""
@@ -467,7 +554,8 @@ class UserDataCache:
     async def get_latest_ari(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get cached latest ARI snapshot"""
         key = CacheKey.USER_ARI_LATEST.format(user_id=user_id)
-        return await self.cache.get(key)
+        snapshot = await self.cache.get(key)
+        return None if snapshot == NEGATIVE_CACHE_MARKER else snapshot
 
     async def set_latest_ari(self, user_id: str, snapshot: Dict[str, Any], ttl: int = 300):
         """Cache latest ARI snapshot"""
@@ -28,6 +28,7 @@ from rich import print as rprint
 from loguru import logger
 
 from .core.integrated_system import IntegratedACSystem, SystemConfig
+from .monitoring.text_analysis import get_text_analyzer
 
 # Initialize Typer app
 app = typer.Typer(
@@ -615,12 +616,15 @@ async def _chat_session(system: IntegratedACSystem, user_id: str, local_only: bo
             # Show processing indicator
             console.print("\n[dim]Thinking...[/dim]\n")
 
+            # Tokenized once, shared by the ARI, RDI and PII analyses below
+            analyzed_input = get_text_analyzer().analyze(user_input)
+
             # === ARI ENGINE: Passive Lexical Analysis ===
             if system.ari_engine:
                 try:
                     await system.ari_engine.lexical_analyzer.analyze_text(
                         user_id=user_id,
-                        text=user_input,
+                        text=analyzed_input,
                         text_type="chat_message"
                     )
                 except Exception as e:
@@ -633,7 +637,7 @@ async def _chat_session(system: IntegratedACSystem, user_id: str, local_only: bo
                 try:
                     rdi_score, drift_signals = await system.rdi_monitor.analyze_input(
                         user_id=user_id,
-                        user_input=user_input,
+                        user_input=analyzed_input,
                         domain=None
                     )
 
@@ -649,7 +653,7 @@ async def _chat_session(system: IntegratedACSystem, user_id: str, local_only: bo
             processed_input = user_input
             if system.privacy_manager:
                 try:
-                    detections = await system.privacy_manager.detect_pii(user_input)
+                    detections = await system.privacy_manager.detect_pii(analyzed_input)
                     if detections:  # List of PIIDetection objects
                         # Scrub PII from input
                         for detection in detections:
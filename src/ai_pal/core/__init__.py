@@ -3,7 +3,7 @@
 from ai_pal.core.orchestrator import Orchestrator
 from ai_pal.core.config import Settings
 from ai_pal.core.hardware import HardwareDetector
-from ai_pal.core.privacy import PIIScrubber
+from ai_pal.core.privacy import PIIScrubber, AnalyzerPool, get_analyzer_pool
 from ai_pal.core.integrated_system import (
     IntegratedACSystem,
     SystemConfig,
@@ -11,15 +11,22 @@ from ai_pal.core.integrated_system import (
     RequestStage,
     create_default_system,
 )
+from ai_pal.core.lazy import LazyComponent, ComponentState
+from ai_pal.core.shards import UserMailboxes
 
 __all__ = [
     "Orchestrator",
     "Settings",
     "HardwareDetector",
     "PIIScrubber",
+    "AnalyzerPool",
+    "get_analyzer_pool",
     "IntegratedACSystem",
     "SystemConfig",
     "ProcessedRequest",
     "RequestStage",
     "create_default_system",
+    "LazyComponent",
+    "ComponentState",
+    "UserMailboxes",
 ]
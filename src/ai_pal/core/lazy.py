@@ -0,0 +1,175 @@
+"""
+Lazy Component Initialization
+
+Wraps expensive subsystems (embedding models, monitors that replay their
+JSON history from disk, provider clients) in proxies that build the real
+object on first use. Startup code can warm selected components ahead of
+time, in parallel worker threads, and report per-component readiness.
+"""
+
+import asyncio
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable
+
+from loguru import logger
+
+
+class ComponentState(Enum):
+    """Initialization state of a lazy component"""
+    COLD = "cold"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+
+# Attributes stored on the proxy itself; everything else is forwarded
+_PROXY_ATTRS = frozenset({
+    "_lazy_name", "_lazy_factory", "_lazy_critical", "_lazy_instance",
+    "_lazy_state", "_lazy_error", "_lazy_init_ms", "_lazy_lock",
+})
+
+
+class LazyComponent:
+    """
+    Proxy that builds a component on first attribute access
+
+    Attribute reads, writes and deletes are forwarded to the real instance,
+    so callers (and unittest.mock.patch.object) can use the proxy in place
+    of the component. A proxy is always truthy: disabled components stay
+    None, so existing `if self.component:` checks keep their meaning.
+
+    Initialization is guarded by a lock and runs once; concurrent first
+    users wait for the same build. A failed build is re-raised to every
+    caller until retried via lazy_warm().
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], critical: bool = False):
+        """
+        Initialize lazy component
+
+        Args:
+            name: Component name (for readiness reports and logs)
+            factory: Zero-argument callable that builds the component
+            critical: Warm this component during startup
+        """
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_critical", critical)
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_state", ComponentState.COLD)
+        object.__setattr__(self, "_lazy_error", None)
+        object.__setattr__(self, "_lazy_init_ms", None)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+
+    # Proxy API is prefixed with lazy_ so it can't shadow component attributes
+
+    @property
+    def lazy_name(self) -> str:
+        return self._lazy_name
+
+    @property
+    def lazy_critical(self) -> bool:
+        return self._lazy_critical
+
+    @property
+    def lazy_state(self) -> ComponentState:
+        return self._lazy_state
+
+    def lazy_get(self) -> Any:
+        """
+        Return the component, building it if necessary
+
+        Returns:
+            The real component instance
+        """
+        if self._lazy_state == ComponentState.READY:
+            return self._lazy_instance
+
+        with self._lazy_lock:
+            if self._lazy_state == ComponentState.READY:
+                return self._lazy_instance
+            if self._lazy_state == ComponentState.FAILED:
+                raise self._lazy_error
+
+            object.__setattr__(self, "_lazy_state", ComponentState.WARMING)
+            start = time.perf_counter()
+            try:
+                instance = self._lazy_factory()
+            except Exception as e:
+                object.__setattr__(self, "_lazy_state", ComponentState.FAILED)
+                object.__setattr__(self, "_lazy_error", e)
+                logger.error(f"Failed to initialize {self._lazy_name}: {e}")
+                raise
+
+            object.__setattr__(self, "_lazy_init_ms", (time.perf_counter() - start) * 1000)
+            object.__setattr__(self, "_lazy_instance", instance)
+            object.__setattr__(self, "_lazy_state", ComponentState.READY)
+            logger.info(f"Initialized {self._lazy_name} in {self._lazy_init_ms:.0f}ms")
+            return instance
+
+    async def lazy_warm(self) -> bool:
+        """
+        Build the component in a worker thread
+
+        Returns:
+            True if the component is ready
+        """
+        if self._lazy_state == ComponentState.FAILED:
+            # Allow a retry
+            object.__setattr__(self, "_lazy_state", ComponentState.COLD)
+            object.__setattr__(self, "_lazy_error", None)
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self.lazy_get)
+        except Exception:
+            return False
+        return True
+
+    def lazy_status(self) -> Dict[str, Any]:
+        """Readiness report for this component"""
+        return {
+            "state": self._lazy_state.value,
+            "critical": self._lazy_critical,
+            "init_ms": self._lazy_init_ms,
+            "error": str(self._lazy_error) if self._lazy_error else None,
+        }
+
+    def __getattr__(self, attr: str) -> Any:
+        # Only called for attributes not found on the proxy itself
+        if attr.startswith("_lazy_"):
+            # Half-constructed proxy (e.g. copy/pickle): don't recurse
+            raise AttributeError(attr)
+        return getattr(self.lazy_get(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        if attr in _PROXY_ATTRS:
+            object.__setattr__(self, attr, value)
+        else:
+            setattr(self.lazy_get(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.lazy_get(), attr)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"<LazyComponent {self._lazy_name} ({self._lazy_state.value})>"
+
+
+async def warm_components(components: Iterable[LazyComponent]) -> Dict[str, bool]:
+    """
+    Warm several lazy components in parallel
+
+    Args:
+        components: Components to build
+
+    Returns:
+        Dict of component name -> whether it is ready
+    """
+    components = list(components)
+    results = await asyncio.gather(*(c.lazy_warm() for c in components))
+    return {c.lazy_name: ok for c, ok in zip(components, results)}
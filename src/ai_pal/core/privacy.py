@@ -1,14 +1,36 @@
-"""Privacy and PII scrubbing functionality."""
-
-import re
+"""Privacy and PII scrubbing functionality.
+
+Presidio's AnalyzerEngine loads a spaCy pipeline, so engines live in a
+process-wide AnalyzerPool and are built once per language. Preloading the
+pool before worker processes fork (e.g. gunicorn --preload with
+AI_PAL_PRELOAD_PII=true) lets every worker share the loaded pipeline
+copy-on-write instead of loading its own.
+
+Scrubbing runs in stages, each timed (ScrubResult.stage_ms and the
+ai_pal_pii_scrub_stage_seconds histogram):
+- prefilter: cheap check for anything the analyzer could flag; texts
+  without such cues skip the NLP model (the regex-only fast path)
+- nlp: Presidio analysis (batched through the spaCy pipeline in scrub_batch)
+- regex: API key, token and crypto address patterns
+- anonymize: replacement of detected entities
+"""
+
+import gc
 import hashlib
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+from dataclasses import dataclass, field
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpEngineProvider
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import OperatorConfig
 from loguru import logger
 
+from ai_pal.monitoring.metrics import MetricsCollector, get_metrics
+
 
 @dataclass
 class PIIDetection:
@@ -30,6 +52,7 @@ class ScrubResult:
     scrubbed_text: str
     detections: List[PIIDetection]
     pii_detected: bool
+    stage_ms: Dict[str, float] = field(default_factory=dict)  # Latency per scrub stage
 
     def __str__(self) -> str:
         """String representation."""
@@ -45,6 +68,174 @@ class ScrubResult:
         return "\n".join(lines)
 
 
+# ============================================================================
+# Warm Analyzer Pool
+# ============================================================================
+
+# spaCy pipeline loaded for each language
+DEFAULT_SPACY_MODELS = {"en": "en_core_web_lg"}
+
+
+class AnalyzerPool:
+    """
+    Process-wide warm Presidio engines, one analyzer per language.
+
+    Engines are only read once built, so one instance serves every
+    scrubber and thread in the process. preload() builds them up front;
+    called before worker processes fork, the workers inherit the loaded
+    pipelines instead of each loading its own.
+    """
+
+    def __init__(self, models: Optional[Dict[str, str]] = None):
+        """
+        Initialize pool (nothing is loaded until first use or preload).
+
+        Args:
+            models: spaCy model per language code (default: DEFAULT_SPACY_MODELS)
+        """
+        self.models = dict(models or DEFAULT_SPACY_MODELS)
+        self.load_seconds: Dict[str, float] = {}
+        self.preloaded_pid: Optional[int] = None
+        self._analyzers: Dict[str, AnalyzerEngine] = {}
+        self._batch_analyzers: Dict[str, BatchAnalyzerEngine] = {}
+        self._anonymizer: Optional[AnonymizerEngine] = None
+        self._lock = threading.Lock()
+
+    def _build_analyzer(self, language: str) -> AnalyzerEngine:
+        """Load the spaCy pipeline for language and wrap it in an analyzer."""
+        if language not in self.models:
+            raise ValueError(f"No spaCy model configured for language '{language}'")
+
+        provider = NlpEngineProvider(nlp_configuration={
+            "nlp_engine_name": "spacy",
+            "models": [{"lang_code": language, "model_name": self.models[language]}],
+        })
+        return AnalyzerEngine(
+            nlp_engine=provider.create_engine(), supported_languages=[language]
+        )
+
+    def _install(self, language: str, analyzer: AnalyzerEngine) -> None:
+        self._analyzers[language] = analyzer
+        self._batch_analyzers[language] = BatchAnalyzerEngine(analyzer_engine=analyzer)
+
+    def analyzer(self, language: str = "en") -> AnalyzerEngine:
+        """Get the analyzer for language, loading it on first use."""
+        analyzer = self._analyzers.get(language)
+        if analyzer is None:
+            with self._lock:
+                analyzer = self._analyzers.get(language)
+                if analyzer is None:
+                    logger.info(f"Loading PII analyzer for '{language}'...")
+                    start = time.perf_counter()
+                    analyzer = self._build_analyzer(language)
+                    self._install(language, analyzer)
+                    self.load_seconds[language] = time.perf_counter() - start
+                    logger.info(
+                        f"PII analyzer for '{language}' loaded in "
+                        f"{self.load_seconds[language]:.2f}s"
+                    )
+        return analyzer
+
+    def batch_analyzer(self, language: str = "en") -> BatchAnalyzerEngine:
+        """Get the batch analyzer (spaCy nlp.pipe) sharing language's analyzer."""
+        self.analyzer(language)
+        return self._batch_analyzers[language]
+
+    def set_analyzer(self, language: str, analyzer: AnalyzerEngine) -> None:
+        """Use an already built analyzer for language (e.g. a custom NLP engine)."""
+        with self._lock:
+            self._install(language, analyzer)
+
+    def anonymizer(self) -> AnonymizerEngine:
+        """Get the shared anonymizer."""
+        if self._anonymizer is None:
+            with self._lock:
+                if self._anonymizer is None:
+                    self._anonymizer = AnonymizerEngine()
+        return self._anonymizer
+
+    def is_loaded(self, language: str = "en") -> bool:
+        """Whether language's analyzer is already built."""
+        return language in self._analyzers
+
+    def preload(self, languages: Iterable[str] = ("en",), freeze: bool = True) -> Dict[str, float]:
+        """
+        Build engines now, ahead of the first scrub.
+
+        Args:
+            languages: Languages to load
+            freeze: Move everything allocated so far out of the garbage
+                collector's generations, so collections in forked workers
+                don't write to (and so copy) the shared pipeline's pages
+
+        Returns:
+            Load time in seconds per language (0 if already loaded)
+        """
+        timings = {}
+        for language in languages:
+            loaded = self.is_loaded(language)
+            self.analyzer(language)
+            timings[language] = 0.0 if loaded else self.load_seconds[language]
+        self.anonymizer()
+
+        if freeze and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+        self.preloaded_pid = os.getpid()
+        return timings
+
+    def _after_fork_in_child(self) -> None:
+        # The parent may have held the lock while forking
+        self._lock = threading.Lock()
+
+
+_analyzer_pool: Optional[AnalyzerPool] = None
+
+
+def get_analyzer_pool() -> AnalyzerPool:
+    """Get global analyzer pool."""
+    global _analyzer_pool
+    if _analyzer_pool is None:
+        _analyzer_pool = AnalyzerPool()
+    return _analyzer_pool
+
+
+def _reset_pool_after_fork() -> None:
+    if _analyzer_pool is not None:
+        _analyzer_pool._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+# ============================================================================
+# Scrubber
+# ============================================================================
+
+# Cues for anything the analyzer could flag: digits (phone, card, SSN,
+# dates, ages), '@' (e-mail), URL markers and lowercase date words
+# (capitalized month and day names are caught as entity words)
+_STRUCTURED_CUE = re.compile(
+    r"[0-9@]|://|\bwww\.|(?i:\b(?:yesterday|today|tonight|tomorrow|ago|weekend"
+    r"|(?:mon|tues|wednes|thurs|fri|satur|sun)day)\b)"
+)
+
+# Words starting with anything but a lowercase ASCII letter (capitalized or
+# non-ASCII words) may be names, places or nationalities (NER entities)
+_ENTITY_WORD_CUE = re.compile(r"\b[^\W\d_a-z]\w*")
+
+# Capitalized words too common at sentence starts to justify the NLP model
+_COMMON_CAPITALIZED = frozenset("""
+    a about after also an and any are as at be because before but by can
+    could did do does for from had has have he hello her here hey hi his how
+    i if in is it its just let maybe my no not now of ok okay on or our
+    please she should so some sorry thanks thank that the their then there
+    these they this those to was we well were what when where which while
+    who why will with would yes you your
+""".split())
+
+
 class PIIScrubber:
     """Scrubs personally identifiable information from text."""
 
@@ -53,6 +244,9 @@ class PIIScrubber:
         language: str = "en",
         score_threshold: float = 0.6,
         custom_patterns: Optional[Dict[str, str]] = None,
+        pool: Optional[AnalyzerPool] = None,
+        fast_path: bool = True,
+        metrics: Optional[MetricsCollector] = None,
     ):
         """
         Initialize PII scrubber.
@@ -61,15 +255,16 @@ class PIIScrubber:
             language: Language code (default: "en")
             score_threshold: Minimum confidence score for PII detection
             custom_patterns: Custom regex patterns {entity_type: pattern}
+            pool: Warm engines to use (default: the process-wide pool)
+            fast_path: Skip the NLP model for texts the prefilter clears
+            metrics: Where to report scrub latency (default: global collector)
         """
         self.language = language
         self.score_threshold = score_threshold
         self.custom_patterns = custom_patterns or {}
-
-        # Initialize Presidio engines
-        logger.info("Initializing PII detection engines...")
-        self.analyzer = AnalyzerEngine()
-        self.anonymizer = AnonymizerEngine()
+        self.pool = pool or get_analyzer_pool()
+        self.fast_path = fast_path
+        self.metrics = metrics or get_metrics()
 
         # Entity types to detect
         self.entity_types = [
@@ -98,6 +293,16 @@ class PIIScrubber:
 
         logger.info(f"PII scrubber initialized (threshold: {score_threshold})")
 
+    @property
+    def analyzer(self) -> AnalyzerEngine:
+        """Shared analyzer for this scrubber's language."""
+        return self.pool.analyzer(self.language)
+
+    @property
+    def anonymizer(self) -> AnonymizerEngine:
+        """Shared anonymizer."""
+        return self.pool.anonymizer()
+
     def _compile_custom_patterns(self) -> None:
         """Compile custom regex patterns for additional PII detection."""
         # API keys and tokens
@@ -120,6 +325,26 @@ class PIIScrubber:
         for entity_type, pattern in self.custom_patterns.items():
             self.api_key_patterns.append((pattern, entity_type))
 
+        self._regex_patterns: List[Tuple[Pattern, str]] = [
+            (re.compile(pattern), entity_type)
+            for pattern, entity_type in self.api_key_patterns + self.crypto_patterns
+        ]
+
+    def needs_nlp(self, text: str) -> bool:
+        """
+        Prefilter: whether text has anything the NLP analyzer could flag.
+
+        Returns:
+            False only if text has no digit, '@', URL, date word or
+            uncommon capitalized/non-ASCII word
+        """
+        if _STRUCTURED_CUE.search(text):
+            return True
+        return any(
+            word.lower() not in _COMMON_CAPITALIZED
+            for word in _ENTITY_WORD_CUE.findall(text)
+        )
+
     def _detect_with_regex(self, text: str) -> List[Tuple[str, str, int, int]]:
         """
         Detect PII using custom regex patterns.
@@ -129,16 +354,9 @@ class PIIScrubber:
         """
         detections = []
 
-        # Check API keys
-        for pattern, entity_type in self.api_key_patterns:
-            for match in re.finditer(pattern, text):
-                detections.append(
-                    (entity_type, match.group(), match.start(), match.end())
-                )
-
-        # Check crypto addresses
-        for pattern, entity_type in self.crypto_patterns:
-            for match in re.finditer(pattern, text):
+        # API keys, then crypto addresses
+        for regex, entity_type in self._regex_patterns:
+            for match in regex.finditer(text):
                 detections.append(
                     (entity_type, match.group(), match.start(), match.end())
                 )
@@ -193,23 +411,109 @@ class PIIScrubber:
             ScrubResult with scrubbed text and detections
         """
         if not text or not text.strip():
-            return ScrubResult(
-                original_text=text,
-                scrubbed_text=text,
-                detections=[],
-                pii_detected=False,
+            return self._empty_result(text)
+
+        stage_ms: Dict[str, float] = {}
+        start = time.perf_counter()
+        needs_nlp = not self.fast_path or self.needs_nlp(text)
+        stage_ms["prefilter"] = (time.perf_counter() - start) * 1000
+
+        analyzer_results: List[RecognizerResult] = []
+        if needs_nlp:
+            # Analyze with Presidio
+            start = time.perf_counter()
+            analyzer_results = self.analyzer.analyze(
+                text=text,
+                language=self.language,
+                entities=self.entity_types,
+                score_threshold=self.score_threshold,
             )
+            stage_ms["nlp"] = (time.perf_counter() - start) * 1000
 
-        # Analyze with Presidio
-        analyzer_results = self.analyzer.analyze(
-            text=text,
-            language=self.language,
-            entities=self.entity_types,
-            score_threshold=self.score_threshold,
+        return self._finish(text, analyzer_results, return_detections, stage_ms)
+
+    def scrub_batch(
+        self,
+        texts: Sequence[str],
+        return_detections: bool = True,
+        batch_size: int = 32,
+        n_process: int = 1,
+    ) -> List[ScrubResult]:
+        """
+        Scrub many texts, running the NLP pipeline over them in batches.
+
+        Texts the prefilter clears skip the model; the rest go through
+        spaCy's nlp.pipe together. Batch stage timings in each result are
+        the batch's time shared evenly across the texts in that stage.
+
+        Args:
+            texts: Input texts to scrub
+            return_detections: Whether to include detection details
+            batch_size: Texts per NLP batch
+            n_process: spaCy processes for the NLP pass
+
+        Returns:
+            ScrubResult per text, in order
+        """
+        results: List[Optional[ScrubResult]] = [None] * len(texts)
+        nlp_indexes = []
+
+        start = time.perf_counter()
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._empty_result(text)
+            elif not self.fast_path or self.needs_nlp(text):
+                nlp_indexes.append(i)
+        prefilter_ms = (time.perf_counter() - start) * 1000 / max(len(texts), 1)
+
+        analyzer_results: Dict[int, List[RecognizerResult]] = {}
+        nlp_ms = 0.0
+        if nlp_indexes:
+            start = time.perf_counter()
+            batches = self.pool.batch_analyzer(self.language).analyze_iterator(
+                [texts[i] for i in nlp_indexes],
+                language=self.language,
+                batch_size=batch_size,
+                n_process=n_process,
+                entities=self.entity_types,
+                score_threshold=self.score_threshold,
+            )
+            analyzer_results = dict(zip(nlp_indexes, batches))
+            nlp_ms = (time.perf_counter() - start) * 1000 / len(nlp_indexes)
+
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                stage_ms = {"prefilter": prefilter_ms}
+                if i in analyzer_results:
+                    stage_ms["nlp"] = nlp_ms
+                results[i] = self._finish(
+                    text, analyzer_results.get(i, []), return_detections, stage_ms
+                )
+
+        return results
+
+    def _empty_result(self, text: str) -> ScrubResult:
+        return ScrubResult(
+            original_text=text,
+            scrubbed_text=text,
+            detections=[],
+            pii_detected=False,
         )
 
+    def _finish(
+        self,
+        text: str,
+        analyzer_results: List[RecognizerResult],
+        return_detections: bool,
+        stage_ms: Dict[str, float],
+    ) -> ScrubResult:
+        """Run the regex and anonymize stages over analyzed text and build the result."""
         # Detect with custom regex patterns
+        start = time.perf_counter()
         regex_detections = self._detect_with_regex(text)
+        stage_ms["regex"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
 
         # Combine all detections
         all_detections: List[PIIDetection] = []
@@ -247,7 +551,7 @@ class PIIScrubber:
             scrubbed_text = anonymized_result.text
 
         # Apply custom regex replacements
-        for entity_type, matched_text, start, end in regex_detections:
+        for entity_type, matched_text, start_pos, end_pos in regex_detections:
             replacement = self._generate_replacement(entity_type, matched_text)
             scrubbed_text = scrubbed_text.replace(matched_text, replacement)
 
@@ -256,22 +560,32 @@ class PIIScrubber:
                     PIIDetection(
                         entity_type=entity_type,
                         text=matched_text,
-                        start=start,
-                        end=end,
+                        start=start_pos,
+                        end=end_pos,
                         score=1.0,  # Regex matches are high confidence
                         anonymized_value=replacement,
                     )
                 )
 
+        stage_ms["anonymize"] = (time.perf_counter() - start) * 1000
+
+        pii_detected = bool(analyzer_results or regex_detections)
         result = ScrubResult(
             original_text=text,
             scrubbed_text=scrubbed_text,
             detections=all_detections if return_detections else [],
-            pii_detected=len(all_detections) > 0,
+            pii_detected=pii_detected,
+            stage_ms=stage_ms,
         )
 
+        self.metrics.record_pii_scrub(
+            "nlp" if "nlp" in stage_ms else "fast",
+            {stage: ms / 1000 for stage, ms in stage_ms.items()},
+        )
         if result.pii_detected:
-            logger.debug(f"PII scrubbed: {len(all_detections)} entities detected")
+            logger.debug(
+                f"PII scrubbed: {len(analyzer_results) + len(regex_detections)} entities detected"
+            )
 
         return result
 
@@ -0,0 +1,144 @@
+"""
+Per-User Mailboxes
+
+Each user's state in the stateful subsystems (context memories, lexical
+baselines, EDM debts, momentum loops) is touched by one piece of work at a
+time: within a process, one user's requests (and their post-response
+tails) run one at a time in arrival order, while different users' requests
+interleave freely.
+"""
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+from ..monitoring.deadline import DeadlineExceeded, RequestDeadline, current_deadline
+
+
+# ============================================================================
+# Mailboxes
+# ============================================================================
+
+
+class UserMailboxes:
+    """
+    Serializes work per user
+
+    Each user has a FIFO of turns; a turn starts once every earlier turn
+    for that user has finished. A turn's place in line is taken when it is
+    requested (for tell(), before it returns), and a user's mailbox is
+    dropped as soon as it empties, so idle users cost nothing.
+
+    Turns are not reentrant: awaiting another turn for the same user from
+    inside a turn deadlocks. Schedule follow-up work with tell() instead.
+    """
+
+    def __init__(self):
+        """Initialize mailboxes"""
+        self._queues: Dict[str, Deque[asyncio.Future]] = {}
+        self.max_depth_seen = 0
+        self.turns_timed_out = 0
+
+    def _reserve(self, user_id: str) -> asyncio.Future:
+        """Take a place in the user's line; the future resolves when it's our turn"""
+        slot = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(user_id, deque())
+        if not queue:
+            slot.set_result(None)
+        queue.append(slot)
+        self.max_depth_seen = max(self.max_depth_seen, len(queue))
+        return slot
+
+    def _release(self, user_id: str, slot: asyncio.Future) -> None:
+        """Leave the line, handing the turn on if we held it"""
+        queue = self._queues[user_id]
+        was_head = queue[0] is slot
+        queue.remove(slot)
+
+        if not queue:
+            del self._queues[user_id]
+        elif was_head and not queue[0].done():
+            queue[0].set_result(None)
+
+    @asynccontextmanager
+    async def _hold(self, user_id: str, slot: asyncio.Future, deadline: Optional[RequestDeadline]):
+        """Wait for a reserved turn, then hold it for the duration of the block"""
+        try:
+            if not slot.done():
+                if deadline is None:
+                    await slot
+                else:
+                    try:
+                        await asyncio.wait_for(slot, timeout=deadline.remaining_ms() / 1000)
+                    except asyncio.TimeoutError:
+                        self.turns_timed_out += 1
+                        raise DeadlineExceeded(deadline, "mailbox") from None
+            yield
+        finally:
+            self._release(user_id, slot)
+
+    @asynccontextmanager
+    async def turn(self, user_id: str, deadline: Optional[RequestDeadline] = None):
+        """
+        Hold the user's turn for the duration of the block
+
+        Args:
+            user_id: User whose state the block touches
+            deadline: Give up waiting when it expires, raising
+                DeadlineExceeded (default: the current deadline)
+        """
+        async with self._hold(user_id, self._reserve(user_id), deadline or current_deadline()):
+            yield
+
+    async def call(self, user_id: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Await fn(*args, **kwargs) in the user's turn
+
+        Args:
+            user_id: User whose state fn touches
+            fn: Coroutine function
+
+        Returns:
+            fn's result
+        """
+        async with self.turn(user_id):
+            return await fn(*args, **kwargs)
+
+    def tell(self, user_id: str, fn: Callable, *args, **kwargs) -> asyncio.Future:
+        """
+        Queue fn(*args, **kwargs) for the user's turn, without waiting
+
+        The place in line is taken immediately, so work queued here runs
+        before any turn requested afterwards. No deadline applies.
+
+        Returns:
+            Future for fn's result
+        """
+        slot = self._reserve(user_id)
+
+        async def run():
+            async with self._hold(user_id, slot, None):
+                return await fn(*args, **kwargs)
+
+        def release_if_never_started(_):
+            # A task cancelled before its first step never runs _hold
+            if slot in self._queues.get(user_id, ()):
+                self._release(user_id, slot)
+
+        task = asyncio.ensure_future(run())
+        task.add_done_callback(release_if_never_started)
+        return task
+
+    def pending(self, user_id: str) -> int:
+        """Turns held or waiting for a user"""
+        return len(self._queues.get(user_id, ()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get mailbox statistics"""
+        return {
+            "active_users": len(self._queues),
+            "queued_turns": sum(len(queue) - 1 for queue in self._queues.values()),
+            "max_depth_seen": self.max_depth_seen,
+            "turns_timed_out": self.turns_timed_out,
+        }
@@ -94,19 +94,21 @@ class AHOTribunal:
         """
         Submit an appeal to the tribunal.
 
-        Maps to Phase 1's Appeal submission.
+        Maps to Phase 1's Appeal submission, stored in this tribunal's database.
         """
-        from ..api.aho_tribunal import submit_appeal
-
-        return await submit_appeal(
+        appeal = Appeal(
+            appeal_id=f"APPEAL-{datetime.now().strftime('%Y%m%d%H%M%S')}-{user_id[-4:]}",
             user_id=user_id,
             action_id=action_id,
+            timestamp=datetime.now(),
+            status=AppealStatus.PENDING,
+            priority=priority,
             ai_decision=ai_decision,
             user_complaint=user_complaint,
             decision_context=context,
-            priority=priority,
-            db=self.db
         )
+        self.db.add_appeal(appeal)
+        return appeal
 
     async def review_appeal(
         self,
@@ -12,10 +12,19 @@ Production Observability:
 - Prometheus metrics collection
 - Health checking for all components
 - OpenTelemetry distributed tracing
+- Request deadline budgets
+- Shared text analysis (tokenize once per request/response text)
 """
 
 from .ari_monitor import ARIMonitor, AgencySnapshot, ARIReport, AgencyTrend
 from .edm_monitor import EDMMonitor, EpistemicDebtSnapshot, EDMReport
+from .fact_check import (
+    FactCheckService,
+    FactCheckCache,
+    FactCheckBackend,
+    FactCheckVerdict,
+    LocalFactCheckBackend,
+)
 from .ari_engine import (
     ARIEngine,
     PassiveLexicalAnalyzer,
@@ -42,6 +51,15 @@ from .logger import StructuredLogger, setup_logging, get_logger
 from .metrics import MetricsCollector, get_metrics, Timer
 from .health import HealthChecker, HealthStatus, SystemHealth, ComponentHealth, get_health_checker
 from .tracer import Tracer, TracerProvider, Span, get_tracer, get_tracer_provider, trace
+from .deadline import (
+    RequestDeadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+    has_budget,
+    with_deadline,
+)
+from .text_analysis import TextAnalyzer, AnalyzedText, get_text_analyzer
 
 __all__ = [
     # ARI Monitoring (Original)
@@ -73,6 +91,12 @@ __all__ = [
     "EDMMonitor",
     "EpistemicDebtSnapshot",
     "EDMReport",
+    # Fact-Checking
+    "FactCheckService",
+    "FactCheckCache",
+    "FactCheckBackend",
+    "FactCheckVerdict",
+    "LocalFactCheckBackend",
     # Logging
     "StructuredLogger",
     "setup_logging",
@@ -94,4 +118,15 @@ __all__ = [
     "get_tracer",
     "get_tracer_provider",
     "trace",
+    # Request deadlines
+    "RequestDeadline",
+    "DeadlineExceeded",
+    "current_deadline",
+    "deadline_scope",
+    "has_budget",
+    "with_deadline",
+    # Shared text analysis
+    "TextAnalyzer",
+    "AnalyzedText",
+    "get_text_analyzer",
 ]
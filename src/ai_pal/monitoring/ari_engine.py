@@ -13,17 +13,18 @@ Part of the Agency-Centric AI framework's monitoring capabilities.
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from pathlib import Path
-import re
 from collections import Counter
 import math
 
 from loguru import logger
 
+from .text_analysis import AnalyzedText, get_text_analyzer
+
 
 # ============================================================================
 # ENUMS & DATA STRUCTURES
@@ -161,6 +162,15 @@ class PassiveLexicalAnalyzer:
     only aggregate metrics.
     """
 
+    # Syntactic complexity indicators, counted as substrings
+    COMPLEXITY_MARKER_SET = "ari.complexity_markers"
+    COMPLEXITY_MARKERS = [
+        ',',  # Subordinate clauses
+        ';',  # Complex sentences
+        'which', 'that', 'who', 'whom',  # Relative clauses
+        'because', 'although', 'while', 'whereas',  # Subordinating conjunctions
+    ]
+
     def __init__(
         self,
         storage_dir: Path,
@@ -184,6 +194,9 @@ class PassiveLexicalAnalyzer:
         # In-memory cache of metrics
         self.metrics_history: Dict[str, List[LexicalMetrics]] = {}
 
+        self._text_analyzer = get_text_analyzer()
+        self._text_analyzer.register_markers(self.COMPLEXITY_MARKER_SET, self.COMPLEXITY_MARKERS)
+
         # Load existing metrics
         self._load_metrics()
 
@@ -224,7 +237,7 @@ class PassiveLexicalAnalyzer:
     async def analyze_text(
         self,
         user_id: str,
-        text: str,
+        text: Union[str, AnalyzedText],
         text_type: str = "document",
         text_sample_id: Optional[str] = None
     ) -> LexicalMetrics:
@@ -236,27 +249,28 @@ class PassiveLexicalAnalyzer:
 
         Args:
             user_id: User who wrote the text
-            text: The text to analyze
+            text: The text to analyze (or its shared AnalyzedText)
             text_type: Type of text (email, code, document, etc.)
             text_sample_id: Optional identifier for the sample
 
         Returns:
             LexicalMetrics object with extracted metrics
         """
-        logger.debug(f"Analyzing text for user {user_id}, type={text_type}, length={len(text)}")
+        analyzed = self._text_analyzer.analyze(text)
+        logger.debug(f"Analyzing text for user {user_id}, type={text_type}, length={len(analyzed)}")
 
         # Calculate metrics
         metrics = LexicalMetrics(
             timestamp=datetime.now(),
-            lexical_diversity=self._calculate_lexical_diversity(text),
-            vocabulary_richness=self._calculate_vocabulary_richness(text),
-            average_sentence_length=self._calculate_avg_sentence_length(text),
-            syntactic_complexity_score=self._calculate_syntactic_complexity(text),
-            domain_term_density=self._calculate_domain_term_density(text),
-            technical_vocabulary_count=self._count_technical_vocabulary(text),
-            total_words=len(self._tokenize_words(text)),
-            unique_words=len(set(self._tokenize_words(text))),
-            sentence_count=len(self._split_sentences(text)),
+            lexical_diversity=self._calculate_lexical_diversity(analyzed),
+            vocabulary_richness=self._calculate_vocabulary_richness(analyzed),
+            average_sentence_length=self._calculate_avg_sentence_length(analyzed),
+            syntactic_complexity_score=self._calculate_syntactic_complexity(analyzed),
+            domain_term_density=self._calculate_domain_term_density(analyzed),
+            technical_vocabulary_count=self._count_technical_vocabulary(analyzed),
+            total_words=len(analyzed.words),
+            unique_words=len(set(analyzed.words)),
+            sentence_count=len(analyzed.sentences),
             text_sample_id=text_sample_id or f"sample_{datetime.now().timestamp()}",
             text_type=text_type
         )
@@ -277,26 +291,14 @@ class PassiveLexicalAnalyzer:
 
         return metrics
 
-    def _tokenize_words(self, text: str) -> List[str]:
-        """Tokenize text into words"""
-        # Simple tokenization (lowercase, alphanumeric)
-        words = re.findall(r'\b[a-z]+\b', text.lower())
-        return words
-
-    def _split_sentences(self, text: str) -> List[str]:
-        """Split text into sentences"""
-        # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
-
-    def _calculate_lexical_diversity(self, text: str) -> float:
+    def _calculate_lexical_diversity(self, analyzed: AnalyzedText) -> float:
         """
         Calculate type-token ratio (TTR)
 
         TTR = unique words / total words
         Higher values indicate richer vocabulary
         """
-        words = self._tokenize_words(text)
+        words = analyzed.words
         if not words:
             return 0.0
 
@@ -309,13 +311,13 @@ class PassiveLexicalAnalyzer:
 
         return min(1.0, ttr / 10.0)  # Normalize to 0-1
 
-    def _calculate_vocabulary_richness(self, text: str) -> float:
+    def _calculate_vocabulary_richness(self, analyzed: AnalyzedText) -> float:
         """
         Calculate vocabulary richness (simple ratio)
 
         Returns: unique_words / total_words
         """
-        words = self._tokenize_words(text)
+        words = analyzed.words
         if not words:
             return 0.0
 
@@ -324,23 +326,19 @@ class PassiveLexicalAnalyzer:
 
         return unique_words / total_words
 
-    def _calculate_avg_sentence_length(self, text: str) -> float:
+    def _calculate_avg_sentence_length(self, analyzed: AnalyzedText) -> float:
         """
         Calculate average sentence length in words
 
         Longer sentences often indicate more complex expression
         """
-        sentences = self._split_sentences(text)
-        if not sentences:
+        lengths = analyzed.sentence_lengths
+        if not lengths:
             return 0.0
 
-        total_words = 0
-        for sentence in sentences:
-            total_words += len(self._tokenize_words(sentence))
-
-        return total_words / len(sentences)
+        return sum(lengths) / len(lengths)
 
-    def _calculate_syntactic_complexity(self, text: str) -> float:
+    def _calculate_syntactic_complexity(self, analyzed: AnalyzedText) -> float:
         """
         Estimate syntactic complexity
 
@@ -351,29 +349,21 @@ class PassiveLexicalAnalyzer:
 
         Returns: 0-1 score
         """
-        sentences = self._split_sentences(text)
-        if not sentences:
+        lengths = analyzed.sentence_lengths
+        if not lengths:
             return 0.0
 
         # Calculate sentence length variance
-        lengths = [len(self._tokenize_words(s)) for s in sentences]
         if len(lengths) < 2:
             variance = 0
-            mean_length = lengths[0] if lengths else 0
+            mean_length = lengths[0]
         else:
             mean_length = sum(lengths) / len(lengths)
             variance = sum((x - mean_length) ** 2 for x in lengths) / len(lengths)
 
         # Count complexity indicators
-        complexity_markers = [
-            ',',  # Subordinate clauses
-            ';',  # Complex sentences
-            'which', 'that', 'who', 'whom',  # Relative clauses
-            'because', 'although', 'while', 'whereas',  # Subordinating conjunctions
-        ]
-
-        marker_count = sum(text.lower().count(marker) for marker in complexity_markers)
-        marker_density = marker_count / len(sentences) if sentences else 0
+        marker_count = sum(analyzed.marker_counts(self.COMPLEXITY_MARKER_SET).values())
+        marker_density = marker_count / len(lengths)
 
         # Combine metrics
         complexity_score = (
@@ -384,42 +374,24 @@ class PassiveLexicalAnalyzer:
 
         return complexity_score
 
-    def _calculate_domain_term_density(self, text: str) -> float:
+    def _calculate_domain_term_density(self, analyzed: AnalyzedText) -> float:
         """
         Calculate density of domain-specific terminology
 
-        Heuristic: words with length > 8 or containing technical patterns
+        Heuristic: long words (8+ letters). Word tokens are lowercase letter
+        runs, so camelCase and snake_case never survive tokenization.
         """
-        words = self._tokenize_words(text)
+        words = analyzed.words
         if not words:
             return 0.0
 
-        # Technical patterns
-        technical_patterns = [
-            r'^[a-z]+[A-Z]',  # camelCase
-            r'_',              # snake_case
-            r'^[a-z]{8,}$',    # Long words (often technical)
-        ]
-
-        technical_count = 0
-        for word in words:
-            if len(word) > 8:
-                technical_count += 1
-            elif any(re.search(pattern, word) for pattern in technical_patterns):
-                technical_count += 1
+        technical_count = sum(1 for word in words if len(word) >= 8)
 
         return technical_count / len(words)
 
-    def _count_technical_vocabulary(self, text: str) -> int:
+    def _count_technical_vocabulary(self, analyzed: AnalyzedText) -> int:
         """Count unique technical/domain-specific terms"""
-        words = self._tokenize_words(text)
-        technical_words = set()
-
-        for word in words:
-            if len(word) > 8 or '_' in word:
-                technical_words.add(word)
-
-        return len(technical_words)
+        return len({word for word in analyzed.words if len(word) > 8})
 
     async def _persist_metric(self, user_id: str, metric: LexicalMetrics) -> None:
         """Persist metric to disk"""
@@ -1088,7 +1060,7 @@ class ARIEngine:
     async def analyze_user_text(
         self,
         user_id: str,
-        text: str,
+        text: Union[str, AnalyzedText],
         text_type: str = "document"
     ) -> LexicalMetrics:
         """
@@ -1096,7 +1068,7 @@ class ARIEngine:
 
         Args:
             user_id: User who wrote the text
-            text: Text to analyze
+            text: Text to analyze (or its shared AnalyzedText)
             text_type: Type of text
 
         Returns:
@@ -0,0 +1,208 @@
+"""
+Request deadlines for AI-PAL.
+
+A RequestDeadline is a time budget for one request. It is carried in a
+context variable, so it follows the request through asyncio tasks created
+by gather()/create_task() without being threaded through every call:
+- Stages read the remaining budget to choose cheaper paths
+- with_deadline() bounds an awaitable by the remaining budget and cancels
+  it (e.g. an outstanding provider call) once the budget is gone
+- Per-stage budget consumption is recorded for metrics
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The request's time budget ran out"""
+
+    def __init__(self, deadline: "RequestDeadline", operation: str = ""):
+        self.deadline = deadline
+        self.operation = operation
+        where = f" during {operation}" if operation else ""
+        super().__init__(f"Request deadline of {deadline.budget_ms:.0f}ms exceeded{where}")
+
+
+class RequestDeadline:
+    """
+    Time budget for a single request.
+
+    Uses the monotonic clock; all public values are in milliseconds.
+    """
+
+    def __init__(self, budget_ms: float):
+        """
+        Initialize deadline.
+
+        Args:
+            budget_ms: Total budget, starting now
+        """
+        self.budget_ms = budget_ms
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget_ms / 1000
+        # Stage name -> wall time spent in that stage (ms)
+        self.stage_usage_ms: Dict[str, float] = {}
+
+    def remaining_ms(self) -> float:
+        """Budget left (never negative)"""
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000)
+
+    def elapsed_ms(self) -> float:
+        """Budget used so far"""
+        return (time.monotonic() - self.started_at) * 1000
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def has_budget(self, min_ms: float) -> bool:
+        """Whether at least min_ms of budget is left"""
+        return self.remaining_ms() >= min_ms
+
+    def check(self, operation: str = "") -> None:
+        """Raise DeadlineExceeded if the budget is gone"""
+        if self.expired:
+            raise DeadlineExceeded(self, operation)
+
+    def record_stage(self, stage: str, elapsed_ms: float) -> None:
+        """Record wall time spent in a stage"""
+        self.stage_usage_ms[stage] = self.stage_usage_ms.get(stage, 0.0) + elapsed_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary for request metadata"""
+        return {
+            "budget_ms": self.budget_ms,
+            "elapsed_ms": self.elapsed_ms(),
+            "remaining_ms": self.remaining_ms(),
+            "expired": self.expired,
+            "stage_usage_ms": dict(self.stage_usage_ms),
+        }
+
+    def __repr__(self) -> str:
+        return f"<RequestDeadline {self.remaining_ms():.0f}/{self.budget_ms:.0f}ms>"
+
+
+_current_deadline: ContextVar[Optional[RequestDeadline]] = ContextVar(
+    "ai_pal_request_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[RequestDeadline]:
+    """
+    Get the deadline of the request being processed.
+
+    Returns:
+        RequestDeadline, or None outside a deadline scope
+    """
+    return _current_deadline.get()
+
+
+def has_budget(min_ms: float) -> bool:
+    """
+    Whether the current request can afford an optional step.
+
+    Args:
+        min_ms: Budget the step needs
+
+    Returns:
+        True if there is no deadline or at least min_ms remains
+    """
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.has_budget(min_ms)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[RequestDeadline]) -> Iterator[Optional[RequestDeadline]]:
+    """
+    Make a deadline current for the enclosed code.
+
+    Tasks created inside the scope inherit the deadline. Passing None
+    clears any outer deadline.
+
+    Args:
+        deadline: Deadline to install
+
+    Yields:
+        The installed deadline
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+async def with_deadline(
+    awaitable: Awaitable[T],
+    deadline: Optional[RequestDeadline] = None,
+    operation: str = ""
+) -> T:
+    """
+    Await with the remaining request budget as a timeout.
+
+    The awaitable runs in a task that sees the deadline as current, so
+    nested calls are bounded by the same budget. On expiry the task is
+    cancelled and DeadlineExceeded is raised.
+
+    Args:
+        awaitable: Coroutine or future to await
+        deadline: Deadline to apply (default: the current deadline)
+        operation: Name for the error message
+
+    Returns:
+        The awaitable's result
+    """
+    deadline = deadline or _current_deadline.get()
+    if deadline is None:
+        return await awaitable
+
+    if deadline.expired:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(deadline, operation)
+
+    with deadline_scope(deadline):
+        task = asyncio.ensure_future(awaitable)
+
+    try:
+        return await asyncio.wait_for(task, timeout=deadline.remaining_ms() / 1000)
+    except asyncio.TimeoutError:
+        if deadline.expired:
+            raise DeadlineExceeded(deadline, operation) from None
+        raise
+
+
+async def iterate_with_deadline(
+    iterator: AsyncIterator[T],
+    deadline: Optional[RequestDeadline] = None,
+    operation: str = ""
+) -> AsyncIterator[T]:
+    """
+    Re-yield an async iterator, bounding each step by the deadline.
+
+    Args:
+        iterator: Async iterator (e.g. a provider token stream)
+        deadline: Deadline to apply (default: the current deadline)
+        operation: Name for the error message
+
+    Yields:
+        Items from the iterator
+    """
+    deadline = deadline or _current_deadline.get()
+    try:
+        while True:
+            try:
+                item = await with_deadline(iterator.__anext__(), deadline, operation)
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
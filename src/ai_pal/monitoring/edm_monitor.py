@@ -14,18 +14,33 @@ Part of Phase 2: Advanced Monitoring & Self-Improvement
 """
 
 import asyncio
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
 import json
 from pathlib import Path
 import re
 import os
 
-import httpx
 from loguru import logger
 
+from .deadline import has_budget
+from .text_analysis import AnalyzedText, get_text_analyzer
+from .fact_check import (
+    FactCheckCache,
+    FactCheckService,
+    FactCheckStatus,
+    FactCheckVerdict,
+    GoogleFactCheckBackend,
+    LocalFactCheckBackend,
+    WikipediaBackend,
+)
+
 
 class DebtSeverity(Enum):
     """Epistemic debt severity levels"""
@@ -35,15 +50,6 @@ class DebtSeverity(Enum):
     CRITICAL = "critical"  # Dangerous misinformation
 
 
-class FactCheckStatus(Enum):
-    """Fact-checking result status"""
-    VERIFIED = "verified"  # Claim verified as true
-    DISPUTED = "disputed"  # Claim has conflicting evidence
-    FALSE = "false"  # Claim verified as false
-    UNVERIFIABLE = "unverifiable"  # Cannot be verified
-    PENDING = "pending"  # Awaiting fact-check
-
-
 @dataclass
 class EpistemicDebtSnapshot:
     """Single epistemic debt instance"""
@@ -86,8 +92,9 @@ class EDMReport:
     verified_claims: int = 0
     false_claims: int = 0
 
-    # By Severity
+    # By Severity and Type
     debt_by_severity: Dict[str, int] = field(default_factory=dict)
+    debt_by_type: Dict[str, int] = field(default_factory=dict)
 
     # Trends
     debt_accumulation_rate: float = 0.0  # Debts per day
@@ -99,6 +106,285 @@ class EDMReport:
     high_risk_claims: List[EpistemicDebtSnapshot] = field(default_factory=list)
 
 
+_REGEX_METACHARACTERS = set(".^$*+?{}[]\\|()")
+
+
+def _trie_regex(phrases: List[str]) -> str:
+    """
+    Regex matching any of a set of literal phrases, shaped as a trie
+
+    Alternatives share their prefixes, so at each text position the regex
+    engine follows at most one branch per character instead of trying
+    every phrase in turn.
+    """
+    root: Dict[str, Dict] = {}
+    for phrase in phrases:
+        node = root
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        ends_here = "" in node
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        return f"(?:{'|'.join(branches)})" + ("?" if ends_here else "")
+
+    return emit(root)
+
+
+class DebtPatternMatcher:
+    """
+    Single-pass matcher for epistemic debt markers
+
+    Marker patterns from every class are compiled into one regex and the
+    text is scanned once, instead of once per pattern. When all markers
+    are plain phrases (the default) they form a trie-shaped alternation
+    matched against the lowercased text, which avoids the regex engine's
+    slow case-insensitive path; any regex syntax falls back to a
+    case-insensitive alternation with a named group per class. Matches are
+    non-overlapping and in text order; the default phrases never overlap
+    one another, so this finds the same hits as scanning for each pattern
+    separately.
+
+    Citations are a separate compiled pattern, searched only in the window
+    after a claim that needs one.
+    """
+
+    def __init__(self, marker_patterns: Dict[str, List[str]], citation_patterns: List[str]):
+        """
+        Initialize matcher
+
+        Args:
+            marker_patterns: Pattern class name -> regex patterns
+            citation_patterns: Regex patterns marking a citation
+        """
+        self._phrase_classes: Optional[Dict[str, str]] = None
+        self._phrase_regex = None
+
+        all_literal = all(
+            not (_REGEX_METACHARACTERS & set(pattern))
+            for patterns in marker_patterns.values() for pattern in patterns
+        )
+        if all_literal:
+            self._phrase_classes = {
+                pattern.lower(): name
+                for name, patterns in marker_patterns.items() for pattern in patterns
+            }
+            if self._phrase_classes:
+                self._phrase_regex = re.compile(_trie_regex(list(self._phrase_classes)))
+
+        groups = [
+            f"(?P<{name}>{'|'.join(f'(?:{p})' for p in patterns)})"
+            for name, patterns in marker_patterns.items() if patterns
+        ]
+        self._grouped_regex = re.compile("|".join(groups), re.IGNORECASE) if groups else None
+        self._citation_regex = re.compile("|".join(f"(?:{p})" for p in citation_patterns)) \
+            if citation_patterns else None
+
+    _shared: Dict[Tuple, "DebtPatternMatcher"] = {}
+
+    @classmethod
+    def shared(cls, marker_patterns: Dict[str, List[str]], citation_patterns: List[str]) -> "DebtPatternMatcher":
+        """Matcher for the given patterns, compiled once per process"""
+        key = (
+            tuple((name, tuple(patterns)) for name, patterns in marker_patterns.items()),
+            tuple(citation_patterns),
+        )
+        matcher = cls._shared.get(key)
+        if matcher is None:
+            matcher = cls._shared[key] = cls(marker_patterns, citation_patterns)
+        return matcher
+
+    def scan(self, text: str, lowered: Optional[str] = None) -> List[Tuple[str, int, int]]:
+        """
+        Find all markers in one pass
+
+        Args:
+            text: Text to scan
+            lowered: text.lower(), if the caller already has it
+
+        Returns:
+            (pattern class, start, end) per marker, in text order
+        """
+        if self._phrase_regex is not None:
+            if lowered is None:
+                lowered = text.lower()
+            # A few characters change length when lowercased, which would
+            # shift offsets; such texts take the case-insensitive path
+            if len(lowered) == len(text):
+                classes = self._phrase_classes
+                return [
+                    (classes[match.group()], match.start(), match.end())
+                    for match in self._phrase_regex.finditer(lowered)
+                ]
+
+        if self._grouped_regex is None:
+            return []
+        return [
+            (match.lastgroup, match.start(), match.end())
+            for match in self._grouped_regex.finditer(text)
+        ]
+
+    def scan_analyzed(self, analyzed: AnalyzedText) -> Tuple[Tuple[str, int, int], ...]:
+        """scan() as a shared text-analysis feature"""
+        return tuple(self.scan(analyzed.text, analyzed.lower))
+
+    def has_citation(self, text: str, start: int, end: int) -> bool:
+        """Whether a citation appears within text[start:end]"""
+        if self._citation_regex is None:
+            return False
+        return self._citation_regex.search(text, start, min(len(text), end)) is not None
+
+
+HIGH_RISK_SEVERITIES = (DebtSeverity.HIGH, DebtSeverity.CRITICAL)
+
+# (severity, debt_type, resolved, fact_check_status)
+DebtKey = Tuple[DebtSeverity, str, bool, FactCheckStatus]
+
+
+class DebtIndex:
+    """
+    Incremental aggregates over the debts of one scope (a user, or all)
+
+    - counts: debts per (severity, type, resolved, fact-check status)
+    - timeline: (timestamp, debt_id) in time order, for date-range queries
+    - unresolved_high_risk: IDs of unresolved HIGH/CRITICAL debts
+
+    Callers must uncount a debt before changing any keyed field and count
+    it again afterwards (see EDMMonitor._update_debt).
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.timeline: List[Tuple[datetime, str]] = []
+        self.unresolved_high_risk: Set[str] = set()
+
+    @staticmethod
+    def key(debt: EpistemicDebtSnapshot) -> DebtKey:
+        return (debt.severity, debt.debt_type, debt.resolved, debt.fact_check_status)
+
+    def add(self, debt: EpistemicDebtSnapshot) -> None:
+        """Index a new debt"""
+        entry = (debt.timestamp, debt.debt_id)
+        if not self.timeline or entry >= self.timeline[-1]:
+            self.timeline.append(entry)
+        else:
+            insort(self.timeline, entry)
+        self.count(debt)
+
+    def count(self, debt: EpistemicDebtSnapshot, delta: int = 1) -> None:
+        """Add (delta=1) or remove (delta=-1) a debt's keyed fields"""
+        key = self.key(debt)
+        self.counts[key] += delta
+        if self.counts[key] <= 0:
+            del self.counts[key]
+
+        if debt.severity in HIGH_RISK_SEVERITIES and not debt.resolved and delta > 0:
+            self.unresolved_high_risk.add(debt.debt_id)
+        else:
+            self.unresolved_high_risk.discard(debt.debt_id)
+
+    def unresolved(self, severity: Optional[DebtSeverity] = None) -> int:
+        """Unresolved debts (of one severity, or all)"""
+        return sum(
+            n for (key_severity, _, resolved, _), n in self.counts.items()
+            if not resolved and (severity is None or key_severity == severity)
+        )
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """Whether [start, end] includes every indexed debt"""
+        return not self.timeline or (start <= self.timeline[0][0] and self.timeline[-1][0] <= end)
+
+    def ids_between(self, start: datetime, end: datetime) -> List[str]:
+        """IDs of debts with start <= timestamp <= end, in time order"""
+        lo = bisect_left(self.timeline, (start, ""))
+        hi = bisect_right(self.timeline, (end, "\uffff"))
+        return [debt_id for _, debt_id in self.timeline[lo:hi]]
+
+
+class DebtStore:
+    """
+    Append-only log of debt records (one JSON object per line)
+
+    Creating or updating a debt appends its full record; on load the last
+    record per debt wins. Once superseded lines dominate, the log is
+    rewritten from its own latest records, under the same lock as appends,
+    so no concurrently appended batch can be dropped.
+    """
+
+    FILENAME = "debts.jsonl"
+
+    def __init__(self, storage_dir: Path, compact_min_lines: int = 1000):
+        """
+        Initialize store
+
+        Args:
+            storage_dir: Directory holding the log
+            compact_min_lines: Never compact logs shorter than this
+        """
+        self.path = Path(storage_dir) / self.FILENAME
+        self.compact_min_lines = compact_min_lines
+        self.lines = 0
+        self._debt_ids: Set[str] = set()
+        # Appends come from the event loop and from executor threads
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """Replay the log: debt_id -> latest record"""
+        with self._lock:
+            records = self._replay()
+            self._debt_ids = set(records)
+        return records
+
+    def append(self, records: List[Dict]) -> None:
+        """Append records in one write, compacting the log when it is due"""
+        if not records:
+            return
+        chunk = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(chunk)
+            self.lines += len(records)
+            self._debt_ids.update(record["debt_id"] for record in records)
+            if self.needs_compaction():
+                self._compact()
+
+    def needs_compaction(self) -> bool:
+        """Whether the log holds mostly superseded records"""
+        return self.lines > max(self.compact_min_lines, 2 * len(self._debt_ids))
+
+    def _replay(self) -> Dict[str, Dict]:
+        """Read the log (caller holds _lock)"""
+        records: Dict[str, Dict] = {}
+        self.lines = 0
+        if not self.path.exists():
+            return records
+
+        with open(self.path, "r") as f:
+            for line in f:
+                self.lines += 1
+                try:
+                    record = json.loads(line)
+                    records[record["debt_id"]] = record
+                except (ValueError, KeyError) as e:
+                    logger.error(f"Skipping bad debt record in {self.path.name}: {e}")
+        return records
+
+    def _compact(self) -> None:
+        """Replace the log with its latest record per debt (caller holds _lock)"""
+        records = self._replay()
+        tmp = self.path.with_suffix(".jsonl.tmp")
+        with open(tmp, "w") as f:
+            for record in records.values():
+                f.write(json.dumps(record) + "\n")
+        tmp.replace(self.path)
+        self.lines = len(records)
+
+
 class EDMMonitor:
     """
     Epistemic Debt Monitoring System
@@ -138,13 +424,36 @@ class EDMMonitor:
         r"generally speaking",
     ]
 
+    CITATION_PATTERNS = [
+        r"\[\d+\]",  # [1]
+        r"\([A-Z][a-z]+,?\s+\d{4}\)",  # (Author, 2020)
+        r"doi:",
+        r"http[s]?://",
+    ]
+
+    # Pattern class -> (debt_type, severity); unverified claims only count
+    # as debt without a citation right after them
+    DEBT_CLASSES = {
+        "unfalsifiable": ("unfalsifiable", DebtSeverity.MEDIUM),
+        "unverified": ("missing_citation", DebtSeverity.HIGH),
+        "vague": ("vague_claim", DebtSeverity.LOW),
+    }
+
+    # How far after an unverified claim a citation may appear
+    CITATION_LOOKAHEAD = 100
+
+    # Fact-checks call external APIs; skip them when less than this much of
+    # the request's deadline budget is left
+    FACT_CHECK_MIN_BUDGET_MS = 2000.0
+
     def __init__(
         self,
         storage_dir: Path,
         fact_check_enabled: bool = True,
         auto_resolve_verified: bool = True,
         max_unresolved_debt: int = 50,
-        google_fact_check_api_key: Optional[str] = None
+        google_fact_check_api_key: Optional[str] = None,
+        fact_checker: Optional[FactCheckService] = None
     ):
         """
         Initialize EDM Monitor
@@ -155,6 +464,9 @@ class EDMMonitor:
             auto_resolve_verified: Auto-resolve verified claims
             max_unresolved_debt: Alert if unresolved debt exceeds this
             google_fact_check_api_key: Google Fact Check Tools API key
+            fact_checker: Fact-check service (default: Google if a key is
+                configured, then Wikipedia; AI_PAL_FACT_CHECK_BACKEND=local
+                uses only the offline local backend)
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -165,11 +477,32 @@ class EDMMonitor:
 
         # API configuration
         self.google_fact_check_api_key = google_fact_check_api_key or os.getenv("GOOGLE_FACT_CHECK_API_KEY")
+        self.fact_checker = fact_checker or self._default_fact_checker()
+
+        self._matcher = DebtPatternMatcher.shared(
+            {
+                "unfalsifiable": self.UNFALSIFIABLE_PATTERNS,
+                "unverified": self.UNVERIFIED_PATTERNS,
+                "vague": self.VAGUE_PATTERNS,
+            },
+            self.CITATION_PATTERNS,
+        )
+
+        # Marker scan as a feature of the shared text analysis
+        self._text_analyzer = get_text_analyzer()
+        self._marker_feature = f"edm.debt_markers.{id(self._matcher)}"
+        self._text_analyzer.register_feature(self._marker_feature, self._matcher.scan_analyzed)
 
         # In-memory cache
         self.debt_instances: Dict[str, EpistemicDebtSnapshot] = {}
         self.user_debt: Dict[str, List[str]] = {}  # user_id -> list of debt_ids
 
+        # Aggregates per user and across all users (alerts and reports)
+        self._user_indexes: Dict[str, DebtIndex] = {}
+        self._global_index = DebtIndex()
+
+        self.store = DebtStore(self.storage_dir)
+
         # Load existing debt
         self._load_debt_instances()
 
@@ -180,48 +513,106 @@ class EDMMonitor:
             f"Google API configured: {bool(self.google_fact_check_api_key)}"
         )
 
+    def _default_fact_checker(self) -> FactCheckService:
+        """Fact-check service over the configured sources"""
+        if os.getenv("AI_PAL_FACT_CHECK_BACKEND", "").lower() == "local":
+            backends = [LocalFactCheckBackend()]
+        else:
+            backends = [WikipediaBackend()]
+            if self.google_fact_check_api_key:
+                backends.insert(0, GoogleFactCheckBackend(self.google_fact_check_api_key))
+
+        return FactCheckService(
+            backends=backends,
+            cache=FactCheckCache(self.storage_dir / "fact_check_cache.jsonl"),
+            workers=int(os.getenv("AI_PAL_FACT_CHECK_WORKERS", "4")),
+            max_queue=int(os.getenv("AI_PAL_FACT_CHECK_QUEUE", "256")),
+            vague_phrases=self.VAGUE_PATTERNS,
+        )
+
     def _load_debt_instances(self) -> None:
         """Load existing debt instances from storage"""
-        debt_files = list(self.storage_dir.glob("*.json"))
-        logger.info(f"Loading {len(debt_files)} debt instance files")
+        records = self.store.load()
+        self._migrate_debt_files(records)
+        logger.info(f"Loading {len(records)} debt instances")
 
+        for data in records.values():
+            try:
+                self._register_debt(self._debt_from_dict(data))
+            except Exception as e:
+                logger.error(f"Failed to load debt instance {data.get('debt_id')}: {e}")
+
+    def _migrate_debt_files(self, records: Dict[str, Dict]) -> None:
+        """Move debts from the old one-file-per-debt layout into the store"""
+        debt_files = sorted(self.storage_dir.glob("*.json"))
+        if not debt_files:
+            return
+
+        migrated = []
         for debt_file in debt_files:
             try:
                 with open(debt_file, 'r') as f:
                     data = json.load(f)
-                    debt = EpistemicDebtSnapshot(
-                        debt_id=data["debt_id"],
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
-                        claim=data["claim"],
-                        context=data["context"],
-                        task_id=data["task_id"],
-                        user_id=data["user_id"],
-                        severity=DebtSeverity(data["severity"]),
-                        debt_type=data["debt_type"],
-                        fact_check_status=FactCheckStatus(data["fact_check_status"]),
-                        fact_check_source=data.get("fact_check_source"),
-                        fact_check_evidence=data.get("fact_check_evidence"),
-                        fact_check_confidence=data.get("fact_check_confidence", 0.0),
-                        resolved=data.get("resolved", False),
-                        resolution_method=data.get("resolution_method"),
-                        resolution_timestamp=datetime.fromisoformat(data["resolution_timestamp"])
-                        if data.get("resolution_timestamp") else None,
-                        metadata=data.get("metadata", {})
-                    )
-
-                    self.debt_instances[debt.debt_id] = debt
-
-                    # Track by user
-                    if debt.user_id not in self.user_debt:
-                        self.user_debt[debt.user_id] = []
-                    self.user_debt[debt.user_id].append(debt.debt_id)
-
+                self._debt_from_dict(data)  # validate before dropping the file
             except Exception as e:
                 logger.error(f"Failed to load debt instance {debt_file}: {e}")
+                continue
+            if data["debt_id"] not in records:
+                records[data["debt_id"]] = data
+                self.store.append([data])
+            migrated.append(debt_file)
+
+        for debt_file in migrated:
+            debt_file.unlink()
+        logger.info(f"Migrated {len(migrated)} debt files into {self.store.path.name}")
+
+    @staticmethod
+    def _debt_from_dict(data: Dict) -> EpistemicDebtSnapshot:
+        """Deserialize a stored debt instance"""
+        return EpistemicDebtSnapshot(
+            debt_id=data["debt_id"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            claim=data["claim"],
+            context=data["context"],
+            task_id=data["task_id"],
+            user_id=data["user_id"],
+            severity=DebtSeverity(data["severity"]),
+            debt_type=data["debt_type"],
+            fact_check_status=FactCheckStatus(data["fact_check_status"]),
+            fact_check_source=data.get("fact_check_source"),
+            fact_check_evidence=data.get("fact_check_evidence"),
+            fact_check_confidence=data.get("fact_check_confidence", 0.0),
+            resolved=data.get("resolved", False),
+            resolution_method=data.get("resolution_method"),
+            resolution_timestamp=datetime.fromisoformat(data["resolution_timestamp"])
+            if data.get("resolution_timestamp") else None,
+            metadata=data.get("metadata", {})
+        )
+
+    def _register_debt(self, debt: EpistemicDebtSnapshot) -> None:
+        """Add a debt to the in-memory cache and indexes"""
+        self.debt_instances[debt.debt_id] = debt
+        self.user_debt.setdefault(debt.user_id, []).append(debt.debt_id)
+
+        index = self._user_indexes.get(debt.user_id)
+        if index is None:
+            index = self._user_indexes[debt.user_id] = DebtIndex()
+        index.add(debt)
+        self._global_index.add(debt)
+
+    def _update_debt(self, debt: EpistemicDebtSnapshot, **changes) -> None:
+        """Change a debt's fields, keeping the indexes in step"""
+        indexes = (self._user_indexes[debt.user_id], self._global_index)
+        for index in indexes:
+            index.count(debt, -1)
+        for name, value in changes.items():
+            setattr(debt, name, value)
+        for index in indexes:
+            index.count(debt)
 
     async def analyze_text(
         self,
-        text: str,
+        text: Union[str, AnalyzedText],
         task_id: str,
         user_id: str,
         context: str = ""
@@ -230,7 +621,7 @@ class EDMMonitor:
         Analyze text for epistemic debt patterns
 
         Args:
-            text: Text to analyze
+            text: Text to analyze (or its shared AnalyzedText)
             task_id: Associated task ID
             user_id: User ID
             context: Additional context
@@ -238,318 +629,160 @@ class EDMMonitor:
         Returns:
             List of detected epistemic debt instances
         """
-        detected_debts = []
-
-        # Check for unfalsifiable claims
-        for pattern in self.UNFALSIFIABLE_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                debt = await self._create_debt_instance(
-                    claim=self._extract_claim(text, match.start(), match.end()),
-                    context=context or text,
-                    task_id=task_id,
-                    user_id=user_id,
-                    debt_type="unfalsifiable",
-                    severity=DebtSeverity.MEDIUM
-                )
-                detected_debts.append(debt)
-
-        # Check for unverified assertions
-        for pattern in self.UNVERIFIED_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Check if citation follows
-                has_citation = self._has_citation_nearby(text, match.end())
-
-                if not has_citation:
-                    debt = await self._create_debt_instance(
-                        claim=self._extract_claim(text, match.start(), match.end()),
-                        context=context or text,
-                        task_id=task_id,
-                        user_id=user_id,
-                        debt_type="missing_citation",
-                        severity=DebtSeverity.HIGH
-                    )
-                    detected_debts.append(debt)
-
-        # Check for vague claims
-        for pattern in self.VAGUE_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                debt = await self._create_debt_instance(
-                    claim=self._extract_claim(text, match.start(), match.end()),
-                    context=context or text,
-                    task_id=task_id,
-                    user_id=user_id,
-                    debt_type="vague_claim",
-                    severity=DebtSeverity.LOW
-                )
-                detected_debts.append(debt)
-
-        # Trigger fact-checking if enabled
+        analyzed = self._text_analyzer.analyze(text)
+        text = analyzed.text
+
+        found = []
+        for kind, start, end in analyzed.feature(self._marker_feature):
+            if kind == "unverified" and self._matcher.has_citation(
+                text, end, end + self.CITATION_LOOKAHEAD
+            ):
+                continue
+
+            debt_type, severity = self.DEBT_CLASSES[kind]
+            found.append((self._extract_claim(text, start, end), debt_type, severity))
+
+        detected_debts = await self._create_debt_instances(
+            found,
+            context=context or text,
+            task_id=task_id,
+            user_id=user_id
+        ) if found else []
+
+        # Trigger fact-checking if enabled (and the request can afford it)
         if self.fact_check_enabled:
-            for debt in detected_debts:
-                if debt.severity in [DebtSeverity.HIGH, DebtSeverity.CRITICAL]:
-                    asyncio.create_task(self._fact_check_claim(debt))
+            to_check = [
+                debt for debt in detected_debts
+                if debt.severity in [DebtSeverity.HIGH, DebtSeverity.CRITICAL]
+            ]
+            if to_check and not has_budget(self.FACT_CHECK_MIN_BUDGET_MS):
+                logger.info(f"Skipping {len(to_check)} fact-checks: request budget nearly spent")
+                to_check = []
+
+            for debt in to_check:
+                self.fact_checker.submit(debt.claim, partial(self._apply_fact_check, debt))
 
         logger.info(f"Detected {len(detected_debts)} epistemic debt instances in text")
         return detected_debts
 
-    async def _create_debt_instance(
+    async def _create_debt_instances(
         self,
-        claim: str,
+        found: List[Tuple[str, str, DebtSeverity]],
         context: str,
         task_id: str,
-        user_id: str,
-        debt_type: str,
-        severity: DebtSeverity
-    ) -> EpistemicDebtSnapshot:
-        """Create and store a debt instance"""
-        debt_id = f"{user_id}_{task_id}_{datetime.now().timestamp()}"
-
-        debt = EpistemicDebtSnapshot(
-            debt_id=debt_id,
-            timestamp=datetime.now(),
-            claim=claim,
-            context=context,
-            task_id=task_id,
-            user_id=user_id,
-            severity=severity,
-            debt_type=debt_type
-        )
+        user_id: str
+    ) -> List[EpistemicDebtSnapshot]:
+        """
+        Create and store the debt instances found in one text
 
-        # Store in memory
-        self.debt_instances[debt_id] = debt
+        Args:
+            found: (claim, debt_type, severity) per instance
+            context: Surrounding context
+            task_id: Associated task ID
+            user_id: User ID
+
+        Returns:
+            Created debt instances
+        """
+        now = datetime.now()
+        debts = [
+            EpistemicDebtSnapshot(
+                debt_id=f"{user_id}_{task_id}_{now.timestamp()}_{i}",
+                timestamp=now,
+                claim=claim,
+                context=context,
+                task_id=task_id,
+                user_id=user_id,
+                severity=severity,
+                debt_type=debt_type
+            )
+            for i, (claim, debt_type, severity) in enumerate(found)
+        ]
 
-        if user_id not in self.user_debt:
-            self.user_debt[user_id] = []
-        self.user_debt[user_id].append(debt_id)
+        # Store in memory
+        for debt in debts:
+            self._register_debt(debt)
 
-        # Persist to disk
-        await self._persist_debt(debt)
+        # Persist to disk (one write batch, off the event loop)
+        await self._persist_debts(debts)
 
         # Check for alerts
         await self._check_debt_alerts(user_id)
 
-        return debt
-
-    async def _persist_debt(self, debt: EpistemicDebtSnapshot) -> None:
-        """Persist debt instance to storage"""
-        filepath = self.storage_dir / f"{debt.debt_id}.json"
+        return debts
+
+    @staticmethod
+    def _debt_to_dict(debt: EpistemicDebtSnapshot) -> Dict:
+        """Serialize a debt instance for storage"""
+        return {
+            "debt_id": debt.debt_id,
+            "timestamp": debt.timestamp.isoformat(),
+            "claim": debt.claim,
+            "context": debt.context,
+            "task_id": debt.task_id,
+            "user_id": debt.user_id,
+            "severity": debt.severity.value,
+            "debt_type": debt.debt_type,
+            "fact_check_status": debt.fact_check_status.value,
+            "fact_check_source": debt.fact_check_source,
+            "fact_check_evidence": debt.fact_check_evidence,
+            "fact_check_confidence": debt.fact_check_confidence,
+            "resolved": debt.resolved,
+            "resolution_method": debt.resolution_method,
+            "resolution_timestamp": debt.resolution_timestamp.isoformat()
+            if debt.resolution_timestamp else None,
+            "metadata": debt.metadata
+        }
 
+    def _write_debt_records(self, records: List[Dict]) -> None:
+        """Append records to the store"""
         try:
-            with open(filepath, 'w') as f:
-                json.dump({
-                    "debt_id": debt.debt_id,
-                    "timestamp": debt.timestamp.isoformat(),
-                    "claim": debt.claim,
-                    "context": debt.context,
-                    "task_id": debt.task_id,
-                    "user_id": debt.user_id,
-                    "severity": debt.severity.value,
-                    "debt_type": debt.debt_type,
-                    "fact_check_status": debt.fact_check_status.value,
-                    "fact_check_source": debt.fact_check_source,
-                    "fact_check_evidence": debt.fact_check_evidence,
-                    "fact_check_confidence": debt.fact_check_confidence,
-                    "resolved": debt.resolved,
-                    "resolution_method": debt.resolution_method,
-                    "resolution_timestamp": debt.resolution_timestamp.isoformat()
-                    if debt.resolution_timestamp else None,
-                    "metadata": debt.metadata
-                }, f, indent=2)
+            self.store.append(records)
         except Exception as e:
-            logger.error(f"Failed to persist debt {debt.debt_id}: {e}")
-
-    async def _fact_check_claim(self, debt: EpistemicDebtSnapshot) -> None:
-        """
-        Perform fact-checking on a claim using multiple sources:
-        1. Google Fact Check Tools API (if API key available)
-        2. Wikipedia API for basic verification
-        3. Heuristic fallback for pattern matching
-
-        Integrates with real fact-checking services.
-        """
-        logger.info(f"Fact-checking claim: {debt.claim[:100]}...")
-
-        # Try Google Fact Check Tools API first
-        if self.google_fact_check_api_key:
-            try:
-                result = await self._check_google_fact_check_api(debt.claim)
-                if result:
-                    debt.fact_check_status = result["status"]
-                    debt.fact_check_source = result["source"]
-                    debt.fact_check_evidence = result["evidence"]
-                    debt.fact_check_confidence = result["confidence"]
-                    await self._persist_debt(debt)
-
-                    if self.auto_resolve_verified and debt.fact_check_status == FactCheckStatus.VERIFIED:
-                        await self.resolve_debt(debt.debt_id, "auto_verified")
-                    return
-            except Exception as e:
-                logger.warning(f"Google Fact Check API failed: {e}, trying fallback methods")
+            logger.error(f"Failed to persist {len(records)} debt instances: {e}")
 
-        # Try Wikipedia API as fallback
-        try:
-            result = await self._check_wikipedia_api(debt.claim)
-            if result:
-                debt.fact_check_status = result["status"]
-                debt.fact_check_source = result["source"]
-                debt.fact_check_evidence = result["evidence"]
-                debt.fact_check_confidence = result["confidence"]
-                await self._persist_debt(debt)
-
-                if self.auto_resolve_verified and debt.fact_check_status == FactCheckStatus.VERIFIED:
-                    await self.resolve_debt(debt.debt_id, "auto_verified")
-                return
-        except Exception as e:
-            logger.warning(f"Wikipedia API failed: {e}, using heuristic fallback")
+    async def _persist_debts(self, debts: List[EpistemicDebtSnapshot]) -> None:
+        """Persist a batch of debt instances in a worker thread"""
+        records = [self._debt_to_dict(debt) for debt in debts]
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_debt_records, records)
 
-        # Fallback to heuristic analysis
-        await self._heuristic_fact_check(debt)
+    async def _persist_debt(self, debt: EpistemicDebtSnapshot) -> None:
+        """Persist debt instance to storage"""
+        self._write_debt_records([self._debt_to_dict(debt)])
+
+    async def close(self) -> None:
+        """Stop fact-check workers and release their HTTP client"""
+        await self.fact_checker.close()
+
+    async def _apply_fact_check(self, debt: EpistemicDebtSnapshot, verdict: FactCheckVerdict) -> None:
+        """Record a fact-check verdict on a debt instance"""
+        self._update_debt(
+            debt,
+            fact_check_status=verdict.status,
+            fact_check_source=verdict.source,
+            fact_check_evidence=verdict.evidence,
+            fact_check_confidence=verdict.confidence
+        )
         await self._persist_debt(debt)
 
         # Auto-resolve if verified and enabled
         if self.auto_resolve_verified and debt.fact_check_status == FactCheckStatus.VERIFIED:
             await self.resolve_debt(debt.debt_id, "auto_verified")
 
-    async def _check_google_fact_check_api(self, claim: str) -> Optional[Dict]:
+    async def fact_check_debt(self, debt: EpistemicDebtSnapshot) -> FactCheckVerdict:
         """
-        Check claim using Google Fact Check Tools API
-
-        Returns dict with status, source, evidence, confidence or None
-        """
-        url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
-        params = {
-            "query": claim,
-            "key": self.google_fact_check_api_key,
-            "languageCode": "en"
-        }
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if not data.get("claims"):
-                return None
-
-            # Get the first claim review
-            claim_review = data["claims"][0]
-            reviews = claim_review.get("claimReview", [])
-
-            if not reviews:
-                return None
-
-            # Analyze the review rating
-            review = reviews[0]
-            rating = review.get("textualRating", "").lower()
-
-            # Map rating to our status
-            if any(word in rating for word in ["true", "correct", "accurate"]):
-                status = FactCheckStatus.VERIFIED
-                confidence = 0.9
-            elif any(word in rating for word in ["false", "incorrect", "inaccurate"]):
-                status = FactCheckStatus.FALSE
-                confidence = 0.9
-            elif any(word in rating for word in ["disputed", "mixed", "partly"]):
-                status = FactCheckStatus.DISPUTED
-                confidence = 0.7
-            else:
-                status = FactCheckStatus.UNVERIFIABLE
-                confidence = 0.5
-
-            return {
-                "status": status,
-                "source": f"Google Fact Check - {review.get('publisher', {}).get('name', 'Unknown')}",
-                "evidence": f"{rating}: {review.get('text', 'No details available')}",
-                "confidence": confidence
-            }
+        Fact-check a debt instance now, bypassing the queue
 
-    async def _check_wikipedia_api(self, claim: str) -> Optional[Dict]:
-        """
-        Check claim against Wikipedia for basic verification
-
-        Returns dict with status, source, evidence, confidence or None
-        """
-        # Extract key terms from claim for search
-        search_terms = " ".join([
-            word for word in claim.split()
-            if len(word) > 4 and word.lower() not in ["that", "this", "with", "from"]
-        ][:5])
-
-        if not search_terms:
-            return None
-
-        # Search Wikipedia
-        search_url = "https://en.wikipedia.org/w/api.php"
-        search_params = {
-            "action": "opensearch",
-            "search": search_terms,
-            "limit": 3,
-            "format": "json"
-        }
-
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(search_url, params=search_params)
-            response.raise_for_status()
-            data = response.json()
-
-            if len(data) < 4 or not data[1]:
-                return None
-
-            # Get the first result's description
-            title = data[1][0]
-            description = data[2][0] if data[2] else ""
-            url = data[3][0] if data[3] else ""
-
-            # Simple relevance check
-            claim_lower = claim.lower()
-            if any(term.lower() in claim_lower for term in title.split()):
-                return {
-                    "status": FactCheckStatus.VERIFIED,
-                    "source": f"Wikipedia - {title}",
-                    "evidence": f"Found relevant article: {description[:200]}... (See: {url})",
-                    "confidence": 0.6
-                }
-
-            return {
-                "status": FactCheckStatus.UNVERIFIABLE,
-                "source": "Wikipedia",
-                "evidence": "No directly relevant Wikipedia articles found",
-                "confidence": 0.4
-            }
+        Args:
+            debt: Debt instance to check
 
-    async def _heuristic_fact_check(self, debt: EpistemicDebtSnapshot) -> None:
-        """
-        Heuristic-based fact checking using pattern matching
+        Returns:
+            The verdict (also recorded on the debt)
         """
-        claim_lower = debt.claim.lower()
-
-        # Check for vague citations
-        if "studies show" in claim_lower or "research indicates" in claim_lower:
-            debt.fact_check_status = FactCheckStatus.UNVERIFIABLE
-            debt.fact_check_confidence = 0.3
-            debt.fact_check_evidence = "Claim requires specific citation to verify"
-
-        # Check for absolute statements
-        elif any(word in claim_lower for word in ["everyone", "no one", "always", "never"]):
-            debt.fact_check_status = FactCheckStatus.DISPUTED
-            debt.fact_check_confidence = 0.6
-            debt.fact_check_evidence = "Absolute claims are rarely accurate without qualification"
-
-        # Check for weasel words
-        elif any(pattern.replace(r"\b", "").replace(r"\\", "") in claim_lower
-                 for pattern in self.VAGUE_PATTERNS):
-            debt.fact_check_status = FactCheckStatus.UNVERIFIABLE
-            debt.fact_check_confidence = 0.4
-            debt.fact_check_evidence = "Vague attribution reduces verifiability"
-
-        # Default: pending further review
-        else:
-            debt.fact_check_status = FactCheckStatus.PENDING
-            debt.fact_check_confidence = 0.5
-            debt.fact_check_evidence = "Requires manual verification or additional context"
+        verdict = await self.fact_checker.check(debt.claim)
+        await self._apply_fact_check(debt, verdict)
+        return verdict
 
     async def resolve_debt(
         self,
@@ -573,9 +806,12 @@ class EDMMonitor:
             return False
 
         debt = self.debt_instances[debt_id]
-        debt.resolved = True
-        debt.resolution_method = resolution_method
-        debt.resolution_timestamp = datetime.now()
+        self._update_debt(
+            debt,
+            resolved=True,
+            resolution_method=resolution_method,
+            resolution_timestamp=datetime.now()
+        )
 
         if notes:
             debt.metadata["resolution_notes"] = notes
@@ -597,44 +833,26 @@ class EDMMonitor:
 
     def _has_citation_nearby(self, text: str, position: int, lookhead: int = 100) -> bool:
         """Check if citation appears near position"""
-        search_text = text[position:min(len(text), position + lookhead)]
-
-        # Look for citation patterns
-        citation_patterns = [
-            r'\[\d+\]',  # [1]
-            r'\([A-Z][a-z]+,?\s+\d{4}\)',  # (Author, 2020)
-            r'doi:',
-            r'http[s]?://',
-        ]
-
-        for pattern in citation_patterns:
-            if re.search(pattern, search_text):
-                return True
-
-        return False
+        return self._matcher.has_citation(text, position, position + lookhead)
 
     async def _check_debt_alerts(self, user_id: str) -> None:
         """Check if user has excessive unresolved debt"""
-        if user_id not in self.user_debt:
+        index = self._user_indexes.get(user_id)
+        if index is None:
             return
 
-        user_debts = [
-            self.debt_instances[debt_id]
-            for debt_id in self.user_debt[user_id]
-            if not self.debt_instances[debt_id].resolved
-        ]
-
-        if len(user_debts) > self.max_unresolved_debt:
+        unresolved = index.unresolved()
+        if unresolved > self.max_unresolved_debt:
             logger.warning(
-                f"⚠️ User {user_id} has {len(user_debts)} unresolved epistemic debts "
+                f"⚠️ User {user_id} has {unresolved} unresolved epistemic debts "
                 f"(threshold: {self.max_unresolved_debt})"
             )
 
         # Check for critical debt
-        critical_debts = [d for d in user_debts if d.severity == DebtSeverity.CRITICAL]
-        if critical_debts:
+        critical = index.unresolved(DebtSeverity.CRITICAL)
+        if critical:
             logger.error(
-                f"🚨 User {user_id} has {len(critical_debts)} CRITICAL epistemic debts!"
+                f"🚨 User {user_id} has {critical} CRITICAL epistemic debts!"
             )
 
     def generate_report(
@@ -649,58 +867,56 @@ class EDMMonitor:
         if start_date is None:
             start_date = end_date - timedelta(days=7)
 
-        # Filter debts
         if user_id:
-            relevant_debt_ids = self.user_debt.get(user_id, [])
-            debts = [self.debt_instances[debt_id] for debt_id in relevant_debt_ids]
+            index = self._user_indexes.get(user_id) or DebtIndex()
         else:
-            debts = list(self.debt_instances.values())
-
-        # Filter by date range
-        period_debts = [
-            d for d in debts
-            if start_date <= d.timestamp <= end_date
-        ]
+            index = self._global_index
+
+        # Whole history: read the running counters; otherwise aggregate the
+        # time-index slice for the period
+        if index.covers(start_date, end_date):
+            counts = index.counts
+            high_risk = [self.debt_instances[debt_id] for debt_id in index.unresolved_high_risk]
+            high_risk.sort(key=lambda d: d.timestamp)
+        else:
+            period_debts = [
+                self.debt_instances[debt_id]
+                for debt_id in index.ids_between(start_date, end_date)
+            ]
+            counts = Counter(DebtIndex.key(d) for d in period_debts)
+            high_risk = [
+                d for d in period_debts
+                if d.severity in HIGH_RISK_SEVERITIES and not d.resolved
+            ]
 
         # Calculate metrics
-        total_debt = len(period_debts)
-        resolved = sum(1 for d in period_debts if d.resolved)
+        total_debt = 0
+        resolved = 0
+        verified = 0
+        false = 0
+        fact_checked = 0
+        debt_by_severity = {severity.value: 0 for severity in DebtSeverity}
+        debt_by_type: Dict[str, int] = {}
+        for (severity, debt_type, is_resolved, status), n in counts.items():
+            total_debt += n
+            debt_by_severity[severity.value] += n
+            debt_by_type[debt_type] = debt_by_type.get(debt_type, 0) + n
+            if is_resolved:
+                resolved += n
+            if status == FactCheckStatus.VERIFIED:
+                verified += n
+            elif status == FactCheckStatus.FALSE:
+                false += n
+            if status != FactCheckStatus.PENDING:
+                fact_checked += n
         pending = total_debt - resolved
 
-        verified = sum(
-            1 for d in period_debts
-            if d.fact_check_status == FactCheckStatus.VERIFIED
-        )
-        false = sum(
-            1 for d in period_debts
-            if d.fact_check_status == FactCheckStatus.FALSE
-        )
-
-        # By severity
-        debt_by_severity = {}
-        for severity in DebtSeverity:
-            debt_by_severity[severity.value] = sum(
-                1 for d in period_debts if d.severity == severity
-            )
-
         # Rates
         days = (end_date - start_date).days or 1
         accumulation_rate = total_debt / days
         resolution_rate = (resolved / total_debt * 100) if total_debt > 0 else 0.0
-
-        fact_checked = sum(
-            1 for d in period_debts
-            if d.fact_check_status != FactCheckStatus.PENDING
-        )
         fact_check_accuracy = (verified / fact_checked * 100) if fact_checked > 0 else 0.0
 
-        # High risk claims
-        high_risk = [
-            d for d in period_debts
-            if d.severity in [DebtSeverity.HIGH, DebtSeverity.CRITICAL]
-            and not d.resolved
-        ]
-
         # Alerts
         alerts = []
         if pending > self.max_unresolved_debt:
@@ -722,6 +938,7 @@ class EDMMonitor:
             verified_claims=verified,
             false_claims=false,
             debt_by_severity=debt_by_severity,
+            debt_by_type=debt_by_type,
             debt_accumulation_rate=accumulation_rate,
             resolution_rate=resolution_rate,
             fact_check_accuracy=fact_check_accuracy,
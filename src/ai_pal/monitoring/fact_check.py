@@ -0,0 +1,743 @@
+"""
+Fact-Check Service
+
+Verifies claims flagged by the EDM monitor without letting verification
+work pile up:
+- A bounded queue drained by a fixed pool of worker tasks; when the queue
+  is full, new claims are dropped (and counted) rather than spawning more
+  tasks
+- Claims are normalized so identical claims are verified once: queued
+  duplicates share a single check, and verdicts are cached with a TTL in
+  an append-only file that survives restarts
+- One shared HTTP client, and a token-bucket rate limit per source
+- Pluggable backends: Google Fact Check Tools, Wikipedia, and a local
+  backend of known verdicts for offline use and tests; a heuristic verdict
+  is the fallback when no backend has an answer
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+from loguru import logger
+
+from .deadline import RequestDeadline, current_deadline
+from .metrics import MetricsCollector, get_metrics
+
+
+class FactCheckStatus(Enum):
+    """Fact-checking result status"""
+    VERIFIED = "verified"  # Claim verified as true
+    DISPUTED = "disputed"  # Claim has conflicting evidence
+    FALSE = "false"  # Claim verified as false
+    UNVERIFIABLE = "unverifiable"  # Cannot be verified
+    PENDING = "pending"  # Awaiting fact-check
+
+
+# Verdicts that may change as sources are updated; cached for less time
+INCONCLUSIVE_STATUSES = (FactCheckStatus.UNVERIFIABLE, FactCheckStatus.PENDING)
+
+
+@dataclass
+class FactCheckVerdict:
+    """Outcome of checking one claim"""
+    status: FactCheckStatus
+    source: Optional[str] = None
+    evidence: Optional[str] = None
+    confidence: float = 0.0  # 0-1
+    checked_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status.value,
+            "source": self.source,
+            "evidence": self.evidence,
+            "confidence": self.confidence,
+            "checked_at": self.checked_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FactCheckVerdict":
+        return cls(
+            status=FactCheckStatus(data["status"]),
+            source=data.get("source"),
+            evidence=data.get("evidence"),
+            confidence=data.get("confidence", 0.0),
+            checked_at=data.get("checked_at", time.time()),
+        )
+
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_claim(claim: str) -> str:
+    """
+    Canonical form of a claim for deduplication and caching
+
+    Case, punctuation, Unicode compatibility forms and whitespace are
+    ignored: "Studies show X." and "studies  show x" are the same claim.
+    """
+    text = unicodedata.normalize("NFKC", claim).casefold()
+    text = _NON_WORD.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def claim_key(claim: str) -> str:
+    """Cache key for a claim (a hash, so claim text is never stored)"""
+    return hashlib.sha256(normalize_claim(claim).encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Rate Limiting
+# ============================================================================
+
+
+class SourceRateLimit:
+    """
+    Token bucket pacing calls to one source
+
+    Callers reserve a token and sleep off any deficit, so bursts are
+    spread out rather than rejected.
+    """
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        """
+        Initialize rate limit
+
+        Args:
+            rate: Calls per second
+            burst: Calls allowed back to back
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; returns seconds to wait before using it"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait for this caller's turn"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class FactCheckBackend(ABC):
+    """A source of fact-check verdicts"""
+
+    name: str = "backend"
+
+    def __init__(self, rate_limit: Optional[SourceRateLimit] = None):
+        """
+        Initialize backend
+
+        Args:
+            rate_limit: Pacing for calls to this source (None = unlimited)
+        """
+        self.rate_limit = rate_limit
+
+    @abstractmethod
+    async def check(self, claim: str, client: httpx.AsyncClient) -> Optional[FactCheckVerdict]:
+        """
+        Check a claim
+
+        Args:
+            claim: Claim text
+            client: Shared HTTP client
+
+        Returns:
+            Verdict, or None if this source has nothing on the claim
+        """
+
+
+class GoogleFactCheckBackend(FactCheckBackend):
+    """Google Fact Check Tools claim search"""
+
+    name = "google"
+    URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+
+    def __init__(self, api_key: str, rate_limit: Optional[SourceRateLimit] = None):
+        super().__init__(rate_limit or SourceRateLimit(rate=5.0, burst=5))
+        self.api_key = api_key
+
+    async def check(self, claim: str, client: httpx.AsyncClient) -> Optional[FactCheckVerdict]:
+        params = {
+            "query": claim,
+            "key": self.api_key,
+            "languageCode": "en"
+        }
+        response = await client.get(self.URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        if not data.get("claims"):
+            return None
+
+        # Get the first claim review
+        reviews = data["claims"][0].get("claimReview", [])
+        if not reviews:
+            return None
+
+        # Map the review rating to our status
+        review = reviews[0]
+        rating = review.get("textualRating", "").lower()
+
+        if any(word in rating for word in ["true", "correct", "accurate"]):
+            status, confidence = FactCheckStatus.VERIFIED, 0.9
+        elif any(word in rating for word in ["false", "incorrect", "inaccurate"]):
+            status, confidence = FactCheckStatus.FALSE, 0.9
+        elif any(word in rating for word in ["disputed", "mixed", "partly"]):
+            status, confidence = FactCheckStatus.DISPUTED, 0.7
+        else:
+            status, confidence = FactCheckStatus.UNVERIFIABLE, 0.5
+
+        return FactCheckVerdict(
+            status=status,
+            source=f"Google Fact Check - {review.get('publisher', {}).get('name', 'Unknown')}",
+            evidence=f"{rating}: {review.get('text', 'No details available')}",
+            confidence=confidence
+        )
+
+
+class WikipediaBackend(FactCheckBackend):
+    """Wikipedia article search for basic verification"""
+
+    name = "wikipedia"
+    URL = "https://en.wikipedia.org/w/api.php"
+
+    def __init__(self, rate_limit: Optional[SourceRateLimit] = None):
+        super().__init__(rate_limit or SourceRateLimit(rate=5.0, burst=5))
+
+    async def check(self, claim: str, client: httpx.AsyncClient) -> Optional[FactCheckVerdict]:
+        # Extract key terms from claim for search
+        search_terms = " ".join([
+            word for word in claim.split()
+            if len(word) > 4 and word.lower() not in ["that", "this", "with", "from"]
+        ][:5])
+
+        if not search_terms:
+            return None
+
+        params = {
+            "action": "opensearch",
+            "search": search_terms,
+            "limit": 3,
+            "format": "json"
+        }
+        response = await client.get(self.URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+
+        if len(data) < 4 or not data[1]:
+            return None
+
+        # Get the first result's description
+        title = data[1][0]
+        description = data[2][0] if data[2] else ""
+        url = data[3][0] if data[3] else ""
+
+        # Simple relevance check
+        claim_lower = claim.lower()
+        if any(term.lower() in claim_lower for term in title.split()):
+            return FactCheckVerdict(
+                status=FactCheckStatus.VERIFIED,
+                source=f"Wikipedia - {title}",
+                evidence=f"Found relevant article: {description[:200]}... (See: {url})",
+                confidence=0.6
+            )
+
+        return FactCheckVerdict(
+            status=FactCheckStatus.UNVERIFIABLE,
+            source="Wikipedia",
+            evidence="No directly relevant Wikipedia articles found",
+            confidence=0.4
+        )
+
+
+class LocalFactCheckBackend(FactCheckBackend):
+    """
+    Verdicts from a local table of known claims
+
+    Needs no network, so it stands in for the remote sources offline and
+    in tests. Claims are matched in normalized form.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        verdicts: Optional[Dict[str, FactCheckVerdict]] = None,
+        latency_seconds: float = 0.0,
+        rate_limit: Optional[SourceRateLimit] = None
+    ):
+        """
+        Initialize backend
+
+        Args:
+            verdicts: Claim -> verdict
+            latency_seconds: Simulated lookup time
+            rate_limit: Optional pacing, to exercise rate limiting offline
+        """
+        super().__init__(rate_limit)
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+        self._verdicts = {
+            normalize_claim(claim): verdict for claim, verdict in (verdicts or {}).items()
+        }
+
+    def add(self, claim: str, verdict: FactCheckVerdict) -> None:
+        """Add or replace a known claim"""
+        self._verdicts[normalize_claim(claim)] = verdict
+
+    async def check(self, claim: str, client: httpx.AsyncClient) -> Optional[FactCheckVerdict]:
+        self.calls += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        verdict = self._verdicts.get(normalize_claim(claim))
+        if verdict is None:
+            return None
+        return FactCheckVerdict(
+            status=verdict.status,
+            source=verdict.source or "Local",
+            evidence=verdict.evidence,
+            confidence=verdict.confidence
+        )
+
+
+def heuristic_verdict(claim: str, vague_phrases: Sequence[str] = ()) -> FactCheckVerdict:
+    """
+    Verdict from the claim's wording alone, when no source has an answer
+
+    Args:
+        claim: Claim text
+        vague_phrases: Weasel-word phrases that reduce verifiability
+
+    Returns:
+        Low-confidence verdict
+    """
+    claim_lower = claim.lower()
+
+    # Check for vague citations
+    if "studies show" in claim_lower or "research indicates" in claim_lower:
+        return FactCheckVerdict(
+            status=FactCheckStatus.UNVERIFIABLE,
+            source="heuristic",
+            evidence="Claim requires specific citation to verify",
+            confidence=0.3
+        )
+
+    # Check for absolute statements
+    if any(word in claim_lower for word in ["everyone", "no one", "always", "never"]):
+        return FactCheckVerdict(
+            status=FactCheckStatus.DISPUTED,
+            source="heuristic",
+            evidence="Absolute claims are rarely accurate without qualification",
+            confidence=0.6
+        )
+
+    # Check for weasel words
+    if any(phrase.replace(r"\b", "").replace("\\", "") in claim_lower for phrase in vague_phrases):
+        return FactCheckVerdict(
+            status=FactCheckStatus.UNVERIFIABLE,
+            source="heuristic",
+            evidence="Vague attribution reduces verifiability",
+            confidence=0.4
+        )
+
+    # Default: pending further review
+    return FactCheckVerdict(
+        status=FactCheckStatus.PENDING,
+        source="heuristic",
+        evidence="Requires manual verification or additional context",
+        confidence=0.5
+    )
+
+
+# ============================================================================
+# Verdict Cache
+# ============================================================================
+
+
+class FactCheckCache:
+    """
+    Claim -> verdict cache with a TTL, persisted as an append-only log
+
+    Each put appends one JSON line; the log is replayed on startup (later
+    lines win, expired entries are skipped) and rewritten once it holds
+    mostly superseded lines. Keys are hashes of the normalized claim.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = 7 * 86400,
+        inconclusive_ttl_seconds: float = 86400,
+        max_entries: int = 10000
+    ):
+        """
+        Initialize cache
+
+        Args:
+            path: Log file (None = memory only)
+            ttl_seconds: Lifetime of conclusive verdicts
+            inconclusive_ttl_seconds: Lifetime of unverifiable/pending verdicts
+            max_entries: Entries kept before evicting least recently used
+        """
+        self.path = Path(path) if path else None
+        self.ttl_seconds = ttl_seconds
+        self.inconclusive_ttl_seconds = inconclusive_ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, Tuple[FactCheckVerdict, float]]" = OrderedDict()
+        self._log_lines = 0
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+
+        now = time.time()
+        with open(self.path, "r") as f:
+            for line in f:
+                self._log_lines += 1
+                try:
+                    record = json.loads(line)
+                    expires_at = record["expires_at"]
+                    if expires_at > now:
+                        self._entries[record["key"]] = (
+                            FactCheckVerdict.from_dict(record["verdict"]), expires_at
+                        )
+                        self._entries.move_to_end(record["key"])
+                    else:
+                        self._entries.pop(record["key"], None)
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping bad fact-check cache line: {e}")
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        logger.info(f"Loaded {len(self._entries)} cached fact-check verdicts")
+
+    def get(self, claim: str) -> Optional[FactCheckVerdict]:
+        """Cached verdict for a claim, if fresh"""
+        key = claim_key(claim)
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, claim: str, verdict: FactCheckVerdict) -> None:
+        """Cache a verdict"""
+        ttl = self.inconclusive_ttl_seconds if verdict.status in INCONCLUSIVE_STATUSES else self.ttl_seconds
+        key = claim_key(claim)
+        expires_at = time.time() + ttl
+
+        self._entries[key] = (verdict, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        if self.path is None:
+            return
+        try:
+            if self._log_lines > 2 * len(self._entries) + 100:
+                self._compact()
+            else:
+                with open(self.path, "a") as f:
+                    f.write(self._line(key, verdict, expires_at))
+                self._log_lines += 1
+        except OSError as e:
+            logger.error(f"Failed to persist fact-check verdict: {e}")
+
+    @staticmethod
+    def _line(key: str, verdict: FactCheckVerdict, expires_at: float) -> str:
+        return json.dumps({"key": key, "verdict": verdict.to_dict(), "expires_at": expires_at}) + "\n"
+
+    def _compact(self) -> None:
+        """Rewrite the log with only live entries"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            for key, (verdict, expires_at) in self._entries.items():
+                f.write(self._line(key, verdict, expires_at))
+        tmp.replace(self.path)
+        self._log_lines = len(self._entries)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ============================================================================
+# Service
+# ============================================================================
+
+
+VerdictHandler = Callable[[FactCheckVerdict], Awaitable[None]]
+
+
+@dataclass
+class _Job:
+    """One queued claim and everyone waiting on its verdict"""
+    claim: str
+    handlers: List[VerdictHandler]
+    deadlines: List[Optional[RequestDeadline]]
+
+
+class FactCheckService:
+    """
+    Bounded, cached, rate-limited claim verification
+
+    Backends are tried in order until one returns a verdict; the heuristic
+    verdict is used when none does. submit() queues a claim for the worker
+    pool and returns immediately; check() verifies inline.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[FactCheckBackend],
+        cache: Optional[FactCheckCache] = None,
+        workers: int = 4,
+        max_queue: int = 256,
+        timeout_seconds: float = 10.0,
+        vague_phrases: Sequence[str] = (),
+        metrics: Optional[MetricsCollector] = None
+    ):
+        """
+        Initialize service
+
+        Args:
+            backends: Sources to try, in order
+            cache: Verdict cache (default: in memory)
+            workers: Claims verified concurrently
+            max_queue: Claims waiting before new ones are dropped
+            timeout_seconds: HTTP timeout per source call
+            vague_phrases: Weasel-word phrases for the heuristic fallback
+            metrics: Where to report checks (default: global collector)
+        """
+        self.backends = list(backends)
+        self.cache = cache if cache is not None else FactCheckCache()
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self.vague_phrases = list(vague_phrases)
+        self.metrics = metrics or get_metrics()
+
+        self.dropped = 0
+        self.completed = 0
+        # Normalized claim -> queued job, so duplicates share one check
+        self._pending: Dict[str, _Job] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ----- verification -----
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=self.workers * 2),
+            )
+        return self._client
+
+    async def check(self, claim: str) -> FactCheckVerdict:
+        """
+        Verify a claim now (cache, then each backend, then the heuristic)
+
+        A heuristic verdict is not cached when a backend failed, so the
+        claim is retried once the source recovers.
+
+        Args:
+            claim: Claim text
+
+        Returns:
+            Verdict
+        """
+        cached = self.cache.get(claim)
+        if cached is not None:
+            self.metrics.record_fact_check("cache", cached.status.value, 0.0)
+            return cached
+
+        failed = False
+        for backend in self.backends:
+            if backend.rate_limit is not None:
+                await backend.rate_limit.acquire()
+
+            start = time.perf_counter()
+            try:
+                verdict = await backend.check(claim, self._get_client())
+            except Exception as e:
+                failed = True
+                self.metrics.record_fact_check(backend.name, "error", time.perf_counter() - start)
+                logger.warning(f"Fact-check source {backend.name} failed: {e}")
+                continue
+
+            if verdict is not None:
+                self.metrics.record_fact_check(backend.name, verdict.status.value, time.perf_counter() - start)
+                self.cache.put(claim, verdict)
+                return verdict
+
+        verdict = heuristic_verdict(claim, self.vague_phrases)
+        self.metrics.record_fact_check("heuristic", verdict.status.value, 0.0)
+        if not failed:
+            self.cache.put(claim, verdict)
+        return verdict
+
+    # ----- worker pool -----
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._queue is not None:
+            return
+
+        # First use, or a new event loop (e.g. between test runs)
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._pending.clear()
+        self._client = None
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"fact-check-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    def submit(self, claim: str, on_verdict: VerdictHandler) -> bool:
+        """
+        Queue a claim for verification
+
+        The current request deadline (if any) travels with the claim: once
+        every requester's deadline has passed, the check is skipped or
+        cancelled.
+
+        Args:
+            claim: Claim text
+            on_verdict: Awaited with the verdict once the claim is checked
+
+        Returns:
+            False if the queue was full and the claim was dropped
+        """
+        self._ensure_started()
+        deadline = current_deadline()
+        key = normalize_claim(claim)
+
+        job = self._pending.get(key)
+        if job is not None:
+            job.handlers.append(on_verdict)
+            job.deadlines.append(deadline)
+            return True
+
+        job = _Job(claim=claim, handlers=[on_verdict], deadlines=[deadline])
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self.metrics.record_fact_check_dropped(self._queue.qsize())
+            logger.debug(f"Fact-check queue full; dropped claim ({self.dropped} dropped so far)")
+            return False
+
+        self._pending[key] = job
+        self.metrics.record_fact_check_queue(self._queue.qsize())
+        return True
+
+    @staticmethod
+    def _time_left(job: _Job) -> Optional[float]:
+        """Seconds the job may run: None if any requester has no deadline"""
+        if any(deadline is None for deadline in job.deadlines):
+            return None
+        return max(deadline.remaining_ms() for deadline in job.deadlines) / 1000
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._pending.pop(normalize_claim(job.claim), None)
+            try:
+                await self._run(job)
+            except Exception as e:
+                logger.error(f"Fact-check worker error: {e}")
+            finally:
+                self._queue.task_done()
+                self.metrics.record_fact_check_queue(self._queue.qsize())
+
+    async def _run(self, job: _Job) -> None:
+        time_left = self._time_left(job)
+        if time_left is not None and time_left <= 0:
+            logger.debug("Skipping fact-check: request deadline passed while queued")
+            return
+
+        try:
+            verdict = await asyncio.wait_for(self.check(job.claim), timeout=time_left)
+        except asyncio.TimeoutError:
+            logger.warning("Fact-check cancelled: request deadline exceeded")
+            return
+
+        self.completed += 1
+        for handler in job.handlers:
+            try:
+                await handler(verdict)
+            except Exception as e:
+                logger.error(f"Fact-check result handler failed: {e}")
+
+    async def join(self) -> None:
+        """Wait until every queued claim has been processed"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the workers (dropping queued claims) and close the HTTP client"""
+        for task in self._workers:
+            task.cancel()
+        if self._workers and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._pending.clear()
+
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get service statistics"""
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "cache_entries": len(self.cache),
+            "cache_hit_rate": self.cache.hit_rate(),
+            "backends": [backend.name for backend in self.backends],
+        }
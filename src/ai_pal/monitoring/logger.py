@@ -87,6 +87,10 @@ def setup_logging(
     # Remove default handler
     loguru_logger.remove()
 
+    # Modules logging through loguru directly have no logger_name; without a
+    # default every such record fails to format and dumps a traceback
+    loguru_logger.configure(extra={"logger_name": "ai_pal"})
+
     # Format
     if json_format:
         # JSON format for production
@@ -413,6 +413,172 @@ class MetricsCollector:
             labels={"plugin": plugin_id},
         )
 
+    def record_cache_lookup(
+        self,
+        function: str,
+        hit: bool,
+        latency_seconds: float,
+        negative: bool = False,
+    ):
+        """
+        Record a lookup through a @cached function.
+
+        Args:
+            function: Qualified name of the cached function
+            hit: Whether the value came from cache
+            latency_seconds: Total call latency (including the function on a miss)
+            negative: Whether the hit was a cached None result
+        """
+        labels = {"function": function}
+
+        # Count hits and misses
+        if hit:
+            self.increment_counter("ai_pal_cache_hits_total", labels=labels)
+        else:
+            self.increment_counter("ai_pal_cache_misses_total", labels=labels)
+
+        if negative:
+            self.increment_counter("ai_pal_cache_negative_hits_total", labels=labels)
+
+        # Record latency by outcome
+        self.observe_histogram(
+            "ai_pal_cached_call_duration_seconds",
+            latency_seconds,
+            labels={"function": function, "result": "hit" if hit else "miss"},
+        )
+
+    def record_stage_budget(
+        self,
+        stage: str,
+        elapsed_seconds: float,
+        budget_seconds: float,
+        exceeded: bool = False,
+    ):
+        """
+        Record how much of a request's deadline budget a stage consumed.
+
+        Args:
+            stage: Pipeline stage name
+            elapsed_seconds: Wall time spent in the stage
+            budget_seconds: Total request budget
+            exceeded: Whether the deadline expired during the stage
+        """
+        labels = {"stage": stage}
+
+        self.observe_histogram("ai_pal_stage_duration_seconds", elapsed_seconds, labels)
+        if budget_seconds > 0:
+            self.observe_histogram(
+                "ai_pal_stage_budget_ratio", elapsed_seconds / budget_seconds, labels
+            )
+
+        if exceeded:
+            self.increment_counter("ai_pal_deadline_exceeded_total", labels=labels)
+
+    def record_admission_shed(self, route: str, reason: str):
+        """
+        Record a request shed by admission control.
+
+        Args:
+            route: Route prefix the request matched ("other" if none)
+            reason: rate_limited, queue_full or queue_timeout
+        """
+        self.increment_counter(
+            "ai_pal_admission_shed_total", labels={"route": route, "reason": reason}
+        )
+
+    def record_admission_queue(self, queue_depths: Dict[str, int], in_flight: int):
+        """
+        Record the generation pool's current load.
+
+        Args:
+            queue_depths: Waiting requests per priority class
+            in_flight: Requests holding a generation slot
+        """
+        for priority, depth in queue_depths.items():
+            self.set_gauge(
+                "ai_pal_admission_queue_depth", depth, labels={"priority": priority}
+            )
+        self.set_gauge("ai_pal_admission_in_flight", in_flight)
+
+    def record_auth_verification(self, outcome: str, latency_seconds: float):
+        """
+        Record a token signature/claims verification.
+
+        Args:
+            outcome: verified or rejected
+            latency_seconds: Verification time, including any JWKS fetch
+        """
+        self.increment_counter("ai_pal_auth_verifications_total", labels={"outcome": outcome})
+        self.observe_histogram(
+            "ai_pal_auth_verification_duration_seconds",
+            latency_seconds,
+            labels={"outcome": outcome},
+        )
+
+    def record_auth_cache_lookup(self, hit: bool, hit_rate: float):
+        """
+        Record a lookup in the verified-principal cache.
+
+        Args:
+            hit: Whether the token was already verified
+            hit_rate: Cache hit rate since startup
+        """
+        if hit:
+            self.increment_counter("ai_pal_auth_cache_hits_total")
+        else:
+            self.increment_counter("ai_pal_auth_cache_misses_total")
+        self.set_gauge("ai_pal_auth_cache_hit_ratio", hit_rate)
+
+    def record_fact_check(self, source: str, status: str, latency_seconds: float):
+        """
+        Record a fact-check verdict.
+
+        Args:
+            source: Backend that answered, "cache" or "heuristic"
+            status: Verdict status, or "error" if the source failed
+            latency_seconds: Time spent on the source
+        """
+        labels = {"source": source, "status": status}
+        self.increment_counter("ai_pal_fact_checks_total", labels=labels)
+        if source not in ("cache", "heuristic"):
+            self.observe_histogram(
+                "ai_pal_fact_check_duration_seconds", latency_seconds, labels={"source": source}
+            )
+
+    def record_fact_check_queue(self, depth: int):
+        """
+        Record the fact-check queue depth.
+
+        Args:
+            depth: Claims waiting for a worker
+        """
+        self.set_gauge("ai_pal_fact_check_queue_depth", depth)
+
+    def record_fact_check_dropped(self, depth: int):
+        """
+        Record a claim dropped because the fact-check queue was full.
+
+        Args:
+            depth: Queue depth at the time
+        """
+        self.increment_counter("ai_pal_fact_check_dropped_total")
+        self.set_gauge("ai_pal_fact_check_queue_depth", depth)
+
+    def record_pii_scrub(self, path: str, stage_seconds: Dict[str, float]):
+        """
+        Record a PII scrub and the time each of its stages took.
+
+        Args:
+            path: "nlp" if the text went through the NLP analyzer, "fast" if
+                the prefilter let it skip the model
+            stage_seconds: Seconds per stage (prefilter, nlp, regex, anonymize)
+        """
+        self.increment_counter("ai_pal_pii_scrubs_total", labels={"path": path})
+        for stage, seconds in stage_seconds.items():
+            self.observe_histogram(
+                "ai_pal_pii_scrub_stage_seconds", seconds, labels={"stage": stage}
+            )
+
     def record_system_resource(
         self, resource_type: str, value: float, unit: str = ""
     ):
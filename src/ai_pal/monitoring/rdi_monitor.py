@@ -18,7 +18,7 @@ Part of the Agency-Centric AI framework's epistemic integrity monitoring.
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Set
+from typing import Dict, List, Optional, Tuple, Any, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import json
@@ -26,8 +26,11 @@ from pathlib import Path
 import hashlib
 import random
 
+import numpy as np
 from loguru import logger
 
+from .text_analysis import AnalyzedText, get_text_analyzer
+
 
 # ============================================================================
 # PRIVACY MARKER
@@ -194,10 +197,82 @@ class AnonymizedRDIStats:
     pii_scrubbed: bool = True
 
 
+# ============================================================================
+# COLUMNAR SCORE STORE
+# ============================================================================
+
+# RDI level bins for the aggregate distribution (lower bounds after "aligned")
+RDI_LEVEL_BINS = np.array([0.2, 0.4, 0.6, 0.8])
+RDI_LEVEL_NAMES = ["aligned", "minor_drift", "moderate_drift", "significant_drift", "critical_drift"]
+
+
+class RDIScoreColumns:
+    """
+    One row per hashed user: latest and previous overall RDI, score count
+    and aggregate opt-in, as NumPy columns.
+
+    Aggregates reduce over whole columns instead of walking every user's
+    score history. Holds no user IDs beyond the local hashes in the index.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.index: Dict[str, int] = {}  # Hashed user_id -> row
+        self.latest = np.zeros(capacity)
+        self.previous = np.zeros(capacity)
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.opted_in = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _row(self, hashed_user_id: str) -> int:
+        row = self.index.get(hashed_user_id)
+        if row is None:
+            row = len(self.index)
+            if row == len(self.latest):
+                # Grow all columns together (amortized O(1) inserts)
+                size = 2 * len(self.latest)
+                for name in ("latest", "previous", "count", "opted_in"):
+                    column = getattr(self, name)
+                    grown = np.zeros(size, dtype=column.dtype)
+                    grown[:row] = column[:row]
+                    setattr(self, name, grown)
+            self.index[hashed_user_id] = row
+        return row
+
+    def record(self, hashed_user_id: str, overall_rdi: float) -> None:
+        """Append a user's newest score"""
+        row = self._row(hashed_user_id)
+        self.previous[row] = self.latest[row]
+        self.latest[row] = overall_rdi
+        self.count[row] += 1
+
+    def opt_in(self, hashed_user_id: str) -> None:
+        """Mark a user as opted in to aggregate sharing"""
+        row = self._row(hashed_user_id)  # may grow (replace) the columns
+        self.opted_in[row] = True
+
+    def opted_in_scores(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Columns restricted to opted-in users with at least one score
+
+        Returns:
+            (latest, previous, count) arrays
+        """
+        n = len(self.index)
+        mask = self.opted_in[:n] & (self.count[:n] > 0)
+        return self.latest[:n][mask], self.previous[:n][mask], self.count[:n][mask]
+
+
 # ============================================================================
 # RDI MONITOR
 # ============================================================================
 
+def _concepts(analyzed: AnalyzedText) -> Tuple[str, ...]:
+    """Key terms (simple heuristic: long tokens)"""
+    return tuple(w for w in analyzed.tokens if len(w) > 5)
+
+
 class RDIMonitor:
     """
     Reality Drift Index Monitor
@@ -218,6 +293,18 @@ class RDIMonitor:
     while respecting absolute privacy.
     """
 
+    # Shared text-analysis features
+    CONCEPTS_FEATURE = "rdi.concepts"
+    REASONING_MARKER_SET = "rdi.reasoning_markers"
+    REASONING_MARKERS = [
+        'because', 'therefore', 'thus', 'hence', 'consequently',
+        'if', 'then', 'since', 'as a result'
+    ]
+
+    # Baseline concept vector size (pruned by frequency)
+    MAX_BASELINE_CONCEPTS = 1000
+    BASELINE_PRUNE_SLACK = 250
+
     def __init__(
         self,
         storage_dir: Path,
@@ -248,12 +335,19 @@ class RDIMonitor:
         self._local_rdi_scores: Dict[str, List[RDIScore]] = {}   # Hashed user_id -> scores
         self._local_drift_signals: Dict[str, List[DriftSignal]] = {}  # Hashed user_id -> signals
 
+        # Latest/previous score per user as columns, for aggregates
+        self._score_columns = RDIScoreColumns()
+
         # Consensus model (public, generalized knowledge)
         self.consensus_model = self._load_or_create_consensus_model(consensus_model_path)
 
         # User opt-ins for aggregate sharing (explicit consent)
         self._aggregate_opt_ins: Set[str] = set()  # Hashed user IDs who opted in
 
+        self._text_analyzer = get_text_analyzer()
+        self._text_analyzer.register_feature(self.CONCEPTS_FEATURE, _concepts)
+        self._text_analyzer.register_markers(self.REASONING_MARKER_SET, self.REASONING_MARKERS)
+
         # Load local data
         self._load_local_data()
 
@@ -374,6 +468,12 @@ class RDIMonitor:
             except Exception as e:
                 logger.error(f"Failed to load score {file}: {e}")
 
+        # Files come back in directory order; histories are oldest first
+        for user_id, scores in self._local_rdi_scores.items():
+            scores.sort(key=lambda score: score.timestamp)
+            for score in scores[-2:]:
+                self._score_columns.record(user_id, score.overall_rdi)
+
         logger.info(
             f"Loaded {len(self._local_baselines)} baselines, "
             f"{sum(len(scores) for scores in self._local_rdi_scores.values())} scores"
@@ -382,7 +482,7 @@ class RDIMonitor:
     async def analyze_input(
         self,
         user_id: str,
-        user_input: str,
+        user_input: Union[str, AnalyzedText],
         domain: Optional[str] = None
     ) -> Tuple[float, List[DriftSignal]]:
         """
@@ -396,13 +496,15 @@ class RDIMonitor:
 
         Args:
             user_id: User (will be hashed internally)
-            user_input: User's input text (analyzed but not stored)
+            user_input: User's input text, or its shared AnalyzedText
+                (analyzed but not stored)
             domain: Optional domain context
 
         Returns:
             Tuple of (drift_score, detected_signals)
         """
-        logger.debug(f"Analyzing input for drift (length={len(user_input)})")
+        analyzed = self._text_analyzer.analyze(user_input)
+        logger.debug(f"Analyzing input for drift (length={len(analyzed)})")
 
         # Hash user ID for privacy
         hashed_user_id = self._hash_user_id(user_id)
@@ -416,9 +518,9 @@ class RDIMonitor:
         baseline = self._local_baselines[hashed_user_id]
 
         # Analyze input (WITHOUT storing raw text)
-        semantic_drift = await self._analyze_semantic_drift(user_input, baseline)
-        factual_drift = await self._analyze_factual_drift(user_input, baseline)
-        logical_drift = await self._analyze_logical_drift(user_input, baseline)
+        semantic_drift = await self._analyze_semantic_drift(analyzed, baseline)
+        factual_drift = await self._analyze_factual_drift(analyzed, baseline)
+        logical_drift = await self._analyze_logical_drift(analyzed, baseline)
 
         # Calculate overall drift
         drift_score = (
@@ -437,7 +539,7 @@ class RDIMonitor:
                 drift_magnitude=semantic_drift,
                 drift_confidence=0.7,
                 affected_domains=[domain] if domain else [],
-                deviation_pattern=hashlib.sha256(user_input.encode()).hexdigest()[:16]
+                deviation_pattern=analyzed.digest[:16]
             ))
 
         if factual_drift > 0.3:
@@ -448,7 +550,7 @@ class RDIMonitor:
                 drift_magnitude=factual_drift,
                 drift_confidence=0.8,
                 affected_domains=[domain] if domain else [],
-                deviation_pattern=hashlib.sha256(user_input.encode()).hexdigest()[:16]
+                deviation_pattern=analyzed.digest[:16]
             ))
 
         # Store signals locally
@@ -457,7 +559,7 @@ class RDIMonitor:
         self._local_drift_signals[hashed_user_id].extend(signals)
 
         # Update baseline (without storing raw input)
-        await self._update_baseline(hashed_user_id, user_input)
+        await self._update_baseline(hashed_user_id, analyzed)
 
         logger.info(
             f"Drift analysis complete: score={drift_score:.3f}, "
@@ -468,7 +570,7 @@ class RDIMonitor:
 
     async def _analyze_semantic_drift(
         self,
-        user_input: str,
+        analyzed: AnalyzedText,
         baseline: SemanticBaseline
     ) -> float:
         """
@@ -480,22 +582,23 @@ class RDIMonitor:
             Drift score (0-1)
         """
         # Extract concepts (simple heuristic: nouns/key terms)
-        words = user_input.lower().split()
-        concepts = [w for w in words if len(w) > 5]
+        concepts = analyzed.feature(self.CONCEPTS_FEATURE)
 
         # Compare to baseline concept frequency
         if not baseline.concept_frequency:
             # No baseline yet, assume aligned
             return 0.1
 
-        # Calculate concept overlap
-        baseline_concepts = set(baseline.concept_frequency.keys())
+        # Calculate concept overlap: share of the input's (distinct) concepts
+        # the baseline's sparse count vector already holds, looked up per
+        # input concept rather than materializing the baseline's key set
         input_concepts = set(concepts)
 
         if not input_concepts:
             return 0.1
 
-        overlap = len(baseline_concepts & input_concepts) / len(input_concepts)
+        frequency = baseline.concept_frequency
+        overlap = sum(1 for concept in input_concepts if concept in frequency) / len(input_concepts)
 
         # Drift is inverse of overlap
         drift = 1.0 - overlap
@@ -504,7 +607,7 @@ class RDIMonitor:
 
     async def _analyze_factual_drift(
         self,
-        user_input: str,
+        analyzed: AnalyzedText,
         baseline: SemanticBaseline
     ) -> float:
         """
@@ -516,7 +619,7 @@ class RDIMonitor:
             Drift score (0-1)
         """
         # Check for common fact patterns in input
-        input_lower = user_input.lower()
+        input_lower = analyzed.lower
 
         # Count violations of common facts
         violations = 0
@@ -540,7 +643,7 @@ class RDIMonitor:
 
     async def _analyze_logical_drift(
         self,
-        user_input: str,
+        analyzed: AnalyzedText,
         baseline: SemanticBaseline
     ) -> float:
         """
@@ -551,22 +654,17 @@ class RDIMonitor:
         Returns:
             Drift score (0-1)
         """
-        # Check for logical reasoning markers
-        reasoning_markers = [
-            'because', 'therefore', 'thus', 'hence', 'consequently',
-            'if', 'then', 'since', 'as a result'
-        ]
-
+        # Check for logical reasoning markers (distinct markers present)
         marker_count = sum(
-            1 for marker in reasoning_markers
-            if marker in user_input.lower()
+            1 for count in analyzed.marker_counts(self.REASONING_MARKER_SET).values()
+            if count
         )
 
         # Expected frequency from consensus model
         expected_freq = self.consensus_model.expected_patterns.get("causal_reasoning", 0.8)
 
         # Calculate actual frequency (normalized)
-        words = len(user_input.split())
+        words = len(analyzed.tokens)
         actual_freq = marker_count / (words / 100) if words > 0 else 0  # Per 100 words
 
         # Drift from expected
@@ -577,7 +675,7 @@ class RDIMonitor:
     async def _update_baseline(
         self,
         hashed_user_id: str,
-        user_input: str
+        analyzed: AnalyzedText
     ) -> None:
         """
         Update user's semantic baseline.
@@ -586,26 +684,26 @@ class RDIMonitor:
 
         Args:
             hashed_user_id: Hashed user ID
-            user_input: Input text (analyzed but not stored)
+            analyzed: Input text (analyzed but not stored)
         """
         baseline = self._local_baselines[hashed_user_id]
 
         # Extract concepts
-        words = user_input.lower().split()
-        concepts = [w for w in words if len(w) > 5]
+        concepts = analyzed.feature(self.CONCEPTS_FEATURE)
 
         # Update concept frequency
         for concept in concepts:
             baseline.concept_frequency[concept] = baseline.concept_frequency.get(concept, 0) + 1
 
-        # Prune to top 1000 concepts for memory efficiency
-        if len(baseline.concept_frequency) > 1000:
+        # Prune to top 1000 concepts for memory efficiency (with slack, so
+        # the sort runs once per ~250 new concepts rather than every input)
+        if len(baseline.concept_frequency) > self.MAX_BASELINE_CONCEPTS + self.BASELINE_PRUNE_SLACK:
             sorted_concepts = sorted(
                 baseline.concept_frequency.items(),
                 key=lambda x: x[1],
                 reverse=True
             )
-            baseline.concept_frequency = dict(sorted_concepts[:1000])
+            baseline.concept_frequency = dict(sorted_concepts[:self.MAX_BASELINE_CONCEPTS])
 
         baseline.sample_count += 1
 
@@ -744,9 +842,7 @@ class RDIMonitor:
             )
 
         # Store score locally
-        if hashed_user_id not in self._local_rdi_scores:
-            self._local_rdi_scores[hashed_user_id] = []
-        self._local_rdi_scores[hashed_user_id].append(score)
+        self._record_score(score)
 
         # Persist score locally
         asyncio.create_task(self._persist_rdi_score(score))
@@ -757,6 +853,16 @@ class RDIMonitor:
 
         return score
 
+    def _record_score(self, score: RDIScore) -> None:
+        """
+        Append a score to its user's local history and the score columns
+
+        Args:
+            score: Score for score.user_id (already hashed)
+        """
+        self._local_rdi_scores.setdefault(score.user_id, []).append(score)
+        self._score_columns.record(score.user_id, score.overall_rdi)
+
     async def _persist_rdi_score(self, score: RDIScore) -> None:
         """
         Persist RDI score to LOCAL storage only.
@@ -847,6 +953,7 @@ class RDIMonitor:
         hashed_user_id = self._hash_user_id(user_id)
 
         self._aggregate_opt_ins.add(hashed_user_id)
+        self._score_columns.opt_in(hashed_user_id)
 
         logger.info(f"User opted in to anonymized aggregate sharing")
 
@@ -867,69 +974,44 @@ class RDIMonitor:
         Returns:
             AnonymizedRDIStats if privacy threshold met, else None
         """
-        # Filter to opted-in users only
-        opted_in_scores = {
-            user_id: scores
-            for user_id, scores in self._local_rdi_scores.items()
-            if user_id in self._aggregate_opt_ins
-        }
+        # Opted-in users only (latest/previous score columns)
+        latest, previous, count = self._score_columns.opted_in_scores()
+        total_users = len(latest)
 
-        if len(opted_in_scores) < 100:
+        if total_users < 100:
             logger.warning(
-                f"Cannot generate aggregate: Only {len(opted_in_scores)} opted-in users "
+                f"Cannot generate aggregate: Only {total_users} opted-in users "
                 "(minimum 100 required for privacy)"
             )
             return None
 
         # Calculate aggregates
-        all_scores = [
-            scores[-1].overall_rdi
-            for scores in opted_in_scores.values()
-            if scores
-        ]
-
-        if not all_scores:
-            return None
-
-        avg_rdi = sum(all_scores) / len(all_scores)
-        sorted_scores = sorted(all_scores)
-        median_rdi = sorted_scores[len(sorted_scores) // 2]
-
-        # Calculate std dev
-        variance = sum((x - avg_rdi) ** 2 for x in all_scores) / len(all_scores)
-        std_dev_rdi = variance ** 0.5
+        avg_rdi = float(latest.mean())
+        median_rdi = float(np.partition(latest, total_users // 2)[total_users // 2])
+        std_dev_rdi = float(latest.std())
 
         # Distribution
-        distribution = {
-            "aligned": len([s for s in all_scores if s < 0.2]),
-            "minor_drift": len([s for s in all_scores if 0.2 <= s < 0.4]),
-            "moderate_drift": len([s for s in all_scores if 0.4 <= s < 0.6]),
-            "significant_drift": len([s for s in all_scores if 0.6 <= s < 0.8]),
-            "critical_drift": len([s for s in all_scores if s >= 0.8]),
-        }
+        level_counts = np.bincount(
+            np.digitize(latest, RDI_LEVEL_BINS), minlength=len(RDI_LEVEL_NAMES)
+        )
+        distribution = dict(zip(RDI_LEVEL_NAMES, level_counts.tolist()))
+
+        # Trends (users with at least two scores)
+        has_trend = count >= 2
+        increasing = int(np.count_nonzero(has_trend & (latest > previous)))
+        stable = int(np.count_nonzero(has_trend & (np.abs(latest - previous) < 0.1)))
+        decreasing = total_users - increasing - stable
 
-        # Trends
-        increasing = len([
-            scores for scores in opted_in_scores.values()
-            if scores and len(scores) >= 2 and scores[-1].overall_rdi > scores[-2].overall_rdi
-        ])
-        stable = len([
-            scores for scores in opted_in_scores.values()
-            if scores and len(scores) >= 2 and abs(scores[-1].overall_rdi - scores[-2].overall_rdi) < 0.1
-        ])
-        decreasing = len(opted_in_scores) - increasing - stable
-
-        total = max(1, len(opted_in_scores))
         trend_summary = {
-            "increasing": increasing / total,
-            "stable": stable / total,
-            "decreasing": decreasing / total
+            "increasing": increasing / total_users,
+            "stable": stable / total_users,
+            "decreasing": decreasing / total_users
         }
 
         stats = AnonymizedRDIStats(
             stats_id=f"aggregate_{datetime.now().isoformat()}",
             collection_period=f"{datetime.now() - timedelta(days=30)} to {datetime.now()}",
-            total_users=len(opted_in_scores),
+            total_users=total_users,
             average_rdi=avg_rdi,
             median_rdi=median_rdi,
             std_dev_rdi=std_dev_rdi,
@@ -0,0 +1,336 @@
+"""
+Shared text analysis for AI-PAL.
+
+The same request and response text is read by several consumers (PII
+detection, ARI lexical metrics, RDI drift, EDM debt scanning, response
+validation). A TextAnalyzer turns a string into an AnalyzedText once:
+- Lowercasing, word tokens, whitespace tokens and sentence spans are
+  computed on first use and shared by every consumer
+- Marker phrases registered by all consumers are counted together, once
+  per distinct phrase
+- Consumers register named features (functions of an AnalyzedText); each
+  is computed at most once per text
+
+Recently analyzed texts are kept in a small in-memory LRU, so consumers
+that are handed a plain string still share the work. Nothing is persisted.
+"""
+
+import hashlib
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
+
+from loguru import logger
+
+Feature = Callable[["AnalyzedText"], Any]
+
+# Word tokens as used by the lexical metrics: lowercase ASCII letter runs
+WORD_PATTERN = re.compile(r'\b[a-z]+\b')
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+
+
+class AnalyzedText:
+    """
+    Immutable view of one text with memoized features
+
+    Built by TextAnalyzer.analyze(); consumers read features and never
+    change them. Sequence features are tuples.
+    """
+
+    __slots__ = ("text", "lower", "_analyzer", "_features")
+
+    def __init__(self, text: str, analyzer: "TextAnalyzer"):
+        self.text = text
+        self.lower = text.lower()
+        self._analyzer = analyzer
+        self._features: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"AnalyzedText(len={len(self.text)}, features={sorted(self._features)})"
+
+    def feature(self, name: str) -> Any:
+        """
+        Get a feature, computing it on first use
+
+        Args:
+            name: Feature registered with the analyzer
+
+        Returns:
+            The feature value
+        """
+        try:
+            return self._features[name]
+        except KeyError:
+            pass
+        value = self._analyzer.feature_function(name)(self)
+        self._features[name] = value
+        return value
+
+    # Built-in features
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """Lowercase letter-run word tokens"""
+        return self.feature("words")
+
+    @property
+    def tokens(self) -> Tuple[str, ...]:
+        """Lowercased whitespace-separated tokens"""
+        return self.feature("tokens")
+
+    @property
+    def sentences(self) -> Tuple[str, ...]:
+        """Non-empty sentences, split on . ! ?"""
+        return self.feature("sentences")
+
+    @property
+    def sentence_lengths(self) -> Tuple[int, ...]:
+        """Word count of each sentence"""
+        return self.feature("sentence_lengths")
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 hex digest of the text"""
+        return self.feature("digest")
+
+    def marker_counts(self, name: str) -> Mapping[str, int]:
+        """
+        Occurrence counts of a registered marker set
+
+        Occurrences are non-overlapping substring matches in the lowercased
+        text (str.count semantics).
+
+        Args:
+            name: Marker set registered with register_markers()
+
+        Returns:
+            Read-only phrase -> count mapping
+        """
+        counts = self.feature("markers")
+        return MappingProxyType({
+            phrase: counts[phrase]
+            for phrase in self._analyzer.marker_set(name)
+        })
+
+
+def _words(analyzed: AnalyzedText) -> Tuple[str, ...]:
+    return tuple(WORD_PATTERN.findall(analyzed.lower))
+
+
+def _tokens(analyzed: AnalyzedText) -> Tuple[str, ...]:
+    return tuple(analyzed.lower.split())
+
+
+def _spans(text: str) -> Tuple[Tuple[int, int], ...]:
+    """(start, end) of each non-empty sentence in text"""
+    spans = []
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        if text[start:match.start()].strip():
+            spans.append((start, match.start()))
+        start = match.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return tuple(spans)
+
+
+def _sentence_spans(analyzed: AnalyzedText) -> Tuple[Tuple[int, int], ...]:
+    return _spans(analyzed.text)
+
+
+def _sentences(analyzed: AnalyzedText) -> Tuple[str, ...]:
+    text = analyzed.text
+    return tuple(text[start:end].strip() for start, end in analyzed.feature("sentence_spans"))
+
+
+def _sentence_lengths(analyzed: AnalyzedText) -> Tuple[int, ...]:
+    # Word start offsets from the single tokenization pass, bucketed by span.
+    # Sentence boundaries are punctuation, so no word straddles two spans.
+    lower = analyzed.lower
+    starts = [match.start() for match in WORD_PATTERN.finditer(lower)]
+    # Lowercasing can change the length of some non-ASCII text
+    spans = analyzed.feature("sentence_spans") if len(lower) == len(analyzed.text) else _spans(lower)
+    return tuple(bisect_left(starts, end) - bisect_left(starts, start) for start, end in spans)
+
+
+def _digest(analyzed: AnalyzedText) -> str:
+    return hashlib.sha256(analyzed.text.encode()).hexdigest()
+
+
+BUILTIN_FEATURES: Dict[str, Feature] = {
+    "words": _words,
+    "tokens": _tokens,
+    "sentence_spans": _sentence_spans,
+    "sentences": _sentences,
+    "sentence_lengths": _sentence_lengths,
+    "digest": _digest,
+}
+
+
+class TextAnalyzer:
+    """
+    Builds AnalyzedText objects and holds the feature registry
+
+    Registering a feature or marker set clears the cache, so cached texts
+    never carry values from a replaced feature function.
+    """
+
+    def __init__(self, cache_size: int = 128, max_cached_chars: int = 200_000):
+        """
+        Initialize analyzer
+
+        Args:
+            cache_size: Recently analyzed texts kept for reuse
+            max_cached_chars: Longer texts are analyzed but not cached
+        """
+        self.cache_size = cache_size
+        self.max_cached_chars = max_cached_chars
+
+        self._features: Dict[str, Feature] = dict(BUILTIN_FEATURES)
+        self._features["markers"] = self._count_markers
+        self._marker_sets: Dict[str, Tuple[str, ...]] = {}
+        self._phrases: Tuple[str, ...] = ()
+
+        self._cache: "OrderedDict[str, AnalyzedText]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ========================================================================
+    # Registration
+    # ========================================================================
+
+    def register_feature(self, name: str, fn: Feature) -> None:
+        """
+        Register (or replace) a named feature
+
+        Args:
+            name: Feature name, namespaced by consumer (e.g. "edm.debt_markers")
+            fn: Computes the feature from an AnalyzedText; should return an
+                immutable value
+        """
+        if name in BUILTIN_FEATURES or name == "markers":
+            raise ValueError(f"Cannot replace built-in feature {name!r}")
+        with self._lock:
+            if self._features.get(name) == fn:
+                return
+            self._features[name] = fn
+            self._cache.clear()
+
+    def register_markers(self, name: str, phrases: Iterable[str]) -> None:
+        """
+        Register (or replace) a named set of marker phrases
+
+        Phrases from all sets are counted together; read the counts with
+        AnalyzedText.marker_counts(name).
+
+        Args:
+            name: Marker set name
+            phrases: Phrases to count (matched against lowercased text)
+        """
+        phrases = tuple(dict.fromkeys(phrase.lower() for phrase in phrases))
+        with self._lock:
+            if self._marker_sets.get(name) == phrases:
+                return
+            self._marker_sets[name] = phrases
+            self._phrases = tuple(dict.fromkeys(
+                phrase for marker_set in self._marker_sets.values() for phrase in marker_set
+            ))
+            self._cache.clear()
+
+    def feature_function(self, name: str) -> Feature:
+        try:
+            return self._features[name]
+        except KeyError:
+            raise KeyError(f"Unknown text feature {name!r}") from None
+
+    def marker_set(self, name: str) -> Tuple[str, ...]:
+        try:
+            return self._marker_sets[name]
+        except KeyError:
+            raise KeyError(f"Unknown marker set {name!r}") from None
+
+    def _count_markers(self, analyzed: AnalyzedText) -> Mapping[str, int]:
+        # str.count is a memchr-driven scan per phrase; for a few dozen short
+        # phrases it beats any combined regex pass
+        lower = analyzed.lower
+        return MappingProxyType({phrase: lower.count(phrase) for phrase in self._phrases})
+
+    # ========================================================================
+    # Analysis
+    # ========================================================================
+
+    def analyze(self, text: Union[str, AnalyzedText]) -> AnalyzedText:
+        """
+        Get the AnalyzedText for a string
+
+        Args:
+            text: Text to analyze (an AnalyzedText is returned unchanged)
+
+        Returns:
+            Shared AnalyzedText (cached for recently seen texts)
+        """
+        if isinstance(text, AnalyzedText):
+            return text
+        if text is None:
+            text = ""
+
+        with self._lock:
+            analyzed = self._cache.get(text)
+            if analyzed is not None:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return analyzed
+            self.misses += 1
+
+        analyzed = AnalyzedText(text, self)
+        if len(text) <= self.max_cached_chars and self.cache_size > 0:
+            with self._lock:
+                self._cache[text] = analyzed
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return analyzed
+
+    def clear(self) -> None:
+        """Drop all cached texts"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        return {
+            "cached_texts": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "features": sorted(self._features),
+            "marker_sets": sorted(self._marker_sets),
+        }
+
+
+# Global text analyzer
+_text_analyzer: Optional[TextAnalyzer] = None
+
+
+def get_text_analyzer() -> TextAnalyzer:
+    """
+    Get global text analyzer (singleton).
+
+    Returns:
+        TextAnalyzer instance
+    """
+    global _text_analyzer
+    if _text_analyzer is None:
+        _text_analyzer = TextAnalyzer()
+        logger.debug("Text analyzer initialized")
+    return _text_analyzer
+
+
+def analyze(text: Union[str, AnalyzedText]) -> AnalyzedText:
+    """Analyze text with the global analyzer"""
+    return get_text_analyzer().analyze(text)
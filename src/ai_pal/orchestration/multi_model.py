@@ -33,6 +33,7 @@ from ai_pal.models.cohere_provider import CohereProvider
 from ai_pal.models.mistral_provider import MistralProvider
 from ai_pal.models.groq_provider import GroqProvider
 from ai_pal.models.base import LLMRequest, LLMResponse
+from ai_pal.monitoring.deadline import iterate_with_deadline, with_deadline
 
 
 class ModelProvider(Enum):
@@ -933,6 +934,9 @@ class MultiModelOrchestrator:
         """
         Execute model and return response
 
+        If a request deadline is current (see ai_pal.monitoring.deadline),
+        the provider call is cancelled once it expires.
+
         Args:
             provider: Model provider
             model_name: Model name
@@ -962,9 +966,12 @@ class MultiModelOrchestrator:
                 stop_sequences=stop_sequences or [],
             )
 
-            # Generate response
+            # Generate response; cancelled if the request deadline expires
             logger.info(f"Executing {provider.value}:{model_name}")
-            response = await provider_instance.generate(request, model_name)
+            response = await with_deadline(
+                provider_instance.generate(request, model_name),
+                operation=f"{provider.value}:{model_name}"
+            )
 
             # Record performance
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -1026,13 +1033,10 @@ class MultiModelOrchestrator:
         Yields:
             Response chunks as they arrive
         """
-        # Note: Streaming implementation depends on provider
-        # For now, fall back to non-streaming
-        logger.warning(f"Streaming not yet implemented for {provider.value}, using non-streaming")
+        start_time = datetime.now()
+        provider_instance = await self._get_provider(provider)
 
-        response = await self.execute_model(
-            provider=provider,
-            model_name=model_name,
+        request = LLMRequest(
             prompt=prompt,
             system_prompt=system_prompt,
             max_tokens=max_tokens,
@@ -1040,8 +1044,35 @@ class MultiModelOrchestrator:
             top_p=top_p,
         )
 
-        # Yield complete response
-        yield response.generated_text
+        logger.info(f"Streaming {provider.value}:{model_name}")
+        try:
+            async for chunk in iterate_with_deadline(
+                provider_instance.generate_streaming(request, model_name),
+                operation=f"{provider.value}:{model_name}"
+            ):
+                yield chunk
+        except Exception as e:
+            latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+            await self.record_performance(
+                provider=provider,
+                model_name=model_name,
+                latency_ms=latency_ms,
+                cost=0.0,
+                success=False,
+                error=str(e),
+            )
+            logger.error(f"Model streaming failed: {provider.value}:{model_name} - {e}")
+            raise
+
+        # Providers don't report usage on the stream, so cost isn't known here
+        latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+        await self.record_performance(
+            provider=provider,
+            model_name=model_name,
+            latency_ms=latency_ms,
+            cost=0.0,
+            success=True,
+        )
 
     async def route_request(
         self,
@@ -1242,6 +1273,31 @@ class MultiModelOrchestrator:
             f"latency={latency_ms:.0f}ms, cost=${cost:.4f}, success={success}"
         )
 
+    async def record_quality(
+        self,
+        provider: ModelProvider,
+        model_name: str,
+        quality_score: float
+    ) -> None:
+        """
+        Record quality feedback for a model call already counted by record_performance
+
+        Args:
+            provider: Model provider
+            model_name: Model name
+            quality_score: Quality feedback (0.0 to 1.0)
+        """
+        perf = self.model_performance.get((provider, model_name))
+        if perf is None:
+            return
+
+        perf.recent_qualities.append(quality_score)
+        if len(perf.recent_qualities) > 100:
+            perf.recent_qualities = perf.recent_qualities[-100:]
+        perf.average_quality = sum(perf.recent_qualities) / len(perf.recent_qualities)
+
+        await self._persist_performance_data()
+
     async def _persist_performance_data(self) -> None:
         """Persist performance data to disk"""
         performance_file = self.storage_dir / "model_performance.json"
@@ -2,11 +2,11 @@
 Privacy Module - Phase 3
 
 Advanced privacy protection:
-- Enhanced PII detection
+- Enhanced PII detection (compiled, prefiltered engine)
 - Differential privacy
 - Data minimization
 - Consent management
-- Privacy budget tracking
+- Privacy budget tracking (in-memory, journaled)
 """
 
 from .advanced_privacy import (
@@ -15,10 +15,12 @@ from .advanced_privacy import (
     PIIDetection,
     PrivacyAction,
     PrivacyBudget,
+    BudgetJournal,
     ConsentLevel,
     ConsentRecord,
     DataMinimizationPolicy,
 )
+from .pii_engine import PIIEngine, PIIRule, DEFAULT_PII_RULES, luhn_valid
 
 __all__ = [
     "AdvancedPrivacyManager",
@@ -26,7 +28,12 @@ __all__ = [
     "PIIDetection",
     "PrivacyAction",
     "PrivacyBudget",
+    "BudgetJournal",
     "ConsentLevel",
     "ConsentRecord",
     "DataMinimizationPolicy",
+    "PIIEngine",
+    "PIIRule",
+    "DEFAULT_PII_RULES",
+    "luhn_valid",
 ]
@@ -13,32 +13,30 @@ Part of Phase 3: Enhanced Context, Privacy, Multi-Model Orchestration
 """
 
 import asyncio
+import atexit
+import threading
+import time
+import weakref
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from pathlib import Path
 import hashlib
-import re
 
 from loguru import logger
 
+from ai_pal.monitoring.text_analysis import AnalyzedText, get_text_analyzer
 
-class PIIType(Enum):
-    """Types of Personally Identifiable Information"""
-    EMAIL = "email"
-    PHONE = "phone"
-    SSN = "ssn"
-    CREDIT_CARD = "credit_card"
-    NAME = "name"
-    ADDRESS = "address"
-    DATE_OF_BIRTH = "date_of_birth"
-    IP_ADDRESS = "ip_address"
-    LOCATION = "location"
-    MEDICAL = "medical"
-    FINANCIAL = "financial"
-    BIOMETRIC = "biometric"
+from .pii_engine import DEFAULT_PII_RULES, PIIDetection, PIIEngine, PIIType, sensitivity_level
+
+if TYPE_CHECKING:
+    from ai_pal.storage.state_store import StateStore
+
+# Shared state namespace for privacy budgets (see storage.state_store)
+PRIVACY_BUDGET_NAMESPACE = "privacy_budget"
 
 
 class PrivacyAction(Enum):
@@ -59,17 +57,6 @@ class ConsentLevel(Enum):
     FULL = "full"  # Full data processing
 
 
-@dataclass
-class PIIDetection:
-    """Detected PII instance"""
-    pii_type: PIIType
-    text: str  # Original text
-    start_pos: int
-    end_pos: int
-    confidence: float  # 0-1
-    sensitivity_level: str  # "low", "medium", "high"
-
-
 @dataclass
 class PrivacyBudget:
     """Differential privacy budget tracking"""
@@ -130,6 +117,126 @@ class ConsentRecord:
     metadata: Dict = field(default_factory=dict)
 
 
+class BudgetJournal:
+    """
+    Privacy budget persistence: snapshot plus append-only journal
+
+    privacy_budgets.json holds a snapshot of every budget; budget changes are
+    appended to privacy_budgets.jsonl as the user's full budget record, tagged
+    with a sequence number. On load the journal is replayed over the snapshot
+    (last record per user wins, records already in the snapshot are skipped),
+    so a crash between writing a snapshot and truncating the journal loses
+    nothing. Once superseded lines dominate, the journal is folded into a
+    fresh snapshot.
+    """
+
+    SNAPSHOT = "privacy_budgets.json"
+    JOURNAL = "privacy_budgets.jsonl"
+
+    def __init__(self, storage_dir: Path, compact_min_lines: int = 1000):
+        """
+        Initialize journal
+
+        Args:
+            storage_dir: Directory holding the snapshot and journal
+            compact_min_lines: Never compact journals shorter than this
+        """
+        self.snapshot_path = Path(storage_dir) / self.SNAPSHOT
+        self.journal_path = Path(storage_dir) / self.JOURNAL
+        self.compact_min_lines = compact_min_lines
+        self.lines = 0
+        self.seq = 0
+        # Writes run in executor threads; atexit flushes from the main thread
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the snapshot and replay the journal: user_id -> budget record"""
+        budgets: Dict[str, Dict[str, Any]] = {}
+        self.lines = 0
+        self.seq = 0
+
+        if self.snapshot_path.exists():
+            try:
+                with open(self.snapshot_path, "r") as f:
+                    data = json.load(f)
+                if "budgets" in data:
+                    budgets = data["budgets"]
+                    self.seq = data.get("journal_seq", 0)
+                else:
+                    # Plain {user_id: budget} file from before the journal
+                    budgets = data
+            except Exception as e:
+                logger.error(f"Failed to load privacy budgets: {e}")
+
+        if self.journal_path.exists():
+            snapshot_seq = self.seq
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    self.lines += 1
+                    try:
+                        record = json.loads(line)
+                        seq = record["seq"]
+                        if seq > snapshot_seq:
+                            budgets[record["user_id"]] = record["budget"]
+                        self.seq = max(self.seq, seq)
+                    except (ValueError, KeyError) as e:
+                        logger.error(f"Skipping bad budget record in {self.JOURNAL}: {e}")
+
+        return budgets
+
+    def append(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Append budget records (user_id -> record) in one write"""
+        if not records:
+            return
+        with self._lock:
+            lines = []
+            for user_id, budget in records.items():
+                self.seq += 1
+                lines.append(json.dumps({"seq": self.seq, "user_id": user_id, "budget": budget}) + "\n")
+            with open(self.journal_path, "a") as f:
+                f.write("".join(lines))
+            self.lines += len(lines)
+
+    def needs_compaction(self, live: int) -> bool:
+        """Whether the journal holds mostly superseded records"""
+        return self.lines > max(self.compact_min_lines, 2 * live)
+
+    def compact(self, budgets: Dict[str, Dict[str, Any]]) -> None:
+        """Replace snapshot and journal with the given (complete) budgets"""
+        with self._lock:
+            tmp = self.snapshot_path.with_suffix(".json.tmp")
+            with open(tmp, "w") as f:
+                json.dump({"journal_seq": self.seq, "budgets": budgets}, f)
+            tmp.replace(self.snapshot_path)
+            # Every journal record is now at or below the snapshot's seq
+            open(self.journal_path, "w").close()
+            self.lines = 0
+
+    def write(
+        self,
+        records: Dict[str, Dict[str, Any]],
+        compacted: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
+        """Append records, or write a compacted snapshot that already includes them"""
+        if compacted is not None:
+            self.compact(compacted)
+        else:
+            self.append(records)
+
+
+# Managers with unflushed budget changes get a last flush at interpreter exit
+_BUDGET_MANAGERS: "weakref.WeakSet[AdvancedPrivacyManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_budgets_at_exit() -> None:
+    for manager in list(_BUDGET_MANAGERS):
+        try:
+            manager._flush_budgets_sync()
+        except Exception as e:
+            logger.error(f"Failed to flush privacy budgets at exit: {e}")
+
+
 class AdvancedPrivacyManager:
     """
     Advanced Privacy Management System
@@ -142,21 +249,19 @@ class AdvancedPrivacyManager:
     - Consent management
     """
 
-    # PII detection patterns (simple regex - Presidio would be more sophisticated)
-    PII_PATTERNS = {
-        PIIType.EMAIL: r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-        PIIType.PHONE: r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-        PIIType.SSN: r'\b\d{3}-\d{2}-\d{4}\b',
-        PIIType.CREDIT_CARD: r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b',
-        PIIType.IP_ADDRESS: r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
-    }
+    # PII detection patterns (simple regex - Presidio would be more sophisticated);
+    # matched by PIIEngine, see pii_engine.DEFAULT_PII_RULES
+    PII_PATTERNS = {rule.pii_type: rule.pattern for rule in DEFAULT_PII_RULES}
 
     def __init__(
         self,
         storage_dir: Path,
         default_epsilon: float = 1.0,
         default_delta: float = 1e-5,
-        enable_presidio: bool = False  # Would integrate Presidio in production
+        enable_presidio: bool = False,  # Would integrate Presidio in production
+        state_store: Optional["StateStore"] = None,
+        pii_cache_size: int = 1024,
+        budget_flush_interval: float = 1.0
     ):
         """
         Initialize Advanced Privacy Manager
@@ -166,6 +271,12 @@ class AdvancedPrivacyManager:
             default_epsilon: Default privacy budget epsilon
             default_delta: Default privacy budget delta
             enable_presidio: Enable Presidio integration (requires installation)
+            state_store: Shared store for privacy budgets, so every API worker
+                enforces the same budget. None keeps them in memory, journaled
+                to storage_dir (see BudgetJournal).
+            pii_cache_size: Texts whose PII detections are kept (LRU)
+            budget_flush_interval: Seconds budget changes are coalesced in
+                memory before being journaled (0 = journal every check)
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
@@ -173,14 +284,29 @@ class AdvancedPrivacyManager:
         self.default_epsilon = default_epsilon
         self.default_delta = default_delta
         self.enable_presidio = enable_presidio
+        self.state_store = state_store
 
-        # In-memory storage
+        # In-memory storage (with a state store, privacy_budgets is this
+        # worker's last-seen view; the store is authoritative)
         self.privacy_budgets: Dict[str, PrivacyBudget] = {}
         self.minimization_policies: Dict[str, DataMinimizationPolicy] = {}
         self.consent_records: Dict[str, ConsentRecord] = {}
 
-        # PII detection cache
-        self.pii_cache: Dict[str, List[PIIDetection]] = {}
+        # PII detection: compiled engine plus a bounded cache keyed by
+        # (text digest, requested types)
+        self.pii_engine = PIIEngine()
+        self.pii_cache_size = pii_cache_size
+        self.pii_cache: "OrderedDict[Tuple[str, Optional[frozenset]], List[PIIDetection]]" = OrderedDict()
+
+        # Local budgets: privacy_budgets is the primary copy; changed users
+        # are journaled at most once per flush interval
+        self.budget_journal = BudgetJournal(self.storage_dir) if state_store is None else None
+        self.budget_flush_interval = budget_flush_interval
+        self._dirty_budgets: Set[str] = set()
+        self._last_budget_flush = time.monotonic()
+        self._budget_flushing = False
+        if self.budget_journal is not None:
+            _BUDGET_MANAGERS.add(self)
 
         # Load existing data
         self._load_privacy_data()
@@ -192,26 +318,13 @@ class AdvancedPrivacyManager:
 
     def _load_privacy_data(self) -> None:
         """Load existing privacy data"""
-        # Load privacy budgets
-        budgets_file = self.storage_dir / "privacy_budgets.json"
-        if budgets_file.exists():
-            try:
-                with open(budgets_file, 'r') as f:
-                    data = json.load(f)
-                    for user_id, budget_data in data.items():
-                        self.privacy_budgets[user_id] = PrivacyBudget(
-                            user_id=user_id,
-                            epsilon=budget_data["epsilon"],
-                            delta=budget_data["delta"],
-                            queries_made=budget_data.get("queries_made", 0),
-                            epsilon_spent=budget_data.get("epsilon_spent", 0.0),
-                            last_reset=datetime.fromisoformat(budget_data["last_reset"]),
-                            max_epsilon=budget_data.get("max_epsilon", 1.0),
-                            max_queries_per_day=budget_data.get("max_queries_per_day", 100),
-                            budget_exceeded=budget_data.get("budget_exceeded", False)
-                        )
-            except Exception as e:
-                logger.error(f"Failed to load privacy budgets: {e}")
+        # Load privacy budgets (read on demand from a state store instead)
+        if self.budget_journal is not None:
+            for user_id, budget_data in self.budget_journal.load().items():
+                try:
+                    self.privacy_budgets[user_id] = self._budget_from_dict(user_id, budget_data)
+                except (KeyError, ValueError) as e:
+                    logger.error(f"Failed to load privacy budget for {user_id}: {e}")
 
         # Load consent records
         consent_file = self.storage_dir / "consent_records.json"
@@ -239,7 +352,7 @@ class AdvancedPrivacyManager:
 
     async def detect_pii(
         self,
-        text: str,
+        text: Union[str, AnalyzedText],
         pii_types: Optional[List[PIIType]] = None
     ) -> List[PIIDetection]:
         """
@@ -249,71 +362,89 @@ class AdvancedPrivacyManager:
         For now, uses regex patterns
 
         Args:
-            text: Text to analyze
+            text: Text to analyze (or its shared AnalyzedText)
             pii_types: Optional list of PII types to detect
 
         Returns:
             List of detected PII instances
         """
-        # Check cache
-        cache_key = hashlib.md5(text.encode()).hexdigest()
-        if cache_key in self.pii_cache:
-            return self.pii_cache[cache_key]
+        analyzed = get_text_analyzer().analyze(text)
+        cache_key = (analyzed.digest, frozenset(pii_types) if pii_types else None)
 
-        detections = []
+        detections = self._cached_detections(cache_key)
+        if detections is None:
+            detections = self.pii_engine.detect(analyzed.text, pii_types or None)
+            self._cache_detections(cache_key, detections)
 
-        # Determine which patterns to use
-        patterns_to_check = self.PII_PATTERNS
-        if pii_types:
-            patterns_to_check = {
-                pii_type: pattern
-                for pii_type, pattern in self.PII_PATTERNS.items()
-                if pii_type in pii_types
-            }
+            if detections:
+                logger.warning(f"Detected {len(detections)} PII instances in text")
 
-        # Detect PII using patterns
-        for pii_type, pattern in patterns_to_check.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                detection = PIIDetection(
-                    pii_type=pii_type,
-                    text=match.group(),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    confidence=0.9,  # Regex patterns are fairly confident
-                    sensitivity_level=self._get_sensitivity_level(pii_type)
-                )
-                detections.append(detection)
-
-        # Cache results
-        self.pii_cache[cache_key] = detections
-
-        if detections:
-            logger.warning(f"Detected {len(detections)} PII instances in text")
+        return detections
+
+    async def detect_pii_batch(
+        self,
+        texts: List[str],
+        pii_types: Optional[List[PIIType]] = None
+    ) -> List[List[PIIDetection]]:
+        """
+        Detect PII in many texts (e.g. stored memories or documents) at once
+
+        Texts not already cached are scanned together, one pass per rule
+        group, instead of one detect_pii call each.
+
+        Args:
+            texts: Texts to analyze
+            pii_types: Optional list of PII types to detect
 
+        Returns:
+            Detected PII instances per text
+        """
+        types_key = frozenset(pii_types) if pii_types else None
+        results: List[Optional[List[PIIDetection]]] = []
+        missing: Dict[str, List[int]] = {}  # text -> result positions
+
+        for i, text in enumerate(texts):
+            detections = self._cached_detections((self._digest(text), types_key))
+            results.append(detections)
+            if detections is None:
+                missing.setdefault(text, []).append(i)
+
+        if missing:
+            pending = list(missing)
+            scanned = self.pii_engine.detect_batch(pending, pii_types or None)
+            for text, detections in zip(pending, scanned):
+                self._cache_detections((self._digest(text), types_key), detections)
+                for i in missing[text]:
+                    results[i] = detections
+
+        total = sum(len(detections) for detections in results)
+        if total:
+            logger.warning(f"Detected {total} PII instances in {len(texts)} texts")
+
+        return results
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        # Same key as AnalyzedText.digest, so single and batch calls share entries
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def _cached_detections(self, key: Tuple[str, Optional[frozenset]]) -> Optional[List[PIIDetection]]:
+        detections = self.pii_cache.get(key)
+        if detections is not None:
+            self.pii_cache.move_to_end(key)
         return detections
 
+    def _cache_detections(self, key: Tuple[str, Optional[frozenset]], detections: List[PIIDetection]) -> None:
+        if self.pii_cache_size <= 0:
+            return
+        self.pii_cache[key] = detections
+        self.pii_cache.move_to_end(key)
+        while len(self.pii_cache) > self.pii_cache_size:
+            self.pii_cache.popitem(last=False)
+
     def _get_sensitivity_level(self, pii_type: PIIType) -> str:
         """Determine sensitivity level for PII type"""
-        high_sensitivity = {
-            PIIType.SSN,
-            PIIType.CREDIT_CARD,
-            PIIType.MEDICAL,
-            PIIType.BIOMETRIC
-        }
-
-        medium_sensitivity = {
-            PIIType.DATE_OF_BIRTH,
-            PIIType.FINANCIAL,
-            PIIType.ADDRESS
-        }
-
-        if pii_type in high_sensitivity:
-            return "high"
-        elif pii_type in medium_sensitivity:
-            return "medium"
-        else:
-            return "low"
+        return sensitivity_level(pii_type)
 
     async def apply_privacy_protection(
         self,
@@ -338,14 +469,53 @@ class AdvancedPrivacyManager:
         if not detections:
             return text, []
 
-        # Apply protection action
-        protected_text = text
+        protected_text = self._protect_text(text, detections, action)
+
+        logger.info(f"Applied {action.value} protection to {len(detections)} PII instances")
+
+        return protected_text, detections
+
+    async def apply_privacy_protection_batch(
+        self,
+        texts: List[str],
+        action: PrivacyAction = PrivacyAction.REDACT,
+        pii_types: Optional[List[PIIType]] = None
+    ) -> List[Tuple[str, List[PIIDetection]]]:
+        """
+        Apply privacy protection to many texts (memories, documents) at once
+
+        Args:
+            texts: Texts to protect
+            action: Privacy action to apply
+            pii_types: Optional list of PII types to protect
+
+        Returns:
+            (protected_text, detections) per text
+        """
+        all_detections = await self.detect_pii_batch(texts, pii_types)
 
-        # Process detections in reverse order to maintain positions
-        for detection in sorted(detections, key=lambda d: d.start_pos, reverse=True):
-            before = protected_text[:detection.start_pos]
-            after = protected_text[detection.end_pos:]
+        results = [
+            (self._protect_text(text, detections, action) if detections else text, detections)
+            for text, detections in zip(texts, all_detections)
+        ]
 
+        total = sum(len(detections) for detections in all_detections)
+        if total:
+            logger.info(f"Applied {action.value} protection to {total} PII instances in {len(texts)} texts")
+
+        return results
+
+    def _protect_text(self, text: str, detections: List[PIIDetection], action: PrivacyAction) -> str:
+        """
+        Replace each detection according to action
+
+        Overlapping detections (e.g. a phone number inside an email address)
+        are merged: the widest one in the group drives the replacement, which
+        covers the whole group's span, so no part of either leaks.
+        """
+        parts = []
+        position = 0
+        for start, end, detection in self._merge_overlapping(detections):
             if action == PrivacyAction.REDACT:
                 replacement = "[REDACTED]"
             elif action == PrivacyAction.MASK:
@@ -357,11 +527,30 @@ class AdvancedPrivacyManager:
             else:
                 replacement = "[PROTECTED]"
 
-            protected_text = before + replacement + after
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(text[position:])
+        return "".join(parts)
 
-        logger.info(f"Applied {action.value} protection to {len(detections)} PII instances")
+    @staticmethod
+    def _merge_overlapping(detections: List[PIIDetection]) -> List[Tuple[int, int, PIIDetection]]:
+        """
+        Group overlapping detections
 
-        return protected_text, detections
+        Returns:
+            (start, end, widest detection) per group, in text order
+        """
+        groups: List[Tuple[int, int, PIIDetection]] = []
+        for detection in sorted(detections, key=lambda d: (d.start_pos, -d.end_pos)):
+            if groups and detection.start_pos < groups[-1][1]:
+                start, end, widest = groups[-1]
+                if detection.end_pos - detection.start_pos > widest.end_pos - widest.start_pos:
+                    widest = detection
+                groups[-1] = (start, max(end, detection.end_pos), widest)
+            else:
+                groups.append((detection.start_pos, detection.end_pos, detection))
+        return groups
 
     def _mask_text(self, text: str, pii_type: PIIType) -> str:
         """Mask text while preserving format"""
@@ -412,16 +601,82 @@ class AdvancedPrivacyManager:
         Returns:
             True if budget allows query
         """
+        if self.state_store is not None:
+            return await self._check_shared_privacy_budget(user_id, epsilon_cost)
+
         # Get or create budget
         if user_id not in self.privacy_budgets:
-            self.privacy_budgets[user_id] = PrivacyBudget(
-                user_id=user_id,
-                epsilon=self.default_epsilon,
-                delta=self.default_delta
-            )
+            self.privacy_budgets[user_id] = self._new_budget(user_id)
 
         budget = self.privacy_budgets[user_id]
 
+        # No await between reading and updating the budget, so concurrent
+        # checks for one user cannot lose a spend
+        allowed = self._spend_budget(budget, epsilon_cost)
+
+        self._dirty_budgets.add(user_id)
+        if time.monotonic() - self._last_budget_flush >= self.budget_flush_interval:
+            await self.flush_privacy_budgets()
+
+        return allowed
+
+    async def _check_shared_privacy_budget(self, user_id: str, epsilon_cost: float) -> bool:
+        """check_privacy_budget against the shared state store (atomic across workers)"""
+        outcome: Dict[str, Any] = {}
+
+        def spend(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            # May run more than once if another worker updates concurrently
+            budget = self._budget_from_dict(user_id, data) if data else self._new_budget(user_id)
+            outcome["allowed"] = self._spend_budget(budget, epsilon_cost)
+            outcome["budget"] = budget
+            return self._budget_to_dict(budget)
+
+        await self.state_store.update(PRIVACY_BUDGET_NAMESPACE, user_id, spend)
+        self.privacy_budgets[user_id] = outcome["budget"]
+        return outcome["allowed"]
+
+    async def load_privacy_budget(self, user_id: str) -> Optional[PrivacyBudget]:
+        """
+        Get a user's current privacy budget
+
+        Reads through the state store when one is configured, refreshing
+        this worker's privacy_budgets view.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            PrivacyBudget or None if the user has no budget yet
+        """
+        if self.state_store is not None:
+            data = await self.state_store.get(PRIVACY_BUDGET_NAMESPACE, user_id)
+            if data is None:
+                return None
+            self.privacy_budgets[user_id] = self._budget_from_dict(user_id, data)
+
+        return self.privacy_budgets.get(user_id)
+
+    def _new_budget(self, user_id: str) -> PrivacyBudget:
+        """Fresh budget with the manager's defaults"""
+        return PrivacyBudget(
+            user_id=user_id,
+            epsilon=self.default_epsilon,
+            delta=self.default_delta
+        )
+
+    def _spend_budget(self, budget: PrivacyBudget, epsilon_cost: float) -> bool:
+        """
+        Apply the daily reset and limits to a budget, deducting the query if allowed
+
+        Args:
+            budget: Budget to update in place
+            epsilon_cost: Privacy cost of query
+
+        Returns:
+            True if the query is within budget
+        """
+        user_id = budget.user_id
+
         # Reset daily budget if needed
         if (datetime.now() - budget.last_reset).days >= 1:
             budget.queries_made = 0
@@ -444,23 +699,12 @@ class AdvancedPrivacyManager:
         budget.queries_made += 1
         budget.epsilon_spent += epsilon_cost
 
-        await self._persist_privacy_budget(user_id)
-
         return True
 
-    async def _persist_privacy_budget(self, user_id: str) -> None:
-        """Persist privacy budget to disk"""
-        budgets_file = self.storage_dir / "privacy_budgets.json"
-
-        # Load existing
-        data = {}
-        if budgets_file.exists():
-            with open(budgets_file, 'r') as f:
-                data = json.load(f)
-
-        # Update
-        budget = self.privacy_budgets[user_id]
-        data[user_id] = {
+    @staticmethod
+    def _budget_to_dict(budget: PrivacyBudget) -> Dict[str, Any]:
+        """Serialize a budget (privacy_budgets.json / state store format)"""
+        return {
             "epsilon": budget.epsilon,
             "delta": budget.delta,
             "queries_made": budget.queries_made,
@@ -471,9 +715,79 @@ class AdvancedPrivacyManager:
             "budget_exceeded": budget.budget_exceeded
         }
 
-        # Save
-        with open(budgets_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    @staticmethod
+    def _budget_from_dict(user_id: str, data: Dict[str, Any]) -> PrivacyBudget:
+        """Deserialize a budget written by _budget_to_dict"""
+        return PrivacyBudget(
+            user_id=user_id,
+            epsilon=data["epsilon"],
+            delta=data["delta"],
+            queries_made=data.get("queries_made", 0),
+            epsilon_spent=data.get("epsilon_spent", 0.0),
+            last_reset=datetime.fromisoformat(data["last_reset"]),
+            max_epsilon=data.get("max_epsilon", 1.0),
+            max_queries_per_day=data.get("max_queries_per_day", 100),
+            budget_exceeded=data.get("budget_exceeded", False)
+        )
+
+    def _take_budget_records(
+        self
+    ) -> Tuple[Dict[str, Dict[str, Any]], Optional[Dict[str, Dict[str, Any]]]]:
+        """
+        Serialize and clear the changed budgets
+
+        Returns:
+            (changed records, all records if the journal is due for compaction)
+        """
+        records = {
+            user_id: self._budget_to_dict(self.privacy_budgets[user_id])
+            for user_id in self._dirty_budgets
+            if user_id in self.privacy_budgets
+        }
+        self._dirty_budgets.clear()
+        self._last_budget_flush = time.monotonic()
+
+        compacted = None
+        if self.budget_journal.needs_compaction(len(self.privacy_budgets)):
+            compacted = {
+                user_id: self._budget_to_dict(budget)
+                for user_id, budget in self.privacy_budgets.items()
+            }
+        return records, compacted
+
+    async def flush_privacy_budgets(self) -> int:
+        """
+        Journal budget changes buffered since the last flush
+
+        Writes run in an executor thread; while one is in flight, further
+        changes stay buffered for the next flush.
+
+        Returns:
+            Number of budgets written
+        """
+        if self.budget_journal is None or self._budget_flushing or not self._dirty_budgets:
+            return 0
+
+        records, compacted = self._take_budget_records()
+        self._budget_flushing = True
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.budget_journal.write, records, compacted)
+        except Exception as e:
+            logger.error(f"Failed to persist privacy budgets: {e}")
+            self._dirty_budgets.update(records)
+            return 0
+        finally:
+            self._budget_flushing = False
+
+        return len(records)
+
+    def _flush_budgets_sync(self) -> None:
+        """Journal buffered budget changes from the calling thread (interpreter exit)"""
+        if self.budget_journal is None or not self._dirty_budgets:
+            return
+        records, compacted = self._take_budget_records()
+        self.budget_journal.write(records, compacted)
 
     async def record_consent(
         self,
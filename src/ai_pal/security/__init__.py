@@ -10,7 +10,16 @@ Provides complete security capabilities including:
 Part of Phase 1 Full Implementation.
 """
 
-from ..core.credentials import SecureCredentialManager as CredentialManager
+
+def __getattr__(name):
+    # ai_pal.core.credentials loads the whole core package (and its NLP
+    # models); only pay for it when CredentialManager is used, so secret
+    # scans and sanitization import quickly
+    if name == "CredentialManager":
+        from ..core.credentials import SecureCredentialManager
+        return SecureCredentialManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Secret scanning
 from .secret_scanner import (
@@ -22,6 +31,7 @@ from .secret_scanner import (
     scan_text,
     scan_file,
 )
+from .scan_engine import SecretScanEngine, ScanStats
 
 # Input/output security
 from .sanitization import (
@@ -61,6 +71,8 @@ __all__ = [
     'get_scanner',
     'scan_text',
     'scan_file',
+    'SecretScanEngine',
+    'ScanStats',
 
     # Sanitization
     'InputSanitizer',
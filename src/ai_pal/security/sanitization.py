@@ -2,12 +2,27 @@
 Input Sanitization and Output Validation
 
 Provides security sanitization for user inputs and validation for system outputs.
+
+Dangerous-pattern detection is compiled once per sanitization level into a
+SanitizationEngine: ASCII strings are checked with literal substring and
+whole-word tests (the regexes only confirm rare keyword hits), and strings
+without any trigger punctuation (plain letters, digits and whitespace) skip
+straight to the keyword tests.
+sanitize_dict() can take the pydantic model describing a payload and skip
+fields that cannot carry strings or are declared safe with
+Field(json_schema_extra={"sanitize": False}). This mode is not wired into
+the API: no route sanitizes request bodies yet, so the request models in
+api/main.py carry no such annotations. Callers opt in by passing schema=.
 """
 
 import re
 import html
 import logging
-from typing import Any, Dict, List, Optional, Set, Tuple
+import typing
+from collections import abc
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -41,6 +56,260 @@ class SanitizationResult:
         }
 
 
+# ============================================================================
+# Compiled Detection
+# ============================================================================
+
+# Compiled once; InputSanitizer._dangerous_patterns is this mapping
+_DANGEROUS_PATTERNS: Mapping[str, re.Pattern] = MappingProxyType({
+    'sql_injection': re.compile(
+        r"('|\"|;|--|\bDROP\b|\bDELETE\b|\bINSERT\b|\bUPDATE\b|\bUNION\b|\bSELECT\b)",
+        re.IGNORECASE
+    ),
+    'command_injection': re.compile(
+        r'(\||&&|;|`|\$\(|\${|>|<)',
+    ),
+    'path_traversal': re.compile(
+        r'(\.\./|\.\.\\)',
+    ),
+    'xss': re.compile(
+        r'(<script|<iframe|javascript:|onerror=|onload=)',
+        re.IGNORECASE
+    ),
+    'code_injection': re.compile(
+        r'(__import__|exec\(|eval\(|\bimport\s+os\b|\bimport\s+subprocess\b)',
+        re.IGNORECASE
+    ),
+})
+
+# \w for ASCII text
+_ASCII_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+
+
+@dataclass(frozen=True)
+class _Trigger:
+    """
+    Exact ASCII equivalent of one dangerous pattern
+
+    The pattern matches an ASCII string iff one of the literals occurs in
+    it, one of the folded literals or whole words occurs in its lowercased
+    form, or the hint occurs there and the verify regex confirms.
+    """
+    name: str
+    literals: Tuple[str, ...] = ()
+    folded: Tuple[str, ...] = ()
+    words: Tuple[str, ...] = ()
+    hint: Optional[str] = None
+    verify: Optional[re.Pattern] = None
+
+
+_TRIGGERS: Tuple[_Trigger, ...] = (
+    _Trigger(
+        'sql_injection',
+        literals=("'", '"', ';', '--'),
+        words=('drop', 'delete', 'insert', 'update', 'union', 'select'),
+    ),
+    _Trigger(
+        'command_injection',
+        literals=('|', '&&', ';', '`', '$(', '${', '>', '<'),
+    ),
+    _Trigger(
+        'path_traversal',
+        literals=('../', '..\\'),
+    ),
+    _Trigger(
+        'xss',
+        folded=('<script', '<iframe', 'javascript:', 'onerror=', 'onload='),
+    ),
+    _Trigger(
+        'code_injection',
+        folded=('__import__', 'exec(', 'eval('),
+        hint='import',
+        verify=re.compile(r'\bimport\s+os\b|\bimport\s+subprocess\b', re.IGNORECASE),
+    ),
+)
+
+
+def _key_char(literal: str) -> str:
+    """First non-alphanumeric character of a trigger literal"""
+    return next(c for c in literal if not c.isalnum())
+
+
+def _has_word(lower: str, word: str) -> bool:
+    """Whether word occurs in lowercased ASCII text between \\b boundaries"""
+    start = lower.find(word)
+    while start >= 0:
+        end = start + len(word)
+        if (start == 0 or lower[start - 1] not in _ASCII_WORD_CHARS) and (
+            end == len(lower) or lower[end] not in _ASCII_WORD_CHARS
+        ):
+            return True
+        start = lower.find(word, start + 1)
+    return False
+
+
+class SanitizationEngine:
+    """
+    Dangerous-pattern detection and limits for one sanitization level
+
+    Finds exactly the patterns _DANGEROUS_PATTERNS would find. Non-ASCII
+    strings (where IGNORECASE folds characters like "ſ" to ASCII letters)
+    go through the regexes.
+    """
+
+    MAX_LENGTH = {
+        SanitizationLevel.STRICT: 1000,
+        SanitizationLevel.MODERATE: 10000,
+        SanitizationLevel.LENIENT: 100000,
+    }
+
+    # Detection results cached for strings up to CACHE_MAX_CHARS
+    CACHE_SIZE = 4096
+    CACHE_MAX_CHARS = 256
+
+    def __init__(self, level: SanitizationLevel):
+        self.level = level
+        self.max_length = self.MAX_LENGTH[level]
+        self.patterns = _DANGEROUS_PATTERNS
+
+        # Every literal holds a non-alphanumeric key character; text with
+        # none of them can only match whole-word keywords
+        self._plan = [
+            (
+                trigger.name,
+                tuple((_key_char(literal), literal, False) for literal in trigger.literals)
+                + tuple((_key_char(literal), literal, True) for literal in trigger.folded),
+                trigger.words,
+                trigger.hint,
+                trigger.verify,
+            )
+            for trigger in _TRIGGERS
+        ]
+        self._key_chars = frozenset(key for _, literals, *_ in self._plan for key, _, _ in literals)
+
+        # Payload values repeat (enums, labels, ids); results for short
+        # strings are kept in a bounded LRU
+        self._detect_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._detect)
+
+    def has_key_chars(self, text: str) -> bool:
+        """Whether text holds any literal's key character (plain text does not)"""
+        return not self._key_chars.isdisjoint(text)
+
+    def detect(self, text: str) -> Tuple[str, ...]:
+        """
+        Names of the dangerous patterns present in text
+
+        Args:
+            text: String to check
+
+        Returns:
+            Pattern names, in _DANGEROUS_PATTERNS order
+        """
+        if len(text) <= self.CACHE_MAX_CHARS:
+            return self._detect_cached(text)
+        return self._detect(text)
+
+    def _detect(self, text: str) -> Tuple[str, ...]:
+        if not text.isascii():
+            return tuple(name for name, pattern in self.patterns.items() if pattern.search(text))
+
+        lower = text.lower()
+        # Fast path (e.g. letters, digits and whitespace): keywords only
+        keys = self._key_chars.intersection(text)
+        found = []
+        for name, literals, words, hint, verify in self._plan:
+            hit = False
+            if keys:
+                for key, literal, folded in literals:
+                    if key in keys and literal in (lower if folded else text):
+                        hit = True
+                        break
+            if not hit:
+                for word in words:
+                    if word in lower and _has_word(lower, word):
+                        hit = True
+                        break
+            if not hit and hint is not None and hint in lower:
+                hit = verify.search(text) is not None
+            if hit:
+                found.append(name)
+        return tuple(found)
+
+
+_ENGINES: Dict[SanitizationLevel, SanitizationEngine] = {}
+
+
+def get_sanitization_engine(level: SanitizationLevel) -> SanitizationEngine:
+    """Get the shared engine for a sanitization level"""
+    engine = _ENGINES.get(level)
+    if engine is None:
+        engine = _ENGINES.setdefault(level, SanitizationEngine(level))
+    return engine
+
+
+# ============================================================================
+# Payload Schemas
+# ============================================================================
+
+def _can_hold_string(annotation: Any) -> bool:
+    """Whether a field annotation admits str values (unknown types do)"""
+    if annotation in (str, Any, object) or isinstance(annotation, (str, typing.TypeVar)):
+        return True
+    origin = typing.get_origin(annotation)
+    if origin is typing.Literal:
+        return any(isinstance(arg, str) for arg in typing.get_args(annotation))
+    if origin is not None:
+        args = typing.get_args(annotation)
+        if isinstance(origin, type) and issubclass(origin, abc.Mapping):
+            args = args[1:]  # keys are never sanitized
+        return any(_can_hold_string(arg) for arg in args)
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return False  # validated to a member
+        if hasattr(annotation, "model_fields"):
+            return True  # nested model, handled field by field
+        return issubclass(annotation, str)
+    return True
+
+
+def _nested_model(annotation: Any) -> Optional[type]:
+    """Model class of a (possibly Optional) nested-model field"""
+    if isinstance(annotation, type) and hasattr(annotation, "model_fields"):
+        return annotation
+    if typing.get_origin(annotation) is typing.Union:
+        models = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(models) == 1:
+            return _nested_model(models[0])
+    return None
+
+
+@lru_cache(maxsize=256)
+def _schema_plan(schema: type) -> Tuple[FrozenSet[str], Mapping[str, type]]:
+    """
+    Fields of a pydantic model that need no sanitization, and nested models
+
+    Args:
+        schema: Pydantic model class
+
+    Returns:
+        (safe field names, field name -> nested model class)
+    """
+    safe = set()
+    nested = {}
+    for name, field_info in schema.model_fields.items():
+        keys = {name} | ({field_info.alias} if field_info.alias else set())
+        extra = field_info.json_schema_extra
+        if isinstance(extra, dict) and extra.get("sanitize") is False:
+            safe |= keys
+        elif not _can_hold_string(field_info.annotation):
+            safe |= keys
+        else:
+            model = _nested_model(field_info.annotation)
+            if model is not None:
+                nested.update(dict.fromkeys(keys, model))
+    return frozenset(safe), MappingProxyType(nested)
+
+
 class InputSanitizer:
     """
     Sanitizes user inputs to prevent injection attacks and malicious content.
@@ -55,30 +324,18 @@ class InputSanitizer:
 
     def __init__(self, level: SanitizationLevel = SanitizationLevel.MODERATE):
         self.level = level
+        self._engine = get_sanitization_engine(level)
         self._dangerous_patterns = self._get_dangerous_patterns()
 
-    def _get_dangerous_patterns(self) -> Dict[str, re.Pattern]:
+    def _get_dangerous_patterns(self) -> Mapping[str, re.Pattern]:
         """Get patterns for detecting dangerous content"""
-        return {
-            'sql_injection': re.compile(
-                r"('|\"|;|--|\bDROP\b|\bDELETE\b|\bINSERT\b|\bUPDATE\b|\bUNION\b|\bSELECT\b)",
-                re.IGNORECASE
-            ),
-            'command_injection': re.compile(
-                r'(\||&&|;|`|\$\(|\${|>|<)',
-            ),
-            'path_traversal': re.compile(
-                r'(\.\./|\.\.\\)',
-            ),
-            'xss': re.compile(
-                r'(<script|<iframe|javascript:|onerror=|onload=)',
-                re.IGNORECASE
-            ),
-            'code_injection': re.compile(
-                r'(__import__|exec\(|eval\(|\bimport\s+os\b|\bimport\s+subprocess\b)',
-                re.IGNORECASE
-            ),
-        }
+        return _DANGEROUS_PATTERNS
+
+    def _detect(self, text: str) -> List[str]:
+        """Names of dangerous patterns in text (compiled engine unless patterns were overridden)"""
+        if self._dangerous_patterns is self._engine.patterns:
+            return list(self._engine.detect(text))
+        return [name for name, pattern in self._dangerous_patterns.items() if pattern.search(text)]
 
     def sanitize_string(self, input_str: str, context: str = "general") -> SanitizationResult:
         """
@@ -104,9 +361,8 @@ class InputSanitizer:
         issues = []
 
         # Check for dangerous patterns
-        for pattern_name, pattern in self._dangerous_patterns.items():
-            if pattern.search(sanitized):
-                issues.append(f"Detected {pattern_name} pattern")
+        for pattern_name in self._detect(sanitized):
+            issues.append(f"Detected {pattern_name} pattern")
 
         # Context-specific sanitization
         if context == "path":
@@ -137,11 +393,7 @@ class InputSanitizer:
         text = text.replace('\x00', '')
 
         # Limit length based on sanitization level
-        max_length = {
-            SanitizationLevel.STRICT: 1000,
-            SanitizationLevel.MODERATE: 10000,
-            SanitizationLevel.LENIENT: 100000,
-        }[self.level]
+        max_length = self._engine.max_length
 
         if len(text) > max_length:
             logger.warning(f"Truncating input from {len(text)} to {max_length} characters")
@@ -213,21 +465,33 @@ class InputSanitizer:
 
         return text
 
-    def sanitize_dict(self, data: Dict[str, Any], context: str = "general") -> Dict[str, Any]:
+    def sanitize_dict(
+        self,
+        data: Dict[str, Any],
+        context: str = "general",
+        schema: Optional[type] = None
+    ) -> Dict[str, Any]:
         """
         Sanitize all string values in a dictionary.
 
         Args:
             data: Dictionary to sanitize
             context: Sanitization context
+            schema: Pydantic model describing data; its fields that cannot
+                hold strings, or are declared with
+                json_schema_extra={"sanitize": False}, are passed through
 
         Returns:
             Sanitized dictionary
         """
         sanitized = {}
+        safe_fields, nested_models = _schema_plan(schema) if schema is not None else ((), {})
 
         for key, value in data.items():
-            if isinstance(value, str):
+            if key in safe_fields:
+                sanitized[key] = value
+
+            elif isinstance(value, str):
                 result = self.sanitize_string(value, context)
                 sanitized[key] = result.sanitized
 
@@ -237,7 +501,7 @@ class InputSanitizer:
                     )
 
             elif isinstance(value, dict):
-                sanitized[key] = self.sanitize_dict(value, context)
+                sanitized[key] = self.sanitize_dict(value, context, nested_models.get(key))
 
             elif isinstance(value, list):
                 sanitized[key] = [
@@ -251,6 +515,28 @@ class InputSanitizer:
         return sanitized
 
 
+# Compiled once; OutputValidator._sensitive_patterns is this mapping
+_SENSITIVE_PATTERNS: Mapping[str, re.Pattern] = MappingProxyType({
+    'email': re.compile(
+        r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    ),
+    'phone': re.compile(
+        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
+    ),
+    'ssn': re.compile(
+        r'\b\d{3}-\d{2}-\d{4}\b'
+    ),
+    'credit_card': re.compile(
+        r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'
+    ),
+    'ip_address': re.compile(
+        r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'
+    ),
+})
+
+_DIGIT = re.compile(r'\d')
+
+
 class OutputValidator:
     """
     Validates system outputs for security and content issues.
@@ -265,25 +551,25 @@ class OutputValidator:
     def __init__(self):
         self._sensitive_patterns = self._get_sensitive_patterns()
 
-    def _get_sensitive_patterns(self) -> Dict[str, re.Pattern]:
+    def _get_sensitive_patterns(self) -> Mapping[str, re.Pattern]:
         """Get patterns for detecting sensitive data"""
-        return {
-            'email': re.compile(
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            ),
-            'phone': re.compile(
-                r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'
-            ),
-            'ssn': re.compile(
-                r'\b\d{3}-\d{2}-\d{4}\b'
-            ),
-            'credit_card': re.compile(
-                r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b'
-            ),
-            'ip_address': re.compile(
-                r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'
-            ),
-        }
+        return _SENSITIVE_PATTERNS
+
+    def _applicable_patterns(self, text: str) -> List[Tuple[str, re.Pattern]]:
+        """
+        Sensitive patterns that can match text
+
+        Every default pattern needs a digit except email, which needs '@'.
+        """
+        if self._sensitive_patterns is not _SENSITIVE_PATTERNS:
+            return list(self._sensitive_patterns.items())
+        has_digit = _DIGIT.search(text) is not None
+        has_at = '@' in text
+        return [
+            (name, pattern)
+            for name, pattern in _SENSITIVE_PATTERNS.items()
+            if (has_at if name == 'email' else has_digit)
+        ]
 
     def validate_output(self, output: str, check_secrets: bool = True) -> Dict[str, Any]:
         """
@@ -300,7 +586,7 @@ class OutputValidator:
         warnings = []
 
         # Check for sensitive data patterns
-        for pattern_name, pattern in self._sensitive_patterns.items():
+        for pattern_name, pattern in self._applicable_patterns(output):
             matches = pattern.findall(output)
             if matches:
                 warnings.append(
@@ -356,7 +642,7 @@ class OutputValidator:
         redactions = []
 
         # Redact each type of sensitive data
-        for pattern_name, pattern in self._sensitive_patterns.items():
+        for pattern_name, pattern in self._applicable_patterns(text):
             matches = pattern.findall(redacted)
 
             for match in matches:
@@ -383,13 +669,20 @@ class SecurityValidator:
         self.input_sanitizer = InputSanitizer(level=sanitization_level)
         self.output_validator = OutputValidator()
 
-    def process_input(self, input_data: Any, context: str = "general") -> Any:
+    def process_input(
+        self,
+        input_data: Any,
+        context: str = "general",
+        schema: Optional[type] = None
+    ) -> Any:
         """
         Process and sanitize input data.
 
         Args:
             input_data: Input to process (string or dict)
             context: Context for sanitization
+            schema: Optional pydantic model describing a dict input (see
+                InputSanitizer.sanitize_dict)
 
         Returns:
             Sanitized input
@@ -403,7 +696,7 @@ class SecurityValidator:
             return result.sanitized
 
         elif isinstance(input_data, dict):
-            return self.input_sanitizer.sanitize_dict(input_data, context)
+            return self.input_sanitizer.sanitize_dict(input_data, context, schema)
 
         else:
             return input_data
@@ -473,9 +766,9 @@ def get_validator() -> SecurityValidator:
     return _validator
 
 
-def sanitize_input(input_data: Any, context: str = "general") -> Any:
-    """Convenience function to sanitize input"""
-    return get_validator().process_input(input_data, context)
+def sanitize_input(input_data: Any, context: str = "general", schema: Optional[type] = None) -> Any:
+    """Convenience function to sanitize input (schema: see InputSanitizer.sanitize_dict)"""
+    return get_validator().process_input(input_data, context, schema)
 
 
 def validate_output(output: str) -> Dict[str, Any]:
@@ -0,0 +1,395 @@
+"""
+Repository Secret Scan Engine
+
+SecretScanner.scan_directory used to collect files with six recursive
+globs and scan them one at a time on one core. The engine instead:
+- Walks the tree once with os.scandir, pruning excluded directories
+  (.git, virtualenvs, node_modules, caches) rather than filtering their
+  files afterwards
+- Skips binary files (NUL byte in the first block) and files over a size cap
+- Scans each file with the scanner's keyword prefilter (one combined pass
+  finds the lines worth running patterns on)
+- Fans files out to a process pool when there is enough to scan
+- Caches results by content hash, with a stat signature (size, mtime) per
+  path so rescans of unchanged files don't even read them; the cache can
+  persist to a JSON file between runs (CI)
+"""
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .secret_scanner import SecretMatch, SecretScanner
+
+logger = logging.getLogger(__name__)
+
+
+# File types scanned in recursive scans
+DEFAULT_SCAN_SUFFIXES = (".py", ".json", ".yaml", ".yml", ".env", ".txt")
+
+# "name/*" entries prune directories by name; others match file paths
+DEFAULT_EXCLUDE_PATTERNS = [
+    "*.pyc", "*.pyo", "*.so", "*.dylib", "*.egg-info/*",
+    ".git/*", ".venv/*", "venv/*", "node_modules/*",
+    "__pycache__/*", "*.min.js", "*.min.css",
+    ".tox/*", ".mypy_cache/*", ".pytest_cache/*", ".ruff_cache/*",
+]
+
+CACHE_VERSION = 2
+
+_BINARY_SNIFF_BYTES = 8192
+
+
+@dataclass
+class ScanStats:
+    """Counters for one directory or path-list scan"""
+    files: int = 0  # Candidate files after walking and exclusion
+    scanned: int = 0  # Files actually run through the patterns
+    cache_hits: int = 0  # Unchanged files served from the cache
+    skipped_binary: int = 0
+    skipped_large: int = 0
+    bytes_scanned: int = 0
+    workers: int = 0  # Processes used (0: scanned in this process)
+    seconds: float = 0.0
+
+
+def _decode(data: bytes) -> str:
+    """Decode like open(..., 'r', encoding='utf-8', errors='ignore')"""
+    text = data.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# Scanner used by pool workers (set by _init_worker)
+_worker_scanner: Optional[SecretScanner] = None
+
+
+def _init_worker(scanner: SecretScanner) -> None:
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _scan_chunk(chunk: List[Tuple[str, bytes]]) -> List[Tuple[str, List[SecretMatch]]]:
+    """Worker: scan (digest, content) pairs"""
+    return [(digest, _worker_scanner.scan_text(_decode(data), honor_allowlist=True)) for digest, data in chunk]
+
+
+class SecretScanEngine:
+    """
+    Parallel, incremental file scanner built on a SecretScanner
+
+    Keep one engine around (SecretScanner.scan_directory does) so repeated
+    scans reuse its cache.
+    """
+
+    def __init__(
+        self,
+        scanner: Optional[SecretScanner] = None,
+        workers: Optional[int] = None,
+        max_file_bytes: int = 2 * 1024 * 1024,
+        suffixes: Sequence[str] = DEFAULT_SCAN_SUFFIXES,
+        cache_path: Optional[Union[str, Path]] = None,
+        parallel_min_bytes: int = 1024 * 1024,
+        chunk_bytes: int = 256 * 1024,
+    ):
+        """
+        Initialize engine
+
+        Args:
+            scanner: Patterns and filtering to apply (default: new SecretScanner)
+            workers: Scan processes (default: CPU count; 1 scans in-process)
+            max_file_bytes: Larger files are skipped
+            suffixes: File suffixes included in recursive scans
+            cache_path: JSON file to load the result cache from and save it to
+            parallel_min_bytes: Less uncached content than this is scanned
+                in-process (a pool costs more than it saves)
+            chunk_bytes: Content per task sent to a worker
+        """
+        self.scanner = scanner or SecretScanner()
+        self.workers = workers or os.cpu_count() or 1
+        self.max_file_bytes = max_file_bytes
+        self.suffixes = tuple(suffixes)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.parallel_min_bytes = parallel_min_bytes
+        self.chunk_bytes = chunk_bytes
+        self.last_stats = ScanStats()
+
+        # path -> (size, mtime_ns, digest); digest -> matches (context unset)
+        self._files: Dict[str, Tuple[int, int, str]] = {}
+        self._results: Dict[str, List[SecretMatch]] = {}
+        self._fingerprint = self._scanner_fingerprint()
+
+        if self.cache_path is not None:
+            self.load_cache()
+
+    def _scanner_fingerprint(self) -> str:
+        """Hash of everything that decides a file's matches; cached results need the same one"""
+        digest = hashlib.sha256()
+        for pattern in self.scanner.patterns:
+            digest.update(repr((
+                pattern.pattern.pattern, pattern.pattern.flags, pattern.secret_type.value,
+                pattern.severity.value, pattern.confidence,
+            )).encode())
+        digest.update(repr(sorted(self.scanner._false_positive_indicators)).encode())
+        return digest.hexdigest()
+
+    # ========================================================================
+    # Walking
+    # ========================================================================
+
+    def iter_files(
+        self,
+        root: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None
+    ) -> Iterator[Path]:
+        """
+        Walk root once, pruning excluded directories
+
+        Args:
+            root: Directory to walk
+            recursive: Descend into subdirectories (only matching suffixes
+                are yielded); otherwise yield every file directly in root
+            exclude_patterns: fnmatch patterns; "name/*" prunes directories
+                called name, others exclude matching file paths or names
+                (default: DEFAULT_EXCLUDE_PATTERNS)
+
+        Yields:
+            Files to scan (never the engine's own cache file)
+        """
+        patterns = DEFAULT_EXCLUDE_PATTERNS if exclude_patterns is None else exclude_patterns
+        dir_patterns = [p[:-2] for p in patterns if p.endswith("/*")]
+        file_patterns = [p for p in patterns if not p.endswith("/*")]
+        cache_file = os.path.abspath(self.cache_path) if self.cache_path else None
+
+        stack = [str(root)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError as e:
+                logger.warning(f"Cannot list directory: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and not any(
+                                fnmatch.fnmatch(entry.name, p) for p in dir_patterns
+                            ):
+                                stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+
+                    if recursive and not entry.name.endswith(self.suffixes):
+                        continue
+                    if any(
+                        fnmatch.fnmatch(entry.path, p) or fnmatch.fnmatch(entry.name, p)
+                        for p in file_patterns
+                    ):
+                        continue
+                    if cache_file is not None and os.path.abspath(entry.path) == cache_file:
+                        continue
+                    yield Path(entry.path)
+
+    # ========================================================================
+    # Scanning
+    # ========================================================================
+
+    def scan_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        exclude_patterns: Optional[List[str]] = None
+    ) -> Dict[str, List[SecretMatch]]:
+        """
+        Scan a directory for secrets
+
+        Args:
+            directory: Directory to scan
+            recursive: If True, scan subdirectories
+            exclude_patterns: See iter_files
+
+        Returns:
+            Dictionary mapping file paths (with findings) to detected secrets
+        """
+        files = sorted(self.iter_files(Path(directory), recursive, exclude_patterns))
+        return self.scan_paths(files)
+
+    def scan_paths(self, paths: Sequence[Union[str, Path]]) -> Dict[str, List[SecretMatch]]:
+        """
+        Scan files, reusing cached results for unchanged ones
+
+        Args:
+            paths: Files to scan
+
+        Returns:
+            Dictionary mapping file paths (with findings) to detected secrets
+        """
+        start = time.perf_counter()
+        stats = ScanStats(files=len(paths))
+
+        fingerprint = self._scanner_fingerprint()
+        if fingerprint != self._fingerprint:
+            # Patterns changed since the cache was filled
+            self.clear_cache()
+            self._fingerprint = fingerprint
+
+        digests: Dict[str, str] = {}
+        pending: Dict[str, bytes] = {}  # digest -> content still to scan
+
+        for path in paths:
+            key = str(path)
+            try:
+                st = os.stat(key)
+                cached = self._files.get(key)
+                if cached is not None and cached[:2] == (st.st_size, st.st_mtime_ns):
+                    if cached[2] in self._results:
+                        digests[key] = cached[2]
+                        stats.cache_hits += 1
+                        continue
+
+                if st.st_size > self.max_file_bytes:
+                    stats.skipped_large += 1
+                    continue
+
+                with open(key, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                logger.error(f"Error scanning file {key}: {e}")
+                continue
+
+            if b"\0" in data[:_BINARY_SNIFF_BYTES]:
+                stats.skipped_binary += 1
+                continue
+
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            self._files[key] = (st.st_size, st.st_mtime_ns, digest)
+            digests[key] = digest
+            if digest in self._results:
+                # Touched or copied, but content already scanned
+                stats.cache_hits += 1
+            elif digest not in pending:
+                pending[digest] = data
+
+        stats.scanned = len(pending)
+        stats.bytes_scanned = sum(len(data) for data in pending.values())
+        self._scan_pending(pending, stats)
+
+        results = {}
+        for key, digest in digests.items():
+            matches = self._results.get(digest)
+            if matches:
+                results[key] = [replace(match, context=key) for match in matches]
+
+        stats.seconds = time.perf_counter() - start
+        self.last_stats = stats
+        logger.info(
+            f"Secret scan: {stats.files} files ({stats.scanned} scanned, "
+            f"{stats.cache_hits} cached, {stats.skipped_binary} binary, "
+            f"{stats.skipped_large} too large) in {stats.seconds:.2f}s, "
+            f"{len(results)} with findings"
+        )
+        return results
+
+    def _scan_pending(self, pending: Dict[str, bytes], stats: ScanStats) -> None:
+        """Scan uncached contents into the result cache, in a pool if worth it"""
+        if not pending:
+            return
+
+        if self.workers <= 1 or stats.bytes_scanned < self.parallel_min_bytes:
+            for digest, data in pending.items():
+                self._results[digest] = self.scanner.scan_text(_decode(data), honor_allowlist=True)
+            return
+
+        # Size-bounded chunks, largest files first so stragglers start early
+        chunks: List[List[Tuple[str, bytes]]] = []
+        chunk: List[Tuple[str, bytes]] = []
+        chunk_size = 0
+        for digest, data in sorted(pending.items(), key=lambda item: -len(item[1])):
+            chunk.append((digest, data))
+            chunk_size += len(data)
+            if chunk_size >= self.chunk_bytes:
+                chunks.append(chunk)
+                chunk, chunk_size = [], 0
+        if chunk:
+            chunks.append(chunk)
+
+        stats.workers = min(self.workers, len(chunks))
+        with ProcessPoolExecutor(
+            max_workers=stats.workers,
+            initializer=_init_worker,
+            initargs=(self.scanner,),
+        ) as pool:
+            for chunk_results in pool.map(_scan_chunk, chunks):
+                self._results.update(chunk_results)
+
+    # ========================================================================
+    # Cache
+    # ========================================================================
+
+    def clear_cache(self) -> None:
+        """Forget all cached results"""
+        self._files.clear()
+        self._results.clear()
+
+    def load_cache(self) -> bool:
+        """
+        Load the result cache from cache_path
+
+        Returns:
+            True if a cache for the same patterns was loaded
+        """
+        if self.cache_path is None or not self.cache_path.exists():
+            return False
+
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable secret scan cache {self.cache_path}: {e}")
+            return False
+
+        if data.get("version") != CACHE_VERSION or data.get("fingerprint") != self._fingerprint:
+            logger.info("Secret scan cache is for different patterns; starting fresh")
+            return False
+
+        self._files = {path: tuple(entry) for path, entry in data["files"].items()}
+        self._results = {
+            digest: [SecretMatch.from_dict(match) for match in matches]
+            for digest, matches in data["results"].items()
+        }
+        return True
+
+    def save_cache(self) -> None:
+        """Write the result cache (entries for known paths only) to cache_path"""
+        if self.cache_path is None:
+            return
+
+        live = {entry[2] for entry in self._files.values()}
+        data = {
+            "version": CACHE_VERSION,
+            "fingerprint": self._fingerprint,
+            "files": self._files,
+            "results": {
+                digest: [match.to_dict() for match in matches]
+                for digest, matches in self._results.items() if digest in live
+            },
+        }
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
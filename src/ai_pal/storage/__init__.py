@@ -37,6 +37,7 @@ from .database import (
     GoalRepository,
     UserProfileRepository
 )
+from .state_store import StateStore, CachedStateStore, create_state_store
 from ..cache.redis_cache import RedisCache, UserDataCache
 from ..tasks.background_jobs import TaskQueue, TaskScheduler
 
@@ -221,6 +222,9 @@ __all__ = [
     "ARIRepository",
     "GoalRepository",
     "UserProfileRepository",
+    "StateStore",
+    "CachedStateStore",
+    "create_state_store",
     "RedisCache",
     "UserDataCache",
     "TaskQueue",
@@ -10,12 +10,13 @@ from datetime import datetime
 
 from loguru import logger
 
-from ai_pal.cache.redis_cache import RedisCache, CacheKey
+from ai_pal.cache.redis_cache import RedisCache, CacheKey, NEGATIVE_CACHE_MARKER
 from ai_pal.storage.database import (
     DatabaseManager,
     ARIRepository,
     GoalRepository,
     BackgroundTaskRepository,
+    DashboardRepository,
 )
 
 
@@ -62,7 +63,7 @@ class CachedARIRepository:
         # Try cache
         cached = await self.cache.get(cache_key)
         if cached is not None:
-            return cached
+            return None if cached == NEGATIVE_CACHE_MARKER else cached
 
         # Fetch from database
         snapshot = await self.db_repo.get_latest_snapshot(user_id)
@@ -244,6 +245,96 @@ class CachedTaskRepository:
         return updated
 
 
+class CachedDashboardRepository:
+    """
+    Batched dashboard reads with Redis caching
+
+    Resolves all requested per-user fields with one MGET, loads only the
+    misses from the database over one session, and repopulates them with one
+    pipelined set_many. Keys are shared with the other cached repositories,
+    so their write-through invalidation applies here too.
+    """
+
+    # Field -> (cache key template, TTL seconds)
+    FIELD_KEYS = {
+        "profile": (CacheKey.USER_PROFILE, 600),
+        "latest_ari": (CacheKey.USER_ARI_LATEST, 300),
+        "recent_ari": (CacheKey.USER_ARI_RECENT, 300),
+        "active_goals": (CacheKey.USER_GOALS_ACTIVE, 600),
+        "tasks": (CacheKey.USER_TASKS, 120),
+    }
+
+    # Short TTL for "no such row" results (missing profile / no snapshots yet)
+    NEGATIVE_TTL = 30
+
+    # "recent_ari" is cached at a fixed depth and sliced per request, so one
+    # cache entry serves every ari_limit up to this size
+    RECENT_ARI_SIZE = 10
+
+    def __init__(self, db_manager: DatabaseManager, cache: RedisCache):
+        """Initialize with database and cache"""
+        self.db_repo = DashboardRepository(db_manager)
+        self.cache = cache
+
+    async def get_user_data(
+        self,
+        user_id: str,
+        fields: Optional[List[str]] = None,
+        ari_limit: int = 2
+    ) -> Dict[str, Any]:
+        """Get dashboard fields for a user (one round trip per tier)"""
+        if ari_limit > self.RECENT_ARI_SIZE:
+            raise ValueError(f"ari_limit must be <= {self.RECENT_ARI_SIZE}")
+
+        fields = list(fields) if fields is not None else list(DashboardRepository.FIELDS)
+        keys = {
+            field: self.FIELD_KEYS[field][0].format(user_id=user_id)
+            for field in fields
+        }
+
+        # Tier 1: single MGET for every field
+        cached = await self.cache.get_many(list(keys.values()))
+
+        data: Dict[str, Any] = {}
+        misses: List[str] = []
+        for field, key in keys.items():
+            if key in cached:
+                value = cached[key]
+                data[field] = None if value == NEGATIVE_CACHE_MARKER else value
+            else:
+                misses.append(field)
+
+        if misses:
+            # Tier 2: grouped database reads for the misses only
+            logger.debug(f"Dashboard cache miss for user {user_id}: {misses}")
+            loaded = await self.db_repo.get_user_data(
+                user_id, misses, ari_limit=self.RECENT_ARI_SIZE
+            )
+            data.update(loaded)
+            await self._repopulate(keys, misses, loaded)
+
+        if data.get("recent_ari"):
+            data["recent_ari"] = data["recent_ari"][:ari_limit]
+
+        return data
+
+    async def _repopulate(
+        self,
+        keys: Dict[str, str],
+        misses: List[str],
+        loaded: Dict[str, Any]
+    ):
+        """Write loaded fields back to cache in one pipeline"""
+        items = {}
+        ttls = {}
+        for field in misses:
+            key = keys[field]
+            value = loaded.get(field)
+            items[key] = NEGATIVE_CACHE_MARKER if value is None else value
+            ttls[key] = self.NEGATIVE_TTL if value is None else self.FIELD_KEYS[field][1]
+        await self.cache.set_many(items, ttls=ttls)
+
+
 # ============================================================================
 # Factory Functions for Easy Integration
 # ============================================================================
@@ -270,3 +361,11 @@ def create_cached_task_repo(
 ) -> CachedTaskRepository:
     """Create cached task repository"""
     return CachedTaskRepository(db_manager, cache)
+
+
+def create_cached_dashboard_repo(
+    db_manager: DatabaseManager,
+    cache: RedisCache
+) -> CachedDashboardRepository:
+    """Create cached dashboard repository"""
+    return CachedDashboardRepository(db_manager, cache)
@@ -24,6 +24,7 @@ import json
 
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -37,7 +38,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
-from sqlalchemy.pool import QueuePool, NullPool
+from sqlalchemy.pool import QueuePool, NullPool, AsyncAdaptedQueuePool
 from loguru import logger
 
 Base = declarative_base()
@@ -212,7 +213,7 @@ class ProgressTapestryDB(Base):
     connected_to = Column(Text, nullable=True)  # JSON array of entry IDs
 
     __table_args__ = (
-        Index('idx_user_timestamp', 'user_id', 'timestamp'),
+        Index('idx_tapestry_user_timestamp', 'user_id', 'timestamp'),
     )
 
 
@@ -227,7 +228,7 @@ class MomentumHistoryDB(Base):
     goal_id = Column(String(36), nullable=True)
 
     __table_args__ = (
-        Index('idx_user_timestamp', 'user_id', 'timestamp'),
+        Index('idx_momentum_user_timestamp', 'user_id', 'timestamp'),
     )
 
 
@@ -311,8 +312,31 @@ class BackgroundTaskDB(Base):
 
     __table_args__ = (
         Index('idx_task_status_created', 'task_name', 'status', 'created_at'),
-        Index('idx_user_status', 'user_id', 'status'),
+        Index('idx_task_user_status', 'user_id', 'status'),
         Index('idx_celery_id', 'celery_task_id'),
+        # Queue index: pending/failed listings and purge scans read only
+        # these columns (plus the row id), so they never touch the table.
+        Index(
+            'idx_task_queue', 'status', priority.desc(), 'created_at',
+            postgresql_include=['id']
+        ),
+    )
+
+
+class SharedStateDB(Base):
+    """Per-user subsystem state shared by all API workers (see storage.state_store)"""
+    __tablename__ = "shared_state"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    namespace = Column(String(64), nullable=False)
+    key = Column(String(255), nullable=False)
+    value = Column(Text, nullable=False)  # JSON
+    # Incremented on every write; updates compare-and-swap on it
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, nullable=False, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        Index('idx_shared_state_key', 'namespace', 'key', unique=True),
     )
 
 
@@ -320,6 +344,20 @@ class BackgroundTaskDB(Base):
 # Database Manager
 # ============================================================================
 
+# Pragmas applied to every connection in tuned SQLite mode.
+# WAL lets readers run alongside the single writer; synchronous=NORMAL is
+# durable across application crashes under WAL (only an OS crash or power
+# loss can drop the last transactions).
+SQLITE_TUNED_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -64000,       # KiB (negative) -> 64 MB page cache per connection
+    "mmap_size": 268435456,     # 256 MB memory-mapped reads
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,       # ms to wait for the write lock instead of failing
+}
+
+
 class DatabaseManager:
     """Manages database connections and operations"""
 
@@ -328,7 +366,11 @@ class DatabaseManager:
         database_url: str = "sqlite+aiosqlite:///./ai_pal.db",
         echo: bool = False,
         pool_size: int = 20,
-        max_overflow: int = 40
+        max_overflow: int = 40,
+        sqlite_tuned: bool = True,
+        sqlite_pool_size: int = 4,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
+        statement_cache_size: int = 256
     ):
         """
         Initialize database manager
@@ -340,13 +382,37 @@ class DatabaseManager:
             echo: Echo SQL statements (for debugging)
             pool_size: Connection pool size (default 20 for PostgreSQL)
             max_overflow: Max overflow connections (default 40)
+            sqlite_tuned: Use the tuned SQLite mode (persistent connection
+                pool, WAL journal, pragmas, statement cache). False restores
+                a fresh connection per session.
+            sqlite_pool_size: Persistent SQLite connections in tuned mode
+            sqlite_pragmas: Overrides merged into SQLITE_TUNED_PRAGMAS
+            statement_cache_size: Prepared statements cached per SQLite connection
         """
         self.database_url = database_url
         self.is_sqlite = "sqlite" in database_url.lower()
+        # In-memory databases are per-connection, so pooling them changes semantics
+        self.sqlite_tuned = (
+            self.is_sqlite and sqlite_tuned and ":memory:" not in database_url
+        )
 
         # Create async engine
-        if self.is_sqlite:
-            # SQLite doesn't support connection pooling
+        if self.sqlite_tuned:
+            # Connections (and their aiosqlite threads, page caches and
+            # prepared statements) are reused instead of reopened per session.
+            # Writes still serialize on SQLite's lock; busy_timeout queues them.
+            self.sqlite_pragmas = {**SQLITE_TUNED_PRAGMAS, **(sqlite_pragmas or {})}
+            self.engine = create_async_engine(
+                database_url,
+                echo=echo,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=sqlite_pool_size,
+                max_overflow=0,
+                connect_args={"cached_statements": statement_cache_size}
+            )
+            event.listen(self.engine.sync_engine, "connect", self._apply_sqlite_pragmas)
+        elif self.is_sqlite:
+            # Untuned SQLite: a new connection for every session
             self.engine = create_async_engine(
                 database_url,
                 echo=echo,
@@ -386,10 +452,26 @@ class DatabaseManager:
             expire_on_commit=False
         )
 
-        logger.info(
-            f"DatabaseManager initialized with {database_url} "
-            f"(pool_size={pool_size}, max_overflow={max_overflow})"
-        )
+        if self.sqlite_tuned:
+            logger.info(
+                f"DatabaseManager initialized with {database_url} "
+                f"(tuned SQLite, pool_size={sqlite_pool_size}, "
+                f"journal_mode={self.sqlite_pragmas['journal_mode']})"
+            )
+        else:
+            logger.info(
+                f"DatabaseManager initialized with {database_url} "
+                f"(pool_size={pool_size}, max_overflow={max_overflow})"
+            )
+
+    def _apply_sqlite_pragmas(self, dbapi_connection, connection_record):
+        """Apply tuned-mode pragmas to a new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.sqlite_pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
 
     async def create_tables(self):
         """Create all tables"""
@@ -682,6 +764,48 @@ class PatchRequestRepository:
 
             return [self._request_to_dict(r) for r in requests]
 
+    async def get_requests_by_statuses(
+        self,
+        limits: Dict[str, int]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the newest patch requests for several statuses in one query
+
+        Args:
+            limits: Status -> max requests to return for that status
+
+        Returns:
+            Status -> requests (newest first); every requested status is present
+        """
+        from sqlalchemy import select, func
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {status: [] for status in limits}
+        if not limits:
+            return grouped
+
+        async with self.db.get_session() as session:
+            # Rank rows within each status so per-status limits apply server-side
+            ranked = select(
+                PatchRequestDB,
+                func.row_number().over(
+                    partition_by=PatchRequestDB.status,
+                    order_by=PatchRequestDB.created_at.desc()
+                ).label("status_rank")
+            ).where(
+                PatchRequestDB.status.in_(list(limits))
+            ).subquery()
+
+            query = select(ranked).where(
+                ranked.c.status_rank <= max(limits.values())
+            ).order_by(ranked.c.created_at.desc())
+
+            result = await session.execute(query)
+            for row in result:
+                if row.status_rank <= limits[row.status]:
+                    grouped[row.status].append(self._request_to_dict(row))
+
+        return grouped
+
     async def update_status(
         self,
         request_id: str,
@@ -771,17 +895,9 @@ class BackgroundTaskRepository:
         from sqlalchemy import insert
 
         async with self.db.get_session() as session:
-            task_data = {
-                "task_id": task_id,
-                "task_name": task_name,
-                "task_type": task_type,
-                "priority": priority,
-                "user_id": user_id,
-                "status": "pending",
-                "args": json.dumps(args or {}),
-                "kwargs": json.dumps(kwargs or {}),
-                "created_at": datetime.now()
-            }
+            task_data = self.build_task_row(
+                task_id, task_name, task_type, priority, user_id, args, kwargs
+            )
 
             stmt = insert(BackgroundTaskDB).values(**task_data)
             await session.execute(stmt)
@@ -797,22 +913,9 @@ class BackgroundTaskRepository:
         completed_at: Optional[datetime] = None
     ):
         """Update task status"""
-        from sqlalchemy import update
-
-        async with self.db.get_session() as session:
-            updates = {"status": status}
-
-            if started_at:
-                updates["started_at"] = started_at
-            if completed_at:
-                updates["completed_at"] = completed_at
-
-            stmt = update(BackgroundTaskDB).where(
-                BackgroundTaskDB.task_id == task_id
-            ).values(**updates)
-
-            await session.execute(stmt)
-            await session.commit()
+        await self._update_task(task_id, self.build_task_updates(
+            status=status, started_at=started_at, completed_at=completed_at
+        ))
 
     async def record_task_result(
         self,
@@ -824,29 +927,47 @@ class BackgroundTaskRepository:
         attempts: Optional[int] = None
     ):
         """Record task result/error"""
-        from sqlalchemy import update
-
-        async with self.db.get_session() as session:
-            updates = {}
-
-            if result is not None:
-                updates["result"] = json.dumps(result)
-
-            if error_message:
-                updates["error_message"] = error_message
-
-            if error_traceback:
-                updates["error_traceback"] = error_traceback
-
-            if duration_seconds is not None:
-                updates["duration_seconds"] = duration_seconds
+        await self._update_task(task_id, self.build_task_updates(
+            result=result,
+            error_message=error_message,
+            error_traceback=error_traceback,
+            duration_seconds=duration_seconds,
+            attempts=attempts
+        ))
+
+    async def finish_task(
+        self,
+        task_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_traceback: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+        completed_at: Optional[datetime] = None
+    ):
+        """
+        Record the final status and result of a task in a single UPDATE
 
-            if attempts is not None:
-                updates["attempts"] = attempts
+        Equivalent to record_task_result() followed by update_task_status(),
+        but with one commit instead of two.
+        """
+        await self._update_task(task_id, self.build_task_updates(
+            status=status,
+            completed_at=completed_at or datetime.now(),
+            result=result,
+            error_message=error_message,
+            error_traceback=error_traceback,
+            duration_seconds=duration_seconds
+        ))
+
+    async def _update_task(self, task_id: str, updates: Dict[str, Any]):
+        """Apply column updates to one task row"""
+        from sqlalchemy import update
 
-            if not updates:
-                return
+        if not updates:
+            return
 
+        async with self.db.get_session() as session:
             stmt = update(BackgroundTaskDB).where(
                 BackgroundTaskDB.task_id == task_id
             ).values(**updates)
@@ -854,6 +975,62 @@ class BackgroundTaskRepository:
             await session.execute(stmt)
             await session.commit()
 
+    @staticmethod
+    def build_task_row(
+        task_id: str,
+        task_name: str,
+        task_type: str,
+        priority: int = 5,
+        user_id: Optional[str] = None,
+        args: Optional[Dict[str, Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build the column values for a new pending task"""
+        return {
+            "task_id": task_id,
+            "task_name": task_name,
+            "task_type": task_type,
+            "priority": priority,
+            "user_id": user_id,
+            "status": "pending",
+            "args": json.dumps(args or {}),
+            "kwargs": json.dumps(kwargs or {}),
+            "created_at": datetime.now()
+        }
+
+    @staticmethod
+    def build_task_updates(
+        status: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        error_traceback: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+        attempts: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build column updates for a task, skipping unset values"""
+        updates: Dict[str, Any] = {}
+
+        if status:
+            updates["status"] = status
+        if started_at:
+            updates["started_at"] = started_at
+        if completed_at:
+            updates["completed_at"] = completed_at
+        if result is not None:
+            updates["result"] = json.dumps(result)
+        if error_message:
+            updates["error_message"] = error_message
+        if error_traceback:
+            updates["error_traceback"] = error_traceback
+        if duration_seconds is not None:
+            updates["duration_seconds"] = duration_seconds
+        if attempts is not None:
+            updates["attempts"] = attempts
+
+        return updates
+
     async def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Get task by ID"""
         from sqlalchemy import select
@@ -912,28 +1089,101 @@ class BackgroundTaskRepository:
             return [self._task_to_dict(t) for t in tasks]
 
     async def get_pending_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get pending tasks"""
-        return await self.get_tasks_by_status("pending", limit=limit)
+        """Get pending tasks in queue order (highest priority, then oldest)"""
+        return await self._get_queued_tasks("pending", limit)
 
     async def get_failed_tasks(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get failed tasks"""
-        return await self.get_tasks_by_status("failed", limit=limit)
+        """Get failed tasks in queue order (highest priority, then oldest)"""
+        return await self._get_queued_tasks("failed", limit)
 
-    async def delete_old_tasks(self, days: int = 7):
-        """Delete tasks older than specified days"""
-        from sqlalchemy import delete
-        from datetime import timedelta
+    async def _get_queued_tasks(self, status: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Page through tasks with the given status using idx_task_queue
+
+        The id lookup is an index-only scan (ordering included); only the
+        `limit` selected rows are then fetched by primary key.
+        """
+        from sqlalchemy import select
 
         async with self.db.get_session() as session:
-            cutoff_date = datetime.now() - timedelta(days=days)
+            id_query = select(BackgroundTaskDB.id).where(
+                BackgroundTaskDB.status == status
+            ).order_by(
+                BackgroundTaskDB.priority.desc(),
+                BackgroundTaskDB.created_at.asc()
+            ).limit(limit)
+            ids = (await session.execute(id_query)).scalars().all()
 
-            stmt = delete(BackgroundTaskDB).where(
-                BackgroundTaskDB.created_at < cutoff_date,
-                BackgroundTaskDB.status.in_(["completed", "failed"])
+            if not ids:
+                return []
+
+            result = await session.execute(
+                select(BackgroundTaskDB).where(BackgroundTaskDB.id.in_(ids))
             )
+            tasks = {t.id: t for t in result.scalars().all()}
 
-            await session.execute(stmt)
-            await session.commit()
+            return [self._task_to_dict(tasks[i]) for i in ids if i in tasks]
+
+    async def purge_old_tasks(
+        self,
+        days: int = 7,
+        statuses: Optional[List[str]] = None,
+        batch_size: int = 500
+    ) -> int:
+        """
+        Delete finished tasks older than a TTL, in small batches
+
+        Each batch selects at most `batch_size` ids from idx_task_queue and
+        deletes them by primary key in its own short transaction, so a large
+        backlog never holds a long write lock on the table.
+
+        Args:
+            days: Task TTL in days
+            statuses: Terminal statuses eligible for purge (default completed, failed)
+            batch_size: Maximum rows deleted per transaction
+
+        Returns:
+            Number of rows deleted
+        """
+        import asyncio
+        from sqlalchemy import select, delete
+        from datetime import timedelta
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+        statuses = statuses or ["completed", "failed"]
+        deleted = 0
+
+        while True:
+            async with self.db.get_session() as session:
+                id_query = select(BackgroundTaskDB.id).where(
+                    BackgroundTaskDB.status.in_(statuses),
+                    BackgroundTaskDB.created_at < cutoff_date
+                ).limit(batch_size)
+                ids = (await session.execute(id_query)).scalars().all()
+
+                if not ids:
+                    break
+
+                await session.execute(
+                    delete(BackgroundTaskDB).where(BackgroundTaskDB.id.in_(ids))
+                )
+                await session.commit()
+
+            deleted += len(ids)
+            if len(ids) < batch_size:
+                break
+
+            # Let other writers in between batches
+            await asyncio.sleep(0)
+
+        if deleted:
+            logger.info(f"Purged {deleted} background tasks older than {days} days")
+
+        return deleted
+
+    async def delete_old_tasks(self, days: int = 7) -> int:
+        """Delete tasks older than specified days"""
+        return await self.purge_old_tasks(days=days)
 
     def _task_to_dict(self, task: BackgroundTaskDB) -> Dict[str, Any]:
         """Convert task model to dict"""
@@ -957,3 +1207,254 @@ class BackgroundTaskRepository:
             "args": json.loads(task.args) if task.args else {},
             "kwargs": json.loads(task.kwargs) if task.kwargs else {}
         }
+
+
+class TaskStateWriter:
+    """
+    Batched writer for background task state
+
+    Buffers task creations and status/result transitions in memory and
+    writes them in one transaction per flush. Transitions for the same task
+    are merged (last value wins), and transitions for a task created in the
+    same batch are folded into its INSERT, so a short task's whole lifecycle
+    can land in a single commit.
+
+    Flushes happen when the buffer reaches `max_batch_size`, every
+    `flush_interval` seconds once start() has been called, and on stop().
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        max_batch_size: int = 100,
+        flush_interval: float = 1.0
+    ):
+        """
+        Initialize task state writer
+
+        Args:
+            db_manager: Database manager
+            max_batch_size: Buffered operations that trigger a flush
+            flush_interval: Seconds between background flushes
+        """
+        import asyncio
+
+        self.db = db_manager
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+
+        self._creates: Dict[str, Dict[str, Any]] = {}
+        self._updates: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._flusher: Optional["asyncio.Task"] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks with buffered writes"""
+        return len(self._creates) + len(self._updates)
+
+    async def create_task(
+        self,
+        task_id: str,
+        task_name: str,
+        task_type: str,
+        priority: int = 5,
+        user_id: Optional[str] = None,
+        args: Optional[Dict[str, Any]] = None,
+        kwargs: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Buffer a new task record (see BackgroundTaskRepository.create_task)"""
+        self._creates[task_id] = BackgroundTaskRepository.build_task_row(
+            task_id, task_name, task_type, priority, user_id, args, kwargs
+        )
+        await self._maybe_flush()
+        return task_id
+
+    async def update_task(self, task_id: str, **fields: Any):
+        """
+        Buffer a task transition
+
+        Args:
+            task_id: Task ID
+            **fields: Any BackgroundTaskRepository.build_task_updates() argument
+        """
+        updates = BackgroundTaskRepository.build_task_updates(**fields)
+        if not updates:
+            return
+
+        if task_id in self._creates:
+            self._creates[task_id].update(updates)
+        else:
+            self._updates.setdefault(task_id, {}).update(updates)
+
+        await self._maybe_flush()
+
+    async def _maybe_flush(self):
+        if self.pending >= self.max_batch_size:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered state in one transaction
+
+        Returns:
+            Number of tasks written
+        """
+        from sqlalchemy import insert, update
+
+        async with self._lock:
+            creates, self._creates = self._creates, {}
+            updates, self._updates = self._updates, {}
+
+            if not creates and not updates:
+                return 0
+
+            try:
+                async with self.db.get_session() as session:
+                    # Rows with the same columns go out as one executemany
+                    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+                    for row in creates.values():
+                        groups.setdefault(tuple(sorted(row)), []).append(row)
+                    for rows in groups.values():
+                        await session.execute(insert(BackgroundTaskDB), rows)
+
+                    for task_id, values in updates.items():
+                        await session.execute(
+                            update(BackgroundTaskDB).where(
+                                BackgroundTaskDB.task_id == task_id
+                            ).values(**values)
+                        )
+
+                    await session.commit()
+            except Exception:
+                # Put the batch back so a transient failure doesn't lose state;
+                # anything buffered meanwhile is newer and takes precedence.
+                for task_id, row in creates.items():
+                    self._creates[task_id] = {**row, **self._creates.get(task_id, {})}
+                for task_id, values in updates.items():
+                    self._updates[task_id] = {**values, **self._updates.get(task_id, {})}
+                raise
+
+            written = len(creates) + len(updates)
+            logger.debug(f"Flushed {written} background task state changes")
+            return written
+
+    async def start(self):
+        """Start periodic background flushing"""
+        import asyncio
+
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop periodic flushing and write anything still buffered"""
+        import asyncio
+
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        await self.flush()
+
+    async def _flush_loop(self):
+        import asyncio
+
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Background task state flush failed: {e}")
+
+
+class DashboardRepository:
+    """
+    Grouped reads for per-user dashboard data
+
+    Loads any subset of a user's dashboard fields over a single session, so a
+    dashboard build costs one database connection regardless of how many
+    fields it needs.
+    """
+
+    FIELDS = ("profile", "latest_ari", "recent_ari", "active_goals", "tasks")
+
+    def __init__(self, db_manager: DatabaseManager):
+        self.db = db_manager
+        self._ari = ARIRepository(db_manager)
+        self._goals = GoalRepository(db_manager)
+        self._profiles = UserProfileRepository(db_manager)
+        self._tasks = BackgroundTaskRepository(db_manager)
+
+    async def get_user_data(
+        self,
+        user_id: str,
+        fields: Optional[List[str]] = None,
+        ari_limit: int = 2,
+        task_limit: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        Load dashboard fields for a user
+
+        Args:
+            user_id: User ID
+            fields: Fields to load (None = all of FIELDS)
+            ari_limit: Number of recent ARI snapshots for "recent_ari"
+            task_limit: Max tasks (newest first) for "tasks"
+
+        Returns:
+            Field -> value; "profile" and "latest_ari" may be None
+        """
+        from sqlalchemy import select
+
+        fields = list(fields) if fields is not None else list(self.FIELDS)
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown dashboard fields: {sorted(unknown)}")
+
+        data: Dict[str, Any] = {}
+
+        async with self.db.get_session() as session:
+            if "profile" in fields:
+                result = await session.execute(
+                    select(UserProfileDB).where(UserProfileDB.user_id == user_id)
+                )
+                profile = result.scalar_one_or_none()
+                data["profile"] = self._profiles._profile_to_dict(profile) if profile else None
+
+            # One query serves both ARI fields
+            if "latest_ari" in fields or "recent_ari" in fields:
+                limit = ari_limit if "recent_ari" in fields else 1
+                result = await session.execute(
+                    select(ARISnapshotDB).where(
+                        ARISnapshotDB.user_id == user_id
+                    ).order_by(ARISnapshotDB.timestamp.desc()).limit(max(limit, 1))
+                )
+                snapshots = [self._ari._snapshot_to_dict(s) for s in result.scalars().all()]
+                if "recent_ari" in fields:
+                    data["recent_ari"] = snapshots[:ari_limit]
+                if "latest_ari" in fields:
+                    data["latest_ari"] = snapshots[0] if snapshots else None
+
+            if "active_goals" in fields:
+                result = await session.execute(
+                    select(GoalDB).where(
+                        GoalDB.user_id == user_id,
+                        GoalDB.status == "active"
+                    ).order_by(GoalDB.created_at.desc())
+                )
+                data["active_goals"] = [self._goals._goal_to_dict(g) for g in result.scalars().all()]
+
+            # All statuses in one query; callers split by status
+            if "tasks" in fields:
+                result = await session.execute(
+                    select(BackgroundTaskDB).where(
+                        BackgroundTaskDB.user_id == user_id
+                    ).order_by(BackgroundTaskDB.created_at.desc()).limit(task_limit)
+                )
+                data["tasks"] = [self._tasks._task_to_dict(t) for t in result.scalars().all()]
+
+        return data
@@ -0,0 +1,562 @@
+"""
+Shared State Store - Per-User State for Stateless API Workers
+
+Subsystems that keep per-user state in process-local dicts give every
+uvicorn worker or pod its own copy, so a user sees different state
+depending on which worker serves the request. A StateStore moves that
+state out of the process. Privacy budgets are the only state moved so far
+(context memories, EDM debts, ARI snapshots and FFE goals are still
+process-local), so each worker still keeps its own copy of those.
+
+Backends:
+
+- MemoryStateStore: process-local (single worker, tests)
+- DatabaseStateStore: shared_state table, compare-and-swap updates
+- RedisStateStore: Redis keys, WATCH/MULTI updates
+
+CachedStateStore wraps any backend with an in-process read-through cache.
+Writes go straight to the backend and are announced on an InvalidationBus
+(Redis pub/sub across workers), so other workers drop their cached copy.
+
+Values are JSON-compatible dicts. update() is the atomic read-modify-write
+primitive: the mutator may be called more than once if another worker wins
+a race, so it must not have side effects beyond its return value.
+
+Usage:
+    store = create_state_store("database", db_manager=db_manager,
+                               redis_url="redis://localhost:6379/0")
+    await store.start()
+
+    budget = await store.update("privacy_budget", user_id, spend)
+"""
+
+import asyncio
+import copy
+import json
+import os
+import socket
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from .database import DatabaseManager, SharedStateDB
+from ..cache.redis_cache import RedisCache, REDIS_AVAILABLE
+
+if REDIS_AVAILABLE:
+    from redis.asyncio import Redis
+    from redis.exceptions import WatchError
+
+
+StateValue = Dict[str, Any]
+StateMutator = Callable[[Optional[StateValue]], StateValue]
+
+# Attempts before update() gives up on a contended key
+MAX_UPDATE_ATTEMPTS = 20
+
+
+class StateConflictError(Exception):
+    """update() lost the race for a key too many times"""
+
+
+def new_worker_id() -> str:
+    """Identifier for this worker process (host, pid and a random suffix)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+class StateStore(ABC):
+    """Keyed per-user state shared across workers"""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[StateValue]:
+        """
+        Get a value
+
+        Args:
+            namespace: State namespace (one per subsystem/kind)
+            key: Key within the namespace (usually a user ID)
+
+        Returns:
+            Stored value or None
+        """
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: StateValue) -> None:
+        """Store a value, replacing any previous one"""
+
+    @abstractmethod
+    async def delete(self, namespace: str, key: str) -> None:
+        """Delete a value (no-op if missing)"""
+
+    @abstractmethod
+    async def update(self, namespace: str, key: str, mutator: StateMutator) -> StateValue:
+        """
+        Atomically read-modify-write a value
+
+        Args:
+            namespace: State namespace
+            key: Key within the namespace
+            mutator: Takes the current value (None if missing) and returns
+                the new one. May run more than once under contention.
+
+        Returns:
+            The value written
+        """
+
+    async def start(self) -> None:
+        """Start background work (invalidation listeners)"""
+
+    async def close(self) -> None:
+        """Release connections"""
+
+
+class MemoryStateStore(StateStore):
+    """Process-local store; only consistent within a single worker"""
+
+    def __init__(self):
+        self._data: Dict[Tuple[str, str], StateValue] = {}
+
+    async def get(self, namespace: str, key: str) -> Optional[StateValue]:
+        value = self._data.get((namespace, key))
+        return copy.deepcopy(value) if value is not None else None
+
+    async def set(self, namespace: str, key: str, value: StateValue) -> None:
+        self._data[(namespace, key)] = copy.deepcopy(value)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        self._data.pop((namespace, key), None)
+
+    async def update(self, namespace: str, key: str, mutator: StateMutator) -> StateValue:
+        # No await between read and write: atomic on the event loop
+        value = mutator(await self.get(namespace, key))
+        self._data[(namespace, key)] = copy.deepcopy(value)
+        return value
+
+
+class DatabaseStateStore(StateStore):
+    """State in the shared_state table; updates compare-and-swap on a version column"""
+
+    def __init__(self, db_manager: DatabaseManager):
+        """
+        Initialize database state store
+
+        Args:
+            db_manager: Database manager (tables must exist)
+        """
+        self.db = db_manager
+
+    async def _read(self, session, namespace: str, key: str) -> Optional[SharedStateDB]:
+        from sqlalchemy import select
+
+        result = await session.execute(
+            select(SharedStateDB).where(
+                SharedStateDB.namespace == namespace,
+                SharedStateDB.key == key
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get(self, namespace: str, key: str) -> Optional[StateValue]:
+        async with self.db.get_session() as session:
+            row = await self._read(session, namespace, key)
+            return json.loads(row.value) if row else None
+
+    async def set(self, namespace: str, key: str, value: StateValue) -> None:
+        await self.update(namespace, key, lambda _: value)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        from sqlalchemy import delete
+
+        async with self.db.get_session() as session:
+            await session.execute(
+                delete(SharedStateDB).where(
+                    SharedStateDB.namespace == namespace,
+                    SharedStateDB.key == key
+                )
+            )
+            await session.commit()
+
+    async def update(self, namespace: str, key: str, mutator: StateMutator) -> StateValue:
+        from sqlalchemy import update
+        from sqlalchemy.exc import IntegrityError
+
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            async with self.db.get_session() as session:
+                row = await self._read(session, namespace, key)
+                value = mutator(json.loads(row.value) if row else None)
+                payload = json.dumps(value)
+
+                if row is None:
+                    session.add(SharedStateDB(namespace=namespace, key=key, value=payload, version=1))
+                    try:
+                        await session.commit()
+                        return value
+                    except IntegrityError:
+                        # Another worker inserted first; retry as an update
+                        await session.rollback()
+                        continue
+
+                result = await session.execute(
+                    update(SharedStateDB)
+                    .where(
+                        SharedStateDB.namespace == namespace,
+                        SharedStateDB.key == key,
+                        SharedStateDB.version == row.version
+                    )
+                    .values(value=payload, version=row.version + 1, updated_at=datetime.now())
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+                if result.rowcount == 1:
+                    return value
+
+            await asyncio.sleep(0)
+
+        raise StateConflictError(f"Too much contention updating {namespace}:{key}")
+
+
+class RedisStateStore(StateStore):
+    """State in Redis keys; updates use optimistic WATCH/MULTI transactions"""
+
+    def __init__(self, redis_cache: RedisCache, key_prefix: str = "state"):
+        """
+        Initialize Redis state store
+
+        Args:
+            redis_cache: Enabled RedisCache (its client and payload codec are reused)
+            key_prefix: Prefix for all state keys
+        """
+        if not redis_cache.enabled or redis_cache.client is None:
+            raise ValueError("RedisStateStore requires an enabled RedisCache")
+
+        self.client = redis_cache.client
+        self.serializer = redis_cache.serializer
+        self.key_prefix = key_prefix
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.key_prefix}:{namespace}:{key}"
+
+    async def get(self, namespace: str, key: str) -> Optional[StateValue]:
+        raw = await self.client.get(self._key(namespace, key))
+        return self.serializer.loads(raw) if raw is not None else None
+
+    async def set(self, namespace: str, key: str, value: StateValue) -> None:
+        # No TTL: this is primary state, not a cache entry
+        await self.client.set(self._key(namespace, key), self.serializer.dumps(value))
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await self.client.delete(self._key(namespace, key))
+
+    async def update(self, namespace: str, key: str, mutator: StateMutator) -> StateValue:
+        redis_key = self._key(namespace, key)
+
+        async with self.client.pipeline(transaction=True) as pipe:
+            for _ in range(MAX_UPDATE_ATTEMPTS):
+                try:
+                    await pipe.watch(redis_key)
+                    raw = await pipe.get(redis_key)
+                    value = mutator(self.serializer.loads(raw) if raw is not None else None)
+
+                    pipe.multi()
+                    pipe.set(redis_key, self.serializer.dumps(value))
+                    await pipe.execute()
+                    return value
+                except WatchError:
+                    continue
+                finally:
+                    await pipe.reset()
+
+        raise StateConflictError(f"Too much contention updating {namespace}:{key}")
+
+
+# ============================================================================
+# Cross-Worker Invalidation
+# ============================================================================
+
+InvalidationCallback = Callable[[str, str, str], None]
+
+
+class InvalidationBus(ABC):
+    """Broadcasts 'this key changed' to every worker's local cache"""
+
+    def __init__(self):
+        self._subscribers: List[InvalidationCallback] = []
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """
+        Register a callback
+
+        Args:
+            callback: Called with (namespace, key, origin_worker_id)
+        """
+        self._subscribers.append(callback)
+
+    def _dispatch(self, namespace: str, key: str, origin: str) -> None:
+        for callback in self._subscribers:
+            try:
+                callback(namespace, key, origin)
+            except Exception as e:
+                logger.error(f"Invalidation callback failed for {namespace}:{key}: {e}")
+
+    @abstractmethod
+    async def publish(self, namespace: str, key: str, origin: str) -> None:
+        """Announce a change to every worker"""
+
+    async def start(self) -> None:
+        """Start listening"""
+
+    async def close(self) -> None:
+        """Stop listening"""
+
+
+class LocalInvalidationBus(InvalidationBus):
+    """Delivers invalidations within this process (single worker, tests)"""
+
+    async def publish(self, namespace: str, key: str, origin: str) -> None:
+        self._dispatch(namespace, key, origin)
+
+
+class RedisInvalidationBus(InvalidationBus):
+    """Delivers invalidations to every worker over Redis pub/sub"""
+
+    def __init__(self, redis_url: str, channel: str = "ai_pal:state:invalidate"):
+        """
+        Initialize Redis invalidation bus
+
+        Args:
+            redis_url: Redis connection URL
+            channel: Pub/sub channel shared by all workers
+        """
+        super().__init__()
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis not installed. Run: pip install redis")
+
+        self.channel = channel
+        # Dedicated connection: a subscribed connection can't run other commands
+        self.client = Redis.from_url(redis_url)
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, namespace: str, key: str, origin: str) -> None:
+        message = json.dumps({"namespace": namespace, "key": key, "origin": origin})
+        await self.client.publish(self.channel, message)
+
+    async def start(self) -> None:
+        if self._listener is not None:
+            return
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        async for message in self._pubsub.listen():
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError, KeyError):
+                continue
+            self._dispatch(data["namespace"], data["key"], data["origin"])
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+        await self.client.close()
+
+
+# ============================================================================
+# Read-Through Cache
+# ============================================================================
+
+class CachedStateStore(StateStore):
+    """
+    In-process read-through cache in front of a shared backend
+
+    Reads are served from a bounded LRU until the entry's TTL passes or
+    another worker invalidates it. Writes always go to the backend.
+    Without a bus, the TTL bounds how stale another worker's view can be.
+    """
+
+    def __init__(
+        self,
+        backend: StateStore,
+        bus: Optional[InvalidationBus] = None,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10000,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Initialize cached state store
+
+        Args:
+            backend: Shared store
+            bus: Cross-worker invalidation bus (None for TTL-only)
+            ttl_seconds: Maximum age of a cached entry
+            max_entries: LRU capacity
+            worker_id: Identifier for this worker (default: host:pid:random)
+        """
+        self.backend = backend
+        self.bus = bus
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.worker_id = worker_id or new_worker_id()
+
+        # (namespace, key) -> (expires_at, value or None for a cached miss)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[StateValue]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        if bus is not None:
+            bus.subscribe(self._on_invalidate)
+
+    def _on_invalidate(self, namespace: str, key: str, origin: str) -> None:
+        if origin == self.worker_id:
+            return
+        if self._cache.pop((namespace, key), None) is not None:
+            self.invalidations += 1
+
+    def _remember(self, namespace: str, key: str, value: Optional[StateValue]) -> None:
+        cache_key = (namespace, key)
+        self._cache[cache_key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def _announce(self, namespace: str, key: str) -> None:
+        if self.bus is not None:
+            try:
+                await self.bus.publish(namespace, key, self.worker_id)
+            except Exception as e:
+                # Other workers fall back to TTL expiry
+                logger.warning(f"State invalidation publish failed for {namespace}:{key}: {e}")
+
+    async def get(self, namespace: str, key: str) -> Optional[StateValue]:
+        entry = self._cache.get((namespace, key))
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            self._cache.move_to_end((namespace, key))
+            return copy.deepcopy(entry[1])
+
+        self.misses += 1
+        value = await self.backend.get(namespace, key)
+        self._remember(namespace, key, value)
+        return value
+
+    async def set(self, namespace: str, key: str, value: StateValue) -> None:
+        await self.backend.set(namespace, key, value)
+        self._remember(namespace, key, value)
+        await self._announce(namespace, key)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await self.backend.delete(namespace, key)
+        self._cache.pop((namespace, key), None)
+        await self._announce(namespace, key)
+
+    async def update(self, namespace: str, key: str, mutator: StateMutator) -> StateValue:
+        # Always against the backend: the cached copy may be stale
+        value = await self.backend.update(namespace, key, mutator)
+        self._remember(namespace, key, value)
+        await self._announce(namespace, key)
+        return value
+
+    def invalidate_local(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries (all, or one namespace)"""
+        if namespace is None:
+            self._cache.clear()
+        else:
+            for cache_key in [k for k in self._cache if k[0] == namespace]:
+                del self._cache[cache_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Local cache statistics"""
+        return {
+            "worker_id": self.worker_id,
+            "entries": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    async def start(self) -> None:
+        await self.backend.start()
+        if self.bus is not None:
+            await self.bus.start()
+
+    async def close(self) -> None:
+        if self.bus is not None:
+            await self.bus.close()
+        await self.backend.close()
+
+
+# ============================================================================
+# Factory
+# ============================================================================
+
+def create_state_store(
+    backend: str = "memory",
+    db_manager: Optional[DatabaseManager] = None,
+    redis_cache: Optional[RedisCache] = None,
+    redis_url: Optional[str] = None,
+    cache_ttl_seconds: float = 30.0,
+    max_cached_entries: int = 10000
+) -> StateStore:
+    """
+    Create a state store for the given backend
+
+    Args:
+        backend: "memory", "database" or "redis"
+        db_manager: Required for "database"
+        redis_cache: Required for "redis"
+        redis_url: Enables cross-worker invalidation over Redis pub/sub
+        cache_ttl_seconds: Local cache TTL
+        max_cached_entries: Local cache capacity
+
+    Returns:
+        StateStore (a CachedStateStore for shared backends)
+    """
+    if backend == "memory":
+        return MemoryStateStore()
+
+    if backend == "database":
+        if db_manager is None:
+            raise ValueError("database state store requires db_manager")
+        shared: StateStore = DatabaseStateStore(db_manager)
+    elif backend == "redis":
+        if redis_cache is None:
+            raise ValueError("redis state store requires redis_cache")
+        shared = RedisStateStore(redis_cache)
+    else:
+        raise ValueError(f"Unknown state store backend: {backend}")
+
+    bus = None
+    if redis_url and REDIS_AVAILABLE:
+        bus = RedisInvalidationBus(redis_url)
+    elif redis_url:
+        logger.warning("redis not installed; shared state cache relies on TTL expiry only")
+
+    logger.info(
+        f"Shared state store: backend={backend}, "
+        f"invalidation={'redis' if bus else 'ttl'}, ttl={cache_ttl_seconds}s"
+    )
+    return CachedStateStore(
+        shared,
+        bus=bus,
+        ttl_seconds=cache_ttl_seconds,
+        max_entries=max_cached_entries
+    )
@@ -17,7 +17,7 @@ from uuid import uuid4
 from celery import Task
 from loguru import logger
 
-from ai_pal.storage.database import DatabaseManager, BackgroundTaskRepository
+from ai_pal.storage.database import DatabaseManager, BackgroundTaskRepository, TaskStateWriter
 
 
 class AIpalTask(Task):
@@ -31,6 +31,8 @@ class AIpalTask(Task):
     # Database manager instance (set by task setup)
     db_manager: Optional[DatabaseManager] = None
     task_repo: Optional[BackgroundTaskRepository] = None
+    # Optional batched writer; when set, task state goes through it
+    state_writer: Optional[TaskStateWriter] = None
 
     def __call__(self, *args, **kwargs) -> Any:
         """
@@ -117,15 +119,21 @@ class AIpalTask(Task):
             return "unknown"
 
     @classmethod
-    def setup_db(cls, db_manager: DatabaseManager):
+    def setup_db(
+        cls,
+        db_manager: DatabaseManager,
+        state_writer: Optional[TaskStateWriter] = None
+    ):
         """
         Setup database manager for all tasks
 
         Args:
             db_manager: Database manager instance
+            state_writer: Batched task state writer (optional)
         """
         cls.db_manager = db_manager
         cls.task_repo = BackgroundTaskRepository(db_manager)
+        cls.state_writer = state_writer
         logger.info("Database manager configured for tasks")
 
     async def on_before_execution(
@@ -152,7 +160,8 @@ class AIpalTask(Task):
             # Create database record
             db_task_id = str(uuid4())
 
-            await self.task_repo.create_task(
+            writer = self.state_writer or self.task_repo
+            await writer.create_task(
                 task_id=db_task_id,
                 task_name=task_name,
                 task_type=self._get_task_type(),
@@ -192,19 +201,19 @@ class AIpalTask(Task):
         try:
             status = "completed" if success else "failed"
 
-            await self.task_repo.record_task_result(
-                task_id=task_id,
+            final_state = dict(
+                status=status,
+                completed_at=datetime.now(),
                 result=result if success else None,
                 error_message=error,
                 error_traceback=error_traceback,
                 duration_seconds=duration
             )
 
-            await self.task_repo.update_task_status(
-                task_id=task_id,
-                status=status,
-                completed_at=datetime.now()
-            )
+            if self.state_writer:
+                await self.state_writer.update_task(task_id, **final_state)
+            else:
+                await self.task_repo.finish_task(task_id, **final_state)
 
             logger.debug(f"Updated database record for task {task_id}: {status}")
 
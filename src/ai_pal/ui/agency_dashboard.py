@@ -1112,20 +1112,19 @@ class AgencyDashboard:
                 total_failed=0
             )
 
-        # Get all requests by status
-        pending = await self.patch_manager.get_pending_requests(limit=20)
-        approved = await self.patch_manager.patch_repository.get_requests_by_status(
-            "APPROVED", limit=10
-        )
-        denied = await self.patch_manager.patch_repository.get_requests_by_status(
-            "DENIED", limit=10
-        )
-        applied = await self.patch_manager.patch_repository.get_requests_by_status(
-            "APPLIED", limit=10
-        )
-        failed = await self.patch_manager.patch_repository.get_requests_by_status(
-            "FAILED", limit=10
-        )
+        # Get all requests by status (one grouped query)
+        by_status = await self.patch_manager.patch_repository.get_requests_by_statuses({
+            "PENDING_APPROVAL": 20,
+            "APPROVED": 10,
+            "DENIED": 10,
+            "APPLIED": 10,
+            "FAILED": 10,
+        })
+        pending = by_status["PENDING_APPROVAL"]
+        approved = by_status["APPROVED"]
+        denied = by_status["DENIED"]
+        applied = by_status["APPLIED"]
+        failed = by_status["FAILED"]
 
         # Count high confidence pending
         high_confidence_pending = sum(
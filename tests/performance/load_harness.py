@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""
+API Load Harness
+
+Drives the real FastAPI app (ai_pal.api.main) with a stub LLM provider
+whose latency is configurable, replaying a weighted mix of chat, streamed
+chat, dashboard, goals and ARI traffic from concurrent virtual users.
+Records per-scenario p50/p95/p99 latency, throughput, error and shed
+counts, time to first streamed token, and event-loop lag, and compares the
+results against a stored baseline.
+
+The app runs either in-process over ASGI (default; no sockets, so the
+numbers are app cost only) or under uvicorn on a local port. Either way
+client and server share one event loop, so loop lag includes the load
+generator's own (small, constant) overhead. httpx's ASGI transport
+buffers response bodies, so time to first streamed token is only recorded
+over uvicorn.
+
+Usage:
+    python tests/performance/load_harness.py                      # run, compare to baseline
+    python tests/performance/load_harness.py --duration 30 --concurrency 64
+    python tests/performance/load_harness.py --transport uvicorn
+    python tests/performance/load_harness.py --update-baseline    # record a new baseline
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from ai_pal.models.base import BaseLLMProvider, LLMRequest, LLMResponse  # noqa: E402
+
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "api_load.json"
+
+# p99 of a few dozen samples is one outlier; only gate on it with enough data
+MIN_SAMPLES_FOR_P99 = 200
+
+# Scenario -> relative weight in the traffic mix
+DEFAULT_MIX = {
+    "chat": 35,
+    "chat_stream": 15,
+    "dashboard": 20,
+    "goals": 15,
+    "ari": 10,
+    "ari_history": 5,
+}
+
+# AC system components switched on for the run: the full default system
+DEFAULT_COMPONENTS = {
+    "enable_gates": True,
+    "enable_tribunal": True,
+    "enable_ari_monitoring": True,
+    "enable_edm_monitoring": True,
+    "enable_self_improvement": True,
+    "enable_privacy_protection": True,
+    "enable_context_management": True,
+    "enable_model_orchestration": True,
+    "enable_dashboard": True,
+    "enable_ffe": True,
+}
+
+
+# ============================================================================
+# Stub LLM
+# ============================================================================
+
+
+class StubLLMProvider(BaseLLMProvider):
+    """LLM provider that sleeps instead of calling a model"""
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 10.0,
+        tokens: int = 20,
+        seed: int = 0
+    ):
+        """
+        Initialize stub
+
+        Args:
+            latency_ms: Mean time to a full response
+            jitter_ms: Uniform +/- variation of latency_ms
+            tokens: Tokens per response (streamed evenly over the latency)
+            seed: Seed for the jitter
+        """
+        super().__init__()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tokens = tokens
+        self._random = random.Random(seed)
+        self.calls = 0
+
+    def _latency_seconds(self) -> float:
+        jitter = self._random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    async def generate(self, request: LLMRequest, model_name: str) -> LLMResponse:
+        self.calls += 1
+        latency = self._latency_seconds()
+        await asyncio.sleep(latency)
+        return LLMResponse(
+            generated_text=" ".join(f"token{i}" for i in range(self.tokens)),
+            prompt_tokens=len(request.prompt.split()),
+            completion_tokens=self.tokens,
+            total_tokens=len(request.prompt.split()) + self.tokens,
+            model_name=model_name,
+            provider="stub",
+            latency_ms=latency * 1000,
+            finish_reason="stop",
+        )
+
+    async def generate_streaming(self, request: LLMRequest, model_name: str) -> AsyncIterator[str]:
+        self.calls += 1
+        per_token = self._latency_seconds() / max(1, self.tokens)
+        for i in range(self.tokens):
+            await asyncio.sleep(per_token)
+            yield f"token{i} "
+
+    def is_available(self) -> bool:
+        return True
+
+
+# ============================================================================
+# Profile and Results
+# ============================================================================
+
+
+@dataclass
+class LoadProfile:
+    """What to run"""
+    concurrency: int = 16
+    duration_seconds: float = 5.0
+    users: int = 50
+    llm_latency_ms: float = 50.0
+    llm_jitter_ms: float = 10.0
+    stream_tokens: int = 20
+    max_concurrent_generations: int = 8
+    seed: int = 7
+    transport: str = "asgi"  # asgi or uvicorn
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    components: Dict[str, bool] = field(default_factory=lambda: dict(DEFAULT_COMPONENTS))
+
+
+@dataclass
+class ScenarioStats:
+    """Latency and outcome counts for one scenario"""
+    requests: int
+    errors: int
+    shed: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    # Streamed scenarios only: time to first token
+    ttft_p50_ms: Optional[float] = None
+    ttft_p95_ms: Optional[float] = None
+
+
+@dataclass
+class LoadReport:
+    """Results of one run"""
+    profile: Dict[str, Any]
+    duration_seconds: float
+    total_requests: int
+    throughput_rps: float
+    error_rate: float
+    loop_lag_p50_ms: float
+    loop_lag_p99_ms: float
+    loop_lag_max_ms: float
+    scenarios: Dict[str, ScenarioStats]
+    errors_sample: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def format(self) -> str:
+        lines = [
+            f"{self.total_requests} requests in {self.duration_seconds:.1f}s: "
+            f"{self.throughput_rps:.1f} req/s, error rate {self.error_rate:.2%}",
+            f"event-loop lag p50 {self.loop_lag_p50_ms:.1f}ms, "
+            f"p99 {self.loop_lag_p99_ms:.1f}ms, max {self.loop_lag_max_ms:.1f}ms",
+            f"{'scenario':<12} {'n':>6} {'err':>4} {'shed':>4} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'ttft p50':>9}",
+        ]
+        for name, stats in sorted(self.scenarios.items()):
+            ttft = f"{stats.ttft_p50_ms:.1f}" if stats.ttft_p50_ms is not None else "-"
+            lines.append(
+                f"{name:<12} {stats.requests:>6} {stats.errors:>4} {stats.shed:>4} "
+                f"{stats.p50_ms:>8.1f} {stats.p95_ms:>8.1f} {stats.p99_ms:>8.1f} {ttft:>9}"
+            )
+        return "\n".join(lines)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(q / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+# ============================================================================
+# App Under Test
+# ============================================================================
+
+
+_SINGLETONS = (
+    "_ac_system", "_admission_controller", "_authenticator", "_db_manager",
+    "_redis_cache", "_state_store", "_warm_up_task", "_privacy_flush_task",
+)
+
+
+@asynccontextmanager
+async def running_app(profile: LoadProfile, work_dir: Path):
+    """
+    Start ai_pal.api.main with isolated storage and the stub LLM
+
+    Storage is a fresh SQLite database and data directory under work_dir;
+    Redis caching and JWT verification are off, and admission control
+    keeps its generation pool but drops per-user rate limits (the virtual users would otherwise be shed as abusive). The
+    module's singletons and environment are restored afterwards.
+
+    Yields:
+        Tuple of (ASGI app, stub provider)
+    """
+    env = {
+        "AI_PAL_DATA_DIR": str(work_dir / "data"),
+        "AI_PAL_CREDENTIALS": str(work_dir / "credentials.json"),
+        "DATABASE_URL": f"sqlite+aiosqlite:///{work_dir / 'load.db'}",
+        "CACHE_ENABLED": "false",
+        "AI_PAL_STATE_BACKEND": "local",
+        "AI_PAL_ADMISSION_ENABLED": "true",
+    }
+    for name in ("AI_PAL_JWT_JWKS_URL", "AI_PAL_JWT_SECRET"):
+        env[name] = ""
+    saved_env = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+
+    import ai_pal.api.main as api_main
+    from ai_pal.api.admission import (
+        AdmissionController, GenerationPool, MemoryRateLimiter, Priority, RoutePolicy,
+    )
+    from ai_pal.core.integrated_system import IntegratedACSystem, SystemConfig
+    from ai_pal.orchestration.multi_model import ModelProvider
+
+    saved_singletons = {name: getattr(api_main, name) for name in _SINGLETONS}
+    for name in _SINGLETONS:
+        setattr(api_main, name, None)
+
+    try:
+        api_main._ac_system = IntegratedACSystem(SystemConfig(
+            data_dir=work_dir / "data",
+            credentials_path=work_dir / "credentials.json",
+            **profile.components
+        ))
+        api_main._admission_controller = AdmissionController(
+            limiter=MemoryRateLimiter(),
+            pool=GenerationPool(max_concurrent=profile.max_concurrent_generations),
+            policies={"/api/chat": RoutePolicy(priority=Priority.INTERACTIVE)},
+            user_limit=None,
+        )
+
+        app = api_main.app
+        async with app.router.lifespan_context(app):
+            if api_main._warm_up_task is not None:
+                await api_main._warm_up_task
+
+            stub = StubLLMProvider(
+                latency_ms=profile.llm_latency_ms,
+                jitter_ms=profile.llm_jitter_ms,
+                tokens=profile.stream_tokens,
+                seed=profile.seed,
+            )
+            orchestrator = api_main._ac_system.orchestrator
+            if orchestrator is not None:
+                for provider in ModelProvider:
+                    orchestrator.providers[provider] = stub
+
+            yield app, stub
+    finally:
+        for name, value in saved_singletons.items():
+            setattr(api_main, name, value)
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@asynccontextmanager
+async def http_client(app, transport: str):
+    """HTTP client for the app, in-process (asgi) or over a uvicorn socket"""
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(60.0)
+
+    if transport == "asgi":
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=timeout
+        ) as client:
+            yield client
+        return
+
+    if transport != "uvicorn":
+        raise ValueError(f"Unknown transport: {transport}")
+
+    import socket
+    import uvicorn
+
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    # Lifespan already runs in running_app
+    server = uvicorn.Server(uvicorn.Config(app, lifespan="off", log_level="warning"))
+    serve = asyncio.create_task(server.serve(sockets=[sock]))
+    try:
+        while not server.started:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=timeout
+        ) as client:
+            yield client
+    finally:
+        server.should_exit = True
+        await serve
+        sock.close()
+
+
+# ============================================================================
+# Traffic
+# ============================================================================
+
+
+async def _run_scenario(client: httpx.AsyncClient, name: str, user: str, seq: int) -> Dict[str, Any]:
+    """Issue one request; returns status and timings"""
+    headers = {"Authorization": f"Bearer {user}"}
+    start = time.perf_counter()
+    ttft = None
+
+    if name == "chat":
+        response = await client.post(
+            "/api/chat",
+            json={"query": f"How should I structure study session {seq}?", "session_id": f"{user}-s"},
+            headers=headers,
+        )
+        status_code = response.status_code
+    elif name == "chat_stream":
+        async with client.stream(
+            "POST",
+            "/api/chat/stream",
+            json={"query": f"Explain step {seq} of my plan", "session_id": f"{user}-s"},
+            headers=headers,
+        ) as response:
+            status_code = response.status_code
+            async for line in response.aiter_lines():
+                if ttft is None and line.startswith("event: token"):
+                    ttft = time.perf_counter() - start
+    else:
+        path = {
+            "dashboard": f"/api/users/{user}/dashboard-summary",
+            "goals": f"/api/users/{user}/goals",
+            "ari": f"/api/users/{user}/ari",
+            "ari_history": f"/api/users/{user}/ari/history?days=30",
+        }[name]
+        response = await client.get(path, headers=headers)
+        status_code = response.status_code
+
+    return {
+        "status": status_code,
+        "latency": time.perf_counter() - start,
+        "ttft": ttft,
+        "error": None if status_code < 400 else f"{name}: HTTP {status_code} {response.text[:200] if name != 'chat_stream' else ''}",
+    }
+
+
+async def _monitor_loop_lag(samples: List[float], stop: asyncio.Event, interval: float = 0.01):
+    """Sample how late the event loop wakes a sleeping task"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - start - interval) * 1000)
+
+
+async def drive(client: httpx.AsyncClient, profile: LoadProfile) -> LoadReport:
+    """
+    Run the traffic mix against a client for profile.duration_seconds
+
+    Each of profile.concurrency workers issues requests back to back
+    (closed loop), choosing scenario and user with its own seeded RNG.
+    One request per scenario is issued first as a warm-up and not counted.
+
+    Args:
+        client: HTTP client for the app
+        profile: Load profile
+
+    Returns:
+        LoadReport
+    """
+    scenarios = list(profile.mix)
+    weights = [profile.mix[s] for s in scenarios]
+    users = [f"load-user-{i}" for i in range(profile.users)]
+
+    for name in scenarios:
+        await _run_scenario(client, name, users[0], 0)
+
+    latencies: Dict[str, List[float]] = {name: [] for name in scenarios}
+    ttfts: Dict[str, List[float]] = {name: [] for name in scenarios}
+    errors = {name: 0 for name in scenarios}
+    shed = {name: 0 for name in scenarios}
+    error_messages: List[str] = []
+    lag_samples: List[float] = []
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_loop_lag(lag_samples, stop))
+    deadline = time.perf_counter() + profile.duration_seconds
+
+    async def worker(index: int):
+        rng = random.Random(profile.seed * 1000 + index)
+        seq = 0
+        while time.perf_counter() < deadline:
+            seq += 1
+            name = rng.choices(scenarios, weights)[0]
+            try:
+                outcome = await _run_scenario(client, name, rng.choice(users), seq)
+            except Exception as e:
+                errors[name] += 1
+                error_messages.append(f"{name}: {type(e).__name__}: {e}")
+                continue
+
+            if outcome["status"] in (429, 503):
+                shed[name] += 1
+            elif outcome["error"]:
+                errors[name] += 1
+                error_messages.append(outcome["error"])
+            else:
+                latencies[name].append(outcome["latency"] * 1000)
+                if outcome["ttft"] is not None and profile.transport == "uvicorn":
+                    ttfts[name].append(outcome["ttft"] * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(profile.concurrency)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+
+    stats = {}
+    for name in scenarios:
+        values = latencies[name]
+        stats[name] = ScenarioStats(
+            requests=len(values) + errors[name] + shed[name],
+            errors=errors[name],
+            shed=shed[name],
+            p50_ms=percentile(values, 50),
+            p95_ms=percentile(values, 95),
+            p99_ms=percentile(values, 99),
+            mean_ms=sum(values) / len(values) if values else 0.0,
+            ttft_p50_ms=percentile(ttfts[name], 50) if ttfts[name] else None,
+            ttft_p95_ms=percentile(ttfts[name], 95) if ttfts[name] else None,
+        )
+
+    total = sum(s.requests for s in stats.values())
+    completed = sum(len(v) for v in latencies.values())
+    return LoadReport(
+        profile=asdict(profile),
+        duration_seconds=elapsed,
+        total_requests=total,
+        throughput_rps=completed / elapsed if elapsed else 0.0,
+        error_rate=sum(errors.values()) / total if total else 0.0,
+        loop_lag_p50_ms=percentile(lag_samples, 50),
+        loop_lag_p99_ms=percentile(lag_samples, 99),
+        loop_lag_max_ms=max(lag_samples, default=0.0),
+        scenarios=stats,
+        errors_sample=error_messages[:10],
+    )
+
+
+async def run_load_test(profile: LoadProfile, work_dir: Optional[Path] = None) -> LoadReport:
+    """
+    Start the app, drive it with the profile's traffic and report
+
+    Args:
+        profile: Load profile
+        work_dir: Directory for the run's database and data (default: temporary)
+
+    Returns:
+        LoadReport
+    """
+    if work_dir is None:
+        with tempfile.TemporaryDirectory(prefix="ai-pal-load-") as tmp:
+            return await run_load_test(profile, Path(tmp))
+
+    async with running_app(profile, work_dir) as (app, _stub):
+        async with http_client(app, profile.transport) as client:
+            return await drive(client, profile)
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, Any]:
+    """Stored baseline: {"profile": ..., "tolerance": ..., "report": ...}"""
+    return json.loads(path.read_text())
+
+
+def save_baseline(report: LoadReport, path: Path = BASELINE_PATH, tolerance: float = 0.5, slack_ms: float = 10.0):
+    """Record a report as the new baseline"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "profile": report.profile,
+        "tolerance": tolerance,
+        "slack_ms": slack_ms,
+        "report": report.to_dict(),
+    }, indent=2, sort_keys=True) + "\n")
+
+
+def compare_to_baseline(
+    report: LoadReport,
+    baseline: Dict[str, Any],
+    tolerance: Optional[float] = None,
+    slack_ms: Optional[float] = None
+) -> List[str]:
+    """
+    List regressions of a report against a baseline
+
+    A latency regresses when it exceeds baseline * (1 + tolerance) + slack_ms
+    (the slack keeps sub-millisecond timings from failing on noise), with
+    p99 only checked for scenarios with MIN_SAMPLES_FOR_P99 requests;
+    throughput when it drops below baseline * (1 - tolerance). Any error
+    fails, as does shedding where the baseline shed nothing.
+
+    Args:
+        report: Current run
+        baseline: Stored baseline (see load_baseline)
+        tolerance: Relative tolerance (default: the baseline's)
+        slack_ms: Absolute latency slack (default: the baseline's)
+
+    Returns:
+        Human-readable regressions (empty if none)
+    """
+    tolerance = baseline.get("tolerance", 0.5) if tolerance is None else tolerance
+    slack_ms = baseline.get("slack_ms", 10.0) if slack_ms is None else slack_ms
+    expected = baseline["report"]
+    problems = []
+
+    def check_latency(label: str, actual: Optional[float], base: Optional[float]):
+        if actual is None or base is None:
+            return
+        limit = base * (1 + tolerance) + slack_ms
+        if actual > limit:
+            problems.append(f"{label}: {actual:.1f}ms > {limit:.1f}ms (baseline {base:.1f}ms)")
+
+    floor = expected["throughput_rps"] * (1 - tolerance)
+    if report.throughput_rps < floor:
+        problems.append(
+            f"throughput: {report.throughput_rps:.1f} req/s < {floor:.1f} "
+            f"(baseline {expected['throughput_rps']:.1f})"
+        )
+    check_latency("event-loop lag p99", report.loop_lag_p99_ms, expected["loop_lag_p99_ms"])
+
+    for name, base in expected["scenarios"].items():
+        stats = report.scenarios.get(name)
+        if stats is None:
+            problems.append(f"{name}: not run")
+            continue
+        if stats.errors:
+            problems.append(f"{name}: {stats.errors} errors")
+        if stats.shed and not base["shed"]:
+            problems.append(f"{name}: {stats.shed} requests shed")
+        metrics = ["p50_ms", "p95_ms", "ttft_p50_ms"]
+        if min(stats.requests, base["requests"]) >= MIN_SAMPLES_FOR_P99:
+            metrics.append("p99_ms")
+        for metric in metrics:
+            check_latency(f"{name} {metric[:-3]}", getattr(stats, metric), base.get(metric))
+
+    return problems
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI-PAL API load harness")
+    parser.add_argument("--duration", type=float, help="Seconds of measured load")
+    parser.add_argument("--concurrency", type=int, help="Concurrent virtual users")
+    parser.add_argument("--users", type=int, help="Distinct user IDs")
+    parser.add_argument("--llm-latency-ms", type=float, help="Stub LLM mean latency")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], help="How requests reach the app")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, help="Relative regression tolerance")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    # Same profile as the stored baseline unless overridden
+    profile = LoadProfile()
+    if args.baseline.exists() and not args.update_baseline:
+        profile = LoadProfile(**load_baseline(args.baseline)["profile"])
+    overrides = {
+        "duration_seconds": args.duration,
+        "concurrency": args.concurrency,
+        "users": args.users,
+        "llm_latency_ms": args.llm_latency_ms,
+        "transport": args.transport,
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            setattr(profile, name, value)
+
+    report = asyncio.run(run_load_test(profile))
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+
+    if args.update_baseline:
+        save_baseline(report, args.baseline, **({"tolerance": args.tolerance} if args.tolerance else {}))
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if args.baseline.exists():
+        problems = compare_to_baseline(report, load_baseline(args.baseline), args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+API Latency SLO Regression Test
+
+Replays the stored baseline's traffic profile against the app (see
+load_harness.py) and fails on errors or latency/throughput regressions
+beyond the baseline's tolerance. Errors always fail; latency and
+throughput regressions fail only with --perf (timings vary on shared
+machines). AI_PAL_LOAD_TOLERANCE overrides the relative tolerance on
+slower machines.
+
+Re-record the baseline after intended performance changes:
+    python tests/performance/load_harness.py --update-baseline
+"""
+
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from load_harness import (  # noqa: E402
+    BASELINE_PATH,
+    LoadProfile,
+    LoadReport,
+    ScenarioStats,
+    compare_to_baseline,
+    load_baseline,
+    percentile,
+    run_load_test,
+)
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0.0
+
+
+def test_compare_flags_regressions():
+    baseline = load_baseline()
+    report_dict = baseline["report"]
+
+    scenarios = {name: ScenarioStats(**stats) for name, stats in report_dict["scenarios"].items()}
+    report = LoadReport(**{**report_dict, "scenarios": scenarios})
+    assert compare_to_baseline(report, baseline) == []
+
+    chat = scenarios["chat"]
+    scenarios["chat"] = ScenarioStats(**{**asdict(chat), "p95_ms": chat.p95_ms * 3 + 100, "errors": 1})
+    problems = compare_to_baseline(LoadReport(**{**report_dict, "scenarios": scenarios}), baseline)
+
+    assert any(p.startswith("chat p95") for p in problems)
+    assert "chat: 1 errors" in problems
+
+
+@pytest.mark.slow
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_api_latency_within_baseline(tmp_path, perf_check):
+    baseline = load_baseline(BASELINE_PATH)
+    tolerance = os.getenv("AI_PAL_LOAD_TOLERANCE")
+
+    report = await run_load_test(LoadProfile(**baseline["profile"]), tmp_path)
+    print("\n" + report.format())
+
+    assert report.error_rate == 0, report.errors_sample
+    problems = compare_to_baseline(report, baseline, float(tolerance) if tolerance else None)
+    perf_check(problems == [], "\n".join(problems))
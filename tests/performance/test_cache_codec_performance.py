@@ -0,0 +1,78 @@
+"""
+Performance Tests for Cache Payload Codecs
+
+Compares the framed codecs against the previous stdlib-JSON cache path:
+- Encode/decode throughput
+- Payload size
+"""
+
+import json
+import time
+import pytest
+from datetime import datetime, timedelta
+
+from ai_pal.cache.codecs import CacheSerializer, MSGPACK_AVAILABLE
+
+
+ITERATIONS = 2000
+
+
+def _snapshot(i: int) -> dict:
+    """Dict shaped like ARIRepository._snapshot_to_dict output"""
+    return {
+        "snapshot_id": f"snap-{i:08d}",
+        "user_id": "user-benchmark",
+        "timestamp": datetime(2025, 1, 1) + timedelta(hours=i),
+        "decision_quality": 0.71,
+        "skill_development": 0.64,
+        "ai_reliance": 0.33,
+        "bottleneck_resolution": 0.58,
+        "user_confidence": 0.8,
+        "engagement": 0.77,
+        "autonomy_perception": 0.69,
+        "autonomy_retention": 72.5,
+        "delta_agency": 0.04,
+        "task_description": "Refactor the reporting pipeline",
+        "task_complexity": "medium",
+    }
+
+
+@pytest.fixture
+def history_payload():
+    """30 days of ARI history, as cached under USER_ARI_HISTORY"""
+    return [_snapshot(i) for i in range(30)]
+
+
+def _legacy_json_dumps(value):
+    # The pre-codec path could not serialize datetimes at all; stringify them so
+    # the baseline measures the same amount of data.
+    return json.dumps(value, default=str)
+
+
+def _bench(fn, arg):
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        result = fn(arg)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6, result
+
+
+@pytest.mark.parametrize("codec", ["json"] + (["msgpack"] if MSGPACK_AVAILABLE else []))
+def test_codec_throughput_and_size(codec, history_payload):
+    """Benchmark framed codec against the legacy JSON path"""
+    serializer = CacheSerializer(codec=codec)
+
+    legacy_encode_us, legacy_payload = _bench(_legacy_json_dumps, history_payload)
+    legacy_decode_us, _ = _bench(json.loads, legacy_payload)
+
+    encode_us, payload = _bench(serializer.dumps, history_payload)
+    decode_us, decoded = _bench(serializer.loads, payload)
+
+    print(
+        f"\n[{codec}] encode {encode_us:.1f}us (legacy {legacy_encode_us:.1f}us), "
+        f"decode {decode_us:.1f}us (legacy {legacy_decode_us:.1f}us), "
+        f"size {len(payload)}B (legacy {len(legacy_payload.encode())}B)"
+    )
+
+    assert decoded == history_payload
+    # Compression kicks in for history-sized payloads
+    assert len(payload) < len(legacy_payload.encode())
@@ -0,0 +1,53 @@
+"""
+Performance Tests for IntegratedACSystem Cold Start
+
+Compares eager construction (every subsystem built in __init__) with lazy
+construction followed by a parallel warm-up of the critical components:
+- Time until the constructor returns (the API can accept connections)
+- Time until the system reports ready
+"""
+
+import time
+import pytest
+
+from ai_pal.core.integrated_system import IntegratedACSystem, SystemConfig
+
+
+def _config(data_dir, lazy: bool) -> SystemConfig:
+    return SystemConfig(
+        data_dir=data_dir,
+        credentials_path=data_dir / "credentials.json",
+        enable_gates=True,
+        enable_tribunal=True,
+        enable_model_orchestration=True,
+        enable_dashboard=True,
+        enable_ffe=True,
+        lazy_init=lazy,
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_cold_start_lazy_vs_eager(tmp_path, perf_check):
+    """Lazy construction returns sooner and warm-up reaches ready"""
+    start = time.perf_counter()
+    IntegratedACSystem(_config(tmp_path / "eager", lazy=False))
+    eager_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    system = IntegratedACSystem(_config(tmp_path / "lazy", lazy=True))
+    construct_ms = (time.perf_counter() - start) * 1000
+
+    await system.warm_up()
+    ready_ms = (time.perf_counter() - start) * 1000
+
+    readiness = system.readiness()
+    assert readiness["ready"], readiness["components"]
+
+    print(f"\nCold start: eager={eager_ms:.0f}ms "
+          f"lazy construct={construct_ms:.0f}ms lazy ready={ready_ms:.0f}ms")
+    for name, status in readiness["components"].items():
+        if status["init_ms"] is not None:
+            print(f"  {name}: {status['init_ms']:.1f}ms")
+
+    perf_check(construct_ms < eager_ms, "lazy construction returns before eager construction")
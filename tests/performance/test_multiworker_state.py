@@ -0,0 +1,97 @@
+"""
+Multi-Process Load Test for Shared Per-User State
+
+Runs several worker processes, each with its own AdvancedPrivacyManager
+and CachedStateStore over one SQLite database (as separate uvicorn workers
+would), all spending privacy budget for the same users:
+- No budget update is lost across processes
+- Aggregate budget-check throughput
+"""
+
+import asyncio
+import multiprocessing
+import time
+import pytest
+
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager, PRIVACY_BUDGET_NAMESPACE
+from ai_pal.storage.database import DatabaseManager
+from ai_pal.storage.state_store import CachedStateStore, DatabaseStateStore
+
+
+WORKERS = 4
+USERS = 5
+CHECKS_PER_WORKER = 60
+EPSILON_COST = 0.001
+
+
+def _database_url(db_path) -> str:
+    return f"sqlite+aiosqlite:///{db_path}"
+
+
+async def _worker_main(db_path: str, data_dir: str, worker: int) -> float:
+    manager = DatabaseManager(database_url=_database_url(db_path))
+    store = CachedStateStore(DatabaseStateStore(manager), worker_id=f"worker-{worker}")
+    privacy = AdvancedPrivacyManager(storage_dir=data_dir, state_store=store)
+
+    try:
+        start = time.perf_counter()
+        for i in range(CHECKS_PER_WORKER):
+            assert await privacy.check_privacy_budget(f"user-{i % USERS}", EPSILON_COST)
+        return time.perf_counter() - start
+    finally:
+        await manager.close()
+
+
+def _run_worker(db_path: str, data_dir: str, worker: int, results) -> None:
+    results.put(asyncio.run(_worker_main(db_path, data_dir, worker)))
+
+
+async def _read_budgets(db_path) -> dict:
+    manager = DatabaseManager(database_url=_database_url(db_path))
+    store = DatabaseStateStore(manager)
+    try:
+        return {
+            f"user-{u}": await store.get(PRIVACY_BUDGET_NAMESPACE, f"user-{u}")
+            for u in range(USERS)
+        }
+    finally:
+        await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_budget_state_consistent_across_processes(tmp_path):
+    """Budget checks from concurrent worker processes all land in shared state"""
+    db_path = tmp_path / "shared.db"
+    manager = DatabaseManager(database_url=_database_url(db_path))
+    await manager.create_tables()
+    await manager.close()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    processes = [
+        ctx.Process(target=_run_worker, args=(str(db_path), str(tmp_path / f"w{i}"), i, results))
+        for i in range(WORKERS)
+    ]
+
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=120)
+    wall = time.perf_counter() - start
+
+    assert all(p.exitcode == 0 for p in processes), [p.exitcode for p in processes]
+    durations = [results.get(timeout=5) for _ in processes]
+
+    budgets = await _read_budgets(db_path)
+    expected = WORKERS * CHECKS_PER_WORKER // USERS
+    assert {user: b["queries_made"] for user, b in budgets.items()} == {
+        f"user-{u}": expected for u in range(USERS)
+    }
+
+    total = WORKERS * CHECKS_PER_WORKER
+    print(
+        f"\n[multi-worker state] {WORKERS} processes, {total} budget checks: "
+        f"{total / max(durations):.0f} checks/s aggregate "
+        f"(slowest worker {max(durations):.2f}s, wall incl. spawn {wall:.2f}s)"
+    )
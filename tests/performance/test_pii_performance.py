@@ -0,0 +1,65 @@
+"""
+Performance Tests for PII Detection
+
+Compares the compiled PII engine with one uncompiled re.finditer per
+pattern (the previous detect_pii):
+- Single long texts, with and without PII-looking characters
+- Batch scanning of many short memories
+"""
+
+import re
+import time
+
+import pytest
+
+from ai_pal.privacy.pii_engine import DEFAULT_PII_RULES, PIIEngine
+
+
+ITERATIONS = 20
+
+_PROSE = (
+    "The retrospective covered the migration plan, the rollout schedule and "
+    "the open questions about caching. Everyone agreed to revisit the design "
+    "after the load tests. "
+)
+_WITH_PII = "Ping ops@example.com or 555-123-4567 about host 10.0.0.12. "
+
+
+def _per_pattern(text: str) -> int:
+    return sum(
+        1 for rule in DEFAULT_PII_RULES for _ in re.finditer(rule.pattern, text)
+    )
+
+
+def _bench(fn, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn(*args)
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+@pytest.mark.perf
+def test_engine_throughput(perf_check):
+    """Benchmark the engine against one scan per pattern"""
+    engine = PIIEngine()
+    prose = _PROSE * (32 * 1024 // len(_PROSE))
+    mixed = (_PROSE * 4 + _WITH_PII) * (32 * 1024 // (len(_PROSE) * 4 + len(_WITH_PII)))
+    memories = [f"{_PROSE[:80]} note {i}" if i % 10 else _WITH_PII for i in range(2000)]
+
+    timings = {
+        "prose": (_bench(_per_pattern, prose), _bench(engine.detect, prose)),
+        "mixed": (_bench(_per_pattern, mixed), _bench(engine.detect, mixed)),
+        "batch": (
+            _bench(lambda: [_per_pattern(m) for m in memories]),
+            _bench(engine.detect_batch, memories),
+        ),
+    }
+
+    print("\n[pii engine] " + ", ".join(
+        f"{name} {old * 1000:.2f}ms -> {new * 1000:.2f}ms ({old / new:.1f}x)"
+        for name, (old, new) in timings.items()
+    ))
+    # Text with no '@' and no digits skips every rule group
+    perf_check(timings["prose"][1] * 10 < timings["prose"][0], "prose at least 10x faster")
+    perf_check(timings["mixed"][1] < timings["mixed"][0], "mixed text faster")
+    perf_check(timings["batch"][1] * 2 < timings["batch"][0], "batch at least 2x faster")
@@ -0,0 +1,65 @@
+"""
+Performance Tests for Privacy Budget Checks
+
+Benchmarks with many stored users:
+- Previous persistence (read, update and rewrite privacy_budgets.json on
+  every check) vs the in-memory budgets with a coalescing journal
+"""
+
+import json
+import time
+
+import pytest
+
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager
+
+
+USERS = 2000
+CHECKS = 60
+
+
+def _rewrite_budget_file(manager, user_id):
+    budgets_file = manager.storage_dir / "legacy_budgets.json"
+    data = {}
+    if budgets_file.exists():
+        with open(budgets_file, "r") as f:
+            data = json.load(f)
+    data[user_id] = manager._budget_to_dict(manager.privacy_budgets[user_id])
+    with open(budgets_file, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_budget_check_throughput(tmp_path, perf_check):
+    """Benchmark whole-file rewrites vs journaled budget checks"""
+    manager = AdvancedPrivacyManager(storage_dir=tmp_path, budget_flush_interval=0.05)
+    for u in range(USERS):
+        manager.privacy_budgets[f"user-{u}"] = manager._new_budget(f"user-{u}")
+    (tmp_path / "legacy_budgets.json").write_text(json.dumps({
+        user_id: manager._budget_to_dict(budget) for user_id, budget in manager.privacy_budgets.items()
+    }))
+
+    users = [f"user-{(i * 37) % USERS}" for i in range(CHECKS)]
+
+    start = time.perf_counter()
+    for user_id in users:
+        manager._spend_budget(manager.privacy_budgets[user_id], 0.001)
+        _rewrite_budget_file(manager, user_id)
+    rewrite_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for user_id in users:
+        assert await manager.check_privacy_budget(user_id, 0.001)
+    await manager.flush_privacy_budgets()
+    journal_seconds = time.perf_counter() - start
+
+    print(
+        f"\n[privacy budget] {CHECKS} checks over {USERS} users: "
+        f"rewrite {rewrite_seconds * 1000 / CHECKS:.2f}ms/check, "
+        f"journal {journal_seconds * 1000 / CHECKS:.3f}ms/check "
+        f"({rewrite_seconds / journal_seconds:.0f}x)"
+    )
+    reloaded = AdvancedPrivacyManager(storage_dir=tmp_path)
+    assert all(reloaded.privacy_budgets[u].queries_made == 2 for u in users)
+    perf_check(journal_seconds * 10 < rewrite_seconds, "journaled checks at least 10x faster")
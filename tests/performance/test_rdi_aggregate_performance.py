@@ -0,0 +1,80 @@
+"""
+Performance Tests for RDI Aggregates
+
+Benchmarks with a large opted-in user base:
+- Anonymized aggregate by walking every user's score history in Python
+  (the previous implementation) vs NumPy reductions over score columns
+"""
+
+import random
+import time
+from datetime import datetime
+
+import pytest
+
+from ai_pal.monitoring.rdi_monitor import RDILevel, RDIMonitor, RDIScore
+
+
+USERS = 100_000
+
+
+def _history_aggregate(monitor):
+    """The previous per-user loops, for comparison"""
+    opted_in_scores = {
+        user_id: scores
+        for user_id, scores in monitor._local_rdi_scores.items()
+        if user_id in monitor._aggregate_opt_ins
+    }
+    all_scores = [scores[-1].overall_rdi for scores in opted_in_scores.values() if scores]
+    avg_rdi = sum(all_scores) / len(all_scores)
+    median_rdi = sorted(all_scores)[len(all_scores) // 2]
+    std_dev_rdi = (sum((x - avg_rdi) ** 2 for x in all_scores) / len(all_scores)) ** 0.5
+    distribution = [
+        len([s for s in all_scores if s < 0.2]),
+        len([s for s in all_scores if 0.2 <= s < 0.4]),
+        len([s for s in all_scores if 0.4 <= s < 0.6]),
+        len([s for s in all_scores if 0.6 <= s < 0.8]),
+        len([s for s in all_scores if s >= 0.8]),
+    ]
+    increasing = len([
+        s for s in opted_in_scores.values()
+        if len(s) >= 2 and s[-1].overall_rdi > s[-2].overall_rdi
+    ])
+    return avg_rdi, median_rdi, std_dev_rdi, distribution, increasing
+
+
+@pytest.mark.perf
+def test_aggregate_throughput(tmp_path, perf_check):
+    """Benchmark per-user loops vs columnar reductions"""
+    monitor = RDIMonitor(storage_dir=tmp_path)
+    rng = random.Random(3)
+    now = datetime.now()
+    for i in range(USERS):
+        hashed = f"{i:016x}"
+        monitor._aggregate_opt_ins.add(hashed)
+        monitor._score_columns.opt_in(hashed)
+        for _ in range(2):
+            monitor._record_score(RDIScore(
+                user_id=hashed, timestamp=now, overall_rdi=rng.random(),
+                rdi_level=RDILevel.ALIGNED, semantic_drift=0.0, factual_drift=0.0,
+                logical_drift=0.0, trend_direction="stable", days_in_trend=0,
+            ))
+
+    start = time.perf_counter()
+    avg, median, std, distribution, increasing = _history_aggregate(monitor)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    aggregate = monitor.generate_anonymized_aggregate()
+    column_seconds = time.perf_counter() - start
+
+    print(
+        f"\n[rdi aggregate] {USERS} users: loops {loop_seconds * 1000:.0f}ms, "
+        f"columns {column_seconds * 1000:.1f}ms ({loop_seconds / column_seconds:.0f}x)"
+    )
+    assert aggregate.average_rdi == pytest.approx(avg)
+    assert aggregate.median_rdi == median
+    assert aggregate.std_dev_rdi == pytest.approx(std)
+    assert list(aggregate.rdi_distribution.values()) == distribution
+    assert aggregate.trend_summary["increasing"] == increasing / USERS
+    perf_check(column_seconds * 10 < loop_seconds, "columnar aggregate at least 10x faster")
@@ -0,0 +1,107 @@
+"""
+Performance Tests for Input Sanitization
+
+Benchmarks on large nested API payloads:
+- Every dangerous-pattern regex on every string (the previous sanitizer)
+  vs the compiled engine
+- Schema-aware sanitization skipping non-string and declared-safe fields
+"""
+
+import random
+import time
+from typing import Dict, List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from ai_pal.security.sanitization import InputSanitizer
+
+
+class RegexSanitizer(InputSanitizer):
+    """Overridden patterns bypass the engine: every regex on every string"""
+
+    def _get_dangerous_patterns(self):
+        return dict(super()._get_dangerous_patterns())
+
+
+class Item(BaseModel):
+    item_id: str = Field(json_schema_extra={"sanitize": False})
+    label: str
+    quantity: int
+    weight: float
+    tags: List[int]
+
+
+class Order(BaseModel):
+    order_id: str = Field(json_schema_extra={"sanitize": False})
+    note: Optional[str] = None
+    express: bool
+    item: Item
+    totals: Dict[str, float]
+
+
+_NOTES = [
+    "please deliver after 5pm, thanks!",
+    "leave it with the neighbour at number 12",
+    "Gift wrap please. It's for my mother's birthday",
+    "call before arriving",
+]
+
+
+def _payload(orders: int = 3000) -> Dict:
+    rng = random.Random(5)
+    return {
+        f"order_{i}": {
+            "order_id": f"ord-{i:08d}-{rng.randrange(16 ** 6):06x}",
+            "note": rng.choice(_NOTES),
+            "express": bool(i % 2),
+            "item": {
+                "item_id": f"sku-{rng.randrange(10 ** 6):06d}",
+                "label": f"Blue ceramic mug {i % 40}",
+                "quantity": rng.randint(1, 5),
+                "weight": rng.random(),
+                "tags": [rng.randint(1, 100) for _ in range(3)],
+            },
+            "totals": {"net": 12.5, "tax": 2.5},
+        }
+        for i in range(orders)
+    }
+
+
+def _best_of(runs, fn):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def _cold(engine, fn):
+    """Clear the engine's detection cache so repeated runs start cold"""
+    def run():
+        engine._engine._detect_cached.cache_clear()
+        return fn()
+    return run
+
+
+@pytest.mark.perf
+def test_sanitize_payload_throughput(perf_check):
+    """Benchmark regex-per-string vs compiled engine vs schema-aware"""
+    payload = _payload()
+    regex, engine = RegexSanitizer(), InputSanitizer()
+
+    baseline, regex_seconds = _best_of(3, lambda: regex.sanitize_dict(payload))
+    compiled, engine_seconds = _best_of(3, _cold(engine, lambda: engine.sanitize_dict(payload)))
+    _, schema_seconds = _best_of(3, _cold(engine, lambda: [
+        engine.sanitize_dict(order, schema=Order) for order in payload.values()
+    ]))
+
+    print(
+        f"\n[sanitization] {len(payload)} orders: regexes {regex_seconds * 1000:.1f}ms, "
+        f"engine {engine_seconds * 1000:.1f}ms ({regex_seconds / engine_seconds:.1f}x), "
+        f"schema-aware {schema_seconds * 1000:.1f}ms ({regex_seconds / schema_seconds:.1f}x)"
+    )
+    assert compiled == baseline
+    perf_check(engine_seconds * 1.25 < regex_seconds, "engine at least 1.25x faster than the regexes")
+    perf_check(schema_seconds < engine_seconds, "schema-aware faster than schema-less")
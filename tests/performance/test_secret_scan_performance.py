@@ -0,0 +1,87 @@
+"""
+Performance Tests for Secret Scanning
+
+Benchmarks on a synthetic source tree:
+- Every pattern on every line of every file (the previous scan loop) vs the
+  keyword-prefiltered engine
+- Rescan of an unchanged tree from the content-hash cache
+"""
+
+import time
+
+import pytest
+
+from ai_pal.security.scan_engine import SecretScanEngine
+from ai_pal.security.secret_scanner import SecretScanner
+
+
+_CODE = """\
+def handler_{i}(request, session):
+    \"\"\"Route handler {i}\"\"\"
+    user = session.query(User).filter(User.id == request.user_id).first()
+    if user is None:
+        raise NotFound("user not found")
+    payload = {{"name": user.name, "items": [item.to_dict() for item in user.items]}}
+    return Response(json.dumps(payload), status=200)
+
+"""
+_SECRET = "DATABASE_URL = 'mongodb" + "://svc:Zx81Lq0Wd7Tp@cluster.internal:27017'\n"
+
+
+def _build_tree(root, files=120, handlers=60):
+    for f in range(files):
+        package = root / f"pkg_{f % 6}"
+        package.mkdir(exist_ok=True)
+        body = "".join(_CODE.format(i=i) for i in range(handlers))
+        if f % 10 == 0:
+            body += _SECRET
+        (package / f"module_{f}.py").write_text(body)
+
+
+def _scan_all_lines(scanner, paths):
+    results = {}
+    for path in paths:
+        matches = []
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for line_num, line in enumerate(f, 1):
+                matches.extend(scanner._scan_line(line, line_num, str(path)))
+        matches = scanner._filter_false_positives(matches)
+        if matches:
+            results[str(path)] = matches
+    return results
+
+
+@pytest.mark.perf
+def test_secret_scan_throughput(tmp_path, perf_check):
+    """Benchmark full-line scanning vs prefiltered, cached engine"""
+    _build_tree(tmp_path)
+    scanner = SecretScanner()
+    engine = SecretScanEngine(scanner, workers=1)
+    paths = list(engine.iter_files(tmp_path))
+
+    start = time.perf_counter()
+    baseline = _scan_all_lines(scanner, paths)
+    baseline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cold = engine.scan_directory(tmp_path)
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = engine.scan_directory(tmp_path)
+    warm_seconds = time.perf_counter() - start
+
+    print(
+        f"\n[secret scan] {len(paths)} files: all lines {baseline_seconds * 1000:.1f}ms, "
+        f"prefiltered {cold_seconds * 1000:.1f}ms "
+        f"({baseline_seconds / cold_seconds:.1f}x), cached {warm_seconds * 1000:.1f}ms"
+    )
+    summary = lambda results: {
+        path: [(m.secret_type, m.line_number, m.column) for m in matches]
+        for path, matches in results.items()
+    }
+    assert summary(cold) == summary(warm) == summary(baseline)
+    assert len(cold) == 12
+    assert engine.last_stats.scanned == 0
+    perf_check(cold_seconds * 3 < baseline_seconds, "prefiltered scan at least 3x faster")
+    perf_check(warm_seconds < cold_seconds, "cached scan faster than cold")
@@ -0,0 +1,81 @@
+"""
+Performance Tests for Shared Text Analysis
+
+Runs the per-request text consumers (ARI lexical metrics, RDI drift, EDM
+debt scan, PII detection) over one long text:
+- Each consumer tokenizing the text itself (cache cleared between them)
+- All consumers sharing one AnalyzedText
+"""
+
+import time
+import pytest
+
+from ai_pal.monitoring.ari_engine import PassiveLexicalAnalyzer
+from ai_pal.monitoring.edm_monitor import EDMMonitor
+from ai_pal.monitoring.rdi_monitor import RDIMonitor
+from ai_pal.monitoring.text_analysis import get_text_analyzer
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager
+
+
+ITERATIONS = 10
+ROUNDS = 5
+
+_PARAGRAPH = (
+    "Because the cache sits in front of the database, reads that hit it never "
+    "touch the primary, which keeps tail latency flat. Studies show that most "
+    "sessions reuse the same records; therefore a small LRU is enough. If the "
+    "hit rate drops, then the warm-up job runs again, although it is rare. "
+)
+
+
+def _consumers(storage_dir, monkeypatch):
+    lexical = PassiveLexicalAnalyzer(storage_dir / "ari")
+    rdi = RDIMonitor(storage_dir / "rdi")
+    edm = EDMMonitor(storage_dir=storage_dir / "edm", fact_check_enabled=False)
+    privacy = AdvancedPrivacyManager(storage_dir=storage_dir / "privacy")
+
+    # Measure analysis, not persistence
+    async def no_persist(*args, **kwargs):
+        pass
+    monkeypatch.setattr(lexical, "_persist_metric", no_persist)
+    monkeypatch.setattr(rdi, "_persist_baseline", no_persist)
+    monkeypatch.setattr(edm, "_persist_debts", no_persist)
+
+    return (
+        lambda t, i: lexical.analyze_text("bench", t),
+        lambda t, i: rdi.analyze_input("bench", t),
+        lambda t, i: edm.analyze_text(t, task_id=f"task-{i}", user_id="bench"),
+        lambda t, i: privacy.detect_pii(t),
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.asyncio
+async def test_shared_analysis_throughput(tmp_path, monkeypatch, perf_check):
+    """Benchmark one shared analysis against per-consumer analysis"""
+    analyzer = get_text_analyzer()
+    text = _PARAGRAPH * (16 * 1024 // len(_PARAGRAPH) + 1)
+
+    # Best of several rounds, alternating modes, each with fresh consumers
+    # (EDM state grows with every text) to damp noise
+    timings = {False: float("inf"), True: float("inf")}
+    for round_ in range(ROUNDS):
+        for shared in (False, True):
+            consumers = _consumers(tmp_path / f"{round_}-{shared}", monkeypatch)
+            start = time.perf_counter()
+            for i in range(ITERATIONS):
+                sample = f"{text} {round_} {i}"
+                source = analyzer.analyze(sample) if shared else sample
+                for consume in consumers:
+                    if not shared:
+                        analyzer.clear()
+                    await consume(source, i)
+            timings[shared] = min(timings[shared], (time.perf_counter() - start) / ITERATIONS)
+
+    print(
+        f"\n[text analysis] 16KB text, 4 consumers: shared {timings[True] * 1000:.1f}ms, "
+        f"separate {timings[False] * 1000:.1f}ms ({timings[False] / timings[True]:.2f}x)"
+    )
+    # ARI's own metrics dominate and PII detection needs no shared
+    # features, so the saving is small: guard against regressions only
+    perf_check(timings[True] < timings[False] * 1.15, "shared analysis not slower than separate")
@@ -0,0 +1,305 @@
+"""
+Tests for API admission control.
+
+Tests:
+- Token buckets (all-or-nothing charging, refill)
+- Generation pool priorities and shedding
+- 429/503 responses with Retry-After through the ASGI middleware
+- Client addresses behind trusted proxies
+- Shed counts and queue depth on /metrics
+"""
+
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import ai_pal.api.main as api_main
+from ai_pal.api.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+    GenerationPool,
+    MemoryRateLimiter,
+    Priority,
+    RateLimit,
+    RoutePolicy,
+    client_address,
+    parse_trusted_proxies,
+)
+from ai_pal.monitoring.metrics import MetricsCollector
+
+
+# ============================================================================
+# Rate Limiter Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_limits():
+    """A full bucket admits `burst` requests, then asks the caller to wait"""
+    limiter = MemoryRateLimiter()
+    bucket = [("user:a", RateLimit(rate=2.0, burst=3))]
+
+    waits = [await limiter.acquire(bucket) for _ in range(4)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert 0.4 < waits[3] <= 0.5
+
+
+@pytest.mark.asyncio
+async def test_buckets_charged_all_or_nothing():
+    """A rejection by one bucket doesn't drain the others"""
+    limiter = MemoryRateLimiter()
+    roomy = ("user:a", RateLimit(rate=1.0, burst=10))
+    tight = ("route:chat", RateLimit(rate=1.0, burst=1))
+
+    assert await limiter.acquire([roomy, tight]) == 0
+    assert await limiter.acquire([roomy, tight]) > 0
+
+    # The roomy bucket paid once, not twice
+    waits = [await limiter.acquire([roomy]) for _ in range(9)]
+    assert waits.count(0) == 9
+
+
+# ============================================================================
+# Generation Pool Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_interactive_admitted_before_background():
+    """Queued interactive requests overtake queued background ones"""
+    pool = GenerationPool(max_concurrent=1, metrics=MetricsCollector())
+    order = []
+    release = asyncio.Event()
+
+    async def run(label, priority):
+        async with pool.slot(priority):
+            order.append(label)
+            await release.wait()
+
+    holder = asyncio.create_task(run("holder", Priority.INTERACTIVE))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(run("background", Priority.BACKGROUND)),
+        asyncio.create_task(run("interactive", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert pool.queue_depth() == 2
+
+    release.set()
+    await asyncio.gather(holder, *waiting)
+
+    assert order == ["holder", "interactive", "background"]
+    assert pool.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_sheds_immediately():
+    """A class whose queue is full gets a 503 without waiting"""
+    metrics = MetricsCollector()
+    pool = GenerationPool(
+        max_concurrent=1,
+        max_queue={Priority.INTERACTIVE: 1, Priority.BACKGROUND: 0},
+        metrics=metrics
+    )
+    release = asyncio.Event()
+
+    async def hold():
+        async with pool.slot():
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()), asyncio.create_task(hold())]
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        async with pool.slot(Priority.BACKGROUND):
+            pass
+    assert exc.value.status_code == 503
+    assert exc.value.reason == "queue_full"
+    assert metrics.get_gauge("ai_pal_admission_queue_depth", {"priority": "interactive"}) == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_wait_timeout_and_cancellation_release_queue():
+    """Requests that give up leave no trace in the queue"""
+    pool = GenerationPool(max_concurrent=1, max_wait_seconds=0.05, metrics=MetricsCollector())
+    release = asyncio.Event()
+
+    async def hold():
+        async with pool.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        async with pool.slot():
+            pass
+    assert exc.value.reason == "queue_timeout"
+
+    cancelled = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert pool.queue_depth() == 0
+    release.set()
+    await holder
+    assert pool.in_flight == 0
+
+
+# ============================================================================
+# Middleware Tests
+# ============================================================================
+
+
+VERIFIED = {"alice", "bob", "carol"}
+
+
+@pytest.fixture
+def controller():
+    return AdmissionController(
+        policies={
+            "/chat": RoutePolicy(
+                user_limit=RateLimit(rate=0.1, burst=2),
+                priority=Priority.INTERACTIVE,
+            ),
+        },
+        user_limit=None,
+        metrics=MetricsCollector(),
+    )
+
+
+@pytest.fixture
+def client(controller):
+    app = FastAPI()
+    async def resolve_principal(scope):
+        # Stands in for JWT verification: only these tokens are valid
+        headers = dict(scope["headers"])
+        token = headers.get(b"authorization", b"").decode().removeprefix("Bearer ")
+        return token if token in VERIFIED else None
+
+    app.add_middleware(
+        AdmissionMiddleware, get_controller=lambda: controller, resolve_principal=resolve_principal
+    )
+
+    @app.post("/chat")
+    async def chat():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_rate_limited_user_gets_429(client, controller):
+    """Over-limit callers are shed with Retry-After; other users aren't"""
+    alice = {"Authorization": "Bearer alice"}
+
+    assert client.post("/chat", headers=alice).status_code == 200
+    assert client.post("/chat", headers=alice).status_code == 200
+    response = client.post("/chat", headers=alice)
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.json()["error"]["reason"] == "rate_limited"
+    assert client.post("/chat", headers={"Authorization": "Bearer bob"}).status_code == 200
+    assert controller.metrics.get_counter(
+        "ai_pal_admission_shed_total", {"route": "/chat", "reason": "rate_limited"}
+    ) == 1
+
+
+def test_unverified_tokens_limited_per_address(client):
+    """A fresh random token per request doesn't get a fresh bucket"""
+    statuses = [
+        client.post("/chat", headers={"Authorization": f"Bearer forged-{i}"}).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [200, 200, 429]
+    # Verified users keep their own buckets
+    assert client.post("/chat", headers={"Authorization": "Bearer alice"}).status_code == 200
+
+
+def test_forwarded_clients_limited_separately_behind_trusted_proxy(controller):
+    """Behind the ingress, unverified callers get per-client buckets"""
+    app = FastAPI()
+    app.add_middleware(
+        AdmissionMiddleware,
+        get_controller=lambda: controller,
+        trusted_proxies=parse_trusted_proxies("10.0.0.0/8"),
+    )
+
+    @app.post("/chat")
+    async def chat():
+        return {"ok": True}
+
+    ingress = TestClient(app, client=("10.1.2.3", 50000))
+
+    def post(client_ip):
+        return ingress.post("/chat", headers={"X-Forwarded-For": client_ip}).status_code
+
+    assert [post("203.0.113.7") for _ in range(3)] == [200, 200, 429]
+    assert post("198.51.100.4") == 200
+
+
+def _scope(peer, *forwarded):
+    return {
+        "client": (peer, 50000),
+        "headers": [(b"x-forwarded-for", value.encode()) for value in forwarded],
+    }
+
+
+def test_client_address_trusts_only_configured_proxies():
+    """Forwarded headers from untrusted peers and client-supplied hops are ignored"""
+    trusted = parse_trusted_proxies("10.0.0.0/8, 192.168.1.5")
+
+    # No trusted proxies configured: the peer is the client
+    assert client_address(_scope("10.1.2.3", "203.0.113.7")) == "10.1.2.3"
+    # Untrusted peer can't claim another address
+    assert client_address(_scope("198.51.100.4", "203.0.113.7"), trusted) == "198.51.100.4"
+    # Rightmost untrusted hop wins; the spoofed leftmost entry is ignored
+    assert client_address(
+        _scope("10.1.2.3", "1.2.3.4, 203.0.113.7", "192.168.1.5"), trusted
+    ) == "203.0.113.7"
+    # Trusted peer without the header
+    assert client_address(_scope("10.1.2.3"), trusted) == "10.1.2.3"
+
+    with pytest.raises(ValueError):
+        parse_trusted_proxies("ingress")
+
+
+def test_exempt_paths_never_limited(client):
+    """Health checks pass regardless of load"""
+    assert all(client.get("/health").status_code == 200 for _ in range(20))
+
+
+def test_overloaded_pool_gets_503(client, controller):
+    """A full generation queue sheds with 503 and Retry-After"""
+    controller.pool.max_concurrent = 0
+    controller.pool.max_queue = {Priority.INTERACTIVE: 0, Priority.BACKGROUND: 0}
+
+    response = client.post("/chat", headers={"Authorization": "Bearer carol"})
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+    assert response.json()["error"]["reason"] == "queue_full"
+
+
+def test_api_exports_admission_metrics(monkeypatch):
+    """The main API's /metrics shows queue depth and in-flight generations"""
+    monkeypatch.setattr(api_main, "_admission_controller", None)
+    api_main.get_admission_controller()
+
+    body = TestClient(api_main.app).get("/metrics").text
+
+    assert 'ai_pal_admission_queue_depth{priority="interactive"}' in body
+    assert "ai_pal_admission_in_flight" in body
@@ -0,0 +1,334 @@
+"""
+Tests for API authentication.
+
+Tests:
+- JWT signature and claim verification (RS256, ES256, HS256)
+- Rejection of alg=none, algorithm confusion and tampered tokens
+- JWKS caching and refresh on key rotation
+- Verified-principal cache (hits, expiry, bound) and its metrics
+- get_current_user and once-per-connection WebSocket authentication
+"""
+
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import hashes, hmac as crypto_hmac
+from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import ai_pal.api.main as api_main
+from ai_pal.api.auth import (
+    Authenticator,
+    AuthError,
+    JWKSCache,
+    JWTVerifier,
+    Principal,
+    TokenCache,
+)
+from ai_pal.monitoring.metrics import MetricsCollector
+
+
+# ============================================================================
+# Token Helpers
+# ============================================================================
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _int_b64(value: int, length: int) -> str:
+    return _b64(value.to_bytes(length, "big"))
+
+
+def _sign(header: dict, claims: dict, key) -> str:
+    signing_input = f"{_b64(json.dumps(header).encode())}.{_b64(json.dumps(claims).encode())}".encode()
+    alg = header["alg"]
+    if alg == "RS256":
+        signature = key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+    elif alg == "ES256":
+        r, s = decode_dss_signature(key.sign(signing_input, ec.ECDSA(hashes.SHA256())))
+        signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+    elif alg == "HS256":
+        mac = crypto_hmac.HMAC(key, hashes.SHA256())
+        mac.update(signing_input)
+        signature = mac.finalize()
+    else:
+        signature = b""
+    return f"{signing_input.decode()}.{_b64(signature)}"
+
+
+def _claims(**overrides) -> dict:
+    claims = {"sub": "alice", "iss": "https://issuer", "aud": "ai-pal", "exp": time.time() + 600}
+    claims.update(overrides)
+    return claims
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(scope="module")
+def ec_key():
+    return ec.generate_private_key(ec.SECP256R1())
+
+
+def _rsa_jwk(key, kid: str) -> dict:
+    numbers = key.public_key().public_numbers()
+    return {"kty": "RSA", "kid": kid, "alg": "RS256", "n": _int_b64(numbers.n, 256), "e": _int_b64(numbers.e, 3)}
+
+
+def _ec_jwk(key, kid: str) -> dict:
+    numbers = key.public_key().public_numbers()
+    return {"kty": "EC", "kid": kid, "crv": "P-256", "x": _int_b64(numbers.x, 32), "y": _int_b64(numbers.y, 32)}
+
+
+class FakeJWKS:
+    """JWKS endpoint whose key set can be rotated"""
+
+    def __init__(self, *keys):
+        self.keys = list(keys)
+        self.calls = 0
+
+    async def __call__(self, url):
+        self.calls += 1
+        return {"keys": list(self.keys)}
+
+
+@pytest.fixture
+def jwks(rsa_key, ec_key):
+    return FakeJWKS(_rsa_jwk(rsa_key, "rsa-1"), _ec_jwk(ec_key, "ec-1"))
+
+
+@pytest.fixture
+def verifier(jwks):
+    return JWTVerifier(
+        jwks=JWKSCache("https://issuer/jwks", fetch=jwks),
+        algorithms=("RS256", "ES256"),
+        issuer="https://issuer",
+        audience="ai-pal",
+    )
+
+
+# ============================================================================
+# Verification Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_verifies_rsa_and_ec_tokens(verifier, rsa_key, ec_key):
+    rs = await verifier.verify(_sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key))
+    es = await verifier.verify(_sign({"alg": "ES256", "kid": "ec-1"}, _claims(sub="bob"), ec_key))
+
+    assert rs.user_id == "alice"
+    assert es.user_id == "bob"
+    assert rs.expires_at > time.time()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("claims,detail", [
+    (_claims(exp=time.time() - 120), "Token expired"),
+    (_claims(nbf=time.time() + 600), "Token not yet valid"),
+    (_claims(iss="https://evil"), "Invalid token issuer"),
+    (_claims(aud="other-app"), "Invalid token audience"),
+    (_claims(sub=None), "Token has no 'sub' claim"),
+])
+async def test_claim_checks(verifier, rsa_key, claims, detail):
+    token = _sign({"alg": "RS256", "kid": "rsa-1"}, claims, rsa_key)
+
+    with pytest.raises(AuthError) as exc:
+        await verifier.verify(token)
+    assert exc.value.detail == detail
+
+
+@pytest.mark.asyncio
+async def test_rejects_forged_tokens(verifier, rsa_key, jwks):
+    """alg=none, HMAC keyed with the public JWK, tampering and wrong keys"""
+    unsigned = _sign({"alg": "none"}, _claims(), None)
+    jwk_as_secret = json.dumps(jwks.keys[0]).encode()
+    confused = _sign({"alg": "HS256", "kid": "rsa-1"}, _claims(), jwk_as_secret)
+    header, payload, signature = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key).split(".")
+    tampered = ".".join([header, _b64(json.dumps(_claims(sub="admin")).encode()), signature])
+    other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    wrong_key = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), other_key)
+    mismatched = _sign({"alg": "ES256", "kid": "rsa-1"}, _claims(), ec.generate_private_key(ec.SECP256R1()))
+
+    for token in (unsigned, confused, tampered, wrong_key, mismatched, "not-a-jwt"):
+        with pytest.raises(AuthError):
+            await verifier.verify(token)
+
+
+@pytest.mark.asyncio
+async def test_shared_secret_tokens():
+    verifier = JWTVerifier(secret="s3cret", algorithms=("HS256",))
+
+    principal = await verifier.verify(_sign({"alg": "HS256"}, _claims(), b"s3cret"))
+    assert principal.user_id == "alice"
+
+    with pytest.raises(AuthError):
+        await verifier.verify(_sign({"alg": "HS256"}, _claims(), b"guess"))
+
+
+# ============================================================================
+# JWKS Cache Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_jwks_fetched_once_and_refreshed_on_rotation(verifier, jwks, rsa_key):
+    token = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key)
+    for _ in range(5):
+        await verifier.verify(token)
+    assert jwks.calls == 1
+
+    # The provider rotates to a new key ID
+    jwks.keys.append(_rsa_jwk(rsa_key, "rsa-2"))
+    verifier.jwks.min_refresh_seconds = 0
+    rotated = _sign({"alg": "RS256", "kid": "rsa-2"}, _claims(), rsa_key)
+    assert (await verifier.verify(rotated)).user_id == "alice"
+    assert jwks.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_key_ids_refetch_at_most_once_per_interval(verifier, jwks, rsa_key):
+    await verifier.verify(_sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key))
+
+    for i in range(5):
+        with pytest.raises(AuthError):
+            await verifier.verify(_sign({"alg": "RS256", "kid": f"forged-{i}"}, _claims(), rsa_key))
+    assert jwks.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_keys(verifier, jwks, rsa_key):
+    token = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key)
+    await verifier.verify(token)
+
+    async def down(url):
+        raise ConnectionError("identity provider down")
+
+    verifier.jwks._fetch = down
+    verifier.jwks.ttl_seconds = 0
+    verifier.jwks.min_refresh_seconds = 0
+    assert (await verifier.verify(token)).user_id == "alice"
+
+
+# ============================================================================
+# Principal Cache Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_tokens_verified_once(verifier, rsa_key):
+    metrics = MetricsCollector()
+    auth = Authenticator(verifier, TokenCache(), metrics)
+    token = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(), rsa_key)
+
+    for _ in range(10):
+        assert (await auth.authenticate(token)).user_id == "alice"
+
+    assert metrics.get_counter("ai_pal_auth_verifications_total", {"outcome": "verified"}) == 1
+    assert metrics.get_counter("ai_pal_auth_cache_hits_total") == 9
+    assert metrics.get_gauge("ai_pal_auth_cache_hit_ratio") == pytest.approx(0.9)
+    assert len(metrics.get_histogram(
+        "ai_pal_auth_verification_duration_seconds", {"outcome": "verified"}
+    )) == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_tokens_not_cached(verifier, rsa_key):
+    metrics = MetricsCollector()
+    auth = Authenticator(verifier, TokenCache(), metrics)
+    token = _sign({"alg": "RS256", "kid": "rsa-1"}, _claims(aud="other"), rsa_key)
+
+    for _ in range(2):
+        with pytest.raises(AuthError):
+            await auth.authenticate(token)
+
+    assert len(auth.cache) == 0
+    assert metrics.get_counter("ai_pal_auth_verifications_total", {"outcome": "rejected"}) == 2
+
+
+def test_cache_entries_end_at_token_expiry():
+    cache = TokenCache(ttl_seconds=300)
+    cache.put("expiring", Principal(user_id="a", expires_at=time.time() - 1))
+    cache.put("fresh", Principal(user_id="b", expires_at=time.time() + 60))
+
+    assert cache.get("expiring") is None
+    assert cache.get("fresh").user_id == "b"
+
+
+def test_cache_bounded_lru():
+    cache = TokenCache(max_entries=2)
+    for token in ("a", "b"):
+        cache.put(token, Principal(user_id=token))
+    cache.get("a")
+    cache.put("c", Principal(user_id="c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+# ============================================================================
+# API Tests
+# ============================================================================
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api_main, "_authenticator", Authenticator(
+        JWTVerifier(secret="s3cret", algorithms=("HS256",)), metrics=MetricsCollector()
+    ))
+    monkeypatch.setattr(api_main, "_admission_controller", None)
+    monkeypatch.setenv("AI_PAL_ADMISSION_ENABLED", "false")
+    return TestClient(api_main.app)
+
+
+def test_requests_need_a_valid_token(client):
+    good = _sign({"alg": "HS256"}, _claims(sub="alice"), b"s3cret")
+    bad = _sign({"alg": "HS256"}, _claims(sub="alice"), b"guess")
+
+    assert client.get("/api/personality/strengths", headers={"Authorization": "Bearer alice"}).status_code == 401
+    response = client.get("/api/personality/strengths", headers={"Authorization": f"Bearer {bad}"})
+    assert response.status_code == 401
+    assert response.json()["error"]["message"] == "Invalid token signature"
+    assert client.get("/api/personality/strengths", headers={"Authorization": f"Bearer {good}"}).status_code != 401
+
+
+@pytest.mark.parametrize("configured, jwks_url, secret, expected", [
+    ("RS256, ES256,,", None, "s", ["RS256", "ES256"]),
+    (None, "https://idp/jwks", None, ["RS256", "ES256", "EdDSA"]),
+    (None, "https://idp/jwks", "s", ["RS256", "ES256", "EdDSA", "HS256"]),
+    (None, None, "s", ["HS256"]),
+])
+def test_configured_algorithms(monkeypatch, configured, jwks_url, secret, expected):
+    if configured is None:
+        monkeypatch.delenv("AI_PAL_JWT_ALGORITHMS", raising=False)
+    else:
+        monkeypatch.setenv("AI_PAL_JWT_ALGORITHMS", configured)
+    assert api_main._jwt_algorithms(jwks_url, secret) == expected
+
+
+def test_websocket_authenticated_once_per_connection(client):
+    token = _sign({"alg": "HS256"}, _claims(sub="alice"), b"s3cret")
+    authenticator = api_main._authenticator
+
+    with client.websocket_connect(f"/ws/alice?token={token}") as ws:
+        ws.receive_json()  # welcome
+        for _ in range(3):
+            ws.send_text("ping")
+
+    assert authenticator.cache.hits + authenticator.cache.misses == 1
+
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect(f"/ws/bob?token={token}"):
+            pass
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/ws/alice"):
+            pass
@@ -188,6 +188,40 @@ class TestAPIIntegration:
         assert hasattr(app, "user_middleware")
 
 
+@pytest.mark.asyncio
+async def test_task_state_writer_started_and_drained(monkeypatch, tmp_path):
+    """Startup hands tasks the batched writer; shutdown flushes what it buffered"""
+    import ai_pal.api.main as api_main
+    from ai_pal.api import ari, dashboard, goals, predictions, tasks
+    from ai_pal.storage.database import BackgroundTaskRepository, DatabaseManager
+    from ai_pal.tasks.base_task import AIpalTask
+
+    database_url = f"sqlite+aiosqlite:///{tmp_path}/tasks.db"
+    monkeypatch.setattr(api_main, "_db_manager", DatabaseManager(database_url))
+    monkeypatch.setattr(api_main, "_task_state_writer", None)
+    monkeypatch.setattr(api_main, "get_redis_cache", MagicMock())
+    monkeypatch.setattr(api_main, "start_heartbeat_task", AsyncMock())
+    for module in (ari, dashboard, goals, predictions, tasks):
+        monkeypatch.setattr(module, "_db_manager", None, raising=False)
+        monkeypatch.setattr(module, "_cache", None, raising=False)
+    for attr in ("db_manager", "task_repo", "state_writer"):
+        monkeypatch.setattr(AIpalTask, attr, getattr(AIpalTask, attr))
+    monkeypatch.setenv("TASK_STATE_FLUSH_INTERVAL", "60")
+
+    await api_main.startup_background_systems()
+    writer = api_main._task_state_writer
+    assert AIpalTask.state_writer is writer
+    await writer.create_task("t1", "job", "maintenance")
+    assert writer.pending == 1
+
+    await api_main.shutdown_background_systems()
+    assert writer.pending == 0
+
+    reopened = DatabaseManager(database_url)
+    assert (await BackgroundTaskRepository(reopened).get_task("t1"))["status"] == "pending"
+    await reopened.close()
+
+
 @pytest.mark.unit
 class TestAPIErrorHandling:
     """Test API error handling"""
@@ -8,8 +8,10 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 from ai_pal.cache.redis_cache import RedisCache
+from ai_pal.cache.redis_cache import NEGATIVE_CACHE_MARKER
 from ai_pal.storage.cached_repositories import (
     CachedARIRepository,
+    CachedDashboardRepository,
     CachedGoalRepository,
     CachedTaskRepository,
     create_cached_ari_repo,
@@ -296,6 +298,74 @@ class TestCachedTaskRepository:
         assert result == updated
 
 
+class TestCachedDashboardRepository:
+    """Test batched dashboard reads (MGET -> grouped DB read -> set_many)."""
+
+    @pytest.fixture
+    def setup(self):
+        """Setup test dependencies."""
+        db_manager = AsyncMock(spec=DatabaseManager)
+        cache = AsyncMock(spec=RedisCache)
+        cache.enabled = True
+        repo = CachedDashboardRepository(db_manager, cache)
+        repo.db_repo.get_user_data = AsyncMock()
+        return {"cache": cache, "repo": repo}
+
+    @pytest.mark.asyncio
+    async def test_all_hits_single_round_trip(self, setup):
+        """All fields cached: one MGET, no database access."""
+        cache, repo = setup["cache"], setup["repo"]
+        cache.get_many.return_value = {
+            "user:ari:recent:user123": [{"snapshot_id": str(i)} for i in range(5)],
+            "user:goals:active:user123": [{"goal_id": "g1"}],
+            "user:profile:user123": NEGATIVE_CACHE_MARKER,
+        }
+
+        result = await repo.get_user_data(
+            "user123", fields=["recent_ari", "active_goals", "profile"], ari_limit=2
+        )
+
+        cache.get_many.assert_called_once()
+        repo.db_repo.get_user_data.assert_not_called()
+        cache.set_many.assert_not_called()
+        assert len(result["recent_ari"]) == 2
+        assert result["active_goals"] == [{"goal_id": "g1"}]
+        assert result["profile"] is None
+
+    @pytest.mark.asyncio
+    async def test_misses_loaded_once_and_repopulated_once(self, setup):
+        """Only missing fields hit the database, written back in one set_many."""
+        cache, repo = setup["cache"], setup["repo"]
+        cache.get_many.return_value = {"user:goals:active:user123": []}
+        repo.db_repo.get_user_data.return_value = {
+            "tasks": [{"task_id": "t1", "status": "pending"}],
+            "latest_ari": None,
+        }
+
+        result = await repo.get_user_data(
+            "user123", fields=["active_goals", "tasks", "latest_ari"]
+        )
+
+        repo.db_repo.get_user_data.assert_called_once()
+        assert repo.db_repo.get_user_data.call_args.args[1] == ["tasks", "latest_ari"]
+
+        cache.set_many.assert_called_once()
+        items = cache.set_many.call_args.args[0]
+        ttls = cache.set_many.call_args.kwargs["ttls"]
+        assert items["user:ari:latest:user123"] == NEGATIVE_CACHE_MARKER
+        assert ttls["user:ari:latest:user123"] == CachedDashboardRepository.NEGATIVE_TTL
+        assert result["tasks"] == [{"task_id": "t1", "status": "pending"}]
+        assert result["latest_ari"] is None
+
+    @pytest.mark.asyncio
+    async def test_ari_limit_bounded_by_cached_depth(self, setup):
+        """ari_limit above the cached depth is rejected."""
+        with pytest.raises(ValueError):
+            await setup["repo"].get_user_data(
+                "user123", ari_limit=CachedDashboardRepository.RECENT_ARI_SIZE + 1
+            )
+
+
 class TestCacheInvalidationPatterns:
     """Test cache invalidation patterns."""
 
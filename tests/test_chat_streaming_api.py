@@ -0,0 +1,219 @@
+"""
+Tests for streamed chat delivery.
+
+Tests:
+- /api/chat/stream Server-Sent Events
+- /api/chat responses and rejections
+- Chat over the /ws/{user_id} WebSocket
+"""
+
+import json
+import pytest
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+
+import ai_pal.api.main as api_main
+from ai_pal.api.admission import AdmissionController, RateLimit, RoutePolicy
+from ai_pal.api.main import app
+from ai_pal.core.integrated_system import ProcessedRequest
+from ai_pal.monitoring.metrics import MetricsCollector
+from ai_pal.orchestration.multi_model import ModelProvider
+
+
+class FakeACSystem:
+    """Yields a fixed frame sequence from stream_request"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    async def stream_request(self, user_id, query, session_id, **kwargs):
+        self.calls.append((user_id, query, session_id))
+        for frame in self.frames:
+            yield frame
+
+
+STREAM = [
+    {"type": "start", "request_id": "r1", "model": "m", "provider": "local"},
+    {"type": "token", "text": "Hi "},
+    {"type": "token", "text": "there"},
+    {"type": "done", "request_id": "r1", "success": True, "epistemic_debts_detected": 0},
+]
+
+
+@pytest.fixture
+def ac_system(monkeypatch):
+    fake = FakeACSystem(STREAM)
+    monkeypatch.setattr(api_main, "_ac_system", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.unit
+class TestChatStreamSSE:
+    """Test the SSE chat endpoint"""
+
+    def test_streams_tokens_then_metadata(self, client, ac_system):
+        response = client.post(
+            "/api/chat/stream",
+            json={"query": "hello", "session_id": "s1"},
+            headers={"Authorization": "Bearer user-1"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        assert [name for name, _ in events] == ["start", "token", "token", "done"]
+        assert events[-1][1]["success"] is True
+        assert ac_system.calls == [("user-1", "hello", "s1")]
+
+    def test_rejection_returns_403(self, client, monkeypatch):
+        monkeypatch.setattr(api_main, "_ac_system", FakeACSystem([
+            {"type": "error", "error": "Request blocked by gates", "rejected": True},
+        ]))
+
+        response = client.post(
+            "/api/chat/stream",
+            json={"query": "hello", "session_id": "s1"},
+            headers={"Authorization": "Bearer user-1"},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["error"]["message"] == "Request blocked by gates"
+
+
+class ProcessingACSystem:
+    """Returns a fixed result from process_request"""
+
+    def __init__(self, result):
+        self.result = result
+        self.kwargs = None
+
+    async def process_request(self, user_id, query, session_id, **kwargs):
+        self.kwargs = kwargs
+        return self.result
+
+
+@pytest.mark.unit
+class TestChat:
+    """Test the non-streamed chat endpoint"""
+
+    @staticmethod
+    def _result(**kwargs):
+        fields = dict(
+            request_id="r1", user_id="user-1", original_query="hello", processed_query="hello",
+            selected_model="m", selected_provider=ModelProvider.LOCAL, model_response="Hi there",
+            pii_detections=[], privacy_budget_used=0.0, relevant_memories=[],
+            new_memories_created=0, agency_snapshot=None, epistemic_debts_detected=0,
+            gate_verdicts={}, tribunal_override=False, latency_ms=5.0, cost=0.0, success=True,
+        )
+        fields.update(kwargs)
+        return ProcessedRequest(**fields)
+
+    def test_response_leaves_out_background_results(self, client, monkeypatch):
+        ac_system = ProcessingACSystem(self._result())
+        monkeypatch.setattr(api_main, "_ac_system", ac_system)
+
+        response = client.post(
+            "/api/chat",
+            json={"query": "hello", "session_id": "s1"},
+            headers={"Authorization": "Bearer user-1"},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["response"] == "Hi there"
+        assert body["ari_snapshot"] is None
+        assert body["edm_analysis"] is None
+        assert "epistemic_debts_detected" not in body["metadata"]
+        assert "new_memories_created" not in body["metadata"]
+        assert ac_system.kwargs["wait_for_background"] is False
+
+    def test_wait_for_background_fills_monitoring_results(self, client, monkeypatch):
+        snapshot = SimpleNamespace(autonomy_retention=0.8, delta_agency=0.1, skill_development=0.2)
+        ac_system = ProcessingACSystem(self._result(
+            agency_snapshot=snapshot, epistemic_debts_detected=2, new_memories_created=1
+        ))
+        monkeypatch.setattr(api_main, "_ac_system", ac_system)
+
+        response = client.post(
+            "/api/chat",
+            json={"query": "hello", "session_id": "s1", "wait_for_background": True},
+            headers={"Authorization": "Bearer user-1"},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert ac_system.kwargs["wait_for_background"] is True
+        assert body["ari_snapshot"] == {
+            "autonomy_retention": 0.8, "delta_agency": 0.1, "skill_development": 0.2
+        }
+        assert body["edm_analysis"] == {"epistemic_debts_detected": 2}
+        assert body["metadata"]["new_memories_created"] == 1
+
+    def test_rejection_returns_403(self, client, monkeypatch):
+        monkeypatch.setattr(api_main, "_ac_system", ProcessingACSystem(SimpleNamespace(
+            success=False, error="Privacy budget exceeded", metadata={"rejected": True}
+        )))
+
+        response = client.post(
+            "/api/chat",
+            json={"query": "hello", "session_id": "s1"},
+            headers={"Authorization": "Bearer user-1"},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["error"]["message"] == "Privacy budget exceeded"
+
+
+@pytest.mark.unit
+class TestChatStreamWebSocket:
+    """Test chat over the user WebSocket"""
+
+    def test_chat_message_streams_events(self, client, ac_system):
+        with client.websocket_connect("/ws/user-1") as ws:
+            assert json.loads(ws.receive_text())["type"] == "connected"
+
+            ws.send_text(json.dumps({"type": "chat", "query": "hello", "session_id": "s1"}))
+            events = [json.loads(ws.receive_text()) for _ in STREAM]
+
+        assert [e["type"] for e in events] == [
+            "chat_started", "chat_token", "chat_token", "chat_complete"
+        ]
+        assert events[1]["data"] == {"text": "Hi "}
+        assert ac_system.calls == [("user-1", "hello", "s1")]
+
+    def test_chat_frames_go_through_admission(self, client, ac_system, monkeypatch):
+        """Each chat frame is charged against the chat rate limit"""
+        monkeypatch.setenv("AI_PAL_ADMISSION_ENABLED", "true")
+        monkeypatch.setattr(api_main, "_admission_controller", AdmissionController(
+            policies={"/api/chat": RoutePolicy(user_limit=RateLimit(rate=0.01, burst=1))},
+            user_limit=None,
+            metrics=MetricsCollector(),
+        ))
+        chat = json.dumps({"type": "chat", "query": "hello", "session_id": "s1"})
+
+        with client.websocket_connect("/ws/user-1") as ws:
+            ws.receive_text()  # connected
+            ws.send_text(chat)
+            admitted = [json.loads(ws.receive_text()) for _ in STREAM]
+            ws.send_text(chat)
+            shed = json.loads(ws.receive_text())
+
+        assert admitted[-1]["type"] == "chat_complete"
+        assert shed["type"] == "chat_error"
+        assert shed["data"]["reason"] == "rate_limited"
+        assert len(ac_system.calls) == 1
+
@@ -0,0 +1,235 @@
+"""
+Tests for the SQLAlchemy storage layer.
+
+Runs the repositories against a temporary SQLite database.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+from ai_pal.storage.database import (
+    DatabaseManager,
+    ARIRepository,
+    BackgroundTaskRepository,
+    DashboardRepository,
+    GoalRepository,
+    PatchRequestRepository,
+    TaskStateWriter,
+)
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Database manager backed by a temporary SQLite file."""
+    manager = DatabaseManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await manager.create_tables()
+    yield manager
+    await manager.close()
+
+
+def _snapshot(user_id: str, index: int) -> dict:
+    return {
+        "snapshot_id": f"{user_id}-snap-{index}",
+        "user_id": user_id,
+        "timestamp": datetime(2025, 1, 1) + timedelta(days=index),
+        "decision_quality": 0.7,
+        "skill_development": 0.6,
+        "ai_reliance": 0.3,
+        "bottleneck_resolution": 0.5,
+        "user_confidence": 0.8,
+        "engagement": 0.7,
+        "autonomy_perception": 0.6,
+        "autonomy_retention": 60.0 + index,
+        "delta_agency": 0.01,
+    }
+
+
+def _patch_request(index: int, status: str) -> dict:
+    return {
+        "request_id": f"req-{index}",
+        "created_at": datetime(2025, 1, 1) + timedelta(hours=index),
+        "target_file": "src/example.py",
+        "reasoning": "Improve clarity",
+        "diff": "-a\n+b",
+        "new_code_blob": "b",
+        "component": "example",
+        "improvement_type": "refactor",
+        "confidence": 0.9,
+        "status": status,
+    }
+
+
+# ============================================================================
+# Dashboard Batch Reads
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_dashboard_repository_loads_requested_fields(db_manager):
+    """One call returns every requested dashboard field."""
+    ari_repo = ARIRepository(db_manager)
+    for i in range(4):
+        await ari_repo.save_snapshot(_snapshot("user-1", i))
+    await GoalRepository(db_manager).save_goal({
+        "goal_id": "goal-1",
+        "user_id": "user-1",
+        "description": "Learn SQL",
+        "importance": 5,
+        "complexity_level": "medium",
+    })
+    task_repo = BackgroundTaskRepository(db_manager)
+    await task_repo.create_task("task-1", "ari_snapshot", "ari", user_id="user-1")
+    await task_repo.create_task("task-2", "ari_snapshot", "ari", user_id="user-2")
+
+    data = await DashboardRepository(db_manager).get_user_data(
+        "user-1", fields=["profile", "latest_ari", "recent_ari", "active_goals", "tasks"],
+        ari_limit=2
+    )
+
+    assert data["profile"] is None
+    assert data["latest_ari"]["snapshot_id"] == "user-1-snap-3"
+    assert [s["snapshot_id"] for s in data["recent_ari"]] == ["user-1-snap-3", "user-1-snap-2"]
+    assert [g["goal_id"] for g in data["active_goals"]] == ["goal-1"]
+    assert [t["task_id"] for t in data["tasks"]] == ["task-1"]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_repository_rejects_unknown_field(db_manager):
+    """Unknown field names are an error, not silently ignored."""
+    with pytest.raises(ValueError):
+        await DashboardRepository(db_manager).get_user_data("user-1", fields=["nope"])
+
+
+@pytest.mark.asyncio
+async def test_patch_requests_grouped_by_status(db_manager):
+    """Per-status limits apply within a single grouped query."""
+    repo = PatchRequestRepository(db_manager)
+    for i in range(5):
+        await repo.save_request(_patch_request(i, "PENDING_APPROVAL"))
+    for i in range(5, 7):
+        await repo.save_request(_patch_request(i, "APPROVED"))
+
+    grouped = await repo.get_requests_by_statuses({
+        "PENDING_APPROVAL": 3,
+        "APPROVED": 10,
+        "DENIED": 10,
+    })
+
+    assert [r["request_id"] for r in grouped["PENDING_APPROVAL"]] == ["req-4", "req-3", "req-2"]
+    assert [r["request_id"] for r in grouped["APPROVED"]] == ["req-6", "req-5"]
+    assert grouped["DENIED"] == []
+
+
+# ============================================================================
+# Background Task State
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_pending_tasks_in_queue_order(db_manager):
+    """Pending tasks come back highest priority first, then oldest first."""
+    repo = BackgroundTaskRepository(db_manager)
+    await repo.create_task("low", "job", "maintenance", priority=1)
+    await repo.create_task("high-old", "job", "maintenance", priority=9)
+    await repo.create_task("high-new", "job", "maintenance", priority=9)
+    await repo.create_task("done", "job", "maintenance", priority=10)
+    await repo.finish_task("done", "completed", result={"ok": True})
+
+    pending = await repo.get_pending_tasks(limit=10)
+
+    assert [t["task_id"] for t in pending] == ["high-old", "high-new", "low"]
+    done = await repo.get_task("done")
+    assert done["status"] == "completed"
+    assert done["result"] == {"ok": True}
+    assert done["completed_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_queue_lookup_uses_covering_index(db_manager):
+    """The queue id scan is answered from idx_task_queue alone."""
+    from sqlalchemy import text
+
+    async with db_manager.get_session() as session:
+        plan = (await session.execute(text(
+            "EXPLAIN QUERY PLAN SELECT id FROM background_tasks "
+            "WHERE status = 'failed' ORDER BY priority DESC, created_at ASC LIMIT 10"
+        ))).all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "COVERING INDEX idx_task_queue" in details
+    assert "TEMP B-TREE" not in details
+
+
+@pytest.mark.asyncio
+async def test_purge_old_tasks_in_batches(db_manager):
+    """Only finished tasks past the TTL are purged, batch by batch."""
+    from sqlalchemy import update
+    from ai_pal.storage.database import BackgroundTaskDB
+
+    repo = BackgroundTaskRepository(db_manager)
+    for i in range(7):
+        await repo.create_task(f"old-{i}", "job", "maintenance")
+        await repo.finish_task(f"old-{i}", "completed")
+    await repo.create_task("old-pending", "job", "maintenance")
+    await repo.create_task("recent", "job", "maintenance")
+    await repo.finish_task("recent", "failed", error_message="boom")
+
+    async with db_manager.get_session() as session:
+        await session.execute(
+            update(BackgroundTaskDB).where(
+                BackgroundTaskDB.task_id.like("old-%")
+            ).values(created_at=datetime.now() - timedelta(days=30))
+        )
+        await session.commit()
+
+    deleted = await repo.purge_old_tasks(days=7, batch_size=3)
+
+    assert deleted == 7
+    assert await repo.get_task("old-pending") is not None
+    assert await repo.get_task("recent") is not None
+    assert await repo.delete_old_tasks(days=7) == 0
+
+
+@pytest.mark.asyncio
+async def test_state_writer_batches_lifecycle(db_manager):
+    """Creates and transitions are merged and written on flush."""
+    repo = BackgroundTaskRepository(db_manager)
+    await repo.create_task("existing", "job", "maintenance")
+    writer = TaskStateWriter(db_manager, max_batch_size=100)
+
+    await writer.create_task("new", "job", "maintenance", priority=7)
+    await writer.update_task("new", status="running", started_at=datetime.now())
+    await writer.update_task("new", status="completed", result={"n": 1}, duration_seconds=0.5)
+    await writer.update_task("existing", status="failed", error_message="boom")
+
+    assert writer.pending == 2
+    assert await repo.get_task("new") is None
+
+    assert await writer.flush() == 2
+    assert writer.pending == 0
+
+    new = await repo.get_task("new")
+    assert new["status"] == "completed"
+    assert new["priority"] == 7
+    assert new["result"] == {"n": 1}
+    assert new["started_at"] is not None
+    existing = await repo.get_task("existing")
+    assert existing["status"] == "failed"
+    assert existing["error_message"] == "boom"
+
+
+@pytest.mark.asyncio
+async def test_state_writer_flushes_at_batch_size(db_manager):
+    """Reaching max_batch_size triggers a flush; stop() drains the rest."""
+    writer = TaskStateWriter(db_manager, max_batch_size=2, flush_interval=60)
+    await writer.start()
+
+    await writer.create_task("a", "job", "maintenance")
+    await writer.create_task("b", "job", "maintenance")
+    await writer.create_task("c", "job", "maintenance")
+    assert writer.pending == 1
+
+    await writer.stop()
+
+    pending = await BackgroundTaskRepository(db_manager).get_pending_tasks(limit=10)
+    assert {t["task_id"] for t in pending} == {"a", "b", "c"}
@@ -0,0 +1,222 @@
+"""
+Tests for API response encoding.
+
+Tests:
+- dumps_json handling of datetimes, enums, dataclasses, sets, models
+- Accept-Encoding negotiation
+- FastJSONRoute default response class
+- Compression above the size threshold, never for event streams
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from ai_pal.api.responses import (
+    BROTLI_AVAILABLE,
+    CompressionMiddleware,
+    FastJSONResponse,
+    FastJSONRoute,
+    dumps_json,
+    negotiate_encoding,
+)
+
+
+class Trend(Enum):
+    UP = "up"
+
+
+@dataclass
+class Point:
+    day: date
+    trend: Trend
+
+
+class Snapshot(BaseModel):
+    score: float
+    taken_at: datetime
+
+
+# ============================================================================
+# JSON Tests
+# ============================================================================
+
+
+def test_dumps_json_native_types():
+    """Datetimes, enums, dataclasses, sets and models serialize without help"""
+    body = json.loads(dumps_json({
+        "at": datetime(2025, 1, 2, 3, 4, 5),
+        "trend": Trend.UP,
+        "point": Point(date(2025, 1, 2), Trend.UP),
+        "tags": {"a"},
+        "id": UUID(int=1),
+        "snapshot": Snapshot(score=0.5, taken_at=datetime(2025, 1, 2)),
+        1: "non-str key",
+    }))
+
+    assert body["at"] == "2025-01-02T03:04:05"
+    assert body["trend"] == "up"
+    assert body["point"] == {"day": "2025-01-02", "trend": "up"}
+    assert body["tags"] == ["a"]
+    assert body["id"] == "00000000-0000-0000-0000-000000000001"
+    assert body["snapshot"] == {"score": 0.5, "taken_at": "2025-01-02T00:00:00"}
+    assert body["1"] == "non-str key"
+
+
+def test_dumps_json_rejects_unknown_types():
+    """Unknown objects fail loudly instead of rendering a repr"""
+    with pytest.raises(TypeError):
+        dumps_json({"x": object()})
+
+
+# ============================================================================
+# Negotiation Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("header,expected", [
+    ("gzip, deflate", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("", None),
+    ("*", "br" if BROTLI_AVAILABLE else "gzip"),
+    ("br, gzip", "br" if BROTLI_AVAILABLE else "gzip"),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+# ============================================================================
+# App Tests
+# ============================================================================
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.router.route_class = FastJSONRoute
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/large")
+    async def large():
+        return {"rows": [{"n": i, "trend": "stable"} for i in range(200)]}
+
+    @router.get("/model", response_model=Snapshot)
+    async def model():
+        return Snapshot(score=0.5, taken_at=datetime(2025, 1, 1))
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            for _ in range(3):
+                yield "data: " + "x" * 400 + "\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_route_class_defaults_to_fast_json(client):
+    """Dict routes render with FastJSONResponse, model routes keep the pydantic path"""
+    routes = {r.path: r for r in client.app.routes if hasattr(r, "response_class")}
+
+    assert routes["/small"].response_class.value is FastJSONResponse
+    assert client.get("/model").json() == {"score": 0.5, "taken_at": "2025-01-01T00:00:00"}
+
+
+def test_large_responses_gzipped(client):
+    """Bodies above the threshold are compressed for clients that accept it"""
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["rows"]) == 200
+
+    raw = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+
+
+def test_small_responses_and_streams_uncompressed(client):
+    """Small bodies and SSE streams pass through untouched"""
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    stream = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in stream.headers
+    assert stream.text.count("data: ") == 3
+
+
+@pytest.mark.skipif(not BROTLI_AVAILABLE, reason="brotli not installed")
+def test_brotli_preferred(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["content-encoding"] == "br"
+    assert len(response.json()["rows"]) == 200
+
+
+# ============================================================================
+# Middleware (ASGI level)
+# ============================================================================
+
+
+def _asgi_app(content_type: str, chunks):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", content_type.encode())],
+        })
+        for i, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": i < len(chunks) - 1})
+    return app
+
+
+async def _run_middleware(app, accept_encoding: str):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    await CompressionMiddleware(app, minimum_size=500)(scope, None, send)
+    return sent
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept", ["gzip", "br"])
+async def test_event_streams_forwarded_chunk_by_chunk(accept):
+    """SSE frames are neither compressed nor buffered, whatever the Starlette version"""
+    chunks = [b"data: " + b"x" * 600 + b"\n\n"] * 3
+    sent = await _run_middleware(_asgi_app("text/event-stream; charset=utf-8", chunks), accept)
+
+    assert sent[0]["type"] == "http.response.start"
+    assert b"content-encoding" not in dict(sent[0]["headers"])
+    assert [m["body"] for m in sent[1:]] == chunks
+
+
+@pytest.mark.asyncio
+async def test_streamed_bodies_compressed_per_chunk():
+    """Each chunk of a streamed body is flushed, and the whole decompresses"""
+    import zlib
+
+    chunks = [b'{"part": "' + b"y" * 700 + b'"}'] * 3
+    sent = await _run_middleware(_asgi_app("application/json", chunks), "gzip")
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    assert all(m["body"] for m in sent[1:])
+    assert zlib.decompress(b"".join(m["body"] for m in sent[1:]), 16 + zlib.MAX_WBITS) == b"".join(chunks)
+
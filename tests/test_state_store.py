@@ -0,0 +1,138 @@
+"""
+Tests for the shared state store.
+
+Simulates several API workers in one process: each worker gets its own
+CachedStateStore over the same SQLite-backed DatabaseStateStore, and the
+workers share a LocalInvalidationBus in place of Redis pub/sub.
+"""
+
+import asyncio
+import pytest
+
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager
+from ai_pal.storage.database import DatabaseManager
+from ai_pal.storage.state_store import (
+    CachedStateStore,
+    DatabaseStateStore,
+    LocalInvalidationBus,
+    MemoryStateStore,
+    create_state_store,
+)
+
+
+@pytest.fixture
+async def db_manager(tmp_path):
+    """Database manager backed by a temporary SQLite file."""
+    manager = DatabaseManager(database_url=f"sqlite+aiosqlite:///{tmp_path / 'state.db'}")
+    await manager.create_tables()
+    yield manager
+    await manager.close()
+
+
+@pytest.fixture
+def workers(db_manager):
+    """Two workers' stores over one database"""
+    backend = DatabaseStateStore(db_manager)
+    bus = LocalInvalidationBus()
+    return [
+        CachedStateStore(backend, bus=bus, worker_id=f"worker-{i}")
+        for i in range(2)
+    ]
+
+
+def _increment(value):
+    value = value or {"count": 0}
+    return {"count": value["count"] + 1}
+
+
+@pytest.mark.asyncio
+async def test_database_store_roundtrip(db_manager):
+    """set/get/delete against the shared_state table"""
+    store = DatabaseStateStore(db_manager)
+
+    assert await store.get("ns", "u1") is None
+    await store.set("ns", "u1", {"a": 1})
+    await store.set("ns", "u1", {"a": 2})
+    assert await store.get("ns", "u1") == {"a": 2}
+
+    await store.delete("ns", "u1")
+    assert await store.get("ns", "u1") is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_updates_are_not_lost(db_manager):
+    """Racing compare-and-swap updates all land"""
+    store = DatabaseStateStore(db_manager)
+
+    await asyncio.gather(*(store.update("ns", "u1", _increment) for _ in range(25)))
+
+    assert await store.get("ns", "u1") == {"count": 25}
+
+
+@pytest.mark.asyncio
+async def test_read_through_cache(workers):
+    """Repeat reads are served locally"""
+    worker = workers[0]
+    await worker.set("ns", "u1", {"a": 1})
+
+    assert await worker.get("ns", "u1") == {"a": 1}
+    assert await worker.get("ns", "u1") == {"a": 1}
+    assert worker.get_stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_other_workers(workers):
+    """A write on one worker is visible on the next read on another"""
+    first, second = workers
+    await first.set("ns", "u1", {"a": 1})
+    assert await second.get("ns", "u1") == {"a": 1}  # now cached on second
+
+    await first.update("ns", "u1", lambda v: {"a": v["a"] + 1})
+
+    assert second.get_stats()["invalidations"] == 1
+    assert await second.get("ns", "u1") == {"a": 2}
+
+
+@pytest.mark.asyncio
+async def test_cached_values_are_copies(workers):
+    """Mutating a returned value doesn't corrupt the cache"""
+    worker = workers[0]
+    await worker.set("ns", "u1", {"items": [1]})
+
+    value = await worker.get("ns", "u1")
+    value["items"].append(2)
+
+    assert await worker.get("ns", "u1") == {"items": [1]}
+
+
+def test_factory_defaults_to_memory():
+    """The memory backend needs no shared infrastructure"""
+    assert isinstance(create_state_store(), MemoryStateStore)
+
+    with pytest.raises(ValueError):
+        create_state_store("database")
+
+
+@pytest.mark.asyncio
+async def test_privacy_budget_shared_across_workers(workers, tmp_path):
+    """Two workers enforce one daily query limit between them"""
+    managers = [
+        AdvancedPrivacyManager(storage_dir=tmp_path / f"privacy-{i}", state_store=store)
+        for i, store in enumerate(workers)
+    ]
+    await managers[0].check_privacy_budget("u1")
+    budget = await managers[1].load_privacy_budget("u1")
+    budget.max_queries_per_day = 5
+    await workers[1].set("privacy_budget", "u1", managers[1]._budget_to_dict(budget))
+
+    results = []
+    for i in range(8):
+        results.append(await managers[i % 2].check_privacy_budget("u1"))
+
+    # 1 earlier query + 4 more fill the limit of 5
+    assert results.count(True) == 4
+    budget = await managers[0].load_privacy_budget("u1")
+    assert budget.queries_made == 5
+    assert budget.budget_exceeded
+    assert not (tmp_path / "privacy-0" / "privacy_budgets.json").exists()
+
@@ -570,10 +570,7 @@ def test_rdi_monitor_aggregate_with_sufficient_users(rdi_monitor):
             days_in_trend=0
         )
 
-        hashed = rdi_monitor._hash_user_id(user_id)
-        if hashed not in rdi_monitor._local_rdi_scores:
-            rdi_monitor._local_rdi_scores[hashed] = []
-        rdi_monitor._local_rdi_scores[hashed].append(score)
+        rdi_monitor._record_score(score)
 
     # Generate aggregate
     aggregate = rdi_monitor.generate_anonymized_aggregate()
@@ -0,0 +1,208 @@
+"""
+Unit Tests for Cache Payload Codecs
+
+Tests the framed cache serialization layer including:
+- Typed round-trips (datetime, date, Enum, dataclass, set)
+- Compression above the size threshold
+- Cross-codec reads via the frame header
+- Legacy (unframed) payload compatibility
+- RedisCache integration with the serializer
+"""
+
+import json
+import pytest
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from unittest.mock import AsyncMock
+
+from ai_pal.cache.codecs import (
+    CacheCodecError,
+    CacheSerializer,
+    FLAG_COMPRESSED,
+    FRAME_MAGIC,
+    MSGPACK_AVAILABLE,
+    register_cache_type,
+)
+from ai_pal.cache.redis_cache import RedisCache
+
+
+@register_cache_type
+class Mood(Enum):
+    CALM = "calm"
+    FOCUSED = "focused"
+
+
+@register_cache_type
+@dataclass
+class Checkpoint:
+    label: str
+    reached_at: datetime
+
+
+class Unregistered(Enum):
+    A = 1
+
+
+CODECS = ["json"] + (["msgpack"] if MSGPACK_AVAILABLE else [])
+
+
+@pytest.fixture
+def snapshot_dict():
+    """Dict shaped like ARIRepository._snapshot_to_dict output"""
+    return {
+        "snapshot_id": "snap-1",
+        "user_id": "user-1",
+        "timestamp": datetime(2025, 1, 15, 9, 30, 12, 123456),
+        "autonomy_retention": 72.5,
+        "delta_agency": 0.12,
+        "task_description": None,
+    }
+
+
+# ============================================================================
+# Round-trip Tests
+# ============================================================================
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_roundtrip_datetime_dict(codec, snapshot_dict):
+    """Datetime values survive a round-trip with their type"""
+    serializer = CacheSerializer(codec=codec)
+
+    decoded = serializer.loads(serializer.dumps(snapshot_dict))
+
+    assert decoded == snapshot_dict
+    assert isinstance(decoded["timestamp"], datetime)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_roundtrip_typed_values(codec):
+    """Registered enums/dataclasses, dates and sets are rebuilt"""
+    serializer = CacheSerializer(codec=codec)
+    value = {
+        "mood": Mood.FOCUSED,
+        "day": date(2025, 3, 1),
+        "tags": {"a", "b"},
+        "checkpoint": Checkpoint("first", datetime(2025, 3, 1, 8, 0)),
+    }
+
+    decoded = serializer.loads(serializer.dumps(value))
+
+    assert decoded == value
+    assert decoded["mood"] is Mood.FOCUSED
+    assert isinstance(decoded["checkpoint"], Checkpoint)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_unregistered_enum_degrades_to_value(codec):
+    """Unregistered enums decode to their plain value"""
+    serializer = CacheSerializer(codec=codec)
+
+    assert serializer.loads(serializer.dumps([Unregistered.A])) == [1]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_unserializable_value_raises(codec):
+    """Values with no encoding raise CacheCodecError"""
+    serializer = CacheSerializer(codec=codec)
+
+    with pytest.raises(CacheCodecError):
+        serializer.dumps({"obj": object()})
+
+
+# ============================================================================
+# Framing and Compression Tests
+# ============================================================================
+
+
+def test_frame_header():
+    """Payloads carry magic, version, codec id and flags"""
+    serializer = CacheSerializer(codec="json", compression_threshold=None)
+
+    payload = serializer.dumps({"a": 1})
+
+    assert payload[0] == FRAME_MAGIC
+    assert payload[2] == serializer.codec.codec_id
+    assert payload[3] & FLAG_COMPRESSED == 0
+
+
+def test_compression_above_threshold():
+    """Large payloads are compressed, small ones are not"""
+    serializer = CacheSerializer(codec="json", compression_threshold=256)
+    large = {"text": "agency " * 500}
+
+    small_payload = serializer.dumps({"a": 1})
+    large_payload = serializer.dumps(large)
+
+    assert small_payload[3] & FLAG_COMPRESSED == 0
+    assert large_payload[3] & FLAG_COMPRESSED
+    assert len(large_payload) < len(json.dumps(large))
+    assert serializer.loads(large_payload) == large
+
+
+@pytest.mark.skipif(not MSGPACK_AVAILABLE, reason="msgpack not installed")
+def test_reader_follows_frame_codec():
+    """A reader configured for one codec decodes frames written by another"""
+    writer = CacheSerializer(codec="msgpack")
+    reader = CacheSerializer(codec="json")
+
+    assert reader.loads(writer.dumps({"n": [1, 2, 3]})) == {"n": [1, 2, 3]}
+
+
+def test_legacy_payloads():
+    """Unframed JSON and plain strings from the old write path still decode"""
+    serializer = CacheSerializer()
+
+    assert serializer.loads(b'{"goal_id": "g1"}') == {"goal_id": "g1"}
+    assert serializer.loads(b"plain response text") == "plain response text"
+
+
+def test_corrupt_frame_raises():
+    """A truncated compressed frame raises instead of returning garbage"""
+    serializer = CacheSerializer(codec="json", compression_threshold=16)
+    payload = serializer.dumps({"text": "x" * 200})
+
+    with pytest.raises(CacheCodecError):
+        serializer.loads(payload[:-5])
+
+
+def test_future_frame_version_rejected():
+    """Frames from a newer format version are refused"""
+    serializer = CacheSerializer(codec="json")
+    payload = bytearray(serializer.dumps({"a": 1}))
+    payload[1] = 99
+
+    with pytest.raises(CacheCodecError):
+        serializer.loads(bytes(payload))
+
+
+# ============================================================================
+# RedisCache Integration
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_set_get_uses_serializer(snapshot_dict):
+    """RedisCache stores framed bytes and decodes them on read"""
+    cache = RedisCache(enabled=False)
+    cache.enabled = True
+    store = {}
+    cache.client = AsyncMock()
+    cache.client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+    cache.client.get.side_effect = lambda key: store.get(key)
+
+    assert await cache.set("user:ari:latest:user-1", snapshot_dict) is True
+    assert isinstance(store["user:ari:latest:user-1"], bytes)
+    assert await cache.get("user:ari:latest:user-1") == snapshot_dict
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_corrupt_value_is_miss():
+    """Undecodable framed values are reported as a cache miss"""
+    cache = RedisCache(enabled=False)
+    cache.enabled = True
+    cache.client = AsyncMock()
+    cache.client.get.return_value = bytes((FRAME_MAGIC, 1, 250, 0)) + b"??"
+
+    assert await cache.get("any") is None
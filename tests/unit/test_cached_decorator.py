@@ -0,0 +1,134 @@
+"""
+Unit Tests for the @cached Decorator
+
+Tests key extraction, negative caching and metrics export.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from ai_pal.cache.redis_cache import (
+    NEGATIVE_CACHE_MARKER,
+    RedisCache,
+    _build_key_extractor,
+    cached,
+)
+from ai_pal.monitoring.metrics import MetricsCollector
+
+
+@pytest.fixture
+def cache():
+    """In-memory stand-in for RedisCache"""
+    store = {}
+    mock = AsyncMock(spec=RedisCache)
+    mock.get.side_effect = lambda key: store.get(key)
+    mock.set.side_effect = lambda key, value, ttl=None: store.__setitem__(key, value)
+    mock.store = store
+    return mock
+
+
+@pytest.fixture
+def metrics():
+    """Isolated metrics collector"""
+    return MetricsCollector()
+
+
+# ============================================================================
+# Key Extraction Tests
+# ============================================================================
+
+
+def test_key_extractor_positional_keyword_and_defaults():
+    """Extractor resolves args by position, keyword and default"""
+    async def fetch(user_id, days=30, *, scope="all"):
+        pass
+
+    extract = _build_key_extractor(fetch, None)
+
+    assert extract(("u1",), {}) == {"user_id": "u1", "days": 30, "scope": "all"}
+    assert extract(("u1", 7), {"scope": "me"}) == {"user_id": "u1", "days": 7, "scope": "me"}
+    assert extract((), {"user_id": "u2", "days": 1}) == {"user_id": "u2", "days": 1, "scope": "all"}
+
+
+def test_key_extractor_subset():
+    """Only requested key args are extracted"""
+    async def fetch(self, user_id, limit=10):
+        pass
+
+    extract = _build_key_extractor(fetch, ["user_id"])
+
+    assert extract((object(), "u1"), {"limit": 5}) == {"user_id": "u1"}
+
+
+# ============================================================================
+# Decorator Behavior Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cached_hit_and_miss_metrics(cache, metrics):
+    """Second call is served from cache and both are counted"""
+    calls = []
+
+    @cached(cache, "user:profile:{user_id}", ttl=60, key_args=["user_id"], metrics=metrics)
+    async def get_profile(user_id, verbose=False):
+        calls.append(user_id)
+        return {"user_id": user_id}
+
+    assert await get_profile("u1") == {"user_id": "u1"}
+    assert await get_profile(user_id="u1", verbose=True) == {"user_id": "u1"}
+
+    assert calls == ["u1"]
+    name = f"{get_profile.__module__}.{get_profile.__qualname__}"
+    assert metrics.get_counter("ai_pal_cache_misses_total", {"function": name}) == 1
+    assert metrics.get_counter("ai_pal_cache_hits_total", {"function": name}) == 1
+    assert len(metrics.get_histogram(
+        "ai_pal_cached_call_duration_seconds", {"function": name, "result": "hit"}
+    )) == 1
+
+
+@pytest.mark.asyncio
+async def test_none_not_cached_by_default(cache, metrics):
+    """Without negative_ttl a None result is recomputed every call"""
+    calls = []
+
+    @cached(cache, "goal:{goal_id}", metrics=metrics)
+    async def get_goal(goal_id):
+        calls.append(goal_id)
+        return None
+
+    await get_goal("g1")
+    await get_goal("g1")
+
+    assert calls == ["g1", "g1"]
+    cache.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_negative_caching(cache, metrics):
+    """None results are cached with the negative TTL and returned as None"""
+    calls = []
+
+    @cached(cache, "goal:{goal_id}", ttl=600, negative_ttl=15, metrics=metrics)
+    async def get_goal(goal_id):
+        calls.append(goal_id)
+        return None
+
+    assert await get_goal("g1") is None
+    assert await get_goal("g1") is None
+
+    assert calls == ["g1"]
+    cache.set.assert_called_once_with("goal:g1", NEGATIVE_CACHE_MARKER, ttl=15)
+    name = f"{get_goal.__module__}.{get_goal.__qualname__}"
+    assert metrics.get_counter("ai_pal_cache_negative_hits_total", {"function": name}) == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_key_arg_falls_through(cache, metrics):
+    """A template field with no matching argument bypasses the cache"""
+    @cached(cache, "user:{user_id}:{missing}", metrics=metrics)
+    async def fetch(user_id):
+        return user_id
+
+    assert await fetch("u1") == "u1"
+    cache.get.assert_not_called()
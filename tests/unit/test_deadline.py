@@ -0,0 +1,151 @@
+"""
+Unit Tests for Request Deadlines
+
+Tests:
+- Deadline propagation through asyncio tasks
+- Cancellation of awaits and streams on expiry
+- EDM fact-check skipping on low budget
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from ai_pal.monitoring.deadline import (
+    DeadlineExceeded,
+    RequestDeadline,
+    current_deadline,
+    deadline_scope,
+    has_budget,
+    iterate_with_deadline,
+    with_deadline,
+)
+from ai_pal.monitoring.edm_monitor import EDMMonitor
+from ai_pal.monitoring.fact_check import FactCheckStatus, FactCheckVerdict
+
+
+# ============================================================================
+# Deadline Scope Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_deadline_propagates_to_child_tasks():
+    """Tasks created inside a scope see the same deadline"""
+    deadline = RequestDeadline(1000)
+
+    async def child():
+        return current_deadline()
+
+    with deadline_scope(deadline):
+        seen = await asyncio.gather(child(), asyncio.create_task(child()))
+
+    assert seen == [deadline, deadline]
+    assert current_deadline() is None
+
+
+def test_has_budget():
+    """has_budget is permissive without a deadline"""
+    assert has_budget(10_000)
+
+    with deadline_scope(RequestDeadline(500)):
+        assert has_budget(100)
+        assert not has_budget(10_000)
+
+
+# ============================================================================
+# Cancellation Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_cancels_slow_call():
+    """A call outliving the budget is cancelled and DeadlineExceeded raised"""
+    cancelled = asyncio.Event()
+
+    async def hung_provider():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with deadline_scope(RequestDeadline(50)):
+        with pytest.raises(DeadlineExceeded) as exc:
+            await with_deadline(hung_provider(), operation="openai:gpt-4")
+
+    assert cancelled.is_set()
+    assert "openai:gpt-4" in str(exc.value)
+    assert isinstance(exc.value, asyncio.TimeoutError)
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_expired_does_not_start():
+    """Nothing runs once the budget is already gone"""
+    started = []
+
+    async def work():
+        started.append(True)
+
+    deadline = RequestDeadline(0)
+    with pytest.raises(DeadlineExceeded):
+        await with_deadline(work(), deadline)
+
+    assert started == []
+
+
+@pytest.mark.asyncio
+async def test_with_deadline_passes_through_without_deadline():
+    """No deadline means a plain await"""
+    async def work():
+        return 42
+
+    assert await with_deadline(work()) == 42
+
+
+@pytest.mark.asyncio
+async def test_iterate_with_deadline_cuts_off_stream():
+    """A stalled token stream stops at the deadline and is closed"""
+    closed = asyncio.Event()
+
+    async def stream():
+        try:
+            yield "first"
+            await asyncio.sleep(10)
+            yield "never"
+        finally:
+            closed.set()
+
+    chunks = []
+    with pytest.raises(DeadlineExceeded):
+        async for chunk in iterate_with_deadline(stream(), RequestDeadline(50)):
+            chunks.append(chunk)
+
+    assert chunks == ["first"]
+    assert closed.is_set()
+
+
+# ============================================================================
+# EDM Cheap Path Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_edm_skips_fact_checks_on_low_budget(tmp_path):
+    """Debts are still detected, but no fact-check is started"""
+    monitor = EDMMonitor(storage_dir=tmp_path)
+    text = "Studies show that this works."
+
+    verdict = FactCheckVerdict(status=FactCheckStatus.PENDING)
+    with patch.object(monitor.fact_checker, "check", new=AsyncMock(return_value=verdict)) as fact_check:
+        with deadline_scope(RequestDeadline(monitor.FACT_CHECK_MIN_BUDGET_MS / 2)):
+            debts = await monitor.analyze_text(text, "task-1", "user-1")
+        await asyncio.sleep(0)
+        assert debts
+        fact_check.assert_not_called()
+
+        with deadline_scope(RequestDeadline(60_000)):
+            await monitor.analyze_text(text, "task-2", "user-1")
+        await asyncio.sleep(0.01)
+        fact_check.assert_awaited()
+    await monitor.close()
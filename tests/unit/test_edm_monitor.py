@@ -8,11 +8,16 @@ Tests the Epistemic Debt Monitoring system including:
 - Debt resolution tracking
 """
 
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from ai_pal.monitoring.edm_monitor import (
+    DebtStore,
     EDMMonitor,
     EpistemicDebtSnapshot,
     DebtSeverity,
@@ -432,5 +437,236 @@ async def test_very_long_text(edm_monitor):
     assert len(debts) > 0
 
 
+# ============================================================================
+# Single-Pass Matching Tests
+# ============================================================================
+
+
+def _per_pattern_hits(monitor, text):
+    """Hits from scanning for each pattern separately"""
+    hits = []
+    classes = [
+        ("unfalsifiable", monitor.UNFALSIFIABLE_PATTERNS),
+        ("unverified", monitor.UNVERIFIED_PATTERNS),
+        ("vague", monitor.VAGUE_PATTERNS),
+    ]
+    for kind, patterns in classes:
+        for pattern in patterns:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                window = text[match.end():match.end() + 100]
+                if kind == "unverified" and any(re.search(c, window) for c in monitor.CITATION_PATTERNS):
+                    continue
+                hits.append((kind, match.start(), match.end()))
+    return sorted(hits, key=lambda hit: hit[1])
+
+
+@pytest.mark.parametrize("text", [
+    "Studies show X [1]. Experts say Y. Clearly, many people agree; some say no.",
+    "RESEARCH INDICATES (Smith, 2020) that it is believed. Statistics show nothing.",
+    "It has been proven doi:10.1/x, and without a doubt everyone knows it.",
+    "Experts say see https://example.org" + " filler" * 30 + " studies show (Lee 2019)",
+    "Nothing to see here.",
+])
+def test_single_pass_matches_per_pattern_scan(edm_monitor, text):
+    """One pass finds the same markers and citation exemptions"""
+    kept = [
+        hit for hit in edm_monitor._matcher.scan(text)
+        if not (hit[0] == "unverified" and edm_monitor._matcher.has_citation(
+            text, hit[2], hit[2] + edm_monitor.CITATION_LOOKAHEAD
+        ))
+    ]
+
+    assert kept == _per_pattern_hits(edm_monitor, text)
+
+
+def test_regex_markers_and_unicode_take_grouped_path(temp_storage):
+    """Non-literal markers, and texts whose length changes when lowercased,
+    are matched case-insensitively on the original text"""
+
+    class HedgeMonitor(EDMMonitor):
+        VAGUE_PATTERNS = EDMMonitor.VAGUE_PATTERNS + [r"some (?:experts|analysts) think"]
+
+    monitor = HedgeMonitor(storage_dir=temp_storage, fact_check_enabled=False)
+    assert monitor._matcher.scan("Some Analysts think so.") == [("vague", 0, 19)]
+
+    text = "İstanbul: many people agree."
+    (kind, start, end), = EDMMonitor(
+        storage_dir=temp_storage, fact_check_enabled=False
+    )._matcher.scan(text)
+    assert (kind, text[start:end]) == ("vague", "many people")
+
+
+@pytest.mark.asyncio
+async def test_debts_persisted_in_one_batch(edm_monitor, monkeypatch):
+    """All debts from one response are written together, with distinct IDs"""
+    batches = []
+    append = edm_monitor.store.append
+    monkeypatch.setattr(edm_monitor.store, "append", lambda records: (batches.append(len(records)), append(records)))
+    alerts = []
+    check = edm_monitor._check_debt_alerts
+
+    async def counting_check(user_id):
+        alerts.append(user_id)
+        await check(user_id)
+    monkeypatch.setattr(edm_monitor, "_check_debt_alerts", counting_check)
+
+    text = "Everyone knows this. Studies show that. Many people say so. " * 5
+    debts = await edm_monitor.analyze_text(text=text, task_id="t", user_id="u")
+
+    assert len(debts) == 15
+    assert batches == [15]
+    assert alerts == ["u"]
+    assert len({d.debt_id for d in debts}) == 15
+    assert len(edm_monitor.store.load()) == 15
+
+
+# ============================================================================
+# Index and Store Tests
+# ============================================================================
+
+
+def _naive_report(monitor, user_id, start, end):
+    """Aggregate a report the slow way, over every debt"""
+    debts = [
+        d for d in monitor.debt_instances.values()
+        if (user_id is None or d.user_id == user_id) and start <= d.timestamp <= end
+    ]
+    return {
+        "total": len(debts),
+        "resolved": sum(d.resolved for d in debts),
+        "verified": sum(d.fact_check_status == FactCheckStatus.VERIFIED for d in debts),
+        "false": sum(d.fact_check_status == FactCheckStatus.FALSE for d in debts),
+        "by_severity": {s.value: sum(d.severity == s for d in debts) for s in DebtSeverity},
+        "high_risk": sorted(
+            d.debt_id for d in debts
+            if d.severity in (DebtSeverity.HIGH, DebtSeverity.CRITICAL) and not d.resolved
+        ),
+    }
+
+
+def _summary(report):
+    return {
+        "total": report.total_debt_instances,
+        "resolved": report.resolved_debt,
+        "verified": report.verified_claims,
+        "false": report.false_claims,
+        "by_severity": report.debt_by_severity,
+        "high_risk": sorted(d.debt_id for d in report.high_risk_claims),
+    }
+
+
+def _debt(debt_id, user_id, days_ago, severity=DebtSeverity.MEDIUM, debt_type="unfalsifiable"):
+    return EpistemicDebtSnapshot(
+        debt_id=debt_id,
+        timestamp=datetime.now() - timedelta(days=days_ago),
+        claim="Everyone knows",
+        context="Everyone knows it.",
+        task_id="t",
+        user_id=user_id,
+        severity=severity,
+        debt_type=debt_type,
+    )
+
+
+@pytest.mark.asyncio
+async def test_indexed_reports_match_full_scan(edm_monitor):
+    """Counters stay exact through resolutions and fact-check updates"""
+    kinds = list(EDMMonitor.DEBT_CLASSES.items())
+    # Registered out of time order, spread over a month
+    for i in range(36):
+        debt_type, (_, severity) = kinds[i % len(kinds)]
+        edm_monitor._register_debt(
+            _debt(f"d{i}", f"user-{i % 3}", (i * 7) % 30, severity, debt_type)
+        )
+    debts = list(edm_monitor.debt_instances.values())
+
+    await edm_monitor.resolve_debt("d0", "manual")
+    await edm_monitor.resolve_debt("d4", "manual")
+    edm_monitor._update_debt(debts[1], fact_check_status=FactCheckStatus.FALSE)
+    edm_monitor._update_debt(debts[7], fact_check_status=FactCheckStatus.VERIFIED)
+
+    now = datetime.now() + timedelta(seconds=1)
+    ranges = [(now - timedelta(days=7), now), (now - timedelta(days=365), now)]
+    for user_id in [None, "user-0", "user-1", "nobody"]:
+        for start, end in ranges:
+            report = edm_monitor.generate_report(user_id=user_id, start_date=start, end_date=end)
+            assert _summary(report) == _naive_report(edm_monitor, user_id, start, end)
+
+    index = edm_monitor._user_indexes["user-0"]
+    assert index.unresolved() == sum(
+        1 for d in debts if d.user_id == "user-0" and not d.resolved
+    )
+
+
+@pytest.mark.asyncio
+async def test_debt_updates_survive_restart(edm_monitor):
+    """The last record per debt wins when the log is replayed"""
+    debts = await edm_monitor.analyze_text(
+        text="Everyone knows this. Studies show that.", task_id="t", user_id="u"
+    )
+    await edm_monitor.resolve_debt(debts[0].debt_id, "manual")
+
+    restarted = EDMMonitor(storage_dir=edm_monitor.storage_dir, fact_check_enabled=False)
+
+    assert restarted.debt_instances[debts[0].debt_id].resolved
+    assert restarted._user_indexes["u"].unresolved() == len(debts) - 1
+    assert restarted.generate_report(user_id="u").resolved_debt == 1
+
+
+def test_legacy_debt_files_migrated(temp_storage):
+    """One-file-per-debt storage is folded into the log on startup"""
+    temp_storage.mkdir(parents=True)
+    legacy = _debt("legacy-1", "u", days_ago=2)
+    (temp_storage / "legacy-1.json").write_text(json.dumps(EDMMonitor._debt_to_dict(legacy)))
+    (temp_storage / "broken.json").write_text("{not json")
+
+    monitor = EDMMonitor(storage_dir=temp_storage, fact_check_enabled=False)
+
+    assert monitor.debt_instances["legacy-1"].claim == "Everyone knows"
+    assert monitor.generate_report(user_id="u").debt_by_type == {"unfalsifiable": 1}
+    assert not (temp_storage / "legacy-1.json").exists()
+    # Unreadable files are left for inspection
+    assert (temp_storage / "broken.json").exists()
+    assert "legacy-1" in EDMMonitor(storage_dir=temp_storage, fact_check_enabled=False).debt_instances
+
+
+@pytest.mark.asyncio
+async def test_debt_log_compacts(edm_monitor):
+    """Superseded records are dropped once they dominate the log"""
+    edm_monitor.store.compact_min_lines = 20
+    debts = await edm_monitor.analyze_text(text="Everyone knows this.", task_id="t", user_id="u")
+    for _ in range(30):
+        await edm_monitor._persist_debt(debts[0])
+    await edm_monitor.analyze_text(text="Many people say so.", task_id="t2", user_id="u")
+
+    # Compacted to one line when the 21st line lands (after 20 updates),
+    # then 10 more updates and the new debt
+    lines = edm_monitor.store.path.read_text().splitlines()
+    assert len(lines) == 12
+    assert len(edm_monitor.store.load()) == 2
+
+
+def test_compaction_keeps_concurrent_appends(temp_storage):
+    """Batches appended while another thread compacts are never dropped"""
+    temp_storage.mkdir(parents=True)
+    store = DebtStore(temp_storage, compact_min_lines=10)
+
+    def writer(worker):
+        for i in range(100):
+            # A new debt plus a rewrite of the worker's first debt
+            store.append([
+                {"debt_id": f"{worker}-{i}", "n": i},
+                {"debt_id": f"{worker}-0", "n": i},
+            ])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(writer, range(8)))
+
+    records = store.load()
+    assert len(records) == 800
+    assert all(records[f"{w}-0"]["n"] == 99 for w in range(8))
+    assert store.lines <= 2 * 800
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,225 @@
+"""
+Unit Tests for the Fact-Check Service
+
+Tests:
+- Claim normalization
+- Verdict cache: hits, persistence, TTLs
+- Backend order, failure fallback and per-source rate limits
+- Bounded queue, duplicate claims and request deadlines
+- EDM monitor integration through the offline local backend
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from ai_pal.monitoring.deadline import RequestDeadline, deadline_scope
+from ai_pal.monitoring.edm_monitor import EDMMonitor
+from ai_pal.monitoring.fact_check import (
+    FactCheckBackend,
+    FactCheckCache,
+    FactCheckService,
+    FactCheckStatus,
+    FactCheckVerdict,
+    LocalFactCheckBackend,
+    SourceRateLimit,
+    normalize_claim,
+)
+from ai_pal.monitoring.metrics import MetricsCollector
+
+
+VERIFIED = FactCheckVerdict(status=FactCheckStatus.VERIFIED, source="Local", confidence=0.9)
+
+
+class FailingBackend(FactCheckBackend):
+    name = "down"
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    async def check(self, claim, client):
+        self.calls += 1
+        raise ConnectionError("source unreachable")
+
+
+def _service(*backends, **kwargs) -> FactCheckService:
+    kwargs.setdefault("metrics", MetricsCollector())
+    return FactCheckService(backends=list(backends), **kwargs)
+
+
+# ============================================================================
+# Normalization and Cache Tests
+# ============================================================================
+
+
+def test_normalize_claim():
+    assert normalize_claim("Studies show  X.") == normalize_claim("studies show x")
+    assert normalize_claim("Ｗater boils!") == "water boils"
+
+
+@pytest.mark.asyncio
+async def test_cached_verdicts_skip_backends(tmp_path):
+    local = LocalFactCheckBackend({"Water boils at 100C": VERIFIED})
+    service = _service(local, cache=FactCheckCache(tmp_path / "cache.jsonl"))
+
+    first = await service.check("Water boils at 100C")
+    second = await service.check("water boils at 100c.")
+
+    assert first.status == second.status == FactCheckStatus.VERIFIED
+    assert local.calls == 1
+    assert service.metrics.get_counter(
+        "ai_pal_fact_checks_total", {"source": "cache", "status": "verified"}
+    ) == 1
+
+    # A new cache instance replays the log
+    restarted = FactCheckCache(tmp_path / "cache.jsonl")
+    assert restarted.get("Water boils at 100C").status == FactCheckStatus.VERIFIED
+
+
+def test_cache_ttls(tmp_path):
+    cache = FactCheckCache(tmp_path / "cache.jsonl", ttl_seconds=60, inconclusive_ttl_seconds=0)
+    cache.put("conclusive", VERIFIED)
+    cache.put("inconclusive", FactCheckVerdict(status=FactCheckStatus.UNVERIFIABLE))
+
+    assert cache.get("conclusive") is not None
+    assert cache.get("inconclusive") is None
+    assert FactCheckCache(tmp_path / "cache.jsonl").get("inconclusive") is None
+
+
+def test_cache_log_compacts(tmp_path):
+    cache = FactCheckCache(tmp_path / "cache.jsonl")
+    for _ in range(300):
+        cache.put("same claim", VERIFIED)
+
+    lines = (tmp_path / "cache.jsonl").read_text().splitlines()
+    assert len(lines) < 150
+    assert len(FactCheckCache(tmp_path / "cache.jsonl")) == 1
+
+
+# ============================================================================
+# Backend Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_falls_through_backends_to_heuristic():
+    down = FailingBackend()
+    local = LocalFactCheckBackend({"known claim": VERIFIED})
+    service = _service(down, local)
+
+    assert (await service.check("known claim")).source == "Local"
+
+    verdict = await service.check("Everyone knows unknown claims")
+    assert verdict.source == "heuristic"
+    assert verdict.status == FactCheckStatus.DISPUTED
+
+    # Not cached while a source was failing: the next check retries it
+    await service.check("Everyone knows unknown claims")
+    assert down.calls == 3
+    assert service.metrics.get_counter(
+        "ai_pal_fact_checks_total", {"source": "down", "status": "error"}
+    ) == 3
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_source_calls():
+    local = LocalFactCheckBackend(rate_limit=SourceRateLimit(rate=50.0, burst=1))
+    service = _service(local)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(service.check(f"claim number {i}") for i in range(6)))
+
+    # One call immediately, then one every 20ms
+    assert time.perf_counter() - start >= 0.09
+    assert local.calls == 6
+
+
+# ============================================================================
+# Worker Pool Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_duplicate_claims_checked_once():
+    local = LocalFactCheckBackend({"the claim": VERIFIED}, latency_seconds=0.01)
+    service = _service(local, workers=2)
+    results = []
+
+    async def record(verdict):
+        results.append(verdict.status)
+
+    for claim in ["The claim.", "the claim", "THE CLAIM!"]:
+        assert service.submit(claim, record)
+    await service.join()
+
+    assert local.calls == 1
+    assert results == [FactCheckStatus.VERIFIED] * 3
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_queue_bounded_under_load():
+    local = LocalFactCheckBackend(latency_seconds=0.05)
+    service = _service(local, workers=2, max_queue=5)
+    tasks_before = len(asyncio.all_tasks())
+
+    async def ignore(verdict):
+        pass
+
+    accepted = sum(service.submit(f"distinct claim {i}", ignore) for i in range(50))
+
+    # Two workers, whatever the load
+    assert len(asyncio.all_tasks()) - tasks_before == 2
+    assert accepted == 5
+    assert service.dropped == 45
+    assert service.metrics.get_counter("ai_pal_fact_check_dropped_total") == 45
+
+    await service.join()
+    assert service.completed == 5
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_skips_queued_check():
+    local = LocalFactCheckBackend(latency_seconds=0.05)
+    service = _service(local, workers=1)
+    results = []
+
+    async def record(verdict):
+        results.append(verdict)
+
+    service.submit("occupies the worker", record)
+    with deadline_scope(RequestDeadline(10)):
+        service.submit("waits past its deadline", record)
+    await service.join()
+
+    assert len(results) == 1
+    assert local.calls == 1
+    await service.close()
+
+
+# ============================================================================
+# EDM Integration Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_edm_verified_claims_auto_resolve_offline(tmp_path, monkeypatch):
+    monkeypatch.setenv("AI_PAL_FACT_CHECK_BACKEND", "local")
+    monitor = EDMMonitor(storage_dir=tmp_path)
+    local = monitor.fact_checker.backends[0]
+    assert isinstance(local, LocalFactCheckBackend)
+
+    text = "Studies show that regular sleep improves memory."
+    claim = monitor._extract_claim(text, 0, len("Studies show"))
+    local.add(claim, VERIFIED)
+
+    debts = await monitor.analyze_text(text, "task-1", "user-1")
+    await monitor.fact_checker.join()
+
+    assert debts[0].fact_check_status == FactCheckStatus.VERIFIED
+    assert debts[0].resolved
+    assert debts[0].resolution_method == "auto_verified"
+    await monitor.close()
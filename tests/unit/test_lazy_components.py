@@ -0,0 +1,159 @@
+"""
+Unit Tests for Lazy Component Initialization
+
+Tests:
+- Proxy forwarding and one-time construction
+- Failure reporting and retry
+- Parallel warm-up
+- IntegratedACSystem readiness
+"""
+
+import threading
+import time
+import pytest
+
+from ai_pal.core.lazy import ComponentState, LazyComponent, warm_components
+from ai_pal.core.integrated_system import IntegratedACSystem, SystemConfig
+
+
+class Widget:
+    def __init__(self):
+        self.value = 1
+
+    def double(self):
+        return self.value * 2
+
+
+def _counting_factory(calls):
+    def factory():
+        calls.append(threading.get_ident())
+        return Widget()
+    return factory
+
+
+# ============================================================================
+# Proxy Tests
+# ============================================================================
+
+
+def test_proxy_builds_on_first_use():
+    """Nothing is built until an attribute is touched"""
+    calls = []
+    proxy = LazyComponent("widget", _counting_factory(calls))
+
+    assert proxy.lazy_state == ComponentState.COLD
+    assert proxy  # truthy while cold
+    assert calls == []
+
+    assert proxy.double() == 2
+    assert proxy.lazy_state == ComponentState.READY
+    assert proxy.lazy_status()["init_ms"] is not None
+
+    proxy.value = 5
+    assert proxy.double() == 10
+    assert len(calls) == 1
+
+
+def test_concurrent_first_use_builds_once():
+    """Threads racing on a cold proxy share one build"""
+    calls = []
+
+    def slow_factory():
+        time.sleep(0.02)
+        return _counting_factory(calls)()
+
+    proxy = LazyComponent("widget", slow_factory)
+    threads = [threading.Thread(target=proxy.lazy_get) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_reported_and_retried():
+    """A failed build is surfaced and lazy_warm() retries it"""
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("model not downloaded")
+        return Widget()
+
+    proxy = LazyComponent("widget", flaky, critical=True)
+
+    assert await proxy.lazy_warm() is False
+    status = proxy.lazy_status()
+    assert status["state"] == "failed"
+    assert status["error"] == "model not downloaded"
+    with pytest.raises(RuntimeError):
+        proxy.double()
+
+    assert await proxy.lazy_warm() is True
+    assert proxy.double() == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_components_runs_in_parallel():
+    """Blocking factories overlap in worker threads"""
+    def slow():
+        time.sleep(0.1)
+        return Widget()
+
+    components = [LazyComponent(f"c{i}", slow) for i in range(4)]
+
+    start = time.perf_counter()
+    results = await warm_components(components)
+    elapsed = time.perf_counter() - start
+
+    assert results == {"c0": True, "c1": True, "c2": True, "c3": True}
+    assert elapsed < 0.3
+
+
+# ============================================================================
+# IntegratedACSystem Tests
+# ============================================================================
+
+
+def _config(tmp_path, **overrides):
+    return SystemConfig(
+        data_dir=tmp_path / "data",
+        credentials_path=tmp_path / "credentials",
+        enable_gates=False,
+        enable_tribunal=False,
+        enable_dashboard=False,
+        enable_ffe=False,
+        enable_model_orchestration=False,
+        **overrides
+    )
+
+
+@pytest.mark.asyncio
+async def test_system_readiness_after_warm_up(tmp_path):
+    """Critical components start cold and report ready once warmed"""
+    system = IntegratedACSystem(_config(tmp_path))
+
+    assert isinstance(system.edm_monitor, LazyComponent)
+    readiness = system.readiness()
+    assert readiness["ready"] is False
+    assert readiness["components"]["edm_monitor"]["state"] == "cold"
+    assert "orchestrator" not in readiness["components"]  # disabled
+
+    results = await system.warm_up()
+
+    assert results and all(results.values())
+    readiness = system.readiness()
+    assert readiness["ready"] is True
+    assert readiness["components"]["edm_monitor"]["state"] == "ready"
+    assert readiness["components"]["ari_engine"]["state"] == "cold"  # not critical
+
+
+def test_eager_mode_builds_in_init(tmp_path):
+    """lazy_init=False keeps the previous construct-everything behavior"""
+    system = IntegratedACSystem(_config(tmp_path, lazy_init=False))
+
+    assert not isinstance(system.edm_monitor, LazyComponent)
+    assert system.readiness()["ready"] is True
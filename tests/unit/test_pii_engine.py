@@ -0,0 +1,122 @@
+"""
+Unit Tests for the Compiled PII Engine
+
+Tests:
+- Same matches as one scan per pattern (validators aside)
+- Validators: Luhn, SSN structure, IPv4 octets
+- Prefilters and type restriction
+- Batch detection and protection
+- Bounded detection cache
+"""
+
+import re
+
+import pytest
+
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager, PrivacyAction
+from ai_pal.privacy.pii_engine import (
+    DEFAULT_PII_RULES,
+    PIIEngine,
+    PIIRule,
+    PIIType,
+    ipv4_valid,
+    luhn_valid,
+    ssn_valid,
+)
+
+
+TEXT = (
+    "Mail jane.doe@example.com or call 555-123-4567. "
+    "Card 4539 1488 0343 6467, SSN 123-45-6789, host 10.0.0.12."
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return AdvancedPrivacyManager(storage_dir=tmp_path, pii_cache_size=4)
+
+
+def _spans(detections):
+    return [(d.pii_type, d.text) for d in detections]
+
+
+def test_matches_per_pattern_scan():
+    engine = PIIEngine([PIIRule(**{**rule.__dict__, "validator": None}) for rule in DEFAULT_PII_RULES])
+
+    # Includes e-mail edge cases around the '@' anchor
+    for text in (TEXT, "a@b.com_x x@@y.io .-%@q.de, @a.bc u@v.w|xy a@b.cd@e.fg"):
+        per_pattern = sorted(
+            (match.start(), rule.pii_type.value, match.group())
+            for rule in DEFAULT_PII_RULES for match in re.finditer(rule.pattern, text)
+        )
+        combined = [(d.start_pos, d.pii_type.value, d.text) for d in engine.detect(text)]
+
+        assert combined == per_pattern
+
+
+def test_validators_reject_false_positives():
+    assert luhn_valid("4539 1488 0343 6467")
+    assert not luhn_valid("4532-1234-5678-9010")
+    assert ssn_valid("123-45-6789")
+    assert not ssn_valid("000-45-6789") and not ssn_valid("912-45-6789") and not ssn_valid("123-00-6789")
+    assert ipv4_valid("10.0.0.12") and not ipv4_valid("999.1.1.1")
+
+    detections = PIIEngine().detect("Order 4532-1234-5678-9010 from 999.10.10.10, ref 666-12-3456")
+    assert detections == []
+
+
+def test_detects_types_in_text_order():
+    assert _spans(PIIEngine().detect(TEXT)) == [
+        (PIIType.EMAIL, "jane.doe@example.com"),
+        (PIIType.PHONE, "555-123-4567"),
+        (PIIType.CREDIT_CARD, "4539 1488 0343 6467"),
+        (PIIType.SSN, "123-45-6789"),
+        (PIIType.IP_ADDRESS, "10.0.0.12"),
+    ]
+
+
+def test_prefilter_and_type_restriction():
+    engine = PIIEngine()
+
+    assert engine._active_groups("no digits or at signs here", None) == []
+    assert engine._active_groups("user@example.org", None) == [(PIIType.EMAIL,)]
+    assert _spans(engine.detect(TEXT, [PIIType.SSN])) == [(PIIType.SSN, "123-45-6789")]
+
+
+def test_detect_batch_offsets_per_text():
+    texts = ["call 555-123-4567", "", "nothing here", "a@b.io then 10.1.1.1", "555-123-"]
+    batch = PIIEngine().detect_batch(texts)
+
+    assert batch == [PIIEngine().detect(text) for text in texts]
+    assert [(d.start_pos, d.end_pos) for d in batch[3]] == [(0, 6), (12, 20)]
+
+
+@pytest.mark.asyncio
+async def test_protection_batch_and_bounded_cache(manager):
+    texts = [f"memory {i}: reach me at user{i}@example.com" for i in range(6)] + ["no pii"]
+
+    results = await manager.apply_privacy_protection_batch(texts, PrivacyAction.REDACT)
+
+    assert results[0] == ("memory 0: reach me at [REDACTED]", results[0][1])
+    assert results[-1] == ("no pii", [])
+    assert len(manager.pii_cache) == 4
+
+    # Single-text calls share the batch's cache entries
+    assert await manager.detect_pii(texts[-1]) is results[-1][1]
+
+    # Cache keys include the requested types
+    assert await manager.detect_pii(TEXT, [PIIType.SSN]) != await manager.detect_pii(TEXT)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("action", list(PrivacyAction))
+async def test_overlapping_detections_leave_nothing_behind(manager, action):
+    text = "call 5551234567@example.com now"
+
+    protected, detections = await manager.apply_privacy_protection(text, action)
+
+    assert {d.pii_type for d in detections} >= {PIIType.EMAIL, PIIType.PHONE}
+    assert protected.startswith("call ") and protected.endswith(" now")
+    assert "5551234567" not in protected
+    if action != PrivacyAction.MASK:
+        assert "example.com" not in protected
@@ -0,0 +1,177 @@
+"""
+Unit Tests for the PII Scrubber and Warm Analyzer Pool
+
+The analyzer runs Presidio over a blank spaCy pipeline (no NER model), so
+pattern recognizers (e-mail, phone, card) work without a model download.
+
+Tests:
+- Prefilter cues and the regex-only fast path
+- Batch scrubbing matches one-at-a-time scrubbing
+- One analyzer per language, shared by every scrubber
+- Pool inherited loaded by forked workers
+- Per-stage latency in results and metrics
+"""
+
+import multiprocessing
+import os
+
+import pytest
+import spacy
+from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer.nlp_engine import SpacyNlpEngine
+
+from ai_pal.core.privacy import AnalyzerPool, PIIScrubber
+from ai_pal.monitoring.metrics import MetricsCollector
+
+
+TEXTS = [
+    "the rollout looks good, thanks.",
+    "Mail jane.doe@example.com about the card 4539 1488 0343 6467",
+    "",
+    "we can ship after the load tests",
+    "Call 212-555-0199 or use key sk-" + "a" * 48,
+]
+
+
+def _blank_analyzer() -> AnalyzerEngine:
+    nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": "en_core_web_sm"}])
+    nlp_engine.nlp = {"en": spacy.blank("en")}
+    return AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=["en"])
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = AnalyzerPool()
+    pool.set_analyzer("en", _blank_analyzer())
+    return pool
+
+
+@pytest.fixture
+def scrubber(pool):
+    return PIIScrubber(pool=pool, metrics=MetricsCollector())
+
+
+def _summary(result):
+    return result.scrubbed_text, [(d.entity_type, d.start, d.end) for d in result.detections]
+
+
+# ============================================================================
+# Prefilter and Fast Path
+# ============================================================================
+
+
+def test_prefilter_cues(scrubber):
+    assert not scrubber.needs_nlp("the plan looks good. Thanks, I think we can ship it.")
+    assert not scrubber.needs_nlp("What should we do about the cache?")
+
+    for text in (
+        "ask alice at a@b.co",
+        "meet Alice tomorrow",
+        "ping me tomorrow",
+        "call 555 0199",
+        "see https://example.com",
+        "ask émile",
+    ):
+        assert scrubber.needs_nlp(text), text
+
+
+def test_fast_path_skips_nlp(scrubber):
+    fast = scrubber.scrub(TEXTS[0])
+    assert not fast.pii_detected
+    assert fast.scrubbed_text == TEXTS[0]
+    assert "nlp" not in fast.stage_ms
+    assert set(fast.stage_ms) == {"prefilter", "regex", "anonymize"}
+
+    # Same text with the fast path off: analyzed, same outcome
+    slow = PIIScrubber(pool=scrubber.pool, fast_path=False, metrics=MetricsCollector()).scrub(TEXTS[0])
+    assert "nlp" in slow.stage_ms
+    assert _summary(slow) == _summary(fast)
+
+
+def test_pii_detected_without_detection_details(scrubber):
+    result = scrubber.scrub(TEXTS[1], return_detections=False)
+
+    assert result.pii_detected and result.detections == []
+    assert not scrubber.is_safe_for_cloud(TEXTS[1])
+    assert scrubber.is_safe_for_cloud(TEXTS[0])
+
+
+# ============================================================================
+# Batch Scrubbing
+# ============================================================================
+
+
+def test_scrub_batch_matches_single_scrubs(scrubber):
+    batch = scrubber.scrub_batch(TEXTS, batch_size=2)
+    single = [scrubber.scrub(text) for text in TEXTS]
+
+    assert [_summary(r) for r in batch] == [_summary(r) for r in single]
+    assert [r.pii_detected for r in batch] == [False, True, False, False, True]
+    assert "jane.doe@example.com" not in batch[1].scrubbed_text
+    assert "[OPENAI_API_KEY_" in batch[4].scrubbed_text
+
+    # Only prefiltered-in texts went through the model
+    assert ["nlp" in r.stage_ms for r in batch] == [False, True, False, False, True]
+
+
+# ============================================================================
+# Analyzer Pool
+# ============================================================================
+
+
+def test_scrubbers_share_pool_engines(pool):
+    first = PIIScrubber(pool=pool, metrics=MetricsCollector())
+    second = PIIScrubber(pool=pool, metrics=MetricsCollector())
+
+    assert first.analyzer is second.analyzer is pool.analyzer("en")
+    assert first.anonymizer is second.anonymizer
+    assert pool.batch_analyzer("en").analyzer_engine is pool.analyzer("en")
+
+    # Already loaded: nothing to load
+    assert pool.preload(["en"], freeze=False) == {"en": 0.0}
+    assert pool.preloaded_pid == os.getpid()
+
+    with pytest.raises(ValueError):
+        pool.analyzer("xx")
+
+
+def _scrub_in_child(pool, queue):
+    scrubber = PIIScrubber(pool=pool, metrics=MetricsCollector())
+    queue.put((pool.is_loaded("en"), scrubber.scrub(TEXTS[1]).scrubbed_text))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_worker_inherits_loaded_pool(pool, scrubber):
+    pool.preload(["en"], freeze=False)
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+
+    worker = context.Process(target=_scrub_in_child, args=(pool, queue))
+    worker.start()
+    loaded, scrubbed = queue.get(timeout=30)
+    worker.join(timeout=30)
+
+    assert worker.exitcode == 0
+    assert loaded
+    assert scrubbed == scrubber.scrub(TEXTS[1]).scrubbed_text
+
+
+# ============================================================================
+# Latency Reporting
+# ============================================================================
+
+
+def test_stage_latency_reported(pool):
+    metrics = MetricsCollector()
+    scrubber = PIIScrubber(pool=pool, metrics=metrics)
+
+    scrubber.scrub(TEXTS[0])
+    scrubber.scrub_batch(TEXTS[1:2])
+
+    assert metrics.get_counter("ai_pal_pii_scrubs_total", {"path": "fast"}) == 1
+    assert metrics.get_counter("ai_pal_pii_scrubs_total", {"path": "nlp"}) == 1
+    assert len(metrics.get_histogram("ai_pal_pii_scrub_stage_seconds", {"stage": "prefilter"})) == 2
+    assert len(metrics.get_histogram("ai_pal_pii_scrub_stage_seconds", {"stage": "nlp"})) == 1
+    assert all(
+        v >= 0 for v in metrics.get_histogram("ai_pal_pii_scrub_stage_seconds", {"stage": "anonymize"})
+    )
@@ -0,0 +1,182 @@
+"""
+Unit Tests for Privacy Budget Persistence
+
+Tests:
+- Budget changes coalesced in memory and journaled once per flush
+- Restart restores budgets from snapshot plus journal
+- Legacy privacy_budgets.json files still load
+- Compaction, and journal records already in the snapshot skipped on replay
+- Concurrent checks for one user never lose a spend
+- The API journals idle users' changes periodically
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ai_pal.privacy import advanced_privacy
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager, BudgetJournal
+
+
+def _manager(storage_dir, interval=3600.0):
+    return AdvancedPrivacyManager(storage_dir=storage_dir, budget_flush_interval=interval)
+
+
+def _journal_lines(storage_dir):
+    path = storage_dir / BudgetJournal.JOURNAL
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def _state(manager):
+    return {
+        user_id: (b.queries_made, round(b.epsilon_spent, 6), b.budget_exceeded)
+        for user_id, b in manager.privacy_budgets.items()
+    }
+
+
+# ============================================================================
+# Coalescing
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_checks_coalesce_until_flush(tmp_path):
+    manager = _manager(tmp_path)
+
+    for i in range(30):
+        assert await manager.check_privacy_budget(f"user-{i % 3}", 0.01)
+    assert _journal_lines(tmp_path) == []
+
+    assert await manager.flush_privacy_budgets() == 3
+    assert len(_journal_lines(tmp_path)) == 3
+    assert await manager.flush_privacy_budgets() == 0
+
+    # Nothing rewritten: the snapshot only appears on compaction
+    assert not (tmp_path / BudgetJournal.SNAPSHOT).exists()
+
+
+@pytest.mark.asyncio
+async def test_zero_interval_journals_every_check(tmp_path):
+    manager = _manager(tmp_path, interval=0)
+
+    await manager.check_privacy_budget("alice", 0.01)
+    await manager.check_privacy_budget("alice", 0.01)
+
+    assert [json.loads(line)["seq"] for line in _journal_lines(tmp_path)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_keep_every_spend(tmp_path):
+    manager = _manager(tmp_path, interval=0)
+
+    results = await asyncio.gather(*(manager.check_privacy_budget("alice", 0.001) for _ in range(80)))
+
+    assert all(results)
+    assert manager.privacy_budgets["alice"].queries_made == 80
+    await manager.flush_privacy_budgets()
+    assert _state(_manager(tmp_path))["alice"][0] == 80
+
+
+@pytest.mark.asyncio
+async def test_api_flushes_idle_budgets_periodically(tmp_path, monkeypatch):
+    """Changes reach the journal without another check or shutdown"""
+    import ai_pal.api.main as api_main
+
+    manager = _manager(tmp_path)
+    monkeypatch.setattr(api_main, "_ac_system", SimpleNamespace(
+        flush_privacy_budgets=manager.flush_privacy_budgets
+    ))
+    await manager.check_privacy_budget("alice", 0.02)
+
+    task = asyncio.create_task(api_main.flush_privacy_budgets_periodically(0.01))
+    try:
+        for _ in range(100):
+            if _journal_lines(tmp_path):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        task.cancel()
+
+    assert _state(_manager(tmp_path)) == _state(manager)
+
+
+# ============================================================================
+# Restart and Migration
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_restart_restores_budgets(tmp_path):
+    manager = _manager(tmp_path)
+    for i in range(10):
+        await manager.check_privacy_budget(f"user-{i % 4}", 0.05)
+    # Denied checks are persisted too (budget_exceeded)
+    assert not await manager.check_privacy_budget("user-0", 5.0)
+    await manager.flush_privacy_budgets()
+
+    reloaded = _manager(tmp_path)
+    assert _state(reloaded) == _state(manager)
+    assert reloaded.privacy_budgets["user-0"].budget_exceeded
+
+
+def test_legacy_budget_file_loads(tmp_path):
+    (tmp_path / BudgetJournal.SNAPSHOT).write_text(json.dumps({
+        "alice": {
+            "epsilon": 1.0,
+            "delta": 1e-5,
+            "queries_made": 7,
+            "epsilon_spent": 0.07,
+            "last_reset": "2026-01-01T00:00:00",
+        }
+    }))
+
+    budget = _manager(tmp_path).privacy_budgets["alice"]
+    assert (budget.queries_made, budget.epsilon_spent) == (7, 0.07)
+
+
+@pytest.mark.asyncio
+async def test_exit_flush_writes_buffered_changes(tmp_path):
+    manager = _manager(tmp_path)
+    await manager.check_privacy_budget("alice", 0.02)
+
+    advanced_privacy._flush_budgets_at_exit()
+
+    assert _state(_manager(tmp_path)) == _state(manager)
+
+
+# ============================================================================
+# Compaction
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_journal_compacts_into_snapshot(tmp_path):
+    manager = _manager(tmp_path, interval=0)
+    manager.budget_journal.compact_min_lines = 10
+
+    for i in range(40):
+        await manager.check_privacy_budget(f"user-{i % 2}", 0.01)
+
+    assert len(_journal_lines(tmp_path)) <= 10
+    snapshot = json.loads((tmp_path / BudgetJournal.SNAPSHOT).read_text())
+    assert set(snapshot["budgets"]) == {"user-0", "user-1"}
+    assert _state(_manager(tmp_path)) == _state(manager)
+
+
+def test_replay_skips_records_in_snapshot(tmp_path):
+    journal = BudgetJournal(tmp_path)
+    journal.append({"alice": {"queries_made": 1}})
+    stale = _journal_lines(tmp_path)
+
+    journal.append({"alice": {"queries_made": 2}})
+    journal.compact({"alice": {"queries_made": 2}})
+
+    # Crash before the journal was truncated: its old records remain
+    (tmp_path / BudgetJournal.JOURNAL).write_text("\n".join(stale) + "\n")
+    journal.append({"bob": {"queries_made": 5}})
+
+    reloaded = BudgetJournal(tmp_path)
+    assert reloaded.load() == {"alice": {"queries_made": 2}, "bob": {"queries_made": 5}}
+    assert reloaded.seq == journal.seq == 3
@@ -0,0 +1,152 @@
+"""
+Unit Tests for RDI Score Columns and Semantic Drift
+
+Tests:
+- Anonymized aggregate from score columns matches per-user histories
+- Columns grow, and are rebuilt oldest-to-newest from stored scores
+- Semantic drift as overlap with the baseline concept vector
+- Baseline pruning keeps the most frequent concepts
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_pal.monitoring.rdi_monitor import (
+    RDILevel,
+    RDIMonitor,
+    RDIScore,
+    RDIScoreColumns,
+    SemanticBaseline,
+)
+
+
+def _score(hashed_user_id, overall_rdi, minutes=0):
+    return RDIScore(
+        user_id=hashed_user_id,
+        timestamp=datetime(2026, 1, 1) + timedelta(minutes=minutes),
+        overall_rdi=overall_rdi,
+        rdi_level=RDILevel.ALIGNED,
+        semantic_drift=0.0,
+        factual_drift=0.0,
+        logical_drift=0.0,
+        trend_direction="stable",
+        days_in_trend=0,
+    )
+
+
+def _reference_aggregate(monitor):
+    """Aggregate straight from the per-user histories"""
+    histories = [
+        scores for user_id, scores in monitor._local_rdi_scores.items()
+        if user_id in monitor._aggregate_opt_ins and scores
+    ]
+    latest = [scores[-1].overall_rdi for scores in histories]
+    pairs = [(s[-1].overall_rdi, s[-2].overall_rdi) for s in histories if len(s) >= 2]
+    increasing = sum(1 for new, old in pairs if new > old)
+    stable = sum(1 for new, old in pairs if abs(new - old) < 0.1)
+    n = len(latest)
+    return {
+        "total_users": n,
+        "average_rdi": sum(latest) / n,
+        "median_rdi": sorted(latest)[n // 2],
+        "distribution": [
+            sum(1 for s in latest if lo <= s < hi)
+            for lo, hi in [(-1, 0.2), (0.2, 0.4), (0.4, 0.6), (0.6, 0.8), (0.8, 2)]
+        ],
+        "trend": (increasing / n, stable / n, (n - increasing - stable) / n),
+    }
+
+
+@pytest.fixture
+def monitor(tmp_path):
+    return RDIMonitor(storage_dir=tmp_path)
+
+
+# ============================================================================
+# Score Columns
+# ============================================================================
+
+
+def test_aggregate_matches_histories(monitor):
+    rng = random.Random(7)
+    for i in range(300):
+        user_id = f"user_{i}"
+        hashed = monitor._hash_user_id(user_id)
+        if i % 4:
+            monitor.opt_in_to_aggregate_sharing(user_id)
+        for step in range(i % 3 + 1):
+            monitor._record_score(_score(hashed, round(rng.random(), 2), step))
+    # Opted in without any score: not counted
+    monitor.opt_in_to_aggregate_sharing("no_scores_yet")
+
+    aggregate = monitor.generate_anonymized_aggregate()
+    expected = _reference_aggregate(monitor)
+
+    assert aggregate.total_users == expected["total_users"] == 225
+    assert aggregate.average_rdi == pytest.approx(expected["average_rdi"])
+    assert aggregate.median_rdi == expected["median_rdi"]
+    assert list(aggregate.rdi_distribution.values()) == expected["distribution"]
+    assert tuple(aggregate.trend_summary.values()) == pytest.approx(expected["trend"])
+
+
+def test_columns_grow_and_track_latest_two():
+    columns = RDIScoreColumns(capacity=2)
+    for i in range(5):
+        # Either call may add the row that grows the columns
+        if i % 2:
+            columns.opt_in(f"u{i}")
+            columns.record(f"u{i}", 0.1 * i)
+        else:
+            columns.record(f"u{i}", 0.1 * i)
+            columns.opt_in(f"u{i}")
+    columns.record("u0", 0.9)
+
+    latest, previous, count = columns.opted_in_scores()
+    assert len(columns) == 5
+    assert latest.tolist() == pytest.approx([0.9, 0.1, 0.2, 0.3, 0.4])
+    assert (previous[0], count[0]) == (0.0, 2)
+
+
+@pytest.mark.asyncio
+async def test_columns_rebuilt_from_stored_scores(monitor, tmp_path):
+    hashed = monitor._hash_user_id("alice")
+    for minutes, value in [(0, 0.1), (2, 0.7), (1, 0.3)]:
+        await monitor._persist_rdi_score(_score(hashed, value, minutes))
+
+    reloaded = RDIMonitor(storage_dir=tmp_path)
+    reloaded.opt_in_to_aggregate_sharing("alice")
+
+    assert [s.overall_rdi for s in reloaded._local_rdi_scores[hashed]] == [0.1, 0.3, 0.7]
+    latest, previous, count = reloaded._score_columns.opted_in_scores()
+    assert (latest.tolist(), previous.tolist(), count.tolist()) == ([0.7], [0.3], [2])
+
+
+# ============================================================================
+# Semantic Baseline
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_semantic_drift_is_concept_overlap(monitor):
+    baseline = SemanticBaseline(user_id="u", concept_frequency={"gardening": 3, "tomatoes": 1})
+    analyzed = monitor._text_analyzer.analyze("gardening tomatoes cucumbers peppers gardening")
+
+    # 2 of 4 distinct concepts known
+    assert await monitor._analyze_semantic_drift(analyzed, baseline) == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_baseline_pruned_to_frequent_concepts(monitor):
+    hashed = monitor._hash_user_id("alice")
+    monitor._local_baselines[hashed] = SemanticBaseline(user_id=hashed)
+    keep = " ".join(f"frequent{i:04d}" for i in range(monitor.MAX_BASELINE_CONCEPTS))
+    for _ in range(2):
+        await monitor._update_baseline(hashed, monitor._text_analyzer.analyze(keep))
+    rare = " ".join(f"rarely{i:04d}" for i in range(monitor.BASELINE_PRUNE_SLACK + 1))
+    await monitor._update_baseline(hashed, monitor._text_analyzer.analyze(rare))
+
+    frequency = monitor._local_baselines[hashed].concept_frequency
+    assert len(frequency) == monitor.MAX_BASELINE_CONCEPTS
+    assert all(concept.startswith("frequent") for concept in frequency)
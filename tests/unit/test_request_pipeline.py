@@ -0,0 +1,433 @@
+"""
+Unit Tests for the IntegratedACSystem Request Pipeline
+
+Tests the stage dependency graph:
+- Independent stages run concurrently
+- Post-response stages run in a background tail
+- Per-stage timing
+- Early rejection
+- Deadline budgets
+- Per-user serialization
+"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec
+
+from ai_pal.core.integrated_system import (
+    IntegratedACSystem,
+    SystemConfig,
+    RequestStage,
+    REQUEST_STAGE_GRAPH,
+)
+from ai_pal.context.enhanced_context import EnhancedContextManager
+from ai_pal.gates.aho_tribunal import AHOTribunal
+from ai_pal.gates.gate_system import GateSystem, GateType, GateResult
+from ai_pal.models.base import LLMResponse
+from ai_pal.monitoring.edm_monitor import EDMMonitor
+from ai_pal.monitoring.metrics import get_metrics
+from ai_pal.orchestration.multi_model import (
+    ModelProvider,
+    ModelSelection,
+    MultiModelOrchestrator,
+    OptimizationGoal,
+    TaskComplexity,
+    TaskRequirements,
+)
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager
+
+
+class ConcurrencyProbe:
+    """Tracks how many probed calls are in flight at once"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    def wrap(self, value, delay=0.02):
+        """Side effect that returns value after delay, counting overlap"""
+        async def call(*args, **kwargs):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(delay)
+                return value
+            finally:
+                self.active -= 1
+        return call
+
+
+def _mock(cls):
+    """Mock instance of cls: unknown attributes and bad call signatures fail"""
+    return create_autospec(cls, instance=True, spec_set=True)
+
+
+def _gate_results(passed=True):
+    """One result per gate, all passing or all failing"""
+    return {
+        gate: GateResult(
+            gate_type=gate, passed=passed, score=1.0 if passed else 0.0,
+            reason="test", details={}, timestamp=datetime.now()
+        )
+        for gate in GateType
+    }
+
+
+@pytest.fixture
+def system(tmp_path):
+    """System with every subsystem replaced by a mock of its real API"""
+    config = SystemConfig(
+        data_dir=tmp_path / "data",
+        credentials_path=tmp_path / "credentials",
+        enable_gates=False,
+        enable_tribunal=False,
+        enable_ari_monitoring=False,
+        enable_edm_monitoring=False,
+        enable_self_improvement=False,
+        enable_privacy_protection=False,
+        enable_context_management=False,
+        enable_model_orchestration=False,
+        enable_dashboard=False,
+        enable_ffe=False,
+    )
+    system = IntegratedACSystem(config)
+    probe = ConcurrencyProbe()
+
+    system.privacy_manager = _mock(AdvancedPrivacyManager)
+    system.privacy_manager.check_privacy_budget.return_value = True
+    system.privacy_manager.apply_privacy_protection.side_effect = lambda text, *a, **kw: (text, [])
+
+    system.context_manager = _mock(EnhancedContextManager)
+    system.context_manager.search_memories.side_effect = probe.wrap([])
+
+    system.gate_system = _mock(GateSystem)
+    system.gate_system.validate_all.side_effect = probe.wrap(_gate_results())
+    system.gate_system.get_failed_gates.side_effect = GateSystem().get_failed_gates
+
+    system.orchestrator = _mock(MultiModelOrchestrator)
+    system.orchestrator.select_model.side_effect = probe.wrap(ModelSelection(
+        provider=ModelProvider.LOCAL,
+        model_name="test-model",
+        confidence=1.0,
+        estimated_cost=0.0,
+        estimated_latency_ms=10,
+        expected_quality=0.9,
+        selection_reason="test",
+        optimization_goal=OptimizationGoal.BALANCED,
+    ))
+    system.orchestrator.execute_model.return_value = LLMResponse(
+        generated_text="A sufficiently long model response.",
+        total_tokens=12,
+        cost_usd=0.001,
+        latency_ms=5.0,
+        finish_reason="stop",
+    )
+
+    system.edm_monitor = _mock(EDMMonitor)
+    system.edm_monitor.analyze_text.return_value = []
+
+    system.probe = probe
+    return system
+
+
+async def _process(system, **kwargs):
+    return await system.process_request(
+        "user-1", "hello", "session-1",
+        requirements=TaskRequirements(task_type="general", complexity=TaskComplexity.SIMPLE),
+        **kwargs
+    )
+
+
+# ============================================================================
+# Response Path Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently(system):
+    """Memory search, gate validation and model selection overlap"""
+    result = await _process(system)
+
+    assert result.success
+    assert result.stage_completed == RequestStage.RESPONSE
+    # 1 memory search + 1 gate validation + 1 model selection
+    assert system.probe.peak == 3
+    assert set(result.gate_verdicts) == set(GateType)
+    assert all(v.passed for v in result.gate_verdicts.values())
+
+
+@pytest.mark.asyncio
+async def test_stage_timings_recorded(system):
+    """Every response-path stage reports its wall time"""
+    result = await _process(system)
+
+    assert set(REQUEST_STAGE_GRAPH) <= set(result.stage_timings_ms)
+    assert all(ms >= 0 for ms in result.stage_timings_ms.values())
+    assert result.stage_timings_ms["gates"] >= 15
+
+
+@pytest.mark.asyncio
+async def test_privacy_rejection_skips_later_stages(system):
+    """An exhausted privacy budget stops the pipeline before execution"""
+    system.privacy_manager.check_privacy_budget.return_value = False
+
+    result = await _process(system)
+
+    assert not result.success
+    assert result.error == "Privacy budget exceeded"
+    assert result.metadata["rejected"] is True
+    system.orchestrator.execute_model.assert_not_called()
+
+
+# ============================================================================
+# Background Tail Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_monitoring_runs_after_response(system):
+    """The response is returned before EDM analysis finishes"""
+    release = asyncio.Event()
+
+    async def slow_analysis(**kwargs):
+        await release.wait()
+        return [Mock(), Mock()]
+
+    system.edm_monitor.analyze_text.side_effect = slow_analysis
+
+    result = await _process(system)
+
+    assert result.success
+    assert result.model_response == "A sufficiently long model response."
+    assert result.epistemic_debts_detected == 0
+    assert "edm" not in result.stage_timings_ms
+
+    release.set()
+    await system.wait_for_background_tasks()
+
+    assert "edm" in result.stage_timings_ms
+    assert result.new_memories_created == 2
+    assert system.context_manager.store_memory.await_count == 2
+    system.orchestrator.record_quality.assert_awaited_once()
+    assert result.stage_completed == RequestStage.RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_wait_for_background(system):
+    """wait_for_background returns only once the tail has run"""
+    result = await _process(system, wait_for_background=True)
+
+    assert result.new_memories_created == 2
+    system.edm_monitor.analyze_text.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_background_failure_does_not_fail_request(system):
+    """Errors in the tail are recorded, not surfaced to the caller"""
+    system.edm_monitor.analyze_text.side_effect = RuntimeError("edm down")
+
+    result = await _process(system, wait_for_background=True)
+
+    assert result.success
+    assert result.metadata["background_error"] == "edm down"
+
+
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_stream_request_frames(system):
+    """Tokens stream between a start frame and a final metadata frame"""
+    async def stream(**kwargs):
+        for chunk in ["Hello ", "there, ", "streaming world."]:
+            yield chunk
+
+    system.orchestrator.execute_with_streaming.side_effect = stream
+
+    frames = [f async for f in system.stream_request(
+        "user-1", "hello", "session-1",
+        requirements=TaskRequirements(task_type="general", complexity=TaskComplexity.SIMPLE)
+    )]
+
+    assert [f["type"] for f in frames] == ["start", "token", "token", "token", "done"]
+    assert "".join(f["text"] for f in frames if f["type"] == "token") == "Hello there, streaming world."
+
+    done = frames[-1]
+    assert done["success"]
+    assert done["new_memories_created"] == 2
+    assert "edm" in done["stage_timings_ms"]
+    assert "time_to_first_token_ms" in done["metadata"]
+    system.edm_monitor.analyze_text.assert_awaited_once()
+    assert system.edm_monitor.analyze_text.await_args.kwargs["text"].text == "Hello there, streaming world."
+
+
+@pytest.mark.asyncio
+async def test_stream_request_rejected_before_generation(system):
+    """Gate rejection yields a single error frame and no tokens"""
+    system.gate_system.validate_all.side_effect = None
+    system.gate_system.validate_all.return_value = _gate_results(passed=False)
+    system.tribunal = _mock(AHOTribunal)
+    system.tribunal.submit_appeal.return_value = SimpleNamespace(appeal_id="APPEAL-1")
+
+    frames = [f async for f in system.stream_request(
+        "user-1", "hello", "session-1",
+        requirements=TaskRequirements(task_type="general", complexity=TaskComplexity.SIMPLE)
+    )]
+
+    assert len(frames) == 1
+    assert frames[0]["type"] == "error"
+    assert frames[0]["rejected"] is True
+    system.orchestrator.execute_with_streaming.assert_not_called()
+    system.tribunal.submit_appeal.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_streamed_request_counted_once(system, tmp_path):
+    """The orchestrator counts a streamed call once; the tail only adds quality"""
+    async def stream(request, model_name):
+        for chunk in ["Hello ", "there, ", "streaming world."]:
+            yield chunk
+
+    orchestrator = MultiModelOrchestrator(storage_dir=tmp_path / "orchestrator")
+    orchestrator.providers[ModelProvider.LOCAL] = SimpleNamespace(generate_streaming=stream)
+    orchestrator.select_model = system.orchestrator.select_model
+    system.orchestrator = orchestrator
+
+    frames = [f async for f in system.stream_request(
+        "user-1", "hello", "session-1",
+        requirements=TaskRequirements(task_type="general", complexity=TaskComplexity.SIMPLE)
+    )]
+
+    assert frames[-1]["success"]
+    perf = orchestrator.model_performance[(ModelProvider.LOCAL, "test-model")]
+    assert perf.total_requests == 1
+    assert perf.recent_qualities == [0.9]
+
+
+# ============================================================================
+# Deadline Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_hung_provider_cancelled_at_deadline(system):
+    """A provider call that outlives the budget is cancelled"""
+    cancelled = asyncio.Event()
+
+    async def hung(**kwargs):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    system.orchestrator.execute_model.side_effect = hung
+
+    result = await _process(system, budget_ms=200)
+
+    assert not result.success
+    assert "deadline" in result.error
+    assert cancelled.is_set()
+    assert result.metadata["deadline"]["expired"]
+    assert set(result.metadata["deadline"]["stage_usage_ms"]) == set(REQUEST_STAGE_GRAPH)
+    system.edm_monitor.analyze_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_low_budget_narrows_memory_search(system):
+    """Less than low_budget_ms left: the memory search asks for fewer results"""
+    system.config.low_budget_ms = 10_000
+
+    result = await _process(system, budget_ms=5_000)
+
+    assert result.success
+    assert system.context_manager.search_memories.await_args.kwargs["limit"] == 3
+    assert result.metadata["degraded_stages"] == ["context"]
+
+
+@pytest.mark.asyncio
+async def test_stage_budget_metrics(system):
+    """Each stage's share of the budget is exported"""
+    metrics = get_metrics()
+    metrics.reset()
+
+    await _process(system, budget_ms=10_000)
+
+    ratios = metrics.get_histogram("ai_pal_stage_budget_ratio", {"stage": "gates"})
+    assert len(ratios) == 1 and 0 < ratios[0] < 1
+
+
+# ============================================================================
+# Per-User Serialization Tests
+# ============================================================================
+
+
+def _probe_execution(system):
+    """Track execute_model overlap per user"""
+    active, peaks = {}, {}
+    response = system.orchestrator.execute_model.return_value
+
+    async def execute(**kwargs):
+        user = kwargs["prompt"]
+        active[user] = active.get(user, 0) + 1
+        peaks[user] = max(peaks.get(user, 0), active[user])
+        try:
+            await asyncio.sleep(0.02)
+            return response
+        finally:
+            active[user] -= 1
+
+    system.orchestrator.execute_model.side_effect = execute
+    return peaks
+
+
+@pytest.mark.asyncio
+async def test_same_user_requests_serialized(system):
+    """Concurrent requests from one user run one at a time; users run in parallel"""
+    peaks = _probe_execution(system)
+    requirements = TaskRequirements(task_type="general", complexity=TaskComplexity.SIMPLE)
+
+    start = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*(
+        system.process_request(user, user, "session-1", requirements=requirements)
+        for user in ["user-1", "user-1", "user-1", "user-2", "user-3"]
+    ))
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert all(r.success for r in results)
+    assert peaks == {"user-1": 1, "user-2": 1, "user-3": 1}
+    # user-1's three requests queue behind each other, others don't wait
+    assert elapsed < 0.2
+
+
+@pytest.mark.asyncio
+async def test_tail_runs_before_users_next_request(system):
+    """A user's next request sees the previous request's memory update"""
+    order = []
+    system.context_manager.store_memory.side_effect = lambda **kw: order.append("memory")
+    system.context_manager.search_memories.side_effect = lambda **kw: order.append("search") or []
+
+    await _process(system)
+    await _process(system)
+    await system.wait_for_background_tasks()
+
+    assert order[:4] == ["search", "memory", "memory", "search"]
+
+
+@pytest.mark.asyncio
+async def test_run_for_user_waits_for_pending_tail(system):
+    """Other per-user entry points run after the user's queued tail"""
+    order = []
+    system.context_manager.store_memory.side_effect = lambda **kw: order.append("memory")
+
+    async def endpoint():
+        order.append("endpoint")
+
+    await _process(system)
+    await system.run_for_user("user-1", endpoint)
+
+    assert order == ["memory", "memory", "endpoint"]
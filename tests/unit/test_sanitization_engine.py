@@ -0,0 +1,155 @@
+"""
+Unit Tests for the Compiled Sanitization Engine
+
+Tests:
+- Engine finds exactly the patterns the regexes find (fuzzed)
+- Plain-text fast path still catches keywords
+- Schema-aware sanitize_dict skips non-string and declared-safe fields
+- Output validation prefilter matches running every pattern
+"""
+
+import logging
+import random
+from enum import Enum
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from ai_pal.security.sanitization import (
+    InputSanitizer,
+    OutputValidator,
+    SanitizationLevel,
+    get_sanitization_engine,
+    sanitize_input,
+)
+
+
+FRAGMENTS = [
+    "a", "Z", "9", " ", "\t", "\n", "\x1c", "_", "-", ".", "/", "\\", ";", "'", '"',
+    "|", "&", "`", "$", "(", "{", ">", "<", ":", "=", "@", "ſ", "K", "İ", "ı", "é",
+    "select", "UPDATE", "drop", "union", "import", "os", "subprocess", "script",
+    "iframe", "javascript", "onerror", "onload", "exec", "eval", "__import__",
+]
+
+
+def _fuzz(seed, count=4000):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+
+class RegexSanitizer(InputSanitizer):
+    """Runs every regex on every string (overridden patterns bypass the engine)"""
+
+    def _get_dangerous_patterns(self):
+        return dict(super()._get_dangerous_patterns())
+
+
+class RegexValidator(OutputValidator):
+    def _get_sensitive_patterns(self):
+        return dict(super()._get_sensitive_patterns())
+
+
+# ============================================================================
+# Detection
+# ============================================================================
+
+
+def test_engine_matches_regexes():
+    engine = InputSanitizer()
+    regex = RegexSanitizer()
+
+    for text in _fuzz(1) + ["please select a time", "import  os", "x = 1 -- note", "a..\\b"]:
+        assert engine._detect(text) == regex._detect(text), repr(text)
+
+
+def test_plain_text_fast_path():
+    engine = get_sanitization_engine(SanitizationLevel.MODERATE)
+
+    assert not engine.has_key_chars("Order 66 ships\ttomorrow\n")
+    assert engine.has_key_chars("it's")
+    assert engine.detect("Order 66 ships tomorrow") == ()
+    assert engine.detect("please UPDATE my plan") == ("sql_injection",)
+    assert engine.detect("import os") == ("code_injection",)
+    assert engine.detect("selected updates") == ()
+    # Long strings bypass the result cache
+    assert engine.detect("x" * 300 + " drop") == ("sql_injection",)
+
+
+def test_engines_shared_per_level():
+    assert InputSanitizer()._engine is InputSanitizer()._engine
+    strict = InputSanitizer(SanitizationLevel.STRICT)
+    assert strict._engine.max_length == 1000
+    assert strict.sanitize_string("x" * 2000).sanitized == "x" * 1000
+
+
+# ============================================================================
+# Schema-Aware Payloads
+# ============================================================================
+
+
+class Priority(str, Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+class Step(BaseModel):
+    title: str
+    minutes: int
+    checksum: str = Field(json_schema_extra={"sanitize": False})
+
+
+class Plan(BaseModel):
+    name: str
+    priority: Priority
+    step_ids: List[int]
+    budgets: Dict[str, float]
+    steps_by_name: Dict[str, Step] = {}
+    first: Optional[Step] = None
+    notes: Optional[str] = None
+
+
+def test_schema_skips_safe_fields(caplog):
+    payload = {
+        "name": "ship\x00 it",
+        "priority": "high",
+        "step_ids": [1, 2],
+        "budgets": {"a": 1.0},
+        "first": {"title": "plan\x00", "minutes": 5, "checksum": "ab\x00; DROP"},
+        "notes": "see <script>",
+        "unknown": "x\x00",
+    }
+
+    with caplog.at_level(logging.WARNING, logger="ai_pal.security.sanitization"):
+        result = InputSanitizer().sanitize_dict(payload, schema=Plan)
+
+    assert result["name"] == "ship it"
+    assert result["first"] == {"title": "plan", "minutes": 5, "checksum": "ab\x00; DROP"}
+    assert result["unknown"] == "x"
+    assert "notes" in caplog.text and "checksum" not in caplog.text
+
+    # Without a schema every string is sanitized
+    assert InputSanitizer().sanitize_dict(payload)["first"]["checksum"] == "ab; DROP"
+
+
+def test_sanitize_input_passes_schema():
+    payload = {"first": {"title": "plan", "minutes": 5, "checksum": "ab\x00"}}
+
+    assert sanitize_input(payload, schema=Plan)["first"]["checksum"] == "ab\x00"
+    assert sanitize_input(payload)["first"]["checksum"] == "ab"
+
+
+# ============================================================================
+# Output Validation
+# ============================================================================
+
+
+def test_output_prefilter_matches_all_patterns():
+    rng = random.Random(2)
+    pieces = ["mail", " ", "a@b.co", "212-555-0199", "4539 1488 0343 6467", "10.0.0.1", "٣", "-", "."]
+    texts = ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 8))) for _ in range(2000)]
+
+    validator, regex = OutputValidator(), RegexValidator()
+    for text in texts + ["no sensitive data here"]:
+        result = validator.validate_output(text, check_secrets=False)
+        assert result == regex.validate_output(text, check_secrets=False), text
+        assert validator.redact_sensitive_data(text) == regex.redact_sensitive_data(text)
@@ -0,0 +1,222 @@
+"""
+Unit Tests for Secret Scanning
+
+Tests:
+- Keyword prefilter finds the same secrets as every pattern on every line
+- Allowlist marker honored in file scans only
+- Single walk with directory pruning; binary and large files skipped
+- Content-hash cache: unchanged files not rescanned, persisted between engines
+- Process pool results match in-process scanning
+"""
+
+import os
+
+import pytest
+
+from ai_pal.security.scan_engine import SecretScanEngine
+from ai_pal.security.secret_scanner import (
+    ALLOWLIST_MARKER,
+    SecretPattern,
+    SecretScanner,
+    SecretSeverity,
+    SecretType,
+)
+
+
+AWS_KEY = "AKIA" + "Q7RZ3MXK2PLW9VNB"
+GITHUB_TOKEN = "ghp_" + "r8Kq2Lm9Xz4Tb7Wc1Vn5Hj3Pd6Fs0Gy2Ae8U"
+DB_URL = "mongodb" + "://admin:Pq8sLw2Xr9@db.internal:27017"
+KEY_HEADER = "-----BEGIN RSA " + "PRIVATE KEY-----"
+
+TEXT = "\n".join([
+    "import os",
+    f"AWS_ACCESS_KEY_ID = '{AWS_KEY}'",
+    "nothing to see here",
+    f"token: {GITHUB_TOKEN}",
+    f"db = '{DB_URL}'",
+    "İndex ſk-" + "a1B2c3D4e5" * 5,
+    KEY_HEADER,
+])
+
+
+def _summary(matches):
+    return [(m.secret_type, m.line_number, m.column, m.matched_text) for m in matches]
+
+
+def _unfiltered():
+    scanner = SecretScanner()
+    scanner._filter_false_positives = lambda matches: matches
+    return scanner
+
+
+def _scan_every_line(scanner, text):
+    matches = []
+    for line_num, line in enumerate(text.split("\n"), 1):
+        matches.extend(scanner._scan_line(line, line_num, None))
+    return scanner._filter_false_positives(matches)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "settings.py").write_text(f"DATABASE_URL = '{DB_URL}'\n")
+    (tmp_path / "src" / "pkg" / "clean.py").write_text("def f():\n    return 1\n")
+    (tmp_path / "config.yaml").write_text(f"tls: |\r\n  {KEY_HEADER}\r\n")
+    (tmp_path / "notes.md").write_text(f"{KEY_HEADER}\n")  # suffix not scanned
+    (tmp_path / "blob.txt").write_bytes(b"\0\1\2" + KEY_HEADER.encode())
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.json").write_text(f'"{KEY_HEADER}"')
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config.txt").write_text(KEY_HEADER)
+    return tmp_path
+
+
+# ============================================================================
+# Prefilter
+# ============================================================================
+
+
+def test_prefilter_matches_full_scan():
+    scanner = _unfiltered()
+    found = _summary(scanner.scan_text(TEXT))
+
+    assert found == _summary(_scan_every_line(scanner, TEXT))
+    assert [(t, line) for t, line, _, _ in found] == [
+        (SecretType.AWS_KEY, 2),
+        (SecretType.TOKEN, 4),
+        (SecretType.DATABASE_URL, 5),
+        (SecretType.PASSWORD, 5),
+        (SecretType.API_KEY, 6),  # "ſ" matches "s" case-insensitively
+        (SecretType.PRIVATE_KEY, 7),
+    ]
+
+
+def test_database_url_without_credentials_group():
+    matches = SecretScanner().scan_text(f"url = '{DB_URL}'")
+    assert [m.secret_type for m in matches] == [SecretType.DATABASE_URL, SecretType.PASSWORD]
+
+
+def test_pattern_without_keywords_scans_every_line():
+    scanner = _unfiltered()
+    scanner.patterns.append(SecretPattern(
+        name="Internal Token",
+        secret_type=SecretType.TOKEN,
+        pattern=r"(itk\.[a-z0-9]{24})",
+        severity=SecretSeverity.HIGH,
+    ))
+
+    matches = scanner.scan_text("x = 1\ncfg = itk.q8w7e6r5t4y3u2i1o9p8a7s6\n")
+    assert [(m.line_number, m.column) for m in matches] == [(2, 6)]
+
+
+def test_allowlisted_lines_not_reported_in_file_scans():
+    text = f"a = '{DB_URL}'\nb = '{DB_URL}'  # {ALLOWLIST_MARKER}\n"
+    scanner = SecretScanner()
+
+    assert [m.line_number for m in scanner.scan_text(text, honor_allowlist=True)] == [1, 1]
+    # Runtime text can't opt out of detection
+    assert [m.line_number for m in scanner.scan_text(text)] == [1, 1, 2, 2]
+
+
+def test_allowlist_marker_does_not_hide_secrets_in_output():
+    from ai_pal.security.sanitization import OutputValidator
+
+    result = OutputValidator().validate_output(f"db = '{DB_URL}'  # {ALLOWLIST_MARKER}")
+    assert result["status"] == "failed"
+
+
+def test_scanner_source_passes_its_own_scan():
+    import ai_pal.security.secret_scanner as module
+
+    assert SecretScanner().scan_file(module.__file__) == []
+
+
+# ============================================================================
+# Walking
+# ============================================================================
+
+
+def test_walk_prunes_and_filters(repo):
+    engine = SecretScanEngine(workers=1)
+
+    files = {p.relative_to(repo).as_posix() for p in engine.iter_files(repo)}
+    assert files == {"src/pkg/settings.py", "src/pkg/clean.py", "config.yaml", "blob.txt"}
+
+    top_level = {p.name for p in engine.iter_files(repo, recursive=False)}
+    assert top_level == {"config.yaml", "notes.md", "blob.txt"}
+
+
+def test_scan_directory_skips_binary_and_large(repo):
+    (repo / "big.json").write_text(f'"{KEY_HEADER}"' + " " * 4096)
+    engine = SecretScanEngine(workers=1, max_file_bytes=1024)
+
+    results = engine.scan_directory(repo)
+
+    assert sorted(os.path.relpath(p, repo) for p in results) == [
+        "config.yaml", os.path.join("src", "pkg", "settings.py"),
+    ]
+    assert engine.last_stats.skipped_binary == 1
+    assert engine.last_stats.skipped_large == 1
+    settings = str(repo / "src" / "pkg" / "settings.py")
+    assert {m.context for m in results[settings]} == {settings}
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+def test_rescans_only_changed_files(repo):
+    engine = SecretScanEngine(workers=1)
+    first = engine.scan_directory(repo)
+    assert engine.last_stats.scanned == 3
+
+    assert engine.scan_directory(repo) == first
+    assert engine.last_stats.scanned == 0
+    assert engine.last_stats.cache_hits == 3
+
+    # New mtime, same content: read and hashed, not rescanned
+    clean = repo / "src" / "pkg" / "clean.py"
+    os.utime(clean, ns=(0, 0))
+    engine.scan_directory(repo)
+    assert (engine.last_stats.scanned, engine.last_stats.cache_hits) == (0, 3)
+
+    clean.write_text(f"{KEY_HEADER}\n")
+    results = engine.scan_directory(repo)
+    assert engine.last_stats.scanned == 1
+    assert str(clean) in results
+
+
+def test_cache_persists_between_engines(repo, tmp_path):
+    cache_path = tmp_path / "cache" / "secrets.json"
+    engine = SecretScanEngine(workers=1, cache_path=cache_path)
+    first = engine.scan_directory(repo)
+    engine.save_cache()
+
+    reloaded = SecretScanEngine(workers=1, cache_path=cache_path)
+    assert reloaded.scan_directory(repo) == first
+    assert reloaded.last_stats.scanned == 0
+
+    # Different patterns: cache discarded
+    scanner = SecretScanner()
+    scanner.patterns.pop()
+    other = SecretScanEngine(scanner, workers=1, cache_path=cache_path)
+    other.scan_directory(repo)
+    assert other.last_stats.scanned == 3
+
+
+# ============================================================================
+# Parallel Scanning
+# ============================================================================
+
+
+def test_process_pool_matches_in_process(repo):
+    for i in range(8):
+        (repo / "src" / f"gen_{i}.py").write_text(TEXT * (i + 1))
+
+    serial = SecretScanEngine(workers=1).scan_directory(repo)
+    pooled = SecretScanEngine(workers=2, parallel_min_bytes=0, chunk_bytes=256)
+    parallel = pooled.scan_directory(repo)
+
+    assert pooled.last_stats.workers == 2
+    assert {p: _summary(m) for p, m in parallel.items()} == {p: _summary(m) for p, m in serial.items()}
@@ -0,0 +1,129 @@
+"""
+Unit Tests for Shared Text Analysis
+
+Tests:
+- Built-in word, token and sentence features
+- Marker sets counted together
+- Registered features computed once per text and cached across consumers
+- ARI, RDI, EDM and PII detection accepting a shared AnalyzedText
+"""
+
+import pytest
+
+from ai_pal.monitoring.ari_engine import PassiveLexicalAnalyzer
+from ai_pal.monitoring.edm_monitor import EDMMonitor
+from ai_pal.monitoring.rdi_monitor import RDIMonitor
+from ai_pal.monitoring.text_analysis import AnalyzedText, TextAnalyzer, get_text_analyzer
+from ai_pal.privacy.advanced_privacy import AdvancedPrivacyManager, PIIType
+
+
+TEXT = "Studies show that caching helps. Which layer? The API layer, because it is hot!"
+
+
+# ============================================================================
+# Feature Tests
+# ============================================================================
+
+
+def test_builtin_features():
+    analyzed = TextAnalyzer().analyze(TEXT)
+
+    assert analyzed.lower == TEXT.lower()
+    assert analyzed.words[:4] == ("studies", "show", "that", "caching")
+    assert analyzed.tokens == tuple(TEXT.lower().split())
+    assert analyzed.sentences == (
+        "Studies show that caching helps",
+        "Which layer",
+        "The API layer, because it is hot",
+    )
+    assert analyzed.sentence_lengths == (5, 2, 7)
+    assert sum(analyzed.sentence_lengths) == len(analyzed.words)
+
+
+def test_sentence_lengths_when_lowercasing_changes_length():
+    # "İ" lowercases to two code points ("i" + combining dot)
+    analyzed = TextAnalyzer().analyze("İİİ one two. three!")
+
+    assert analyzed.sentence_lengths == (5, 1)
+
+
+def test_marker_sets_counted_together():
+    analyzer = TextAnalyzer()
+    analyzer.register_markers("a", ["that", "because", ","])
+    analyzer.register_markers("b", ["Because", "layer"])
+    analyzed = analyzer.analyze(TEXT)
+
+    assert dict(analyzed.marker_counts("a")) == {"that": 1, "because": 1, ",": 1}
+    assert dict(analyzed.marker_counts("b")) == {"because": 1, "layer": 2}
+    with pytest.raises(TypeError):
+        analyzed.marker_counts("b")["layer"] = 0
+
+
+def test_features_computed_once_and_cached():
+    analyzer = TextAnalyzer(cache_size=2)
+    calls = []
+
+    def long_words(analyzed):
+        calls.append(analyzed.text)
+        return tuple(w for w in analyzed.words if len(w) > 5)
+
+    analyzer.register_feature("long_words", long_words)
+
+    first = analyzer.analyze(TEXT)
+    assert analyzer.analyze(TEXT) is first
+    assert analyzer.analyze(first) is first
+    assert first.feature("long_words") == analyzer.analyze(TEXT).feature("long_words")
+    assert calls == [TEXT]
+
+    # LRU eviction
+    analyzer.analyze("two")
+    analyzer.analyze("three")
+    assert analyzer.analyze(TEXT) is not first
+
+    # Re-registering the same function keeps the cache; a new one clears it
+    cached = analyzer.analyze(TEXT)
+    analyzer.register_feature("long_words", long_words)
+    assert analyzer.analyze(TEXT) is cached
+    analyzer.register_feature("long_words", lambda analyzed: ())
+    assert analyzer.analyze(TEXT) is not cached
+
+    with pytest.raises(ValueError):
+        analyzer.register_feature("words", long_words)
+    with pytest.raises(KeyError):
+        cached.feature("missing")
+
+
+# ============================================================================
+# Consumer Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_consumers_share_one_analysis(tmp_path):
+    lexical = PassiveLexicalAnalyzer(tmp_path / "ari")
+    rdi = RDIMonitor(tmp_path / "rdi")
+    edm = EDMMonitor(storage_dir=tmp_path / "edm", fact_check_enabled=False)
+    privacy = AdvancedPrivacyManager(storage_dir=tmp_path / "privacy")
+
+    text = TEXT + " Contact me at someone@example.com."
+    analyzed = get_text_analyzer().analyze(text)
+    assert isinstance(analyzed, AnalyzedText)
+
+    from_shared = await lexical.analyze_text("u", analyzed, text_sample_id="s")
+    from_string = await lexical.analyze_text("u", text, text_sample_id="s")
+    assert from_shared.syntactic_complexity_score == from_string.syntactic_complexity_score
+    assert from_shared.sentence_count == 5  # the e-mail address splits a sentence
+
+    drift, _ = await rdi.analyze_input("u", analyzed)
+    assert 0.0 <= drift <= 1.0
+
+    debts = await edm.analyze_text(analyzed, task_id="t", user_id="u")
+    assert [d.debt_type for d in debts] == ["missing_citation"]
+
+    detections = await privacy.detect_pii(analyzed)
+    assert [d.pii_type for d in detections] == [PIIType.EMAIL]
+
+    # Every consumer read the same cached object
+    assert get_text_analyzer().analyze(text) is analyzed
+    for name in ("words", "tokens", "markers", "digest", RDIMonitor.CONCEPTS_FEATURE, edm._marker_feature):
+        assert name in analyzed._features
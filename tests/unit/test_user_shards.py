@@ -0,0 +1,143 @@
+"""
+Unit Tests for Per-User Mailboxes
+
+Tests:
+- Per-user mailbox serialization and FIFO order
+- Concurrency across users
+- Deadline-bounded waits for a turn
+"""
+
+import asyncio
+import pytest
+
+from ai_pal.core.shards import UserMailboxes
+from ai_pal.monitoring.deadline import DeadlineExceeded, RequestDeadline, deadline_scope
+
+
+class OverlapProbe:
+    """Tracks peak concurrency, overall and per user"""
+
+    def __init__(self):
+        self.active = {}
+        self.peak_per_user = 0
+        self.peak_total = 0
+        self.order = []
+
+    async def work(self, user_id, label, delay=0.02):
+        self.active[user_id] = self.active.get(user_id, 0) + 1
+        self.peak_per_user = max(self.peak_per_user, self.active[user_id])
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        try:
+            await asyncio.sleep(delay)
+            self.order.append(label)
+            return label
+        finally:
+            self.active[user_id] -= 1
+
+
+# ============================================================================
+# Mailbox Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_same_user_serialized_in_arrival_order():
+    """One user's calls never overlap and finish in the order they arrived"""
+    mailboxes = UserMailboxes()
+    probe = OverlapProbe()
+
+    results = await asyncio.gather(*(
+        mailboxes.call("u1", probe.work, "u1", i) for i in range(5)
+    ))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert probe.order == [0, 1, 2, 3, 4]
+    assert probe.peak_per_user == 1
+    assert mailboxes.max_depth_seen == 5
+
+
+@pytest.mark.asyncio
+async def test_different_users_run_concurrently():
+    """Users don't wait for each other"""
+    mailboxes = UserMailboxes()
+    probe = OverlapProbe()
+
+    await asyncio.gather(*(
+        mailboxes.call(f"u{i}", probe.work, f"u{i}", i) for i in range(4)
+    ))
+
+    assert probe.peak_total == 4
+    assert probe.peak_per_user == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_users_are_dropped():
+    """Mailboxes exist only while a user has work"""
+    mailboxes = UserMailboxes()
+    probe = OverlapProbe()
+
+    pending = mailboxes.tell("u1", probe.work, "u1", "a")
+    await asyncio.sleep(0)
+    assert mailboxes.pending("u1") == 1
+
+    assert await pending == "a"
+    assert mailboxes.pending("u1") == 0
+    assert mailboxes.get_stats()["active_users"] == 0
+
+
+@pytest.mark.asyncio
+async def test_turn_released_on_error():
+    """A failing call doesn't block the user's next call"""
+    mailboxes = UserMailboxes()
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await mailboxes.call("u1", fail)
+
+    assert await asyncio.wait_for(mailboxes.call("u1", asyncio.sleep, 0, "ok"), timeout=1) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_turn_bounded_by_deadline():
+    """A request stuck behind a slow one gives up at its deadline"""
+    mailboxes = UserMailboxes()
+    slow = mailboxes.tell("u1", asyncio.sleep, 0.5)
+    await asyncio.sleep(0)
+
+    with deadline_scope(RequestDeadline(50)):
+        with pytest.raises(DeadlineExceeded) as exc:
+            async with mailboxes.turn("u1"):
+                pass
+
+    assert "mailbox" in str(exc.value)
+    assert mailboxes.get_stats()["turns_timed_out"] == 1
+
+    await slow
+    assert mailboxes.pending("u1") == 0
+
+
+@pytest.mark.asyncio
+async def test_tell_takes_its_place_immediately():
+    """Queued work runs before turns requested after tell() returns"""
+    mailboxes = UserMailboxes()
+    probe = OverlapProbe()
+
+    tail = mailboxes.tell("u1", probe.work, "u1", "tail")
+    await mailboxes.call("u1", probe.work, "u1", "next", delay=0)
+    await tail
+
+    assert probe.order == ["tail", "next"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_tell_frees_the_turn():
+    """Cancelling queued work before it starts doesn't wedge the user"""
+    mailboxes = UserMailboxes()
+
+    mailboxes.tell("u1", asyncio.sleep, 10).cancel()
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(mailboxes.call("u1", asyncio.sleep, 0, "ok"), timeout=1) == "ok"
+    assert mailboxes.pending("u1") == 0